@@ -17,64 +17,75 @@ import gc
 
 import warp as wp
 
+from ..benchmarks_utils import BENCHMARK_DEVICES, get_benchmark_device
+
 N = 8192
 
 
 class ArrayEmpty:
     """Benchmark wp.empty()."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     repeat = 1000  # Number of samples to run
     number = 1  # Number of measurements to make between a single setup and teardown
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
         self.alloc = None
         gc.disable()
 
-    def teardown(self):
+    def teardown(self, device):
         gc.enable()
         self.alloc = None
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(self.device)
 
-    def time_empty(self):
-        self.alloc = wp.empty(N, dtype=float, device="cuda:0")
+    def time_empty(self, device):
+        self.alloc = wp.empty(N, dtype=float, device=self.device)
 
 
 class ArrayZeros:
     """Benchmark wp.zeros()."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     repeat = 1000
     number = 1
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
         self.alloc = None
         gc.disable()
 
-    def teardown(self):
+    def teardown(self, device):
         gc.enable()
         self.alloc = None
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(self.device)
 
-    def time_zeros(self):
-        self.alloc = wp.zeros(N, dtype=float, device="cuda:0")
+    def time_zeros(self, device):
+        self.alloc = wp.zeros(N, dtype=float, device=self.device)
 
 
 class ArrayFree:
     """Benchmark array free including GPU work."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     repeat = 100
     number = 1
 
-    def setup(self):
-        wp.init()
-        self.test_array = wp.empty(N, dtype=float, device="cuda:0")
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
+        self.test_array = wp.empty(N, dtype=float, device=self.device)
         self.allocs = [None] * 10
         for i in range(len(self.allocs)):
-            self.allocs[i] = wp.empty(N, dtype=float, device="cuda:0")
-        wp.synchronize_device("cuda:0")
+            self.allocs[i] = wp.empty(N, dtype=float, device=self.device)
+        wp.synchronize_device(self.device)
 
-    def time_ten_free_sync(self):
+    def time_ten_free_sync(self, device):
         for i in range(len(self.allocs)):
             self.allocs[i] = None
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(self.device)
@@ -13,8 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+
+from asv_runner.benchmarks.mark import skip_for_params
+
 import warp as wp
 
+from ..benchmarks_utils import BENCHMARK_DEVICES, get_benchmark_device
+
 wp.set_module_options({"enable_backward": False})
 
 N = 8192
@@ -27,28 +33,32 @@ def inc_kernel(a: wp.array(dtype=float)):
 
 
 class KernelLaunch:
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     number = 1000  # Number of measurements to make between a single setup and teardown
 
-    def setup(self):
-        wp.init()
-        wp.load_module(device="cuda:0")
-        self.test_array = wp.zeros(N, dtype=float, device="cuda:0")
-        self.stream = wp.Stream("cuda:0")
-        self.cmd = wp.launch(inc_kernel, (N,), inputs=[self.test_array], record_cmd=True)
-        wp.synchronize_device("cuda:0")
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
+        wp.load_module(device=self.device)
+        self.test_array = wp.zeros(N, dtype=float, device=self.device)
+        self.stream = wp.Stream(self.device) if self.device.is_cuda else None
+        self.cmd = wp.launch(inc_kernel, (N,), inputs=[self.test_array], device=self.device, record_cmd=True)
+        wp.synchronize_device(self.device)
 
-    def teardown(self):
-        wp.synchronize_device("cuda:0")
+    def teardown(self, device):
+        wp.synchronize_device(self.device)
 
-    def time_standard_launch(self):
+    def time_standard_launch(self, device):
         """Time a standard kernel launch.
 
         A synchronize at the end of the function is intentionally omitted.
         """
 
-        wp.launch(inc_kernel, (N,), inputs=[self.test_array])
+        wp.launch(inc_kernel, (N,), inputs=[self.test_array], device=self.device)
 
-    def time_launch_on_stream(self):
+    @skip_for_params([("cpu",)])
+    def time_launch_on_stream(self, device):
         """Time a kernel launch on a specified stream.
 
         A synchronize at the end of the function is intentionally omitted.
@@ -56,7 +66,7 @@ class KernelLaunch:
 
         wp.launch(inc_kernel, (N,), inputs=[self.test_array], stream=self.stream)
 
-    def time_launch_object(self):
+    def time_launch_object(self, device):
         """Time a kernel launch from a stored launch object.
 
         A synchronize at the end of the function is intentionally omitted.
@@ -114,16 +124,19 @@ def k0():
 
 
 class KernelLaunchParameters:
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     number = 1000
 
-    def setup(self):
-        wp.init()
-        wp.load_module(device="cuda:0")
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
+        wp.load_module(device=self.device)
 
         n = 1
-        self.a = wp.zeros(n, dtype=float, device="cuda:0")
-        self.b = wp.zeros(n, dtype=float, device="cuda:0")
-        self.c = wp.zeros(n, dtype=float, device="cuda:0")
+        self.a = wp.zeros(n, dtype=float, device=self.device)
+        self.b = wp.zeros(n, dtype=float, device=self.device)
+        self.c = wp.zeros(n, dtype=float, device=self.device)
         self.x = 17.0
         self.y = 42.0
         self.z = 99.0
@@ -145,39 +158,92 @@ class KernelLaunchParameters:
 
         self.s0 = S0()
 
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(self.device)
 
-    def teardown(self):
-        wp.synchronize_device("cuda:0")
+    def teardown(self, device):
+        wp.synchronize_device(self.device)
 
-    def time_direct_full(self):
+    def time_direct_full(self, device):
         wp.launch(
-            kz, dim=1, inputs=[self.a, self.b, self.c, self.x, self.y, self.z, self.u, self.v, self.w], device="cuda:0"
+            kz,
+            dim=1,
+            inputs=[self.a, self.b, self.c, self.x, self.y, self.z, self.u, self.v, self.w],
+            device=self.device,
         )
 
-    def time_struct_full(self):
-        wp.launch(ksz, dim=1, inputs=[self.sz], device="cuda:0")
+    def time_struct_full(self, device):
+        wp.launch(ksz, dim=1, inputs=[self.sz], device=self.device)
+
+    def time_direct_empty(self, device):
+        wp.launch(k0, dim=1, inputs=[], device=self.device)
+
+    def time_struct_empty(self, device):
+        wp.launch(ks0, dim=1, inputs=[self.s0], device=self.device)
+
+
+class CpuKernelLaunch:
+    """Python overhead of small CPU kernel launches."""
+
+    number = 1000
+
+    def setup(self):
+        wp.init()
+        wp.load_module(device="cpu")
+
+        self.a = wp.zeros(1, dtype=float, device="cpu")
+        self.b = wp.zeros(1, dtype=float, device="cpu")
+        self.c = wp.zeros(1, dtype=float, device="cpu")
+        self.inputs = [
+            self.a,
+            self.b,
+            self.c,
+            17.0,
+            42.0,
+            99.0,
+            wp.vec3(1, 2, 3),
+            wp.vec3(10, 20, 30),
+            wp.vec3(100, 200, 300),
+        ]
+
+        # warm up the argument packing caches
+        wp.launch(kz, dim=1, inputs=self.inputs, device="cpu")
+        wp.launch(k0, dim=1, inputs=[], device="cpu")
+
+    def time_direct_full(self):
+        wp.launch(kz, dim=1, inputs=self.inputs, device="cpu")
 
     def time_direct_empty(self):
-        wp.launch(k0, dim=1, inputs=[], device="cuda:0")
+        wp.launch(k0, dim=1, inputs=[], device="cpu")
 
-    def time_struct_empty(self):
-        wp.launch(ks0, dim=1, inputs=[self.s0], device="cuda:0")
+    def track_launches_per_second(self):
+        num_launches = 10000
+
+        start = time.perf_counter()
+        for _ in range(num_launches):
+            wp.launch(kz, dim=1, inputs=self.inputs, device="cpu")
+        elapsed = time.perf_counter() - start
+
+        return num_launches / elapsed
+
+    track_launches_per_second.unit = "launches/s"
 
 
 class GraphLaunch:
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     repeat = 10
     number = 1000
 
-    def setup(self):
-        wp.init()
-        wp.load_module(device="cuda:0")
-        self.test_array = wp.zeros(N, dtype=float, device="cuda:0")
-        self.stream = wp.Stream("cuda:0")
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
+        wp.load_module(device=self.device)
+        self.test_array = wp.zeros(N, dtype=float, device=self.device)
+        self.stream = wp.Stream(self.device) if self.device.is_cuda else None
 
         # capture graph
-        with wp.ScopedCapture(device="cuda:0") as capture:
-            wp.launch(inc_kernel, (N,), inputs=[self.test_array])
+        with wp.ScopedCapture(device=self.device) as capture:
+            wp.launch(inc_kernel, (N,), inputs=[self.test_array], device=self.device)
 
         self.graph = capture.graph
 
@@ -185,15 +251,16 @@ class GraphLaunch:
         for _ in range(5):
             wp.capture_launch(self.graph)
 
-        wp.synchronize_device("cuda:0")
+        wp.synchronize_device(self.device)
 
-    def teardown(self):
-        wp.synchronize_device("cuda:0")
+    def teardown(self, device):
+        wp.synchronize_device(self.device)
 
-    def time_ten_graph(self):
+    def time_ten_graph(self, device):
         for _ in range(10):
             wp.capture_launch(self.graph)
 
-    def time_ten_graph_on_stream(self):
+    @skip_for_params([("cpu",)])
+    def time_ten_graph_on_stream(self, device):
         for _ in range(10):
             wp.capture_launch(self.graph, stream=self.stream)
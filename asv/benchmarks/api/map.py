@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+import warp as wp
+
+from ..benchmarks_utils import BENCHMARK_DEVICES, get_benchmark_device
+
+
+@wp.func
+def smooth_step(x: float, y: float):
+    t = wp.clamp(x - y, 0.0, 1.0)
+    return t * t * (3.0 - 2.0 * t)
+
+
+class Map:
+    """Benchmark wp.map() with builtin, Warp, and Python functions.
+
+    The small size measures the per-call overhead of ``wp.map()``, the large size its throughput.
+    """
+
+    params = ([16, 1024 * 1024], BENCHMARK_DEVICES)
+    param_names = ["size", "device"]
+
+    def setup(self, size, device):
+        self.device = get_benchmark_device(device)
+
+        rng = np.random.default_rng(42)
+        self.x = wp.array(rng.uniform(-1.0, 1.0, size=size), dtype=float, device=self.device)
+        self.y = wp.array(rng.uniform(-1.0, 1.0, size=size), dtype=float, device=self.device)
+        self.out = wp.empty_like(self.x)
+
+        # keep the same Python function object, so that the generated kernel is reused across calls
+        self.py_func = lambda x, y: x * y + 2.0 * x
+
+        # warm up the kernel caches
+        self.time_map_builtin(size, device)
+        self.time_map_warp_func(size, device)
+        self.time_map_python_func(size, device)
+
+    def time_map_builtin(self, size, device):
+        wp.map(wp.clamp, self.x, -0.5, 0.5, out=self.out, device=self.device)
+        wp.synchronize_device(self.device)
+
+    def time_map_warp_func(self, size, device):
+        wp.map(smooth_step, self.x, self.y, out=self.out, device=self.device)
+        wp.synchronize_device(self.device)
+
+    def time_map_python_func(self, size, device):
+        wp.map(self.py_func, self.x, self.y, out=self.out, device=self.device)
+        wp.synchronize_device(self.device)
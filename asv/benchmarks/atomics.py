@@ -25,6 +25,8 @@ import numpy as np
 
 import warp as wp
 
+from .benchmarks_utils import get_benchmark_device
+
 # Map string parameter names to warp dtypes
 DTYPE_MAP = {
     "float32": wp.float32,
@@ -86,8 +88,7 @@ class AtomicMax:
         return vals_np_dict
 
     def setup(self, vals_np_dict, dtype_str):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
 
         dtype = DTYPE_MAP[dtype_str]
 
@@ -141,8 +142,7 @@ class AtomicMin:
         return vals_np_dict
 
     def setup(self, vals_np_dict, dtype_str):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
 
         dtype = DTYPE_MAP[dtype_str]
 
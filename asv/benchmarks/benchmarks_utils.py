@@ -29,3 +29,18 @@ def clear_kernel_cache():
     # Fallback when benchmarking older versions of Warp that didn't have
     # `clear_kernel_cache` exposed to the root namespace.
     return wp.build.clear_kernel_cache()
+
+
+BENCHMARK_DEVICES = ["cpu", "cuda:0"]
+"""Devices over which device-parameterized benchmarks are run."""
+
+
+def get_benchmark_device(device: str):
+    """Return the Warp device named ``device``, skipping the benchmark if it is not available."""
+    wp.init()
+
+    try:
+        return wp.get_device(device)
+    except (RuntimeError, ValueError):
+        # asv skips benchmarks whose setup raises NotImplementedError
+        raise NotImplementedError(f"Device {device} is not available") from None
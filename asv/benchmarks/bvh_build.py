@@ -23,7 +23,7 @@ from asv_runner.benchmarks.mark import skip_benchmark_if, skip_for_params
 
 import warp as wp
 
-from .benchmarks_utils import get_asset_directory
+from .benchmarks_utils import BENCHMARK_DEVICES, get_asset_directory, get_benchmark_device
 
 pxr = importlib.util.find_spec("pxr")
 USD_AVAILABLE = pxr is not None
@@ -47,8 +47,8 @@ def compute_tri_aabbs(
 
 
 class BvhBuild:
-    params = (["median", "lbvh"], ["bunny", "bear", "rocks"])
-    param_names = ["method", "asset"]
+    params = (["median", "lbvh"], ["bunny", "bear", "rocks"], BENCHMARK_DEVICES)
+    param_names = ["method", "asset", "device"]
 
     repeat = 100
     number = 5
@@ -70,8 +70,8 @@ class BvhBuild:
             points_np = np.array(mesh_geom.GetPointsAttr().Get())
             indices_np = np.array(mesh_geom.GetFaceVertexIndicesAttr().Get())
 
-            # Compute AABBs on GPU
-            with wp.ScopedDevice("cuda:0"):
+            # Compute AABBs on the CPU, which is available on every machine
+            with wp.ScopedDevice("cpu"):
                 points = wp.array(points_np, dtype=wp.vec3)
                 indices = wp.array(indices_np, dtype=wp.int32)
                 num_faces = int(indices.shape[0] / 3)
@@ -94,10 +94,10 @@ class BvhBuild:
 
         return asset_data
 
-    def setup(self, asset_data, method, asset):
-        self.device = wp.get_device("cuda:0")
+    def setup(self, asset_data, method, asset, device):
+        self.device = get_benchmark_device(device)
 
-        # Get pre-computed AABB numpy arrays and transfer to GPU
+        # Get pre-computed AABB numpy arrays and transfer to the device
         lowers_np = asset_data[asset]["lowers_np"]
         uppers_np = asset_data[asset]["uppers_np"]
 
@@ -107,8 +107,50 @@ class BvhBuild:
 
     # This small median build exhibits host-dependent timing modes in CI while
     # duplicating median coverage provided by the larger assets.
+    # The LBVH constructor is only available on CUDA devices.
     @skip_benchmark_if(USD_AVAILABLE is False)
-    @skip_for_params([("median", "bear")])
-    def time_build(self, asset_data, method, asset):
+    @skip_for_params(
+        [("median", "bear", device) for device in BENCHMARK_DEVICES] + [("lbvh", asset, "cpu") for asset in assets]
+    )
+    def time_build(self, asset_data, method, asset, device):
         _bvh = wp.Bvh(self.lowers, self.uppers, constructor=method)
         wp.synchronize_device(self.device)
+
+
+class BvhBuildCpu:
+    """Benchmark CPU BVH construction on random boxes.
+
+    Parameterized over ``warp.config.cpu_max_threads`` so the serial builder (1)
+    can be compared against the multi-threaded builder (0, all hardware threads).
+    """
+
+    params = ([1, 0], ["sah", "median"])
+    param_names = ["cpu_max_threads", "method"]
+
+    repeat = 10
+    number = 1
+
+    num_items = 1024 * 1024
+
+    def setup(self, cpu_max_threads, method):
+        wp.init()
+        self.device = wp.get_device("cpu")
+        self.saved_cpu_max_threads = wp.config.cpu_max_threads
+        wp.config.cpu_max_threads = cpu_max_threads
+
+        rng = np.random.default_rng(42)
+        centers = rng.uniform(-100.0, 100.0, size=(self.num_items, 3)).astype(np.float32)
+        extents = rng.uniform(0.01, 1.0, size=(self.num_items, 3)).astype(np.float32)
+
+        self.lowers = wp.array(centers - extents, dtype=wp.vec3, device=self.device)
+        self.uppers = wp.array(centers + extents, dtype=wp.vec3, device=self.device)
+        self.bvh = wp.Bvh(self.lowers, self.uppers, constructor=method)
+
+    def teardown(self, cpu_max_threads, method):
+        wp.config.cpu_max_threads = self.saved_cpu_max_threads
+
+    def time_build(self, cpu_max_threads, method):
+        _bvh = wp.Bvh(self.lowers, self.uppers, constructor=method)
+
+    def time_rebuild(self, cpu_max_threads, method):
+        self.bvh.rebuild(method)
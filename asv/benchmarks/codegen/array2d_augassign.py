@@ -15,7 +15,7 @@
 
 import warp as wp
 
-from ..benchmarks_utils import clear_kernel_cache
+from ..benchmarks_utils import clear_kernel_cache, get_benchmark_device
 
 
 @wp.kernel
@@ -44,7 +44,7 @@ class CompileModule:
 
 class RunForwardKernel:
     def setup(self):
-        wp.init()
+        get_benchmark_device("cuda:0")
         wp.load_module(device="cuda:0")
 
         N = (1024, 1024)
@@ -67,7 +67,7 @@ class RunForwardKernel:
 
 class RunBackwardKernel:
     def setup(self):
-        wp.init()
+        get_benchmark_device("cuda:0")
         wp.load_module(device="cuda:0")
 
         N = (1024, 1024)
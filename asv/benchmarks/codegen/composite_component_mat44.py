@@ -15,6 +15,8 @@ from statistics import median
 
 import warp as wp
 
+from ..benchmarks_utils import get_benchmark_device
+
 
 @wp.kernel
 def mat44_multi_elem(dst: wp.array(dtype=wp.mat44), src: wp.array(dtype=wp.float32)):
@@ -28,7 +30,7 @@ def mat44_multi_elem(dst: wp.array(dtype=wp.mat44), src: wp.array(dtype=wp.float
 
 class RunKernel:
     def setup(self):
-        wp.init()
+        get_benchmark_device("cuda:0")
         wp.load_module(device="cuda:0")
         self.n = 1 << 20
         self.dst = wp.zeros(self.n, dtype=wp.mat44, device="cuda:0", requires_grad=True)
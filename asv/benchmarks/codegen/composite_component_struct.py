@@ -14,6 +14,8 @@ from statistics import median
 
 import warp as wp
 
+from ..benchmarks_utils import get_benchmark_device
+
 
 @wp.struct
 class StateStruct:
@@ -40,7 +42,7 @@ def state_multi_field(
 
 class RunKernel:
     def setup(self):
-        wp.init()
+        get_benchmark_device("cuda:0")
         wp.load_module(device="cuda:0")
         self.n = 1 << 20
         self.dst = wp.zeros(self.n, dtype=StateStruct, device="cuda:0", requires_grad=True)
@@ -14,6 +14,8 @@ from statistics import median
 
 import warp as wp
 
+from ..benchmarks_utils import get_benchmark_device
+
 
 @wp.kernel
 def vec3_triple_slot(dst: wp.array(dtype=wp.vec3), src: wp.array(dtype=wp.float32)):
@@ -25,7 +27,7 @@ def vec3_triple_slot(dst: wp.array(dtype=wp.vec3), src: wp.array(dtype=wp.float3
 
 class RunKernel:
     def setup(self):
-        wp.init()
+        get_benchmark_device("cuda:0")
         wp.load_module(device="cuda:0")
         self.n = 1 << 20
         self.dst = wp.zeros(self.n, dtype=wp.vec3, device="cuda:0", requires_grad=True)
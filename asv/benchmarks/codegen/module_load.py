@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for the stages of loading a module.
+
+- ``ModuleCodegen`` times the Python-side code generation of the C++/CUDA source,
+  which needs no compiler and no GPU.
+- ``ModuleCompile`` times a cold load, i.e. code generation and compilation
+  with an empty kernel cache.
+- ``ModuleLoadCached`` times a warm load, i.e. hashing the module and loading
+  the binary from the kernel cache.
+
+The compile and load benchmarks are parameterized over device so that the CPU
+backend is tracked on machines without GPUs.
+"""
+
+import warp as wp
+import warp._src.context
+
+from ..benchmarks_utils import BENCHMARK_DEVICES, clear_kernel_cache, get_benchmark_device
+
+
+@wp.func
+def spring_force(xa: wp.vec3, xb: wp.vec3, va: wp.vec3, vb: wp.vec3, rest: float, ke: float, kd: float):
+    d = xb - xa
+    length = wp.length(d)
+    if length < 1.0e-6:
+        return wp.vec3(0.0)
+
+    dir = d / length
+    stretch = length - rest
+    damping = wp.dot(vb - va, dir)
+    return dir * (ke * stretch + kd * damping)
+
+
+@wp.kernel
+def integrate_springs(
+    x: wp.array(dtype=wp.vec3),
+    v: wp.array(dtype=wp.vec3),
+    springs: wp.array2d(dtype=int),
+    rest: wp.array(dtype=float),
+    ke: float,
+    kd: float,
+    f: wp.array(dtype=wp.vec3),
+):
+    tid = wp.tid()
+
+    a = springs[tid, 0]
+    b = springs[tid, 1]
+    fs = spring_force(x[a], x[b], v[a], v[b], rest[tid], ke, kd)
+
+    wp.atomic_add(f, a, fs)
+    wp.atomic_sub(f, b, fs)
+
+
+@wp.kernel
+def integrate_particles(
+    x: wp.array(dtype=wp.vec3),
+    v: wp.array(dtype=wp.vec3),
+    f: wp.array(dtype=wp.vec3),
+    inv_mass: wp.array(dtype=float),
+    rot: wp.quat,
+    gravity: wp.vec3,
+    dt: float,
+):
+    tid = wp.tid()
+
+    v_new = v[tid] + (f[tid] * inv_mass[tid] + gravity * wp.step(-inv_mass[tid])) * dt
+    x_new = x[tid] + wp.quat_rotate(rot, v_new) * dt
+
+    # project onto a ground plane with friction
+    if x_new[1] < 0.0:
+        x_new = wp.vec3(x_new[0], 0.0, x_new[2])
+        v_new = wp.vec3(v_new[0] * 0.9, 0.0, v_new[2] * 0.9)
+
+    m = wp.outer(v_new, v_new)
+    for i in range(3):
+        v_new[i] = v_new[i] - 1.0e-3 * m[i, i] * wp.sign(v_new[i])
+
+    x[tid] = x_new
+    v[tid] = v_new
+
+
+class ModuleCodegen:
+    """Benchmark the generation of the module source, without compiling it."""
+
+    params = ["cpu", "cuda"]
+    param_names = ["target"]
+
+    repeat = 10
+    number = 5
+
+    def setup(self, target):
+        if not hasattr(warp._src.context.Module, "_run_codegen"):
+            raise NotImplementedError("Module code generation cannot be run separately")
+
+        wp.init()
+        self.module = integrate_particles.module
+        self.module.hash_module()
+        self.options = self.module.resolve_options(wp.config)
+
+    def time_codegen(self, target):
+        self.module._run_codegen(self.options, is_cpu=target == "cpu")
+
+
+class ModuleCompile:
+    """Benchmark loading the module with an empty kernel cache."""
+
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
+    repeat = 5
+    number = 1
+    warmup_time = 0.0
+
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
+        clear_kernel_cache()
+
+    def teardown(self, device):
+        integrate_particles.module.unload()
+
+    def time_compile(self, device):
+        wp.load_module(integrate_particles.module, device=self.device)
+
+
+class ModuleLoadCached:
+    """Benchmark loading the module from the kernel cache."""
+
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
+    repeat = 20
+    number = 1
+    warmup_time = 0.0
+
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
+
+        # populate the kernel cache, unloading forces the module to be rehashed on the next load
+        wp.load_module(integrate_particles.module, device=self.device)
+        integrate_particles.module.unload()
+
+    def teardown(self, device):
+        integrate_particles.module.unload()
+
+    def time_load_cached(self, device):
+        wp.load_module(integrate_particles.module, device=self.device)
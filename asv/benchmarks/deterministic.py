@@ -11,6 +11,8 @@ import numpy as np
 
 import warp as wp
 
+from .benchmarks_utils import get_benchmark_device
+
 DETERMINISTIC_BENCHMARK_SIZES = [64 * 1024, 256 * 1024, 1024 * 1024]
 DETERMINISM_SUPPORTED = hasattr(wp.config, "deterministic")
 DETERMINISTIC_BENCHMARK_MODES = ("normal", "deterministic")
@@ -110,8 +112,7 @@ class AtomicAddDeterminismOverhead:
         return vals_np, indices_np
 
     def setup(self, cache, mode, num_outputs, num_elements):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
 
         if mode == "deterministic" and not DETERMINISM_SUPPORTED:
             raise NotImplementedError("deterministic kernel options are not supported by this Warp version")
@@ -181,8 +182,7 @@ class AtomicCounterDeterminismOverhead:
         return {n: rng.random(n, dtype=np.float32) for n in DETERMINISTIC_BENCHMARK_SIZES}
 
     def setup(self, vals_np, mode, num_elements):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
 
         if mode == "deterministic" and not DETERMINISM_SUPPORTED:
             raise NotImplementedError("deterministic kernel options are not supported by this Warp version")
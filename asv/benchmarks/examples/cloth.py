@@ -17,6 +17,8 @@ import numpy as np
 
 import warp as wp
 
+from ..benchmarks_utils import get_benchmark_device
+
 
 @wp.kernel
 def eval_springs(
@@ -100,8 +102,7 @@ class Cloth:
     param_names = ["res"]
 
     def setup(self, res):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
         wp.load_module(device=self.device)
 
         lower = (0.0, 0.0, 0.0)
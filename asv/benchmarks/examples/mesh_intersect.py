@@ -22,7 +22,7 @@ from asv_runner.benchmarks.mark import skip_benchmark_if
 
 import warp as wp
 
-from ..benchmarks_utils import get_asset_directory
+from ..benchmarks_utils import get_asset_directory, get_benchmark_device
 
 pxr = importlib.util.find_spec("pxr")
 USD_AVAILABLE = pxr is not None
@@ -105,8 +105,7 @@ class MeshIntersect:
     number = 250
 
     def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
         wp.load_module(device=self.device)
 
         self.query_count = 1024
@@ -21,6 +21,8 @@ import warp.fem as fem
 import warp.sparse as wps
 from warp.examples.fem.utils import gen_tetmesh
 
+from ..benchmarks_utils import BENCHMARK_DEVICES, get_benchmark_device
+
 # ruff: noqa: RUF059
 
 
@@ -220,6 +222,8 @@ class FemCorotatedElasticity:
         if fn == "hessian_compressed" and self._compressed_hessian_output.status_sync() != 0:
             raise RuntimeError("Padded FEM Hessian assembly exceeded row capacity")
 
+        # graphs are only captured on CUDA devices, the CPU timings include launch overheads
+        self._use_graph = self._use_graph and self.device.is_cuda
         if self._use_graph:
             with wp.ScopedCapture() as capture:
                 integrate_fn()
@@ -354,21 +358,20 @@ class FemCorotatedElasticityQuadraticTetmesh(FemCorotatedElasticity):
     repeat = 5
     number = 15
 
-    params = (["energy", "forces", "hessian", "hessian_compressed"], ["dispatch"])
-    param_names = ["fn", "assembly"]
+    params = (["energy", "forces", "hessian", "hessian_compressed"], ["dispatch"], BENCHMARK_DEVICES)
+    param_names = ["fn", "assembly", "device"]
 
-    def setup(self, fn: str, assembly: str):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, fn: str, assembly: str, device: str):
+        self.device = get_benchmark_device(device)
 
-        res = 16
+        res = 16 if self.device.is_cuda else 4
         with wp.ScopedDevice(self.device):
             pos, cells = gen_tetmesh(res=(res, res, res))
             geo = fem.Tetmesh(cells, pos)
             space = fem.make_polynomial_space(geo, degree=2, dtype=wp.vec3)
             self.make_integrate_func(space, fn, assembly)
 
-    def time_cuda(self, fn, assembly):
+    def time_integrate(self, fn, assembly, device):
         self.run(fn)
 
 
@@ -378,20 +381,19 @@ class FemCorotatedElasticityLinearGrid(FemCorotatedElasticity):
     repeat = 5
     number = 15
 
-    params = (["energy", "forces", "hessian", "hessian_compressed"], ["generic", "dispatch"])
-    param_names = ["fn", "assembly"]
+    params = (["energy", "forces", "hessian", "hessian_compressed"], ["generic", "dispatch"], BENCHMARK_DEVICES)
+    param_names = ["fn", "assembly", "device"]
 
-    def setup(self, fn: str, assembly: str):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, fn: str, assembly: str, device: str):
+        self.device = get_benchmark_device(device)
 
-        res = 32
+        res = 32 if self.device.is_cuda else 6
         with wp.ScopedDevice(self.device):
             geo = fem.Grid3D(res=(res, res, res))
             space = fem.make_polynomial_space(geo, degree=1, dtype=wp.vec3)
             self.make_integrate_func(space, fn, assembly)
 
-    def time_cuda(self, fn, assembly):
+    def time_integrate(self, fn, assembly, device):
         self.run(fn)
 
 
@@ -401,81 +403,77 @@ class FemCorotatedElasticityVeryHighOrder(FemCorotatedElasticity):
     repeat = 15
     number = 50
 
-    params = (["energy", "forces", "hessian", "hessian_compressed"], ["dispatch"])
-    param_names = ["fn", "assembly"]
+    params = (["energy", "forces", "hessian", "hessian_compressed"], ["dispatch"], BENCHMARK_DEVICES)
+    param_names = ["fn", "assembly", "device"]
 
-    def setup(self, fn: str, assembly: str):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, fn: str, assembly: str, device: str):
+        self.device = get_benchmark_device(device)
 
-        res = 2
+        res = 2 if self.device.is_cuda else 1
         with wp.ScopedDevice(self.device):
             geo = fem.Grid3D(res=(res, res, res))
             space = fem.make_polynomial_space(geo, degree=4, dtype=wp.vec3)
             self.make_integrate_func(space, fn, assembly)
 
-    def time_cuda(self, fn, assembly):
+    def time_integrate(self, fn, assembly, device):
         self.run(fn)
 
 
 class FemCorotatedElasticitySparseAssemblyQuadraticTetmesh(FemCorotatedElasticitySparseAssembly):
     """Test post-dispatch sparse assembly for quadratic tetrahedral elements."""
 
-    params = (["hessian", "hessian_compressed"], ["dispatch"])
-    param_names = ["fn", "assembly"]
+    params = (["hessian", "hessian_compressed"], ["dispatch"], BENCHMARK_DEVICES)
+    param_names = ["fn", "assembly", "device"]
 
-    def setup(self, fn: str, assembly: str):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, fn: str, assembly: str, device: str):
+        self.device = get_benchmark_device(device)
 
-        res = 16
+        res = 16 if self.device.is_cuda else 4
         with wp.ScopedDevice(self.device):
             pos, cells = gen_tetmesh(res=(res, res, res))
             geo = fem.Tetmesh(cells, pos)
             space = fem.make_polynomial_space(geo, degree=2, dtype=wp.vec3)
             self.make_sparse_assembly_func(space, fn, assembly)
 
-    def time_cuda(self, fn, assembly):
+    def time_sparse_assembly(self, fn, assembly, device):
         self.run()
 
 
 class FemCorotatedElasticitySparseAssemblyLinearGrid(FemCorotatedElasticitySparseAssembly):
     """Test post-dispatch sparse assembly for linear grid elements."""
 
-    params = (["hessian", "hessian_compressed"], ["generic", "dispatch"])
-    param_names = ["fn", "assembly"]
+    params = (["hessian", "hessian_compressed"], ["generic", "dispatch"], BENCHMARK_DEVICES)
+    param_names = ["fn", "assembly", "device"]
 
-    def setup(self, fn: str, assembly: str):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, fn: str, assembly: str, device: str):
+        self.device = get_benchmark_device(device)
 
-        res = 32
+        res = 32 if self.device.is_cuda else 6
         with wp.ScopedDevice(self.device):
             geo = fem.Grid3D(res=(res, res, res))
             space = fem.make_polynomial_space(geo, degree=1, dtype=wp.vec3)
             self.make_sparse_assembly_func(space, fn, assembly)
 
-    def time_cuda(self, fn, assembly):
+    def time_sparse_assembly(self, fn, assembly, device):
         self.run()
 
 
 class FemCorotatedElasticitySparseAssemblyVeryHighOrder(FemCorotatedElasticitySparseAssembly):
     """Test post-dispatch sparse assembly for high order elements."""
 
-    params = (["hessian", "hessian_compressed"], ["dispatch"])
-    param_names = ["fn", "assembly"]
+    params = (["hessian", "hessian_compressed"], ["dispatch"], BENCHMARK_DEVICES)
+    param_names = ["fn", "assembly", "device"]
 
-    def setup(self, fn: str, assembly: str):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, fn: str, assembly: str, device: str):
+        self.device = get_benchmark_device(device)
 
-        res = 2
+        res = 2 if self.device.is_cuda else 1
         with wp.ScopedDevice(self.device):
             geo = fem.Grid3D(res=(res, res, res))
             space = fem.make_polynomial_space(geo, degree=4, dtype=wp.vec3)
             self.make_sparse_assembly_func(space, fn, assembly)
 
-    def time_cuda(self, fn, assembly):
+    def time_sparse_assembly(self, fn, assembly, device):
         self.run()
 
 
@@ -489,7 +487,7 @@ if __name__ == "__main__":
 
         for fn in case.params[0]:
             for asm in case.params[1]:
-                case.setup(fn, asm)
+                case.setup(fn, asm, "cuda:0")
                 for _k in range(3):
                     with wp.ScopedTimer(f"{cases[1]}_{fn}_{asm}", synchronize=True):
-                        case.time_cuda(fn, asm)
+                        case.time_integrate(fn, asm, "cuda:0")
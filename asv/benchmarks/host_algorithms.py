@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for the host implementations of the built-in array algorithms.
+
+Each benchmark is parameterized over ``warp.config.cpu_max_threads`` so the
+serial path (1) can be compared against the multi-threaded path (0, all
+hardware threads).
+"""
+
+import numpy as np
+
+import warp as wp
+
+NUM_ELEMENTS = 4 * 1024 * 1024
+
+
+class _HostAlgorithmBenchmark:
+    params = [1, 0]
+    param_names = ["cpu_max_threads"]
+
+    def setup(self, cpu_max_threads):
+        wp.init()
+        self.device = wp.get_device("cpu")
+        self.saved_cpu_max_threads = wp.config.cpu_max_threads
+        wp.config.cpu_max_threads = cpu_max_threads
+
+    def teardown(self, cpu_max_threads):
+        wp.config.cpu_max_threads = self.saved_cpu_max_threads
+
+
+class RadixSortPairs(_HostAlgorithmBenchmark):
+    """Benchmark wp.utils.radix_sort_pairs() on random keys."""
+
+    params = ([1, 0], ["int32", "float32", "int64"])
+    param_names = ["cpu_max_threads", "dtype"]
+
+    # sorting is in place, so every sample starts from freshly assigned keys
+    number = 1
+    repeat = 20
+
+    def setup(self, cpu_max_threads, dtype):
+        super().setup(cpu_max_threads)
+
+        rng = np.random.default_rng(42)
+        if dtype == "float32":
+            keys_np = rng.uniform(-1.0e6, 1.0e6, size=NUM_ELEMENTS).astype(np.float32)
+        else:
+            keys_np = rng.integers(-(2**30), 2**30, size=NUM_ELEMENTS, dtype=np.dtype(dtype))
+
+        self.keys = wp.zeros(2 * NUM_ELEMENTS, dtype=wp.dtype_from_numpy(keys_np.dtype), device=self.device)
+        self.values = wp.zeros(2 * NUM_ELEMENTS, dtype=int, device=self.device)
+        self.keys[:NUM_ELEMENTS].assign(keys_np)
+        self.values[:NUM_ELEMENTS].assign(np.arange(NUM_ELEMENTS, dtype=np.int32))
+
+    def teardown(self, cpu_max_threads, dtype):
+        super().teardown(cpu_max_threads)
+
+    def time_radix_sort_pairs(self, cpu_max_threads, dtype):
+        wp.utils.radix_sort_pairs(self.keys, self.values, NUM_ELEMENTS)
+
+
+class ArrayScan(_HostAlgorithmBenchmark):
+    """Benchmark an inclusive wp.utils.array_scan() on scalar and vector arrays."""
+
+    params = ([1, 0], ["int32", "float32", "vec3"])
+    param_names = ["cpu_max_threads", "dtype"]
+
+    number = 10
+
+    def setup(self, cpu_max_threads, dtype):
+        super().setup(cpu_max_threads)
+
+        wp_dtype = {"int32": wp.int32, "float32": wp.float32, "vec3": wp.vec3}[dtype]
+        self.values = wp.ones(NUM_ELEMENTS, dtype=wp_dtype, device=self.device)
+        self.result = wp.empty_like(self.values)
+
+    def teardown(self, cpu_max_threads, dtype):
+        super().teardown(cpu_max_threads)
+
+    def time_array_scan(self, cpu_max_threads, dtype):
+        wp.utils.array_scan(self.values, self.result, inclusive=True)
+
+
+class RunlengthEncode(_HostAlgorithmBenchmark):
+    """Benchmark wp.utils.runlength_encode() on sorted keys with short runs."""
+
+    number = 10
+
+    def setup(self, cpu_max_threads):
+        super().setup(cpu_max_threads)
+
+        rng = np.random.default_rng(42)
+        values_np = np.sort(rng.integers(0, NUM_ELEMENTS // 4, size=NUM_ELEMENTS, dtype=np.int32))
+
+        self.values = wp.array(values_np, dtype=int, device=self.device)
+        self.run_values = wp.empty_like(self.values)
+        self.run_lengths = wp.empty_like(self.values)
+        self.run_count = wp.empty(1, dtype=int, device=self.device)
+
+    def time_runlength_encode(self, cpu_max_threads):
+        wp.utils.runlength_encode(self.values, self.run_values, self.run_lengths, run_count=self.run_count)
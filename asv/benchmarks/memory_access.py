@@ -15,6 +15,8 @@
 
 import warp as wp
 
+from .benchmarks_utils import get_benchmark_device
+
 wp.set_module_options({"enable_backward": False})
 
 
@@ -44,8 +46,7 @@ class ArrayOfStructures:
     number = 100
 
     def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
         wp.load_module(device=self.device)
         self.test_array = wp.ones((N, N, N, NUM_COMPONENTS), dtype=float, device=self.device)
         self.cmd = wp.launch(kernel_aos, (N, N, N), inputs=[self.test_array], record_cmd=True, device=self.device)
@@ -64,8 +65,7 @@ class StructureOfArrays:
     number = 100
 
     def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
         wp.load_module(device=self.device)
         self.test_array = wp.ones((NUM_COMPONENTS, N, N, N), dtype=float, device=self.device)
         self.cmd = wp.launch(kernel_soa, (N, N, N), inputs=[self.test_array], record_cmd=True, device=self.device)
@@ -98,8 +98,7 @@ class LoadStoreIJ:
     number = 100
 
     def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
         wp.load_module(device=self.device)
         self.input_array = wp.ones((8192, 4096), dtype=float, device=self.device)
         self.output_array = wp.empty_like(self.input_array)
@@ -127,8 +126,7 @@ class LoadStoreJI:
     number = 100
 
     def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
         wp.load_module(device=self.device)
         self.input_array = wp.ones((8192, 4096), dtype=float, device=self.device)
         self.output_array = wp.empty_like(self.input_array)
@@ -148,3 +146,35 @@ class LoadStoreJI:
     def time_cuda(self):
         self.cmd.launch()
         wp.synchronize_device(self.device)
+
+
+def create_axpy_kernel(cpu_simd_width):
+    @wp.kernel(module="unique", module_options={"enable_backward": False, "cpu_simd_width": cpu_simd_width})
+    def kernel_axpy(a: float, x: wp.array(dtype=float), y: wp.array(dtype=float)):
+        i = wp.tid()
+        y[i] = a * x[i] + y[i]
+
+    return kernel_axpy
+
+
+class ElementwiseCpu:
+    """Benchmark for an elementwise CPU kernel with and without batched (SIMD) code generation."""
+
+    params = [0, 8, 16]
+    param_names = ["cpu_simd_width"]
+
+    number = 20
+
+    def setup(self, cpu_simd_width):
+        wp.init()
+        self.device = wp.get_device("cpu")
+        kernel = create_axpy_kernel(cpu_simd_width)
+        n = N * N * N
+        self.x = wp.ones(n, dtype=float, device=self.device)
+        self.y = wp.ones(n, dtype=float, device=self.device)
+        self.cmd = wp.launch(kernel, n, inputs=[1.00001, self.x, self.y], record_cmd=True, device=self.device)
+        # Warmup
+        self.cmd.launch()
+
+    def time_kernel(self, cpu_simd_width):
+        self.cmd.launch()
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for the gradient-based optimizers in warp.optim.
+
+The per-array :class:`warp.optim.Adam` loop issues one launch per parameter
+array, while :class:`warp.optim.FusedAdam` updates all of them with a single
+launch, so the gap grows with the number of (small) parameter arrays.
+"""
+
+import numpy as np
+
+import warp as wp
+import warp.optim
+
+ARRAY_SIZE = 1024
+
+
+class AdamStep:
+    params = (["loop", "fused"], [16, 256])
+    param_names = ["optimizer", "num_arrays"]
+
+    number = 20
+
+    def setup(self, optimizer, num_arrays):
+        wp.init()
+        self.device = wp.get_preferred_device()
+
+        rng = np.random.default_rng(42)
+        self.params = [
+            wp.array(rng.uniform(-1.0, 1.0, size=ARRAY_SIZE), dtype=float, device=self.device)
+            for _ in range(num_arrays)
+        ]
+        self.grads = [
+            wp.array(rng.uniform(-1.0, 1.0, size=ARRAY_SIZE), dtype=float, device=self.device)
+            for _ in range(num_arrays)
+        ]
+
+        if optimizer == "loop":
+            self.opt = warp.optim.Adam(self.params, lr=1.0e-3)
+        else:
+            self.opt = warp.optim.FusedAdam(self.params, lr=1.0e-3)
+
+        # load the kernels outside of the timed region
+        self.opt.step(self.grads)
+        wp.synchronize_device(self.device)
+
+    def time_step(self, optimizer, num_arrays):
+        self.opt.step(self.grads)
+        wp.synchronize_device(self.device)
@@ -21,6 +21,8 @@ import warp.fem as fem
 import warp.sparse as wps
 from warp.examples.fem.utils import gen_tetmesh
 
+from ..benchmarks_utils import BENCHMARK_DEVICES, get_benchmark_device
+
 
 @fem.integrand
 def grad_field(s: fem.Sample, u: fem.Field):
@@ -71,6 +73,8 @@ class BsrMMFemMatrix:
 
         self._run_impl(reuse_topology=False)
 
+        # graphs are only captured on CUDA devices, the CPU timings include launch overheads
+        self._use_graph = self._use_graph and self.device.is_cuda
         if self._use_graph:
             with wp.ScopedCapture() as capture:
                 self._run_impl(reuse_topology=True)
@@ -98,56 +102,62 @@ class BsrMMFemMatrix:
 class BsrMMQuadraticTetmeshMatrix(BsrMMFemMatrix):
     """Test BSR matrix-vector multiplication with quadratic tetrahedral elements."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 5
 
-    def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
 
-        res = 32
+        res = 32 if self.device.is_cuda else 12
         with wp.ScopedDevice(self.device):
             pos, cells = gen_tetmesh(res=(res, res, res))
             geo = fem.Tetmesh(cells, pos)
             space = fem.make_polynomial_space(geo, degree=2, dtype=wp.vec3)
             self.build_system(space)
 
-    def time_cuda(self):
+    def time_bsr_mm(self, device):
         self.run()
 
 
 class BsrMMLinearGridMatrix(BsrMMFemMatrix):
     """Test BSR matrix-vector multiplication with linear grid elements."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 5
 
-    def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
 
-        res = 64
+        res = 64 if self.device.is_cuda else 32
         with wp.ScopedDevice(self.device):
             geo = fem.Grid3D(res=(res, res, res))
             space = fem.make_polynomial_space(geo)
             self.build_system(space)
 
-    def time_cuda(self):
+    def time_bsr_mm(self, device):
         self.run()
 
 
 class BsrMMDeepDense(BsrMMFemMatrix):
     """Test BSR matrix-vector multiplication with almost dense matrices (high-order elements)."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 5
 
-    def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
 
         res = 1
         n_qp = 6000
@@ -164,7 +174,7 @@ class BsrMMDeepDense(BsrMMFemMatrix):
 
             self.build_system(space, quadrature=quadrature, block_shape=(9, 12))
 
-    def time_cuda(self):
+    def time_bsr_mm(self, device):
         self.run()
 
 
@@ -175,8 +185,8 @@ if __name__ == "__main__":
         # (BsrMMLinearGridMatrix, "linear_grid"),
     ):
         A = cases[0](use_graph=False)
-        A.setup()
+        A.setup("cuda:0")
 
         for _k in range(3):
             with wp.ScopedTimer(cases[1], synchronize=True):
-                A.time_cuda()
+                A.time_bsr_mm("cuda:0")
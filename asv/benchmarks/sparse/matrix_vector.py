@@ -13,11 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+
 import warp as wp
 import warp.fem as fem
 import warp.sparse as wps
 from warp.examples.fem.utils import gen_tetmesh
 
+from ..benchmarks_utils import BENCHMARK_DEVICES, get_benchmark_device
+
 
 @fem.integrand
 def diffusion_form_scalar(s: fem.Sample, u: fem.Field, v: fem.Field):
@@ -40,13 +44,19 @@ class BsrMvFemMatrix:
         v = fem.make_test(space)
 
         self._mat = fem.integrate(integrand, fields={"u": u, "v": v}, output_dtype=float)
+        self._prepare_system()
+
+    def _prepare_system(self):
         self._vec = wp.ones(shape=self._mat.shape[0], dtype=wp.float32)
         self._res = wp.zeros(shape=self._mat.shape[0], dtype=wp.float32)
 
-        self._mat.nnz_sync()
+        if isinstance(self._mat, wps.BsrMatrix):
+            self._mat.nnz_sync()
 
         self._run_impl()
 
+        # graphs are only captured on CUDA devices, the CPU timings include launch overheads
+        self._use_graph = self._use_graph and self.device.is_cuda
         if self._use_graph:
             with wp.ScopedCapture() as capture:
                 self._run_impl()
@@ -69,56 +79,62 @@ class BsrMvFemMatrix:
 class BsrMvQuadraticTetmeshMatrix(BsrMvFemMatrix):
     """Test BSR matrix-vector multiplication with quadratic tetrahedral elements."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 10  # Number of measurements to make between a single setup and teardown
 
-    def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
 
-        res = 32
+        res = 32 if self.device.is_cuda else 12
         with wp.ScopedDevice(self.device):
             pos, cells = gen_tetmesh(res=(res, res, res))
             geo = fem.Tetmesh(cells, pos)
             space = fem.make_polynomial_space(geo, degree=2, dtype=wp.vec3)
             self.build_system(space, diffusion_form_vector)
 
-    def time_cuda(self):
+    def time_bsr_mv(self, device):
         self.run()
 
 
 class BsrMvLinearGridMatrix(BsrMvFemMatrix):
     """Test BSR matrix-vector multiplication with linear grid elements."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 10  # Number of measurements to make between a single setup and teardown
 
-    def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
 
-        res = 64
+        res = 64 if self.device.is_cuda else 32
         with wp.ScopedDevice(self.device):
             geo = fem.Grid3D(res=(res, res, res))
             space = fem.make_polynomial_space(geo)
             self.build_system(space, diffusion_form_scalar)
 
-    def time_cuda(self):
+    def time_bsr_mv(self, device):
         self.run()
 
 
 class BsrMvAlmostDense(BsrMvFemMatrix):
     """Test BSR matrix-vector multiplication with almost dense matrices (high-order elements)."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 10  # Number of measurements to make between a single setup and teardown
 
-    def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
 
         res = 2
         with wp.ScopedDevice(self.device):
@@ -126,5 +142,50 @@ class BsrMvAlmostDense(BsrMvFemMatrix):
             space = fem.make_polynomial_space(geo, degree=4, dtype=wp.vec3)
             self.build_system(space, diffusion_form_vector)
 
-    def time_cuda(self):
+    def time_bsr_mv(self, device):
+        self.run()
+
+
+class BsrMvQuadraticTetmeshLayout(BsrMvFemMatrix):
+    """Compare BSR matrix-vector multiplication with reordered and sliced-ELL layouts.
+
+    The node numbering of the quadratic tetrahedral matrix is shuffled to emulate unstructured meshes.
+    """
+
+    params = (["shuffled", "rcm", "sell", "rcm_sell"], BENCHMARK_DEVICES)
+    param_names = ["layout", "device"]
+
+    rounds = 1
+    repeat = 2
+    number = 10  # Number of measurements to make between a single setup and teardown
+
+    def setup(self, layout, device):
+        if not hasattr(wps, "bsr_to_sell"):
+            raise NotImplementedError("Sparse reordering and sliced-ELL storage are not available")
+
+        self.device = get_benchmark_device(device)
+
+        res = 24 if self.device.is_cuda else 12
+        with wp.ScopedDevice(self.device):
+            pos, cells = gen_tetmesh(res=(res, res, res))
+            geo = fem.Tetmesh(cells, pos)
+            space = fem.make_polynomial_space(geo, degree=2, dtype=wp.vec3)
+            u = fem.make_trial(space)
+            v = fem.make_test(space)
+            mat = fem.integrate(diffusion_form_vector, fields={"u": u, "v": v}, output_dtype=float)
+
+            rng = np.random.default_rng(123)
+            mat = wps.bsr_permuted(mat, wp.array(rng.permutation(mat.nrow), dtype=int))
+            if layout in ("rcm", "rcm_sell"):
+                mat = wps.bsr_permuted(mat, wps.bsr_rcm_permutation(mat))
+            if layout in ("sell", "rcm_sell"):
+                mat = wps.bsr_to_sell(mat)
+
+            self._mat = mat
+            self._prepare_system()
+
+    def _run_impl(self):
+        wps.bsr_mv(self._mat, self._vec, self._res, alpha=1.0, beta=1.0)
+
+    def time_bsr_mv(self, layout, device):
         self.run()
@@ -8,6 +8,8 @@ import numpy as np
 import warp as wp
 import warp.sparse as wps
 
+from ..benchmarks_utils import BENCHMARK_DEVICES, get_benchmark_device
+
 
 def _require_row_capacity_support():
     probe = wps.bsr_zeros(0, 0, float)
@@ -81,14 +83,16 @@ def _make_duplicate_candidate_matrix(nrow: int, ncol: int, capacity_per_row: int
 class BsrMvGappedRows:
     """Test matrix-vector multiplication on a matrix with row-local slack capacity."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 20
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
         _require_row_capacity_support()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device(device)
 
         with wp.ScopedDevice(self.device):
             self._mat = _make_row_capacity_matrix(
@@ -104,7 +108,7 @@ class BsrMvGappedRows:
     def _run_impl(self):
         wps.bsr_mv(self._mat, self._x, self._y, alpha=1.0, beta=0.0)
 
-    def time_cuda(self):
+    def time_bsr_mv(self, device):
         self._run_impl()
         wp.synchronize_device(self.device)
 
@@ -112,15 +116,17 @@ class BsrMvGappedRows:
 class BsrCompressGappedRows:
     """Test compact export from row-local candidate storage with duplicate columns."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 5
     pool_size = 64
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
         _require_row_capacity_support()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device(device)
 
         with wp.ScopedDevice(self.device):
             self._src_template = _make_duplicate_candidate_matrix(32768, 32768, capacity_per_row=8, device=self.device)
@@ -138,7 +144,7 @@ class BsrCompressGappedRows:
         self._src_index += 1
         wps.bsr_compress(src)
 
-    def time_cuda(self):
+    def time_bsr_compress(self, device):
         self._run_impl()
         wp.synchronize_device(self.device)
 
@@ -146,14 +152,16 @@ class BsrCompressGappedRows:
 class BsrSetFromTripletsPaddedRows:
     """Test padded triplet construction from row-local duplicate candidates."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 5
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
         _require_row_capacity_support()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device(device)
 
         nrow = 32768
         ncol = 32768
@@ -172,7 +180,7 @@ class BsrSetFromTripletsPaddedRows:
     def _run_impl(self):
         wps.bsr_set_from_triplets(self._dest, self._rows, self._columns, self._values, topology="padded")
 
-    def time_cuda(self):
+    def time_bsr_set_from_triplets(self, device):
         self._run_impl()
         wp.synchronize_device(self.device)
 
@@ -180,14 +188,16 @@ class BsrSetFromTripletsPaddedRows:
 class BsrAxpyPaddedRows:
     """Test padded topology insertion into existing row capacity."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 5
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
         _require_row_capacity_support()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device(device)
 
         with wp.ScopedDevice(self.device):
             self._x = _make_row_capacity_matrix(32768, 32768, active_per_row=4, capacity_per_row=4, device=self.device)
@@ -199,7 +209,7 @@ class BsrAxpyPaddedRows:
     def _run_impl(self):
         wps.bsr_axpy(self._x, self._y, alpha=1.0, beta=0.0, topology="padded")
 
-    def time_cuda(self):
+    def time_bsr_axpy(self, device):
         self._run_impl()
         wp.synchronize_device(self.device)
 
@@ -207,14 +217,16 @@ class BsrAxpyPaddedRows:
 class BsrSetFromTripletsPaddedWideRows:
     """Test padded triplet construction with wider row-local duplicate candidates."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 3
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
         _require_row_capacity_support()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device(device)
 
         nrow = 32768
         ncol = 32768
@@ -235,7 +247,7 @@ class BsrSetFromTripletsPaddedWideRows:
     def _run_impl(self):
         wps.bsr_set_from_triplets(self._dest, self._rows, self._columns, self._values, topology="padded")
 
-    def time_cuda(self):
+    def time_bsr_set_from_triplets(self, device):
         self._run_impl()
         wp.synchronize_device(self.device)
 
@@ -243,14 +255,16 @@ class BsrSetFromTripletsPaddedWideRows:
 class BsrAxpyPaddedMergeWideRows:
     """Test padded row-local merge into existing row capacity."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 5
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
         _require_row_capacity_support()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device(device)
 
         with wp.ScopedDevice(self.device):
             self._x = _make_row_capacity_matrix(
@@ -267,7 +281,7 @@ class BsrAxpyPaddedMergeWideRows:
     def _run_impl(self):
         wps.bsr_axpy(self._x, self._y, alpha=1.0, beta=1.0, topology="padded", work_arrays=self._work)
 
-    def time_cuda(self):
+    def time_bsr_axpy(self, device):
         self._run_impl()
         wp.synchronize_device(self.device)
 
@@ -275,14 +289,16 @@ class BsrAxpyPaddedMergeWideRows:
 class BsrSetTransposePaddedWideRows:
     """Test padded transpose into wider row-local capacity."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 3
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
         _require_row_capacity_support()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device(device)
 
         with wp.ScopedDevice(self.device):
             self._src = _make_row_capacity_matrix(
@@ -298,7 +314,7 @@ class BsrSetTransposePaddedWideRows:
     def _run_impl(self):
         wps.bsr_set_transpose(self._dest, self._src, topology="padded")
 
-    def time_cuda(self):
+    def time_bsr_set_transpose(self, device):
         self._run_impl()
         wp.synchronize_device(self.device)
 
@@ -306,14 +322,16 @@ class BsrSetTransposePaddedWideRows:
 class BsrMMPaddedWideRows:
     """Test padded matrix multiplication into wider row-local capacity."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     rounds = 1
     repeat = 2
     number = 3
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
         _require_row_capacity_support()
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device(device)
 
         with wp.ScopedDevice(self.device):
             self._x = _make_row_capacity_matrix(32768, 32768, active_per_row=8, capacity_per_row=8, device=self.device)
@@ -327,6 +345,6 @@ class BsrMMPaddedWideRows:
     def _run_impl(self):
         wps.bsr_mm(self._x, self._y, self._z, topology="padded", work_arrays=self._work)
 
-    def time_cuda(self):
+    def time_bsr_mm(self, device):
         self._run_impl()
         wp.synchronize_device(self.device)
@@ -24,7 +24,7 @@ from numpy.random import default_rng
 
 import warp as wp
 
-from .benchmarks_utils import get_asset_directory
+from .benchmarks_utils import BENCHMARK_DEVICES, get_asset_directory, get_benchmark_device
 
 pxr = importlib.util.find_spec("pxr")
 USD_AVAILABLE = pxr is not None
@@ -649,3 +649,273 @@ class BvhRayQuery:
     def time_mesh_ray_vs_aabb_query(self, resolution, leaf_size, device, bvh_constructor):
         wp.capture_launch(self.cuda_graph_mesh_ray_vs_aabb)
         wp.synchronize_device()
+
+
+# The following benchmarks use procedural geometry so that they run on any device without USD.
+
+
+def _make_sphere_mesh(segments: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the points and triangle indices of a UV sphere with ``2 * segments * segments`` triangles."""
+
+    theta = np.linspace(0.0, np.pi, segments + 1)
+    phi = np.linspace(0.0, 2.0 * np.pi, segments + 1)
+    theta, phi = np.meshgrid(theta, phi, indexing="ij")
+    points = np.stack((np.sin(theta) * np.cos(phi), np.cos(theta), np.sin(theta) * np.sin(phi)), axis=-1)
+
+    vertex = np.arange((segments + 1) * (segments + 1)).reshape(segments + 1, segments + 1)
+    v00 = vertex[:-1, :-1].flatten()
+    v01 = vertex[:-1, 1:].flatten()
+    v10 = vertex[1:, :-1].flatten()
+    v11 = vertex[1:, 1:].flatten()
+    indices = np.stack((np.stack((v00, v10, v11), axis=-1), np.stack((v00, v11, v01), axis=-1)), axis=1)
+
+    return points.reshape(-1, 3).astype(np.float32), indices.flatten().astype(np.int32)
+
+
+def _default_bvh_constructor(device) -> str:
+    return "lbvh" if device.is_cuda else "sah"
+
+
+@wp.kernel
+def bvh_query_aabb_count(
+    bvh: wp.uint64,
+    lowers: wp.array(dtype=wp.vec3),
+    uppers: wp.array(dtype=wp.vec3),
+    counts: wp.array(dtype=int),
+):
+    tid = wp.tid()
+    query = wp.bvh_query_aabb(bvh, lowers[tid], uppers[tid])
+
+    index = int(0)
+    count = int(0)
+    while wp.bvh_query_next(query, index):
+        count += 1
+
+    counts[tid] = count
+
+
+@wp.kernel
+def bvh_query_ray_count(
+    bvh: wp.uint64,
+    starts: wp.array(dtype=wp.vec3),
+    dirs: wp.array(dtype=wp.vec3),
+    counts: wp.array(dtype=int),
+):
+    tid = wp.tid()
+    query = wp.bvh_query_ray(bvh, starts[tid], dirs[tid])
+
+    index = int(0)
+    count = int(0)
+    while wp.bvh_query_next(query, index):
+        count += 1
+
+    counts[tid] = count
+
+
+class BvhQueryRandomBoxes:
+    """Benchmark BVH box and ray queries against random boxes."""
+
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
+    number = 5
+
+    num_items = 100000
+    num_queries = 32768
+
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
+        wp.load_module(device=self.device)
+
+        rng = default_rng(42)
+        centers = rng.uniform(-10.0, 10.0, size=(self.num_items, 3)).astype(np.float32)
+        extents = rng.uniform(0.01, 0.1, size=(self.num_items, 3)).astype(np.float32)
+        lowers = wp.array(centers - extents, dtype=wp.vec3, device=self.device)
+        uppers = wp.array(centers + extents, dtype=wp.vec3, device=self.device)
+        self.bvh = wp.Bvh(lowers, uppers, constructor=_default_bvh_constructor(self.device))
+
+        query_centers = rng.uniform(-10.0, 10.0, size=(self.num_queries, 3)).astype(np.float32)
+        self.query_lowers = wp.array(query_centers - 0.2, dtype=wp.vec3, device=self.device)
+        self.query_uppers = wp.array(query_centers + 0.2, dtype=wp.vec3, device=self.device)
+
+        dirs = rng.normal(size=(self.num_queries, 3)).astype(np.float32)
+        dirs /= np.linalg.norm(dirs, axis=1, keepdims=True)
+        self.ray_starts = wp.array(query_centers, dtype=wp.vec3, device=self.device)
+        self.ray_dirs = wp.array(dirs, dtype=wp.vec3, device=self.device)
+
+        self.counts = wp.zeros(self.num_queries, dtype=int, device=self.device)
+
+        self.cmd_aabb = wp.launch(
+            bvh_query_aabb_count,
+            dim=self.num_queries,
+            inputs=[self.bvh.id, self.query_lowers, self.query_uppers, self.counts],
+            device=self.device,
+            record_cmd=True,
+        )
+        self.cmd_ray = wp.launch(
+            bvh_query_ray_count,
+            dim=self.num_queries,
+            inputs=[self.bvh.id, self.ray_starts, self.ray_dirs, self.counts],
+            device=self.device,
+            record_cmd=True,
+        )
+
+        # Warmup
+        self.cmd_aabb.launch()
+        self.cmd_ray.launch()
+        wp.synchronize_device(self.device)
+
+    def time_bvh_query_aabb(self, device):
+        self.cmd_aabb.launch()
+        wp.synchronize_device(self.device)
+
+    def time_bvh_query_ray(self, device):
+        self.cmd_ray.launch()
+        wp.synchronize_device(self.device)
+
+
+@wp.kernel
+def mesh_query_ray_hit(
+    mesh: wp.uint64,
+    starts: wp.array(dtype=wp.vec3),
+    dirs: wp.array(dtype=wp.vec3),
+    hits: wp.array(dtype=wp.vec3),
+):
+    tid = wp.tid()
+    query = wp.mesh_query_ray(mesh, starts[tid], dirs[tid], 1.0e6)
+
+    if query.result:
+        hits[tid] = wp.vec3(float(query.face), query.u, query.v)
+
+
+class MeshQuerySphere:
+    """Benchmark mesh closest-point and ray queries against a procedural sphere."""
+
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
+    number = 5
+
+    segments = 128
+    num_queries = 32768
+
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
+        wp.load_module(device=self.device)
+
+        points, indices = _make_sphere_mesh(self.segments)
+        self.mesh = wp.Mesh(
+            points=wp.array(points, dtype=wp.vec3, device=self.device),
+            indices=wp.array(indices, dtype=int, device=self.device),
+            bvh_constructor=_default_bvh_constructor(self.device),
+        )
+
+        rng = default_rng(42)
+        query_points = rng.uniform(-1.5, 1.5, size=(self.num_queries, 3)).astype(np.float32)
+        self.query_points = wp.array(query_points, dtype=wp.vec3, device=self.device)
+
+        # rays start outside the sphere and aim at random points inside it
+        starts = rng.normal(size=(self.num_queries, 3)).astype(np.float32)
+        starts *= 3.0 / np.linalg.norm(starts, axis=1, keepdims=True)
+        dirs = 0.5 * query_points - starts
+        dirs /= np.linalg.norm(dirs, axis=1, keepdims=True)
+        self.ray_starts = wp.array(starts, dtype=wp.vec3, device=self.device)
+        self.ray_dirs = wp.array(dirs, dtype=wp.vec3, device=self.device)
+
+        self.results = wp.empty_like(self.query_points)
+
+        self.cmd_point = wp.launch(
+            sample_mesh_query_no_sign,
+            dim=self.num_queries,
+            inputs=[self.mesh.id, self.query_points, 1.0e7, self.results],
+            device=self.device,
+            record_cmd=True,
+        )
+        self.cmd_ray = wp.launch(
+            mesh_query_ray_hit,
+            dim=self.num_queries,
+            inputs=[self.mesh.id, self.ray_starts, self.ray_dirs, self.results],
+            device=self.device,
+            record_cmd=True,
+        )
+
+        # Warmup
+        self.cmd_point.launch()
+        self.cmd_ray.launch()
+        wp.synchronize_device(self.device)
+
+    def time_mesh_query_closest_point(self, device):
+        self.cmd_point.launch()
+        wp.synchronize_device(self.device)
+
+    def time_mesh_query_ray(self, device):
+        self.cmd_ray.launch()
+        wp.synchronize_device(self.device)
+
+    def time_mesh_refit(self, device):
+        self.mesh.refit()
+        wp.synchronize_device(self.device)
+
+
+@wp.kernel
+def hash_grid_count_neighbors(
+    grid: wp.uint64,
+    points: wp.array(dtype=wp.vec3),
+    radius: float,
+    counts: wp.array(dtype=int),
+):
+    tid = wp.tid()
+    p = points[tid]
+
+    query = wp.hash_grid_query(grid, p, radius)
+    index = int(0)
+    count = int(0)
+    while wp.hash_grid_query_next(query, index):
+        if wp.length(points[index] - p) <= radius:
+            count += 1
+
+    counts[tid] = count
+
+
+class HashGridQuery:
+    """Benchmark hash grid construction and neighbor queries on random points."""
+
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
+    number = 5
+
+    num_points = 100000
+    radius = 0.05
+
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
+        wp.load_module(device=self.device)
+
+        rng = default_rng(42)
+        points = rng.uniform(0.0, 1.0, size=(self.num_points, 3)).astype(np.float32)
+        self.points = wp.array(points, dtype=wp.vec3, device=self.device)
+        self.counts = wp.zeros(self.num_points, dtype=int, device=self.device)
+
+        self.grid = wp.HashGrid(128, 128, 128, device=self.device)
+        self.grid.build(self.points, self.radius)
+
+        self.cmd_query = wp.launch(
+            hash_grid_count_neighbors,
+            dim=self.num_points,
+            inputs=[self.grid.id, self.points, self.radius, self.counts],
+            device=self.device,
+            record_cmd=True,
+        )
+
+        # Warmup
+        self.cmd_query.launch()
+        wp.synchronize_device(self.device)
+
+    def time_hash_grid_build(self, device):
+        self.grid.build(self.points, self.radius)
+        wp.synchronize_device(self.device)
+
+    def time_hash_grid_query(self, device):
+        self.cmd_query.launch()
+        wp.synchronize_device(self.device)
@@ -17,6 +17,8 @@ import numpy as np
 
 import warp as wp
 
+from ..benchmarks_utils import BENCHMARK_DEVICES, get_benchmark_device
+
 
 @wp.kernel
 def array_sum_simt(
@@ -53,14 +55,16 @@ def array_sum_tile(
 class ArraySumSimt:
     """Atomically adds all array values using wp.atomic_add from all threads."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     number = 100
 
-    def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
         wp.load_module(device=self.device)
 
-        shape = (4096, 4096)
+        shape = (4096, 4096) if self.device.is_cuda else (1024, 1024)
 
         rng = np.random.default_rng(42)
 
@@ -79,7 +83,7 @@ class ArraySumSimt:
         self.cmd.launch()
         wp.synchronize_device(self.device)
 
-    def time_cuda(self):
+    def time_array_sum(self, device):
         self.cmd.launch()
         wp.synchronize_device(self.device)
 
@@ -87,14 +91,16 @@ class ArraySumSimt:
 class ArraySumTile:
     """Atomically adds all array values using wp.tile_atomic_add with intermediate tile sum."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     number = 100
 
-    def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
         wp.load_module(device=self.device)
 
-        shape = (4096, 4096)
+        shape = (4096, 4096) if self.device.is_cuda else (1024, 1024)
 
         rng = np.random.default_rng(42)
 
@@ -114,6 +120,6 @@ class ArraySumTile:
 
         wp.synchronize_device(self.device)
 
-    def time_cuda(self):
+    def time_array_sum(self, device):
         self.cmd.launch()
         wp.synchronize_device(self.device)
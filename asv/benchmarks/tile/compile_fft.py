@@ -17,7 +17,7 @@
 
 import warp as wp
 
-from ..benchmarks_utils import clear_kernel_cache
+from ..benchmarks_utils import clear_kernel_cache, get_benchmark_device
 
 wp.set_module_options({"enable_backward": False, "block_dim": 8})
 
@@ -41,7 +41,7 @@ class ColdCompileFftLTO:
     number = 1  # Number of measurements to make between a single setup and teardown
 
     def setup(self):
-        wp.init()
+        get_benchmark_device("cuda:0")
         clear_kernel_cache()
         wp.clear_lto_cache()
 
@@ -59,7 +59,7 @@ class WarmCompileFftLTO:
     number = 10  # Number of measurements to make between a single setup and teardown
 
     def setup(self):
-        wp.init()
+        get_benchmark_device("cuda:0")
         clear_kernel_cache()
         wp.clear_lto_cache()
         wp.load_module(device="cuda:0")
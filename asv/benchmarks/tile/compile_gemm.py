@@ -15,7 +15,7 @@
 
 import warp as wp
 
-from ..benchmarks_utils import clear_kernel_cache
+from ..benchmarks_utils import clear_kernel_cache, get_benchmark_device
 
 wp.set_module_options({"enable_backward": False, "block_dim": 64})
 
@@ -56,7 +56,7 @@ class ColdCompileGemmLTO:
     timeout = 120.0
 
     def setup(self):
-        wp.init()
+        get_benchmark_device("cuda:0")
         clear_kernel_cache()
         wp.clear_lto_cache()
 
@@ -75,7 +75,7 @@ class WarmCompileGemmLTO:
     timeout = 120.0
 
     def setup(self):
-        wp.init()
+        get_benchmark_device("cuda:0")
         clear_kernel_cache()
         wp.clear_lto_cache()
         wp.load_module(device="cuda:0")
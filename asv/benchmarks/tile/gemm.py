@@ -14,9 +14,12 @@
 # limitations under the License.
 
 import numpy as np
+from asv_runner.benchmarks.mark import skip_for_params
 
 import warp as wp
 
+from ..benchmarks_utils import BENCHMARK_DEVICES, get_benchmark_device
+
 
 def create_mlp_kernel(m, n, k):
     TILE_M = m
@@ -40,9 +43,11 @@ def create_mlp_kernel(m, n, k):
 class Gemm256:
     """Benchmark performance of M=N=K=256 GEMM."""
 
-    def setup(self):
-        wp.init()
-        self.device = wp.get_device("cuda:0")
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
+    def setup(self, device):
+        self.device = get_benchmark_device(device)
 
         # Parameters found by auto-tuning for a 256x256 GEMM
         self.tile_m = 16
@@ -70,7 +75,7 @@ class Gemm256:
         self.cmd.launch()
         wp.synchronize_device(self.device)
 
-    def time_cuda(self):
+    def time_gemm(self, device):
         self.cmd.launch()
         wp.synchronize_device(self.device)
 
@@ -78,12 +83,14 @@ class Gemm256:
 class Gemm1024:
     """Benchmark performance of M=N=K=1024 GEMM."""
 
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     number = 1000
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
         wp.set_module_options({"fast_math": True, "enable_backward": False})
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device(device)
 
         self.tile_m = 64
         self.tile_n = 64
@@ -112,6 +119,8 @@ class Gemm1024:
 
         wp.synchronize_device(self.device)
 
-    def time_cuda(self):
+    # too slow to be sampled 1000 times on the CPU
+    @skip_for_params([("cpu",)])
+    def time_gemm(self, device):
         self.cmd.launch()
         wp.synchronize_device(self.device)
@@ -12,6 +12,8 @@ import numpy as np
 
 import warp as wp
 
+from ..benchmarks_utils import get_benchmark_device
+
 _DTYPE_MAP = {
     "float32": wp.float32,
     "mat33": wp.mat33,
@@ -42,9 +44,8 @@ class LoadStoreCoalesced:
     param_names = ["tile_size", "dtype"]
 
     def setup(self, tile_size, dtype_name):
-        wp.init()
         wp.set_module_options({"fast_math": True, "enable_backward": False})
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
         wp.load_module(device=self.device)
 
         dtype = _DTYPE_MAP[dtype_name]
@@ -7,6 +7,8 @@ import numpy as np
 
 import warp as wp
 
+from ..benchmarks_utils import get_benchmark_device
+
 
 def _create_kernel_1d(tile_dim, dtype):
     TILE = tile_dim
@@ -61,9 +63,8 @@ class LoadStoreRegister:
     param_names = ["ndim", "dtype"]
 
     def setup(self, ndim, dtype_name):
-        wp.init()
         wp.set_module_options({"fast_math": True, "enable_backward": False})
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
         wp.load_module(device=self.device)
 
         dtype = _DTYPE_MAP[dtype_name]
@@ -12,6 +12,8 @@ import numpy as np
 
 import warp as wp
 
+from ..benchmarks_utils import get_benchmark_device
+
 # Non-POT tile sizes that are NOT float4-aligned for float32 (last_dim * 4 % 16 != 0)
 _TILE_DIMS = {1: 17, 2: 17, 3: 7}
 
@@ -67,9 +69,8 @@ class LoadStoreScalar:
     param_names = ["ndim", "dtype"]
 
     def setup(self, ndim, dtype_name):
-        wp.init()
         wp.set_module_options({"fast_math": True, "enable_backward": False})
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
         wp.load_module(device=self.device)
 
         dtype = _DTYPE_MAP[dtype_name]
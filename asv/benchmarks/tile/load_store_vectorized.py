@@ -12,6 +12,8 @@ import numpy as np
 
 import warp as wp
 
+from ..benchmarks_utils import get_benchmark_device
+
 
 def _create_kernel_2d(tile_dim, dtype):
     TILE = tile_dim
@@ -71,9 +73,8 @@ class LoadStoreVectorized:
     param_names = ["size", "ndim", "dtype"]
 
     def setup(self, size, ndim, dtype_name):
-        wp.init()
         wp.set_module_options({"fast_math": True, "enable_backward": False})
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
         wp.load_module(device=self.device)
 
         dtype = _DTYPE_MAP[dtype_name]
@@ -11,6 +11,8 @@ and ``tile_empty`` skips, so the measured delta attributes that cost.
 
 import warp as wp
 
+from ..benchmarks_utils import get_benchmark_device
+
 # Output edge size in float32 elements. Each kernel launches a (EDGE / tile_dim)^2
 # grid of blocks so the total store volume is constant across tile sizes (16 MiB).
 _OUTPUT_EDGE = 2048
@@ -53,9 +55,8 @@ class TileZerosSharedStore:
     param_names = ["tile_dim"]
 
     def setup(self, tile_dim):
-        wp.init()
         wp.set_module_options({"fast_math": True, "enable_backward": False})
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
         wp.load_module(device=self.device)
 
         kernel = _create_zeros_kernel(tile_dim)
@@ -101,7 +102,7 @@ class TileEmptySharedStore:
         if "tile_empty" not in builtin_functions:
             raise NotImplementedError("wp.tile_empty is not available in this Warp build")
         wp.set_module_options({"fast_math": True, "enable_backward": False})
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device("cuda:0")
         wp.load_module(device=self.device)
 
         kernel = _create_empty_kernel(tile_dim)
@@ -17,6 +17,8 @@ import numpy as np
 
 import warp as wp
 
+from ..benchmarks_utils import BENCHMARK_DEVICES, get_benchmark_device
+
 DT = wp.constant(0.01)
 SOFTENING_SQ = wp.constant(0.1**2)  # Softening factor for numerical stability
 TILE_SIZE = wp.constant(64)
@@ -90,15 +92,18 @@ def integrate_bodies_simt(
 
 
 class TileNBody:
+    params = BENCHMARK_DEVICES
+    param_names = ["device"]
+
     number = 10  # Number of measurements to make between a single setup and teardown
 
-    def setup(self):
-        wp.init()
+    def setup(self, device):
         wp.set_module_options({"fast_math": True, "enable_backward": False})
-        self.device = wp.get_device("cuda:0")
+        self.device = get_benchmark_device(device)
         wp.load_module(device=self.device)
 
-        self.num_bodies = 65536
+        # the all-pairs interactions are quadratic in the number of bodies
+        self.num_bodies = 65536 if self.device.is_cuda else 4096
 
         rng = np.random.default_rng(42)
 
@@ -112,9 +117,9 @@ class TileNBody:
 
         init_pos_np = np.stack((x, y, z), axis=1)
 
-        self.pos_array_0 = wp.array(init_pos_np, dtype=wp.vec3)
+        self.pos_array_0 = wp.array(init_pos_np, dtype=wp.vec3, device=self.device)
         self.pos_array_1 = wp.empty_like(self.pos_array_0)
-        self.vel_array = wp.zeros(self.num_bodies, dtype=wp.vec3)
+        self.vel_array = wp.zeros(self.num_bodies, dtype=wp.vec3, device=self.device)
 
         self.tile_cmd = wp.launch(
             integrate_bodies_tiled,
@@ -133,10 +138,10 @@ class TileNBody:
             record_cmd=True,
         )
 
-    def time_tile(self):
+    def time_tile(self, device):
         self.tile_cmd.launch()
         wp.synchronize_device(self.device)
 
-    def time_simt(self):
+    def time_simt(self, device):
         self.simt_cmd.launch()
         wp.synchronize_device(self.device)
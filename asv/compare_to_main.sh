@@ -1,4 +1,36 @@
 #!/bin/bash
-set -e
+# Compare the benchmarks of the current commit against main.
+#
+# Exits with a non-zero status if any benchmark regressed by more than the
+# allowed factor. Compilation benchmarks are noisier than runtime benchmarks
+# and are compared with a separate, looser factor.
+#
+# Environment variables:
+#   ASV_FACTOR          Allowed slowdown for runtime benchmarks (default: 1.10)
+#   ASV_COMPILE_FACTOR  Allowed slowdown for compilation benchmarks (default: 1.25)
+#   ASV_BENCH           Optional regex restricting the benchmarks to run
 
-asv continuous --append-samples --interleave-rounds --no-only-changed main $(git rev-parse HEAD 2>/dev/null)
+ASV_FACTOR=${ASV_FACTOR:-1.10}
+ASV_COMPILE_FACTOR=${ASV_COMPILE_FACTOR:-1.25}
+
+COMPILE_BENCHMARKS='codegen\.|tile\.compile_'
+BENCH_FILTER=""
+if [ -n "${ASV_BENCH}" ]; then
+    BENCH_FILTER="(?=.*(${ASV_BENCH}))"
+fi
+
+HEAD_COMMIT=$(git rev-parse HEAD 2>/dev/null)
+
+status=0
+
+asv continuous --append-samples --interleave-rounds --no-only-changed \
+    --factor "${ASV_FACTOR}" \
+    --bench "^(?!${COMPILE_BENCHMARKS})${BENCH_FILTER}" \
+    main "${HEAD_COMMIT}" || status=1
+
+asv continuous --append-samples --interleave-rounds --no-only-changed \
+    --factor "${ASV_COMPILE_FACTOR}" \
+    --bench "^(?=${COMPILE_BENCHMARKS})${BENCH_FILTER}" \
+    main "${HEAD_COMMIT}" || status=1
+
+exit ${status}
@@ -291,6 +291,7 @@ from warp._src.context import is_cuda_available as is_cuda_available
 
 from warp._src.build import clear_kernel_cache as clear_kernel_cache
 from warp._src.build import clear_lto_cache as clear_lto_cache
+from warp._src.build import prune_kernel_cache as prune_kernel_cache
 
 from warp._src.context import print_diagnostics as print_diagnostics
 
@@ -315,6 +316,7 @@ from warp._src.context import overload as overload
 from warp._src.types import constant as constant
 from warp._src.types import address_of as address_of
 from warp._src.utils import map as map
+from warp._src.utils import ArrayExpression as ArrayExpression
 from warp._src.builtins import static as static
 
 
@@ -334,6 +336,8 @@ from warp._src.context import synchronize as synchronize
 # category: Automatic Differentiation
 
 from warp._src.tape import Tape as Tape
+from warp._src.tape import checkpoint as checkpoint
+from warp._src.tape import checkpoint_loop as checkpoint_loop
 
 
 # category: Device Management
@@ -461,6 +465,7 @@ from warp._src.utils import TimingResult as TimingResult
 from warp._src.utils import timing_begin as timing_begin
 from warp._src.utils import timing_end as timing_end
 from warp._src.utils import timing_print as timing_print
+from warp._src.utils import timing_to_chrome_trace as timing_to_chrome_trace
 
 
 from warp._src.utils import ScopedMemoryTracker as ScopedMemoryTracker
@@ -474,6 +479,7 @@ from warp._src.utils import TIMING_KERNEL_BUILTIN as TIMING_KERNEL_BUILTIN
 from warp._src.utils import TIMING_MEMCPY as TIMING_MEMCPY
 from warp._src.utils import TIMING_MEMSET as TIMING_MEMSET
 from warp._src.utils import TIMING_GRAPH as TIMING_GRAPH
+from warp._src.utils import TIMING_MODULE as TIMING_MODULE
 from warp._src.utils import TIMING_ALL as TIMING_ALL
 
 
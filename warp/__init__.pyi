@@ -91,6 +91,7 @@ from warp._src.context import is_cubql_available as is_cubql_available
 from warp._src.context import is_cuda_available as is_cuda_available
 from warp._src.build import clear_kernel_cache as clear_kernel_cache
 from warp._src.build import clear_lto_cache as clear_lto_cache
+from warp._src.build import prune_kernel_cache as prune_kernel_cache
 from warp._src.context import print_diagnostics as print_diagnostics
 from warp._src.codegen import WarpCodegenAttributeError as WarpCodegenAttributeError
 from warp._src.codegen import WarpCodegenError as WarpCodegenError
@@ -109,6 +110,7 @@ from warp._src.context import overload as overload
 from warp._src.types import constant as constant
 from warp._src.types import address_of as address_of
 from warp._src.utils import map as map
+from warp._src.utils import ArrayExpression as ArrayExpression
 from warp._src.builtins import static as static
 from warp._src.context import Kernel as Kernel
 from warp._src.context import Function as Function
@@ -119,6 +121,8 @@ from warp._src.context import launch_tiled as launch_tiled
 from warp._src.context import get_suggested_block_size as get_suggested_block_size
 from warp._src.context import synchronize as synchronize
 from warp._src.tape import Tape as Tape
+from warp._src.tape import checkpoint as checkpoint
+from warp._src.tape import checkpoint_loop as checkpoint_loop
 from warp._src.context import Device as Device
 from warp._src.utils import ScopedDevice as ScopedDevice
 from warp._src.context import is_device_available as is_device_available
@@ -197,6 +201,7 @@ from warp._src.utils import TimingResult as TimingResult
 from warp._src.utils import timing_begin as timing_begin
 from warp._src.utils import timing_end as timing_end
 from warp._src.utils import timing_print as timing_print
+from warp._src.utils import timing_to_chrome_trace as timing_to_chrome_trace
 from warp._src.utils import ScopedMemoryTracker as ScopedMemoryTracker
 from warp._src.context import print_memory_report as print_memory_report
 from warp._src.utils import TIMING_KERNEL as TIMING_KERNEL
@@ -204,6 +209,7 @@ from warp._src.utils import TIMING_KERNEL_BUILTIN as TIMING_KERNEL_BUILTIN
 from warp._src.utils import TIMING_MEMCPY as TIMING_MEMCPY
 from warp._src.utils import TIMING_MEMSET as TIMING_MEMSET
 from warp._src.utils import TIMING_GRAPH as TIMING_GRAPH
+from warp._src.utils import TIMING_MODULE as TIMING_MODULE
 from warp._src.utils import TIMING_ALL as TIMING_ALL
 from warp._src.context import cuda_profiler_start as cuda_profiler_start
 from warp._src.context import cuda_profiler_stop as cuda_profiler_stop
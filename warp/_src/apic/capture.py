@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 import warp._src.types
 from warp._src.apic.types import (
+    APIC_LAUNCH_FLAG_TRACKED_ACCESS,
     APIC_RELOC_DATA_PTR,
     APIC_RELOC_HANDLE,
     APIC_RELOC_NULL,
@@ -309,6 +310,47 @@ class APICapture:
                 raise NotImplementedError("APIC capture does not yet support wp.indexedfabricarray launch params")
             # Plain scalars / vec / mat / ctypes Arrays: no relocations.
 
+    @staticmethod
+    def _is_tracked_arg_type(arg_type) -> bool:
+        """Return whether all memory reachable through a kernel argument of this type is relocated.
+
+        Arrays, indexed arrays, and structs of them are described by ``APIC_RELOC_DATA_PTR``
+        relocations. ``uint64`` values (and arrays of them) may hold the ids of meshes, volumes,
+        or other objects the kernel dereferences, and handles refer to memory outside the
+        recorded regions, so they are not tracked.
+        """
+        import warp._src.codegen  # noqa: PLC0415
+
+        if warp._src.types.is_array(arg_type):
+            if not (
+                warp._src.types.matches_array_class(arg_type, warp._src.types.array)
+                or warp._src.types.matches_array_class(arg_type, warp._src.types.indexedarray)
+            ):
+                return False
+            return APICapture._is_tracked_arg_type(arg_type.dtype)
+
+        if isinstance(arg_type, warp._src.codegen.Struct):
+            return all(APICapture._is_tracked_arg_type(var.type) for var in arg_type.vars.values())
+
+        if not warp._src.types.type_is_value(arg_type):
+            return False
+
+        return warp._src.types.type_scalar_type(arg_type) is not warp._src.types.uint64
+
+    def _launch_flags(self, kernel, module_exec: ModuleExec) -> int:
+        """Return the ``APICLaunchFlags`` recorded with a launch of ``kernel``."""
+        if not self.device.is_cpu:
+            return 0
+
+        # kernels using tiles share a static tile buffer, so they cannot overlap with each other
+        if module_exec.meta.get(kernel.get_mangled_name() + "_cpu_kernel_uses_tiles", True) is not False:
+            return 0
+
+        if not all(self._is_tracked_arg_type(arg.type) for arg in kernel.adj.args):
+            return 0
+
+        return APIC_LAUNCH_FLAG_TRACKED_ACCESS
+
     @staticmethod
     def _adjoint_blob_type(arg_type):
         """Return the type whose layout matches the *adjoint* value blob.
@@ -471,6 +513,7 @@ class APICapture:
         info.kernel_key = key_str.encode("utf-8")
         info.module_hash = hash_str.encode("utf-8")
         info.is_forward = 0 if adjoint else 1
+        info.flags = self._launch_flags(kernel, module_exec)
         info.params = param_array
         info.num_params = num_params
         info.kernel_dim = kernel.adj.kernel_dim
@@ -42,6 +42,10 @@ APIC_RELOC_HANDLE = 2  # wp.handle / mesh id: write handle_ptr_remap[region_offs
 APIC_RELOC_NULL = 3  # Explicit zero (null array data/grad, absent indexedarray dim)
 
 
+# Kernel-launch record flags (must match APICLaunchFlags in apic_types.h).
+APIC_LAUNCH_FLAG_TRACKED_ACCESS = 1 << 0  # All accessed memory is reached through DATA_PTR relocations
+
+
 class APICLaunchParamRecord(ctypes.Structure):
     """One entry per kernel argument (16 bytes, packed). Matches apic_types.h.
 
@@ -96,7 +100,8 @@ class APICLaunchInfo(ctypes.Structure):
         ("kernel_key", ctypes.c_char_p),
         ("module_hash", ctypes.c_char_p),
         ("is_forward", ctypes.c_uint8),
-        ("_pad", ctypes.c_uint8 * 7),
+        ("flags", ctypes.c_uint8),
+        ("_pad", ctypes.c_uint8 * 6),
         ("params", ctypes.POINTER(APICLaunchParamRecord)),
         ("num_params", ctypes.c_int32),
         ("kernel_dim", ctypes.c_int32),
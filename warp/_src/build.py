@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import builtins
+import contextlib
 import ctypes
 import errno
 import hashlib
@@ -10,6 +11,7 @@ import os
 import shutil
 import threading
 import time
+from collections.abc import Sequence
 from pathlib import Path
 
 import warp.config
@@ -210,7 +212,7 @@ def init_kernel_cache(path=None):
 def clear_kernel_cache() -> None:
     """Clear the kernel cache directory of previously generated source code and compiler artifacts.
 
-    Only directories beginning with ``wp_`` will be deleted.
+    Only directories and compile lock files beginning with ``wp_`` will be deleted.
     This function only clears the cache for the current Warp version.
     LTO artifacts are not affected.
     """
@@ -228,6 +230,11 @@ def clear_kernel_cache() -> None:
         if os.path.isdir(item_path) and item.startswith("wp_"):
             # Remove the directory and its contents
             shutil.rmtree(item_path, ignore_errors=True)
+        elif item.startswith("wp_") and item.endswith(".lock"):
+            try:
+                os.remove(item_path)
+            except OSError:
+                pass
 
 
 def clear_lto_cache() -> None:
@@ -248,6 +255,296 @@ def clear_lto_cache() -> None:
         shutil.rmtree(lto_path, ignore_errors=True)
 
 
+def get_shared_kernel_cache_dir() -> str | None:
+    """Get the directory of the shared kernel cache tier for the current Warp version.
+
+    Returns ``None`` if :attr:`warp.config.kernel_cache_shared_dir` is not set.
+    """
+    if warp.config.kernel_cache_shared_dir is None:
+        return None
+
+    return os.path.join(os.path.realpath(warp.config.kernel_cache_shared_dir), warp.config.version)
+
+
+def find_shared_cache_entry(entry_name: str, file_names: Sequence[str]) -> str | None:
+    """Look up a kernel cache entry in the shared tier.
+
+    Args:
+        entry_name: The name of the cache entry directory, e.g. ``wp_<module>_<hash>``.
+        file_names: The files the entry must contain, with the metadata file last.
+
+    Returns:
+        The path of the shared entry directory if all ``file_names`` exist in it, otherwise ``None``.
+    """
+    shared_dir = get_shared_kernel_cache_dir()
+    if shared_dir is None:
+        return None
+
+    entry_dir = os.path.join(shared_dir, entry_name)
+    if all(os.path.exists(os.path.join(entry_dir, name)) for name in file_names):
+        return entry_dir
+
+    return None
+
+
+def promote_cache_files(local_dir: str, entry_name: str, file_names: Sequence[str]) -> bool:
+    """Publish freshly built files from the local kernel cache to the shared tier.
+
+    Each file is copied to a temporary name next to its destination and then renamed
+    into place, so readers of the shared tier never observe a partially written file.
+    Files are promoted in the given order and the metadata file should come last,
+    since a shared entry is only used once all of its files exist. Files that already
+    exist in the shared tier are left untouched.
+
+    Promotion is skipped silently if the shared tier is not configured or not writable
+    by this process, which is the normal case for a read-only mount.
+
+    Returns:
+        ``True`` if all files are present in the shared tier afterwards.
+    """
+    shared_dir = get_shared_kernel_cache_dir()
+    if shared_dir is None:
+        return False
+
+    entry_dir = os.path.join(shared_dir, entry_name)
+    suffix = f".p{os.getpid()}_t{threading.get_ident()}"
+
+    try:
+        os.makedirs(entry_dir, exist_ok=True)
+
+        for name in file_names:
+            dst_path = os.path.join(entry_dir, name)
+            if os.path.exists(dst_path):
+                continue
+
+            tmp_path = dst_path + suffix
+            try:
+                shutil.copyfile(os.path.join(local_dir, name), tmp_path)
+                os.replace(tmp_path, dst_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+    except OSError as e:
+        from warp._src.logger import log_debug  # noqa: PLC0415
+
+        log_debug(f"Could not promote {entry_name} to the shared kernel cache {shared_dir}: {e}")
+        return False
+
+    return True
+
+
+def touch_cache_entry(path: str) -> None:
+    """Record a use of a kernel cache entry.
+
+    The modification time of each ``wp_*`` entry in the kernel cache directory serves
+    as its access-time index for :func:`prune_kernel_cache`.
+    """
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _get_cache_entry_size(path: str) -> int:
+    size = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        size += _get_cache_entry_size(entry.path)
+                    else:
+                        size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return size
+
+
+def _is_build_dir(name: str) -> bool:
+    """Whether ``name`` is the in-flight build directory of a compiling process or thread."""
+    prefix, sep, thread_id = name.rpartition("_t")
+    if not sep or not thread_id.isdigit():
+        return False
+    _, sep, pid = prefix.rpartition("_p")
+    return bool(sep) and pid.isdigit()
+
+
+def _remove_lock_file(lock_path: str) -> None:
+    """Delete a compile lock file of the kernel cache unless another process holds it."""
+    try:
+        fd = os.open(lock_path, os.O_RDWR)
+    except OSError:
+        return
+
+    try:
+        try:
+            locked = _try_lock_file(fd)
+        except OSError:
+            locked = False
+
+        # an open file cannot be deleted on Windows, so the lock is released first there
+        if locked and os.name != "nt":
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
+        if locked:
+            try:
+                _unlock_file(fd)
+            except OSError:
+                pass
+    finally:
+        os.close(fd)
+
+    if locked and os.name == "nt":
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+
+def _get_lock_owner(lock_name: str, entry_names: set[str]) -> str | None:
+    """Get the name of the cache entry that the lock file ``lock_name`` was created for.
+
+    Compile locks are named after the binary they guard, e.g. ``wp_<module>_<hash>.o.lock``
+    for the entry ``wp_<module>_<hash>``. Module names may contain dots themselves, so each
+    dot-separated prefix is tried.
+    """
+    end = lock_name.find(".")
+    while end != -1:
+        if lock_name[:end] in entry_names:
+            return lock_name[:end]
+        end = lock_name.find(".", end + 1)
+    return None
+
+
+def _prune_kernel_cache(cache_dir: str, max_bytes: int, min_age: float, lock_timeout: float | None) -> int:
+    # a single process prunes at a time, the others skip or wait depending on lock_timeout
+    prune_lock_path = os.path.join(cache_dir, "wp_prune.lock")
+    with cache_lock(prune_lock_path, timeout=lock_timeout) as locked:
+        if not locked and lock_timeout is not None and lock_timeout <= 0.0:
+            return 0
+
+        entries = []
+        lock_names = []
+        try:
+            with os.scandir(cache_dir) as items:
+                for item in items:
+                    if not item.name.startswith("wp_") or _is_build_dir(item.name):
+                        continue
+                    try:
+                        if not item.is_dir(follow_symlinks=False):
+                            if item.name.endswith(".lock") and item.path != prune_lock_path:
+                                lock_names.append(item.name)
+                            continue
+                        last_used = item.stat(follow_symlinks=False).st_mtime
+                    except OSError:
+                        continue
+                    entries.append((last_used, item.path, _get_cache_entry_size(item.path)))
+        except OSError:
+            return 0
+
+        # group the compile locks by entry, locks of entries that no longer exist are removed right away
+        entry_locks = {}
+        entry_names = {os.path.basename(path) for _, path, _ in entries}
+        for lock_name in lock_names:
+            owner = _get_lock_owner(lock_name, entry_names)
+            if owner is None:
+                _remove_lock_file(os.path.join(cache_dir, lock_name))
+            else:
+                entry_locks.setdefault(owner, []).append(lock_name)
+
+        total_bytes = sum(size for _, _, size in entries)
+        if total_bytes <= max_bytes:
+            return 0
+
+        now = time.time()
+        freed_bytes = 0
+
+        # evict the least recently used entries first
+        for last_used, path, size in sorted(entries):
+            if total_bytes - freed_bytes <= max_bytes:
+                break
+            if now - last_used < min_age:
+                # everything after this entry was used even more recently
+                break
+
+            # move the entry out of the way first, so that other processes never see it half-deleted
+            evicted_path = f"{path}_p{os.getpid()}_t{threading.get_ident()}"
+            try:
+                os.rename(path, evicted_path)
+            except OSError:
+                continue
+            shutil.rmtree(evicted_path, ignore_errors=True)
+            freed_bytes += size
+
+            for lock_name in entry_locks.get(os.path.basename(path), ()):
+                _remove_lock_file(os.path.join(cache_dir, lock_name))
+
+        if freed_bytes > 0:
+            from warp._src.logger import log_debug  # noqa: PLC0415
+
+            log_debug(f"Pruned {freed_bytes} bytes from the kernel cache {cache_dir}")
+
+        return freed_bytes
+
+
+def prune_kernel_cache(max_bytes: int | None = None, min_age: float = 60.0) -> int:
+    """Evict the least recently used entries from the kernel cache directory.
+
+    Kernel cache entries are the ``wp_*`` directories keyed by module content hash.
+    Every time an entry is compiled or loaded from the cache its modification time is
+    refreshed, and entries are removed in order of least recent use until the total
+    size of the cache fits within ``max_bytes``. The compile lock files of evicted
+    entries, and of entries that no longer exist, are removed as well.
+
+    Pruning is safe while other processes share the cache directory: only one
+    process prunes at a time, entries used within the last ``min_age`` seconds
+    are never evicted, and an evicted entry is simply compiled again by the next
+    process that needs it. This function only prunes the cache for the current
+    Warp version. LTO artifacts are not affected.
+
+    Args:
+        max_bytes: The maximum total size of the cache entries in bytes. If ``None``,
+            :attr:`warp.config.kernel_cache_max_bytes` is used, and nothing is pruned
+            if that is also ``None``.
+        min_age: Entries used more recently than this many seconds ago are kept,
+            even if the cache remains larger than ``max_bytes``.
+
+    Returns:
+        The number of bytes freed.
+    """
+
+    warp._src.context.init()
+
+    is_initialized = warp._src.context.runtime is not None
+    assert is_initialized, "The kernel cache directory is not configured; wp.init() has not been called yet or failed."
+
+    if max_bytes is None:
+        max_bytes = warp.config.kernel_cache_max_bytes
+        if max_bytes is None:
+            return 0
+
+    if max_bytes < 0:
+        raise ValueError(f"max_bytes must be non-negative, got {max_bytes}")
+
+    return _prune_kernel_cache(
+        warp.config.kernel_cache_dir, max_bytes, min_age, lock_timeout=warp.config.compile_lock_timeout
+    )
+
+
+def auto_prune_kernel_cache() -> None:
+    """Prune the kernel cache after a compilation if :attr:`warp.config.kernel_cache_max_bytes` is set."""
+    max_bytes = warp.config.kernel_cache_max_bytes
+    if max_bytes is None or not warp.config.cache_kernels:
+        return
+
+    # don't wait for another process that is already pruning
+    _prune_kernel_cache(warp.config.kernel_cache_dir, max_bytes, min_age=60.0, lock_timeout=0.0)
+
+
 def safe_rename(src, dst, attempts=5, delay=0.1):
     for i in range(attempts):
         try:
@@ -277,6 +574,108 @@ def safe_rename(src, dst, attempts=5, delay=0.1):
                     raise e
 
 
+def _try_lock_file(fd: int) -> bool:
+    """Try to take an exclusive OS lock on an open lock file without blocking.
+
+    Returns ``False`` if another process (or another open handle) holds the lock.
+    Raises ``OSError`` if the file system does not support locking.
+    """
+    if os.name == "nt":
+        import msvcrt  # noqa: PLC0415
+
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError as e:
+            if e.errno in (errno.EACCES, errno.EDEADLK):
+                return False
+            raise
+    else:
+        import fcntl  # noqa: PLC0415
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+
+    return True
+
+
+def _unlock_file(fd: int) -> None:
+    if os.name == "nt":
+        import msvcrt  # noqa: PLC0415
+
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl  # noqa: PLC0415
+
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def cache_lock(lock_path: str, timeout: float | None = None):
+    """Hold an advisory cross-process lock while building one kernel cache entry.
+
+    Processes sharing a kernel cache directory use this lock so that only one of
+    them compiles a given binary while the others wait and then load the cached
+    result. The lock is an OS file lock on ``lock_path`` (``flock`` on POSIX,
+    ``msvcrt.locking`` on Windows), so it is released by the operating system when
+    its owner exits or crashes and a stale lock file never blocks other processes.
+
+    If the lock is not acquired within ``timeout`` seconds (``None`` waits
+    indefinitely), or the file system does not support locking, the body runs
+    without the lock and the caller compiles independently, as it would without
+    coordination.
+
+    Yields:
+        ``True`` if the lock is held, ``False`` otherwise.
+    """
+    from warp._src.logger import log_debug  # noqa: PLC0415
+
+    try:
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+    except OSError as e:
+        log_debug(f"Could not open cache lock file {lock_path}, building without it: {e}")
+        yield False
+        return
+
+    locked = False
+    try:
+        start = time.monotonic()
+        delay = 0.01
+        waiting = False
+        while True:
+            try:
+                locked = _try_lock_file(fd)
+            except OSError as e:
+                log_debug(f"File locking is not supported for {lock_path}, building without it: {e}")
+                break
+
+            if locked:
+                break
+
+            if not waiting:
+                log_debug(f"Waiting for another process to finish building {lock_path.removesuffix('.lock')}")
+                waiting = True
+
+            if timeout is not None and time.monotonic() - start >= timeout:
+                log_debug(f"Timed out after {timeout} s waiting for {lock_path}, building without it")
+                break
+
+            time.sleep(delay)
+            delay = min(delay * 2.0, 0.25)
+
+        yield locked
+    finally:
+        if locked:
+            try:
+                _unlock_file(fd)
+            except OSError:
+                pass
+        os.close(fd)
+
+
 def hash_symbol(symbol):
     ch = hashlib.sha256()
     ch.update(symbol.encode("utf-8"))
@@ -843,6 +843,9 @@ def build_dll_for_arch(args, dll_path, cpp_paths, cu_paths, arch, libs: list[str
                         ld_inputs.append(f"-lnvJitLink -L{args.libmathdx_path}/lib -lmathdx")
                     else:
                         ld_inputs.append(f"-lnvJitLink_static -L{args.libmathdx_path}/lib -lmathdx_static")
+            elif sys.platform != "darwin":
+                # the host thread pool (thread_pool.cpp) needs pthreads on glibc < 2.34
+                ld_inputs.append("-lpthread")
 
             if args.jobs <= 1:
                 with ScopedTimer("build_cuda", active=args.verbose):
@@ -1726,6 +1726,9 @@ class Adjoint:
         # Reset to None if ``adj.tree`` is ever mutated after the cache is populated.
         adj._reference_nodes = None
 
+        # Content hash memoized by ModuleHasher, see warp._src.context._AdjointHashMemo.
+        adj._hash_memo = None
+
     # allocate extra space for a function call that requires its
     # own shared memory space, we treat shared memory as a stack
     # where each function pushes and pops space off, the extra
@@ -6063,6 +6066,25 @@ void {name}_cpu_kernel_forward(
 
 """
 
+# Forward kernel for the "cpu_simd_width" module option. The body is force-inlined into the
+# batched lane loop of the range entry point, which keeps every index within int range, so
+# the 1-D tid() overflow warning (a call the vectorizer cannot handle) is left out.
+cpu_kernel_template_forward_batched = """
+
+#undef builtin_tid1d
+#define builtin_tid1d() wp::tid_unchecked(task_index, dim)
+
+static inline __attribute__((always_inline)) void {name}_cpu_kernel_forward(
+    {forward_args},
+    wp_args_{name} *_wp_args)
+{{
+{forward_body}}}
+
+#undef builtin_tid1d
+#define builtin_tid1d() wp::tid(task_index, dim)
+
+"""
+
 cpu_kernel_template_backward = """
 
 void {name}_cpu_kernel_backward(
@@ -6079,19 +6101,19 @@ cpu_module_template_forward = """
 extern "C" {{
 
 // Python CPU entry points
+WP_API void {name}_cpu_forward_range(
+    wp::launch_bounds_t<{launch_ndim}> *dim,
+    wp_args_{name} *_wp_args,
+    size_t task_begin,
+    size_t task_end)
+{{
+{tile_storage}{forward_loop}}}
+
 WP_API void {name}_cpu_forward(
     wp::launch_bounds_t<{launch_ndim}> *dim,
     wp_args_{name} *_wp_args)
 {{
-    wp::tile_shared_storage_t tile_mem;
-#if defined(WP_ENABLE_TILES_IN_STACK_MEMORY)
-    wp::shared_tile_storage = &tile_mem;
-#endif
-
-    for (size_t task_index = 0; task_index < dim->size; ++task_index)
-    {{
-        {name}_cpu_kernel_forward(*dim, task_index, _wp_args);
-    }}
+    {name}_cpu_forward_range(dim, _wp_args, 0, dim->size);
 }}
 
 }} // extern C
@@ -6102,26 +6124,72 @@ cpu_module_template_backward = """
 
 extern "C" {{
 
-WP_API void {name}_cpu_backward(
+WP_API void {name}_cpu_backward_range(
     wp::launch_bounds_t<{launch_ndim}> *dim,
     wp_args_{name} *_wp_args,
-    wp_args_{name} *_wp_adj_args)
+    wp_args_{name} *_wp_adj_args,
+    size_t task_begin,
+    size_t task_end)
 {{
-    wp::tile_shared_storage_t tile_mem;
-#if defined(WP_ENABLE_TILES_IN_STACK_MEMORY)
-    wp::shared_tile_storage = &tile_mem;
-#endif
-
-    for (size_t task_index = 0; task_index < dim->size; ++task_index)
+{tile_storage}
+    for (size_t task_index = task_begin; task_index < task_end; ++task_index)
     {{
         {name}_cpu_kernel_backward(*dim, task_index, _wp_args, _wp_adj_args);
     }}
 }}
 
+WP_API void {name}_cpu_backward(
+    wp::launch_bounds_t<{launch_ndim}> *dim,
+    wp_args_{name} *_wp_args,
+    wp_args_{name} *_wp_adj_args)
+{{
+    {name}_cpu_backward_range(dim, _wp_args, _wp_adj_args, 0, dim->size);
+}}
+
 }} // extern C
 
 """
 
+cpu_module_forward_loop = """
+    for (size_t task_index = task_begin; task_index < task_end; ++task_index)
+    {{
+        {name}_cpu_kernel_forward(*dim, task_index, _wp_args);
+    }}
+"""
+
+# Batched forward loop used when the "cpu_simd_width" module option is set. The kernel body is
+# force-inlined into a fixed-width lane loop so that Clang can widen it into SIMD code; lanes
+# are independent because kernel threads carry no ordering guarantees. Indices that do not
+# fill a whole batch run through the scalar tail loop.
+cpu_module_forward_loop_batched = """
+    size_t task_index = task_begin;
+
+    // batches stay within the int range returned by tid(), which lets the optimizer drop its overflow check
+    const size_t batch_end = task_end < size_t(2147483648u) ? task_end : size_t(2147483648u);
+
+    for (; task_index + {simd_width} <= batch_end; task_index += {simd_width})
+    {{
+#pragma clang loop vectorize(assume_safety) vectorize_width({simd_width}) interleave(disable)
+        for (size_t lane = 0; lane < {simd_width}; ++lane)
+        {{
+            {name}_cpu_kernel_forward(*dim, task_index + lane, _wp_args);
+        }}
+    }}
+
+    for (; task_index < task_end; ++task_index)
+    {{
+        {name}_cpu_kernel_forward(*dim, task_index, _wp_args);
+    }}
+"""
+
+# Tile storage is only reserved by kernels that use tiles. The storage pointer lives in a
+# static variable on x86-64, so such kernels must also run single-threaded on the CPU.
+cpu_module_tile_storage = """    wp::tile_shared_storage_t tile_mem;
+#if defined(WP_ENABLE_TILES_IN_STACK_MEMORY)
+    wp::shared_tile_storage = &tile_mem;
+#endif
+"""
+
 
 # converts a constant Python value to equivalent C-repr
 def constant_str(value):
@@ -6817,7 +6885,10 @@ def codegen_kernel(kernel, device, options):
         func_line_directive = f"{line_directive}\n"
 
     if device == "cpu":
-        template_forward = cpu_kernel_template_forward
+        if get_cpu_simd_width(kernel, options) > 1:
+            template_forward = cpu_kernel_template_forward_batched
+        else:
+            template_forward = cpu_kernel_template_forward
         template_backward = cpu_kernel_template_backward
     elif device == "cuda":
         if kernel.grid_stride:
@@ -6916,6 +6987,41 @@ def codegen_kernel(kernel, device, options):
     return args_struct + s
 
 
+def get_cpu_simd_width(kernel, options) -> int:
+    """Return the effective ``cpu_simd_width`` for a kernel, or 0 when it runs one index at a time.
+
+    Tile kernels reuse one tile buffer for consecutive launch indices, so their lanes are not
+    independent and they are never batched.
+    """
+    simd_width = options.get("cpu_simd_width", 0)
+    if simd_width > 1 and adjoint_uses_tiles(kernel.adj):
+        return 0
+    return simd_width
+
+
+def adjoint_uses_tiles(adj) -> bool:
+    """Return whether a built kernel or function, or any user function it calls, uses tile types."""
+    visited = set()
+    stack = [adj]
+    while stack:
+        adj = stack.pop()
+        if id(adj) in visited:
+            continue
+        visited.add(id(adj))
+
+        for var in adj.variables:
+            var_type = strip_reference(var.type)
+            if is_tile(var_type) or is_tile_stack(var_type):
+                return True
+
+        for func in getattr(adj, "called_user_functions", ()):
+            for f in (func, func.custom_grad_func, func.custom_replay_func):
+                if f is not None and getattr(f, "adj", None) is not None:
+                    stack.append(f.adj)
+
+    return False
+
+
 def codegen_module(kernel, device, options):
     if device != "cpu":
         return ""
@@ -6923,13 +7029,29 @@ def codegen_module(kernel, device, options):
     # Update the module's options with the ones defined on the kernel, if any.
     options = options | kernel.options
 
+    simd_width = get_cpu_simd_width(kernel, options)
+    if simd_width > 1:
+        forward_loop = cpu_module_forward_loop_batched
+    else:
+        forward_loop = cpu_module_forward_loop
+
     template = ""
     template_fmt_args = {
         "name": kernel.get_mangled_name(),
         "launch_ndim": kernel.adj.kernel_dim,
+        "tile_storage": cpu_module_tile_storage if adjoint_uses_tiles(kernel.adj) else "",
+        "simd_width": simd_width,
     }
-
-    template += cpu_module_template_forward
+    template_fmt_args["forward_loop"] = forward_loop.format(**template_fmt_args)
+
+    if simd_width > 1:
+        # kernels with calls or complex control flow may not vectorize; they still run correctly,
+        # so silence the warning Clang emits when a requested vectorization cannot be applied
+        template += '\n#pragma clang diagnostic push\n#pragma clang diagnostic ignored "-Wpass-failed"\n'
+        template += cpu_module_template_forward
+        template += "#pragma clang diagnostic pop\n"
+    else:
+        template += cpu_module_template_forward
 
     if options["enable_backward"]:
         template += cpu_module_template_backward
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import ast
 import collections
+import contextlib
 import ctypes
 import enum
 import functools
@@ -24,6 +25,7 @@ import sys
 import tempfile
 import textwrap
 import threading
+import time
 import types
 import weakref
 from collections.abc import Callable, Iterable, Mapping, Sequence
@@ -863,10 +865,24 @@ def call_builtin_from_desc(
 
 
 class KernelHooks:
-    def __init__(self, forward, backward, forward_smem_bytes=0, backward_smem_bytes=0, cluster_dim=1):
+    def __init__(
+        self,
+        forward,
+        backward,
+        forward_smem_bytes=0,
+        backward_smem_bytes=0,
+        cluster_dim=1,
+        forward_range=None,
+        backward_range=None,
+    ):
         self.forward = forward
         self.backward = backward
 
+        # Raw addresses of the CPU range entry points used for multi-threaded
+        # launches, or None when the kernel must run on a single host thread.
+        self.forward_range = forward_range
+        self.backward_range = backward_range
+
         self.forward_smem_bytes = forward_smem_bytes
         self.backward_smem_bytes = backward_smem_bytes
 
@@ -1050,6 +1066,9 @@ class Kernel:
         # cache for invoke() struct types (avoids dynamic type() calls)
         self._invoke_cache = {}
 
+        # cache for launch argument packers, see _pack_launch_args()
+        self._launch_packers = {}
+
         if self.module:
             self.module.register_kernel(self)
 
@@ -2434,20 +2453,79 @@ def _verify_library_version(lib, library_name: str, version_symbol: str, expecte
         )
 
 
+# Definition epochs validate the adjoint hashes memoized by ModuleHasher across module
+# modifications. Every (re)definition of a user function bumps the epoch of its key, so
+# a memoized hash is reused only if none of the functions it (transitively) references
+# were redefined since it was computed. Redefining a struct invalidates all memos.
+_definition_lock = threading.Lock()
+_definition_epoch = 0
+_definition_epochs: dict[str, int] = {}  # (function key: epoch of its latest definition)
+_all_definitions_epoch = 0
+
+
+def _mark_definition_modified(key: str | None = None) -> None:
+    """Invalidate the memoized hashes that depend on the function ``key``, or all of them if ``key`` is ``None``."""
+    global _definition_epoch, _all_definitions_epoch
+
+    with _definition_lock:
+        _definition_epoch += 1
+        if key is None:
+            _all_definitions_epoch = _definition_epoch
+        else:
+            _definition_epochs[key] = _definition_epoch
+
+
+class _AdjointHashMemo:
+    """The hash of an adjoint along with everything needed to check that it is still current."""
+
+    __slots__ = ("bindings", "constants", "dependencies", "epoch", "hash")
+
+    def __init__(self, hash, epoch, dependencies, bindings, constants):
+        self.hash = hash
+        self.epoch = epoch
+        # keys of the user functions referenced directly or indirectly
+        self.dependencies = dependencies
+        # (name, object) of the closure or global variables the adjoint's names resolved to
+        self.bindings = bindings
+        # (path, bytes) of the constants referenced through attributes, resolved again on every lookup
+        self.constants = constants
+
+
 # ModuleHasher computes the module hash based on all the kernels, module options,
 # and build configuration.  For each kernel, it computes a deep hash by recursively
 # hashing all referenced functions, structs, and constants, even those defined in
 # other modules.  The module hash is computed in the constructor and can be retrieved
 # using get_hash().  In addition, the ModuleHasher takes care of filtering out
 # duplicate kernels for codegen (see get_unique_kernels()).
+#
+# Adjoint hashes are memoized on the adjoints themselves (see _AdjointHashMemo), so
+# rehashing a module after one of its definitions changed only rehashes the kernels
+# and functions affected by that change.
 class ModuleHasher:
     def __init__(self, kernels, options):
         # cache function hashes to avoid hashing multiple times
         self.function_hashes = {}  # (function: hash)
+        self.function_dependencies = {}  # (function: keys of the user functions it references)
 
         # avoid recursive spiral of doom (e.g., function calling an overload of itself)
         self.functions_in_progress = set()
 
+        # Hashes computed while a recursive reference was skipped depend on where the
+        # recursion was entered, so they are not memoized. Functions whose hash is
+        # affected are tracked to propagate this to everything that references them.
+        self.num_recursion_skips = 0
+        self.recursion_dependent_functions = set()
+
+        # stack of the user function keys referenced by the functions and adjoints being hashed
+        self.dependencies_stack = []
+
+        # statistics for the compile-time trace
+        self.num_adjoints_hashed = 0
+        self.num_adjoints_reused = 0
+
+        with _definition_lock:
+            self.epoch = _definition_epoch
+
         # all unique kernels for codegen, filtered by hash
         self.unique_kernels = {}  # (hash: kernel)
 
@@ -2557,9 +2635,14 @@ class ModuleHasher:
 
         h = self.function_hashes.get(func)
         if h is not None:
+            self._add_dependencies(self.function_dependencies[func])
+            if func in self.recursion_dependent_functions:
+                self.num_recursion_skips += 1
             return h
 
         self.functions_in_progress.add(func)
+        self.dependencies_stack.append({func.key})
+        num_recursion_skips = self.num_recursion_skips
 
         ch = hashlib.sha256()
 
@@ -2595,8 +2678,56 @@ class ModuleHasher:
 
         self.functions_in_progress.remove(func)
 
+        dependencies = self.dependencies_stack.pop()
+        self.function_dependencies[func] = dependencies
+        self._add_dependencies(dependencies)
+
+        if self.num_recursion_skips != num_recursion_skips:
+            self.recursion_dependent_functions.add(func)
+
         return h
 
+    def _add_dependencies(self, dependencies) -> None:
+        if self.dependencies_stack:
+            self.dependencies_stack[-1].update(dependencies)
+
+    def _hash_function_reference(self, ch, func: Function) -> None:
+        self._add_dependencies((func.key,))
+        if func in self.functions_in_progress:
+            self.num_recursion_skips += 1
+        else:
+            ch.update(self.hash_function(func))
+
+    @staticmethod
+    def _is_memo_current(adj: warp._src.codegen.Adjoint, memo: _AdjointHashMemo) -> bool:
+        if memo.epoch < _all_definitions_epoch:
+            return False
+
+        for key in memo.dependencies:
+            if _definition_epochs.get(key, 0) > memo.epoch:
+                return False
+
+        # names may have been rebound to other functions, types, or constants since the memo was created
+        closure_vars = warp._src.codegen.get_closure_vars(adj.func)
+        for name, obj in memo.bindings:
+            if (closure_vars[name] if name in closure_vars else adj.func.__globals__.get(name)) is not obj:
+                return False
+
+        # values of constants reached through attributes, e.g. ``module.CONSTANT``
+        for name, value_bytes in memo.constants:
+            try:
+                if "." in name:
+                    value = adj.resolve_path(name.split("."))
+                else:
+                    value = adj.resolve_external_reference(name)
+
+                if not warp._src.types.is_value(value) or ModuleHasher.get_constant_bytes(value) != value_bytes:
+                    return False
+            except Exception:
+                return False
+
+        return True
+
     @staticmethod
     def hash_builtin_function(func: Function) -> bytes:
         """Hash the identity of a built-in function used as a specialization input.
@@ -2622,9 +2753,20 @@ class ModuleHasher:
         return ch.digest()
 
     def hash_adjoint(self, adj: warp._src.codegen.Adjoint) -> bytes:
-        # NOTE: We don't cache adjoint hashes, because adjoints are always unique.
-        # Even instances of generic kernels and functions have unique adjoints with
-        # different argument types.
+        # NOTE: Adjoints are always unique, even instances of generic kernels and functions
+        # have unique adjoints with different argument types. Their hashes are memoized on
+        # the adjoint and reused by later ModuleHashers while the memo is current.
+
+        memo = adj._hash_memo
+        if memo is not None and self._is_memo_current(adj, memo):
+            self._add_dependencies(memo.dependencies)
+            self.num_adjoints_reused += 1
+            return memo.hash
+
+        self.num_adjoints_hashed += 1
+        self.dependencies_stack.append(set())
+        num_recursion_skips = self.num_recursion_skips
+        constant_bytes = []
 
         ch = hashlib.sha256()
 
@@ -2652,15 +2794,16 @@ class ModuleHasher:
 
         # hash referenced constants
         for name, value in constants.items():
+            value_bytes = self.get_constant_bytes(value)
+            constant_bytes.append((name, value_bytes))
             ch.update(bytes(name, "utf-8"))
-            ch.update(self.get_constant_bytes(value))
+            ch.update(value_bytes)
 
         # hash wp.static() expressions (declaration-time + deferred codegen-time)
         for k, v in itertools.chain(adj.resolved_static_expressions.items(), adj.deferred_static_expressions):
             ch.update(bytes(k, "utf-8"))
             if isinstance(v, Function):
-                if v not in self.functions_in_progress:
-                    ch.update(self.hash_function(v))
+                self._hash_function_reference(ch, v)
             else:
                 ch.update(self.get_constant_bytes(v))
 
@@ -2670,15 +2813,53 @@ class ModuleHasher:
 
         # hash referenced functions
         for f in functions.keys():
-            if f not in self.functions_in_progress:
-                if f.is_builtin():
+            if f.is_builtin():
+                if f not in self.functions_in_progress:
                     ch.update(self.hash_builtin_function(f))
-                else:
-                    ch.update(self.hash_function(f))
+            else:
+                self._hash_function_reference(ch, f)
 
-        return ch.digest()
+        h = ch.digest()
+
+        dependencies = self.dependencies_stack.pop()
+        self._add_dependencies(dependencies)
+
+        # Memoize the hash unless it depends on state that the memo cannot check cheaply:
+        # wp.static() expressions evaluated during codegen, and wp.Function targets, which
+        # are resolved from argument types and (mutable) function defaults.
+        if (
+            self.num_recursion_skips == num_recursion_skips
+            and not adj.deferred_static_expressions
+            and not adj.has_unresolved_static_expressions
+            and not getattr(adj, "callable_arg_values", None)
+            and not any(self._has_function_targets(f) for f in functions.keys())
+        ):
+            closure_vars = warp._src.codegen.get_closure_vars(adj.func)
+            names = {node.id for node in adj.reference_nodes() if type(node) is ast.Name}
+            bindings = tuple(
+                (name, closure_vars[name] if name in closure_vars else adj.func.__globals__.get(name)) for name in names
+            )
+            adj._hash_memo = _AdjointHashMemo(
+                h, self.epoch, frozenset(dependencies), bindings, tuple(c for c in constant_bytes if "." in c[0])
+            )
+
+        return h
+
+    @staticmethod
+    def _has_function_targets(func: Function) -> bool:
+        """Whether any overload of ``func`` takes a ``wp.Function`` parameter."""
+        if func.is_builtin():
+            return False
 
-    def get_constant_bytes(self, value) -> bytes:
+        overloads = itertools.chain((func,), func.user_overloads.values(), func.user_templates.values())
+        return any(
+            warp._src.types.is_warp_function_annotation(arg_type)
+            for ovl in overloads
+            for arg_type in ovl.input_types.values()
+        )
+
+    @staticmethod
+    def get_constant_bytes(value) -> bytes:
         if isinstance(value, int):
             # this also handles builtins.bool
             return bytes(ctypes.c_int(value))
@@ -2707,7 +2888,7 @@ class ModuleHasher:
 
 
 class ModuleBuilder:
-    def __init__(self, module, options, hasher=None):
+    def __init__(self, module, options, hasher=None, kernels=None):
         self.functions = {}
         self.structs = {}
         self.options = options
@@ -2718,11 +2899,13 @@ class ModuleBuilder:
         self.ltoirs_decl = {}  # map from lto symbol to lto forward declaration
         self.shared_memory_bytes = {}  # map from lto symbol to shared memory requirements
 
-        if hasher is None:
-            hasher = ModuleHasher(module._get_live_kernels(), options)
+        if kernels is None:
+            if hasher is None:
+                hasher = ModuleHasher(module._get_live_kernels(), options)
+            kernels = hasher.get_unique_kernels()
 
-        # build all unique kernels
-        self.kernels = hasher.get_unique_kernels()
+        # build all unique kernels (or the given subset, for per-kernel translation units)
+        self.kernels = kernels
         for kernel in self.kernels:
             self.build_kernel(kernel)
 
@@ -2931,6 +3114,7 @@ class ModuleBuilder:
                 # no backward kernel is generated, so there is nothing to reserve
                 backward_smem_bytes = 0
             meta[name + "_cuda_kernel_backward_smem_bytes"] = backward_smem_bytes
+            meta[name + "_cpu_kernel_uses_tiles"] = warp._src.codegen.adjoint_uses_tiles(kernel.adj)
 
         return meta
 
@@ -3057,10 +3241,23 @@ class ModuleExec:
     def __new__(cls, *args, **kwargs):
         instance = super().__new__(cls)
         instance.handle = None
+        instance.kernel_handles = None
         return instance
 
-    def __init__(self, handle, module_hash, device, meta, block_dim: int, compile_arch: int | None = None):
+    def __init__(
+        self,
+        handle,
+        module_hash,
+        device,
+        meta,
+        block_dim: int,
+        compile_arch: int | None = None,
+        kernel_handles: dict[str, str] | None = None,
+    ):
         self.handle = handle
+        # CPU modules built from per-kernel translation units load one LLVM module per kernel,
+        # keyed by the kernel's mangled name; ``handle`` is None in that case.
+        self.kernel_handles = kernel_handles
         self.module_hash = module_hash
         self.device = device
         self.kernel_hooks = {}
@@ -3085,6 +3282,13 @@ class ModuleExec:
                 # Suppress TypeError and AttributeError when callables become None during shutdown
                 pass
 
+        if self.kernel_handles is not None:
+            try:
+                for handle in self.kernel_handles.values():
+                    runtime.llvm.wp_unload_obj(handle.encode("utf-8"))
+            except (TypeError, AttributeError):
+                pass
+
     # lookup and cache kernel entry points
     def get_kernel_hooks(self, kernel) -> KernelHooks:
         # Key by the mangled name (compiled-symbol identity), not kernel.adj, which pinned one
@@ -3175,21 +3379,36 @@ class ModuleExec:
             )
 
         else:
+            if self.kernel_handles is not None:
+                handle = self.kernel_handles[name].encode("utf-8")
+            else:
+                handle = self.handle.encode("utf-8")
+
             func = ctypes.CFUNCTYPE(None)
-            forward = (
-                func(runtime.llvm.wp_lookup(self.handle.encode("utf-8"), (name + "_cpu_forward").encode("utf-8")))
-                or None
-            )
+            forward = func(runtime.llvm.wp_lookup(handle, (name + "_cpu_forward").encode("utf-8"))) or None
 
             if options["enable_backward"]:
-                backward = (
-                    func(runtime.llvm.wp_lookup(self.handle.encode("utf-8"), (name + "_cpu_backward").encode("utf-8")))
-                    or None
-                )
+                backward = func(runtime.llvm.wp_lookup(handle, (name + "_cpu_backward").encode("utf-8"))) or None
             else:
                 backward = None
 
-            hooks = KernelHooks(forward, backward)
+            # Range entry points let the runtime split a launch across host threads. Kernels
+            # that use tiles share a static tile buffer and deterministic mode requires a fixed
+            # execution order, so both keep the serial path. Cached modules built before the
+            # range entry points existed have no "_cpu_kernel_uses_tiles" meta entry.
+            forward_range = None
+            backward_range = None
+            if (
+                self.meta.get(name + "_cpu_kernel_uses_tiles", True) is False
+                and options["deterministic"] == warp.config.DeterministicMode.NOT_GUARANTEED
+            ):
+                forward_range = runtime.llvm.wp_lookup(handle, (name + "_cpu_forward_range").encode("utf-8")) or None
+                if backward is not None:
+                    backward_range = (
+                        runtime.llvm.wp_lookup(handle, (name + "_cpu_backward_range").encode("utf-8")) or None
+                    )
+
+            hooks = KernelHooks(forward, backward, forward_range=forward_range, backward_range=backward_range)
 
         self.kernel_hooks[name] = hooks
         return hooks
@@ -3273,6 +3492,8 @@ class Module:
             "mode": None,
             "optimization_level": None,
             "cpu_compiler_flags": None,
+            "cpu_simd_width": 0,
+            "cpu_incremental_build": None,  # None means inherit warp.config.cpu_incremental_build
             "block_dim": 256,
             "compile_time_trace": warp.config.compile_time_trace,
             "strip_hash": False,
@@ -3349,6 +3570,19 @@ class Module:
             raise ValueError(f"deterministic_max_records must be non-negative, got {deterministic_max_records}")
         options["deterministic_max_records"] = deterministic_max_records
 
+        cpu_simd_width = options["cpu_simd_width"]
+        if isinstance(cpu_simd_width, bool) or not isinstance(cpu_simd_width, int):
+            raise TypeError(f"cpu_simd_width must be an int, got {type(cpu_simd_width).__name__}")
+        if cpu_simd_width < 0 or cpu_simd_width > 64 or (cpu_simd_width & (cpu_simd_width - 1)):
+            raise ValueError(f"cpu_simd_width must be 0 or a power of two no greater than 64, got {cpu_simd_width}")
+
+        if options["cpu_incremental_build"] is None:
+            options["cpu_incremental_build"] = config.cpu_incremental_build
+        if not isinstance(options["cpu_incremental_build"], bool):
+            raise TypeError(
+                f"cpu_incremental_build must be a bool, got {type(options['cpu_incremental_build']).__name__}"
+            )
+
         if options["default_grid_stride"] is None:
             options["default_grid_stride"] = config.default_grid_stride
 
@@ -3376,6 +3610,9 @@ class Module:
     def register_struct(self, struct):
         self.structs[struct.key] = struct
 
+        # struct types are folded into the hashes of everything that uses them
+        _mark_definition_modified()
+
         # for a reload of module on next launch
         self.mark_modified()
 
@@ -3455,6 +3692,9 @@ class Module:
 
         self._find_references(func.adj)
 
+        # rehash the kernels and functions that reference this function
+        _mark_definition_modified(func.key)
+
         # for a reload of module on next launch
         self.mark_modified()
 
@@ -3541,6 +3781,17 @@ class Module:
             if isinstance(arg.type, warp._src.codegen.Struct) and arg.type.module is not None:
                 add_ref(arg.type.module)
 
+    def _create_hasher(self, options: dict) -> ModuleHasher:
+        with warp.ScopedTimer(
+            f"Hash module {self.name}", active=(warp.config.verbose or warp.config.log_level <= warp.LOG_DEBUG)
+        ) as timer:
+            hasher = ModuleHasher(self._get_live_kernels(), options)
+            timer.extra_msg = (
+                f" ({hasher.num_adjoints_hashed} hashed, {hasher.num_adjoints_reused} reused"
+                f" of {hasher.num_adjoints_hashed + hasher.num_adjoints_reused} kernels and functions)"
+            )
+        return hasher
+
     @synchronized(_codegen_lock)
     def hash_module(self) -> bytes:
         """Get the hash of the module for the current block_dim.
@@ -3549,11 +3800,12 @@ class Module:
         """
         block_dim = self.options["block_dim"]
         options = self.resolve_options(warp.config)
-        self.hashers[block_dim] = ModuleHasher(self._get_live_kernels(), options)
+        hasher = self._create_hasher(options)
+        # publish the options first, readers on the lock-free path expect both once the hasher is visible
         self.resolved_options[block_dim] = options
-        return self.hashers[block_dim].get_hash()
+        self.hashers[block_dim] = hasher
+        return hasher.get_hash()
 
-    @synchronized(_codegen_lock)
     def get_module_hash(self, block_dim: int | None = None) -> bytes:
         """Get the hash of the module for a block_dim variant.
 
@@ -3563,6 +3815,18 @@ class Module:
         if block_dim is None:
             block_dim = self.options["block_dim"]
 
+        # Fast path without taking ``_codegen_lock`` when the module is unchanged.
+        # ``mark_modified()`` replaces ``self.hashers`` instead of mutating it, so a
+        # concurrent modification at worst returns the hash of the previous version.
+        hasher = self.hashers.get(block_dim)
+        if hasher is not None and not self.has_unresolved_static_expressions:
+            return hasher.get_hash()
+
+        return self._compute_module_hash(block_dim)
+
+    @synchronized(_codegen_lock)
+    def _compute_module_hash(self, block_dim: int) -> bytes:
+        """Compute and cache the hash of a block_dim variant under ``_codegen_lock``, see :meth:`get_module_hash`."""
         # Both branches below mutate shared ``@wp.func`` adjoint state
         # (``ModuleBuilder`` runs ``adj.build`` to resolve deferred
         # ``wp.static`` expressions; ``ModuleHasher`` reads the
@@ -3582,8 +3846,9 @@ class Module:
 
                 if block_dim not in self.hashers:
                     options = self.resolve_options(warp.config, block_dim=block_dim)
-                    self.hashers[block_dim] = ModuleHasher(self._get_live_kernels(), options)
+                    hasher = self._create_hasher(options)
                     self.resolved_options[block_dim] = options
+                    self.hashers[block_dim] = hasher
 
         return self.hashers[block_dim].get_hash()
 
@@ -3818,162 +4083,387 @@ class Module:
         else:
             output_dir = os.fspath(output_dir)
 
+        binary_path = os.path.join(output_dir, output_name)
+        meta_path = os.path.join(output_dir, self._get_meta_name(block_dim=active_block_dim))
+
         # Skip compilation if the binary and metadata are already cached
         # (forced rebuild when verifying autograd array access)
+        use_cache = warp.config.cache_kernels and not options.get("verify_autograd_array_access", False)
+        if use_cache and os.path.exists(binary_path) and os.path.exists(meta_path):
+            warp._src.build.touch_cache_entry(output_dir)
+            return False
+
+        # Processes sharing the kernel cache compile each binary only once: the first one to
+        # take the lock builds it, the others wait here and then find it in the cache.
+        # Binaries compiled to a caller-provided directory (e.g. ahead of time) are not locked,
+        # so that no lock files are left next to it.
+        cache_dir = os.path.dirname(os.path.normpath(output_dir))
         if (
-            warp.config.cache_kernels
-            and not options.get("verify_autograd_array_access", False)
-            and os.path.exists(os.path.join(output_dir, output_name))
-            and os.path.exists(os.path.join(output_dir, self._get_meta_name(block_dim=active_block_dim)))
+            use_cache
+            and warp.config.kernel_cache_dir is not None
+            and os.path.realpath(cache_dir) == os.path.realpath(warp.config.kernel_cache_dir)
         ):
-            return False
+            lock_path = os.path.join(cache_dir, f"{output_name}.lock")
+            cache_lock = warp._src.build.cache_lock(lock_path, timeout=warp.config.compile_lock_timeout)
+        else:
+            cache_lock = contextlib.nullcontext()
 
-        # Python codegen window -- runs serialised under ``_codegen_lock``
-        # inside ``_run_codegen``. Snapshots all builder state needed by
-        # the native compile below, so the native step (the dominant cost)
-        # runs unlocked and parallelises across N modules.
-        #
-        # NOTE: ``_run_codegen`` is intentionally outside the
-        # ``failed_builds`` try/except below. ``ModuleBuilder`` can
-        # legitimately raise from ``adj.build`` (e.g. user kernels with
-        # type mismatches in the error tests); if we recorded those in
-        # ``failed_builds`` the next ``Module.load`` on the same device
-        # short-circuits with ``return None`` and subsequent unrelated
-        # kernels in the same module silently fail to launch.
-        source_str, source_code_ext, meta, ltoir_values, fatbin_values = self._run_codegen(options, is_cpu)
+        with cache_lock:
+            if use_cache and os.path.exists(binary_path) and os.path.exists(meta_path):
+                warp._src.build.touch_cache_entry(output_dir)
+                return False
 
-        meta_path = os.path.join(output_dir, self._get_meta_name(block_dim=active_block_dim))
+            # Python codegen window -- runs serialised under ``_codegen_lock``
+            # inside ``_run_codegen``. Snapshots all builder state needed by
+            # the native compile below, so the native step (the dominant cost)
+            # runs unlocked and parallelises across N modules.
+            #
+            # NOTE: ``_run_codegen`` is intentionally outside the
+            # ``failed_builds`` try/except below. ``ModuleBuilder`` can
+            # legitimately raise from ``adj.build`` (e.g. user kernels with
+            # type mismatches in the error tests); if we recorded those in
+            # ``failed_builds`` the next ``Module.load`` on the same device
+            # short-circuits with ``return None`` and subsequent unrelated
+            # kernels in the same module silently fail to launch.
+            source_str, source_code_ext, meta, ltoir_values, fatbin_values = self._run_codegen(options, is_cpu)
 
-        build_dir = os.path.normpath(output_dir) + f"_p{os.getpid()}_t{threading.get_ident()}"
+            build_dir = os.path.normpath(output_dir) + f"_p{os.getpid()}_t{threading.get_ident()}"
 
-        # dir may exist from previous attempts / runs / archs
-        Path(build_dir).mkdir(parents=True, exist_ok=True)
+            # dir may exist from previous attempts / runs / archs
+            Path(build_dir).mkdir(parents=True, exist_ok=True)
 
-        mode = options["mode"]
-        opt = options["optimization_level"]
-        if opt is None:
-            # Default to O2 for CPU, O3 for CUDA
-            opt = 2 if is_cpu else 3
+            mode = options["mode"]
+            opt = options["optimization_level"]
+            if opt is None:
+                # Default to O2 for CPU, O3 for CUDA
+                opt = 2 if is_cpu else 3
 
-        if opt != 3 and not is_cpu and runtime.toolkit_version is not None and runtime.toolkit_version < (12, 9):
-            log_warning("Optimization level other than 3 has no effect on CUDA versions prior to 12.9.", once=True)
+            if opt != 3 and not is_cpu and runtime.toolkit_version is not None and runtime.toolkit_version < (12, 9):
+                log_warning("Optimization level other than 3 has no effect on CUDA versions prior to 12.9.", once=True)
 
-        source_code_path = os.path.join(build_dir, f"{module_name_short}.{source_code_ext}")
-        with open(source_code_path, "w") as source_file:
-            source_file.write(source_str)
+            source_code_path = os.path.join(build_dir, f"{module_name_short}.{source_code_ext}")
+            with open(source_code_path, "w") as source_file:
+                source_file.write(source_str)
 
-        output_path = os.path.join(build_dir, output_name)
+            output_path = os.path.join(build_dir, output_name)
 
-        try:
-            if is_cpu:
-                # build object code
-                with warp.ScopedTimer(
-                    "Compile x86", active=(warp.config.verbose or warp.config.log_level <= warp.LOG_DEBUG)
-                ):
-                    warp._src.build.build_cpu(
-                        output_path,
-                        source_code_path,
-                        mode=mode,
-                        fast_math=options["fast_math"],
-                        verify_fp=options["verify_fp"],
-                        fuse_fp=options["fuse_fp"],
-                        extra_flags=options["cpu_compiler_flags"],
-                        optimization_level=opt,
-                        verbose=warp.config.verbose or warp.config.log_level <= warp.LOG_DEBUG,
-                        use_precompiled_headers=options["use_precompiled_headers"],
-                        pch_dir=runtime.get_clang_pch_dir() if options["use_precompiled_headers"] else None,
-                        block_dim=options["block_dim"],
-                        enable_tiles_in_stack_memory=options["enable_tiles_in_stack_memory"],
-                    )
-            else:
-                # generate PTX or CUBIN
-                with warp.ScopedTimer(
-                    f"Compile CUDA (arch={options['output_arch']}{arch_suffix}, mode={mode}, block_dim={options['block_dim']})",
-                    active=(warp.config.verbose or warp.config.log_level <= warp.LOG_DEBUG),
-                ):
-                    warp._src.build.build_cuda(
-                        source_code_path,
-                        options["output_arch"],
-                        output_path,
-                        config=mode,
-                        optimization_level=opt,
-                        verify_fp=options["verify_fp"],
-                        fast_math=options["fast_math"],
-                        fuse_fp=options["fuse_fp"],
-                        lineinfo=options["lineinfo"],
-                        compile_time_trace=options["compile_time_trace"],
-                        ltoirs=ltoir_values,
-                        fatbins=fatbin_values,
-                        arch_suffix=arch_suffix,
-                        pch_dir=runtime.get_nvrtc_pch_dir(),
-                        llvm_cuda=options["llvm_cuda"],
-                        use_precompiled_headers=options["use_precompiled_headers"],
-                    )
+            try:
+                if is_cpu:
+                    # build object code
+                    with warp.ScopedTimer(
+                        "Compile x86", active=(warp.config.verbose or warp.config.log_level <= warp.LOG_DEBUG)
+                    ):
+                        warp._src.build.build_cpu(
+                            output_path,
+                            source_code_path,
+                            mode=mode,
+                            fast_math=options["fast_math"],
+                            verify_fp=options["verify_fp"],
+                            fuse_fp=options["fuse_fp"],
+                            extra_flags=options["cpu_compiler_flags"],
+                            optimization_level=opt,
+                            verbose=warp.config.verbose or warp.config.log_level <= warp.LOG_DEBUG,
+                            use_precompiled_headers=options["use_precompiled_headers"],
+                            pch_dir=runtime.get_clang_pch_dir() if options["use_precompiled_headers"] else None,
+                            block_dim=options["block_dim"],
+                            enable_tiles_in_stack_memory=options["enable_tiles_in_stack_memory"],
+                        )
+                else:
+                    # generate PTX or CUBIN
+                    with warp.ScopedTimer(
+                        f"Compile CUDA (arch={options['output_arch']}{arch_suffix}, mode={mode}, block_dim={options['block_dim']})",
+                        active=(warp.config.verbose or warp.config.log_level <= warp.LOG_DEBUG),
+                    ):
+                        warp._src.build.build_cuda(
+                            source_code_path,
+                            options["output_arch"],
+                            output_path,
+                            config=mode,
+                            optimization_level=opt,
+                            verify_fp=options["verify_fp"],
+                            fast_math=options["fast_math"],
+                            fuse_fp=options["fuse_fp"],
+                            lineinfo=options["lineinfo"],
+                            compile_time_trace=options["compile_time_trace"],
+                            ltoirs=ltoir_values,
+                            fatbins=fatbin_values,
+                            arch_suffix=arch_suffix,
+                            pch_dir=runtime.get_nvrtc_pch_dir(),
+                            llvm_cuda=options["llvm_cuda"],
+                            use_precompiled_headers=options["use_precompiled_headers"],
+                        )
 
-        except Exception as e:
-            if isinstance(e, FileNotFoundError):
-                _check_and_raise_long_path_error(e)
+            except Exception as e:
+                if isinstance(e, FileNotFoundError):
+                    _check_and_raise_long_path_error(e)
 
-            if is_cpu:
-                self.failed_builds.add((None, active_block_dim))
-            elif device:
-                self.failed_builds.add((device.context, active_block_dim))
+                if is_cpu:
+                    self.failed_builds.add((None, active_block_dim))
+                elif device:
+                    self.failed_builds.add((device.context, active_block_dim))
 
-            raise (e)
+                raise (e)
 
-        # ------------------------------------------------------------
-        # write meta data (already produced by ``_run_codegen`` above)
+            # ------------------------------------------------------------
+            # write meta data (already produced by ``_run_codegen`` above)
 
-        output_meta_path = os.path.join(build_dir, self._get_meta_name(block_dim=active_block_dim))
+            output_meta_path = os.path.join(build_dir, self._get_meta_name(block_dim=active_block_dim))
 
-        with open(output_meta_path, "w") as meta_file:
-            json.dump(meta, meta_file)
+            with open(output_meta_path, "w") as meta_file:
+                json.dump(meta, meta_file)
 
-        # -----------------------------------------------------------
-        # update cache
+            # -----------------------------------------------------------
+            # update cache
 
-        # try to move process outputs to cache
-        warp._src.build.safe_rename(build_dir, output_dir)
+            # try to move process outputs to cache
+            warp._src.build.safe_rename(build_dir, output_dir)
 
-        if os.path.exists(output_dir):
-            # final object binary path
-            binary_path = os.path.join(output_dir, output_name)
+            if os.path.exists(output_dir):
+                if not os.path.exists(binary_path) or self.options["strip_hash"]:
+                    # copy our output file to the destination module
+                    # this is necessary in case different processes
+                    # have different GPU architectures / devices
+                    try:
+                        os.replace(output_path, binary_path)
+                    except OSError:
+                        # another process likely updated the module dir first
+                        pass
 
-            if not os.path.exists(binary_path) or self.options["strip_hash"]:
-                # copy our output file to the destination module
-                # this is necessary in case different processes
-                # have different GPU architectures / devices
-                try:
-                    os.replace(output_path, binary_path)
-                except OSError:
-                    # another process likely updated the module dir first
-                    pass
+                if not os.path.exists(meta_path) or self.options["strip_hash"]:
+                    # copy our output file to the destination module
+                    # this is necessary in case different processes
+                    # have different GPU architectures / devices
+                    try:
+                        os.replace(output_meta_path, meta_path)
+                    except OSError:
+                        # another process likely updated the module dir first
+                        pass
 
-            if not os.path.exists(meta_path) or self.options["strip_hash"]:
-                # copy our output file to the destination module
-                # this is necessary in case different processes
-                # have different GPU architectures / devices
                 try:
-                    os.replace(output_meta_path, meta_path)
+                    final_source_path = os.path.join(output_dir, os.path.basename(source_code_path))
+                    if not os.path.exists(final_source_path) or self.options["strip_hash"]:
+                        os.replace(source_code_path, final_source_path)
                 except OSError:
                     # another process likely updated the module dir first
                     pass
+                except Exception as e:
+                    # We don't need source_code_path to be copied successfully to proceed, so warn and keep running
+                    log_warning(f"Exception when renaming {source_code_path}: {e}")
+
+                # clean up build_dir used for this process regardless
+                shutil.rmtree(build_dir, ignore_errors=True)
+
+            return True
+
+    def _use_shared_cache(self, options: dict) -> bool:
+        """Whether loads of this module may use the shared kernel cache tier, see ``warp.config.kernel_cache_shared_dir``."""
+        return (
+            warp.config.kernel_cache_shared_dir is not None
+            and warp.config.cache_kernels
+            and not options["verify_autograd_array_access"]
+            and not self.options["strip_hash"]
+        )
+
+    def _get_cpu_unit_dir(self) -> str:
+        """Get the cache directory holding the per-kernel CPU objects of this module."""
+        return os.path.join(warp.config.kernel_cache_dir, f"wp_{self.name}_units")
+
+    @synchronized(_codegen_lock)
+    def _run_unit_codegen(self, options: dict, kernels: list[Kernel]) -> list[tuple[str, dict]]:
+        """Generate a self-contained CPU translation unit for each kernel.
+
+        Each unit only contains the structs and functions reachable from its
+        kernel. Returns a ``(source, meta)`` pair per kernel.
+        """
+        units = []
+        for kernel in kernels:
+            builder = ModuleBuilder(self, options, kernels=[kernel])
+            units.append((builder.codegen("cpu"), builder.build_meta()))
+        return units
+
+    def _compile_cpu_units(self, options: dict) -> tuple[dict[str, str], dict, int]:
+        """Compile each kernel of this module into its own cached CPU object file.
+
+        Used by :meth:`load` instead of :meth:`_compile` when the
+        ``"cpu_incremental_build"`` option is enabled. A unit is keyed by the
+        kernel hash and the resolved module options, so kernels that did not
+        change keep their cached objects when other kernels in the module are
+        edited. Out-of-date units are compiled concurrently.
+
+        Args:
+            options: Resolved module options for the active ``block_dim`` variant.
+
+        Returns:
+            ``(objects, meta, num_compiled)``: the object file path for each
+            kernel's mangled name, the merged module metadata, and the number
+            of units that were compiled.
+        """
+        options = options | {"output_arch": None}
+        kernels = list(self.hashers[options["block_dim"]].get_unique_kernels())
+
+        # fold the options into every unit key, the same way ModuleHasher folds them into the module hash
+        ch = hashlib.sha256()
+        for opt in sorted(options.keys()):
+            ch.update(bytes(f"{opt}:{options[opt]}", "utf-8"))
+        # -march=native objects are only valid on hosts with the same ISA features
+        if _uses_march_native(options["cpu_compiler_flags"]):
+            ch.update(bytes(_get_cpu_isa_hash(), "utf-8"))
+        options_hash = ch.digest()
+
+        unit_dir = self._get_cpu_unit_dir()
+        unit_dir_name = os.path.basename(unit_dir)
+
+        use_cache = warp.config.cache_kernels and not options["verify_autograd_array_access"]
+        use_shared_cache = self._use_shared_cache(options)
+
+        def is_cached(unit_path: str) -> bool:
+            return use_cache and os.path.exists(unit_path + ".o") and os.path.exists(unit_path + ".meta")
+
+        objects = {}
+        meta = {}
+        pending = []
+        for kernel in kernels:
+            name = kernel.get_mangled_name()
+            # the slot identifies a kernel overload across edits, so that its out-of-date units can be found
+            slot_hash = hashlib.sha256(bytes(f"{kernel.key}:{kernel.sig}", "utf-8") + options_hash).hexdigest()[:8]
+            unit_hash = hashlib.sha256(kernel.hash + options_hash).hexdigest()[:16]
+            unit_name = f"{kernel.key}_{slot_hash}_{unit_hash}"
+            unit_path = os.path.join(unit_dir, unit_name)
+
+            if not is_cached(unit_path) and use_shared_cache:
+                # units missing from the local tier are looked up in the shared tier before compiling
+                shared_dir = warp._src.build.find_shared_cache_entry(
+                    unit_dir_name, (unit_name + ".o", unit_name + ".meta")
+                )
+                if shared_dir is not None:
+                    unit_path = os.path.join(shared_dir, unit_name)
+
+            objects[name] = unit_path + ".o"
+
+            if is_cached(unit_path):
+                with open(unit_path + ".meta") as meta_file:
+                    meta.update(json.load(meta_file))
+            else:
+                pending.append((kernel, unit_path))
+
+        if not pending:
+            warp._src.build.touch_cache_entry(unit_dir)
+            return objects, meta, 0
+
+        # serialised codegen window, see _run_codegen()
+        sources = self._run_unit_codegen(options, [kernel for kernel, _ in pending])
+
+        Path(unit_dir).mkdir(parents=True, exist_ok=True)
 
+        opt = options["optimization_level"]
+        if opt is None:
+            opt = 2
+
+        # per-process/thread suffix for intermediate files, see _compile()
+        build_suffix = f"_p{os.getpid()}_t{threading.get_ident()}"
+
+        def remove_stale_units(unit_path: str):
+            # units of previous versions of the same kernel are never loaded again by this module,
+            # remove them so that repeatedly editing a kernel does not grow the cache without bound
+            unit_name = os.path.basename(unit_path)
+            slot_prefix = unit_name.rpartition("_")[0]
+            # intermediate files of in-flight builds carry a process suffix and do not match
+            unit_pattern = re.compile(rf"({re.escape(slot_prefix)}_[0-9a-f]{{16}})\.(cpp|o|meta|lock)")
             try:
-                final_source_path = os.path.join(output_dir, os.path.basename(source_code_path))
-                if not os.path.exists(final_source_path) or self.options["strip_hash"]:
-                    os.replace(source_code_path, final_source_path)
+                stale_names = {
+                    match.group(1) for match in map(unit_pattern.fullmatch, os.listdir(unit_dir)) if match
+                } - {unit_name}
             except OSError:
-                # another process likely updated the module dir first
-                pass
+                return
+
+            for stale_name in stale_names:
+                stale_path = os.path.join(unit_dir, stale_name)
+                # skip units that another process is still building
+                with warp._src.build.cache_lock(stale_path + ".lock", timeout=0.0) as locked:
+                    if not locked:
+                        continue
+                    # the metadata file marks a unit as complete, so it is removed first
+                    for ext in (".meta", ".o", ".cpp", ".lock"):
+                        try:
+                            os.remove(stale_path + ext)
+                        except OSError:
+                            pass
+
+        def compile_unit(unit_path: str, source: str, unit_meta: dict):
+            # units are shared between processes like whole modules, see _compile()
+            if use_cache:
+                cache_lock = warp._src.build.cache_lock(unit_path + ".lock", timeout=warp.config.compile_lock_timeout)
+            else:
+                cache_lock = contextlib.nullcontext()
+
+            with cache_lock:
+                if is_cached(unit_path):
+                    return
+
+                build_path = unit_path + build_suffix
+                with open(build_path + ".cpp", "w") as source_file:
+                    source_file.write(source)
+
+                warp._src.build.build_cpu(
+                    build_path + ".o",
+                    build_path + ".cpp",
+                    mode=options["mode"],
+                    fast_math=options["fast_math"],
+                    verify_fp=options["verify_fp"],
+                    fuse_fp=options["fuse_fp"],
+                    extra_flags=options["cpu_compiler_flags"],
+                    optimization_level=opt,
+                    verbose=warp.config.verbose or warp.config.log_level <= warp.LOG_DEBUG,
+                    use_precompiled_headers=options["use_precompiled_headers"],
+                    pch_dir=runtime.get_clang_pch_dir() if options["use_precompiled_headers"] else None,
+                    block_dim=options["block_dim"],
+                    enable_tiles_in_stack_memory=options["enable_tiles_in_stack_memory"],
+                )
+
+                with open(build_path + ".meta", "w") as meta_file:
+                    json.dump(unit_meta, meta_file)
+
+                # the metadata file marks a unit as complete, so it is moved into place last
+                for ext in (".cpp", ".o", ".meta"):
+                    os.replace(build_path + ext, unit_path + ext)
+
+                remove_stale_units(unit_path)
+
+            if use_shared_cache:
+                unit_name = os.path.basename(unit_path)
+                warp._src.build.promote_cache_files(unit_dir, unit_dir_name, (unit_name + ".o", unit_name + ".meta"))
+
+        max_workers = warp.config.load_module_max_workers
+        if max_workers is None:
+            max_workers = min(os.cpu_count(), 4)
+
+        with warp.ScopedTimer(
+            f"Compile x86 ({len(pending)} of {len(kernels)} kernels)",
+            active=(warp.config.verbose or warp.config.log_level <= warp.LOG_DEBUG),
+        ):
+            try:
+                if max_workers <= 1 or len(pending) == 1:
+                    for (_, unit_path), (source, unit_meta) in zip(pending, sources, strict=True):
+                        compile_unit(unit_path, source, unit_meta)
+                else:
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        futures = [
+                            executor.submit(compile_unit, unit_path, source, unit_meta)
+                            for (_, unit_path), (source, unit_meta) in zip(pending, sources, strict=True)
+                        ]
+                        for future in futures:
+                            future.result()
             except Exception as e:
-                # We don't need source_code_path to be copied successfully to proceed, so warn and keep running
-                log_warning(f"Exception when renaming {source_code_path}: {e}")
+                if isinstance(e, FileNotFoundError):
+                    _check_and_raise_long_path_error(e)
 
-            # clean up build_dir used for this process regardless
-            shutil.rmtree(build_dir, ignore_errors=True)
+                self.failed_builds.add((None, options["block_dim"]))
+                raise e
 
-        return True
+        for _, unit_meta in sources:
+            meta.update(unit_meta)
+
+        return objects, meta, len(pending)
 
     def load(
         self,
@@ -4026,14 +4516,23 @@ class Module:
         if warp.config.verbose or warp.config.log_level <= warp.LOG_DEBUG:
             module_load_timer_name += f" (block_dim={active_block_dim})"
 
-        with warp.ScopedTimer(
-            module_load_timer_name,
-            active=not warp.config.quiet and warp.config.log_level <= warp.LOG_INFO,
-        ) as module_load_timer:
+        with (
+            warp.ScopedTimer(
+                module_load_timer_name,
+                active=not warp.config.quiet and warp.config.log_level <= warp.LOG_INFO,
+            ) as module_load_timer,
+            warp._src.utils.ScopedCpuActivity(
+                device,
+                lambda: f"module load {self.name}{module_load_timer.extra_msg}",
+                warp._src.utils.TIMING_MODULE,
+                args={"block_dim": active_block_dim},
+            ),
+        ):
             # -----------------------------------------------------------
             # Determine binary path and build if necessary
 
             compiled = False
+            unit_objects = None
             if binary_path:
                 # We will never re-codegen or re-compile in this situation
                 # The expected files must already exist
@@ -4049,21 +4548,56 @@ class Module:
                     raise FileNotFoundError(f"Binary file {binary_path} does not exist")
                 else:
                     module_load_timer.extra_msg = " (cached)"
+            elif device.is_cpu and options["cpu_incremental_build"]:
+                output_arch = None
+
+                try:
+                    unit_objects, meta, num_compiled = self._compile_cpu_units(options)
+                except Exception as e:
+                    module_load_timer.extra_msg = " (error)"
+                    raise e
+
+                compiled = num_compiled > 0 and num_compiled == len(unit_objects)
+                if num_compiled > 0:
+                    warp._src.build.auto_prune_kernel_cache()
+                if compiled:
+                    module_load_timer.extra_msg = " (compiled)"
+                elif num_compiled > 0:
+                    module_load_timer.extra_msg = f" (compiled {num_compiled} of {len(unit_objects)} kernels)"
+                else:
+                    module_load_timer.extra_msg = " (cached)"
             else:
                 output_name = self._get_compile_output_name(device, block_dim=active_block_dim)
                 output_arch = self._get_compile_arch(device)
 
+                meta_name = self._get_meta_name(block_dim=active_block_dim)
                 module_dir = os.path.join(warp.config.kernel_cache_dir, module_name_short)
-                meta_path = os.path.join(module_dir, self._get_meta_name(block_dim=active_block_dim))
+                meta_path = os.path.join(module_dir, meta_name)
                 binary_path = os.path.join(module_dir, output_name)
 
-                try:
-                    compiled = self._compile(device, module_dir, output_name, output_arch, options=options)
-                except Exception as e:
-                    module_load_timer.extra_msg = " (error)"
-                    raise e
+                # fall back to the shared cache tier before compiling a module missing from the local tier
+                shared_dir = None
+                use_shared_cache = self._use_shared_cache(options)
+                if use_shared_cache and not (os.path.exists(binary_path) and os.path.exists(meta_path)):
+                    shared_dir = warp._src.build.find_shared_cache_entry(module_name_short, (output_name, meta_name))
 
-                module_load_timer.extra_msg = " (compiled)" if compiled else " (cached)"
+                if shared_dir is not None:
+                    meta_path = os.path.join(shared_dir, meta_name)
+                    binary_path = os.path.join(shared_dir, output_name)
+                    module_load_timer.extra_msg = " (cached, shared)"
+                else:
+                    try:
+                        compiled = self._compile(device, module_dir, output_name, output_arch, options=options)
+                    except Exception as e:
+                        module_load_timer.extra_msg = " (error)"
+                        raise e
+
+                    module_load_timer.extra_msg = " (compiled)" if compiled else " (cached)"
+
+                    if compiled:
+                        if use_shared_cache:
+                            warp._src.build.promote_cache_files(module_dir, module_name_short, (output_name, meta_name))
+                        warp._src.build.auto_prune_kernel_cache()
 
             if not compiled:
                 self._refresh_deterministic_metadata_for_cache_hit(active_block_dim, options)
@@ -4071,6 +4605,29 @@ class Module:
             # -----------------------------------------------------------
             # Load CPU or CUDA binary
 
+            if unit_objects is not None:
+                # per-kernel objects are loaded as separate LLVM modules
+                module_exec = ModuleExec(
+                    None, module_hash, device, meta, active_block_dim, output_arch, kernel_handles={}
+                )
+                for name, object_path in unit_objects.items():
+                    module_handle = f"wp_{self.name}_{self.increment_id()}"
+                    if (
+                        runtime.llvm.wp_load_obj(
+                            object_path.encode("utf-8"),
+                            module_handle.encode("utf-8"),
+                            warp.config.legacy_cpu_linker,
+                        )
+                        != 0
+                    ):
+                        raise Exception(
+                            f"Failed to load CPU object for kernel '{name}' of module '{self.name}' "
+                            f"({module_load_diagnostics})"
+                        )
+                    module_exec.kernel_handles[name] = module_handle
+                self.execs[(None, active_block_dim)] = module_exec
+                return module_exec
+
             if os.path.exists(meta_path):
                 with open(meta_path) as meta_file:
                     meta = json.load(meta_file)
@@ -5818,6 +6375,19 @@ class Runtime:
                 ctypes.POINTER(APICLaunchInfo),  # apic_info
             ]
             self.core.wp_cpu_launch_kernel.restype = None
+            self.core.wp_cpu_launch_kernel_parallel.argtypes = [
+                ctypes.c_void_p,  # func
+                ctypes.c_void_p,  # bounds
+                ctypes.c_void_p,  # args
+                ctypes.c_void_p,  # adj_args
+                ctypes.c_size_t,  # size
+                ctypes.c_int,  # num_threads
+            ]
+            self.core.wp_cpu_launch_kernel_parallel.restype = None
+            self.core.wp_cpu_hardware_threads.argtypes = []
+            self.core.wp_cpu_hardware_threads.restype = ctypes.c_int
+            self.core.wp_cpu_set_max_threads.argtypes = [ctypes.c_int]
+            self.core.wp_cpu_set_max_threads.restype = None
             self.core.wp_apic_register_cpu_kernel.argtypes = [
                 ctypes.c_void_p,
                 ctypes.c_char_p,  # kernel_key
@@ -7348,6 +7918,10 @@ class Runtime:
                 f"{native_error}"
             )
 
+        # host sort/scan/run-length encode read the thread count from the native library;
+        # later changes are forwarded by warp.config
+        self.core.wp_cpu_set_max_threads(warp.config.cpu_max_threads)
+
         self.device_map = {}  # device lookup by alias
         self.context_map = {}  # device lookup by context
 
@@ -7463,6 +8037,9 @@ class Runtime:
         # global tape
         self.tape = None
 
+        # host activity recorder, see warp.timing_begin()
+        self.cpu_timing = None
+
         # print device and version information
         if not warp.config.quiet and warp.config.log_level <= warp.LOG_INFO:
             greeting = []
@@ -9747,6 +10324,92 @@ def pack_arg(kernel, arg_type, arg_name, value, device, adjoint=False):
             ) from e
 
 
+def _make_arg_packer(kernel, arg_type, value_type, adjoint):
+    """Return a fast packer for values of ``value_type`` passed as a kernel argument of ``arg_type``.
+
+    The packers cover the common argument kinds (arrays, scalars, value types, and structs)
+    and skip the type dispatch of :func:`pack_arg`. ``None`` is returned for everything else,
+    which is then packed by :func:`pack_arg` on every launch.
+    """
+    if warp._src.types.is_array(arg_type):
+        if adjoint:
+            array_matches = issubclass(value_type, warp.array)
+        else:
+            array_matches = value_type is warp._src.types.concrete_array_type(arg_type)
+
+        if not array_matches:
+            return None
+
+        dtype = arg_type.dtype
+        ndim = arg_type.ndim
+
+        def pack_array(value):
+            # arrays of other dtypes or dimensions share the Python type, so check them on every launch
+            if value.dtype is not dtype or value.ndim != ndim:
+                raise TypeError
+            return value.__ctype__()
+
+        return pack_array
+
+    elif isinstance(arg_type, warp._src.codegen.Struct):
+        if value_type is type(None):
+            return None
+        return lambda value: value.__ctype__()
+
+    elif arg_type in (Texture1D, Texture2D, Texture3D) or not isinstance(arg_type, type):
+        return None
+
+    elif issubclass(arg_type, ctypes.Array):
+        if warp._src.types.types_equal(value_type, arg_type):
+            return lambda value: value
+        return None
+
+    elif issubclass(arg_type, ctypes.Structure):
+        return None
+
+    elif arg_type in (warp._src.types.float16, warp._src.types.bfloat16):
+        return None
+
+    elif value_type in (int, float, bool):
+        return arg_type._type_
+
+    return None
+
+
+def _pack_launch_args(kernel, args, params, device, adjoint=False):
+    """Convert launch arguments to the kernel's expected ctypes and append them to ``params``.
+
+    Equivalent to calling :func:`pack_arg` for each argument, but the per-argument
+    dispatch is resolved once per argument type signature and cached on the kernel,
+    so repeated launches with the same kinds of arguments only pay for the conversion.
+    """
+    kernel_args = kernel.adj.args
+
+    # the diagnostic array access checks are only performed by pack_arg()
+    if warp.config.launch_array_access_mode == warp.config.LaunchArrayAccessMode.RELAXED:
+        cache_key = (adjoint, *map(type, args))
+        packers = kernel._launch_packers.get(cache_key)
+        if packers is None:
+            packers = tuple(_make_arg_packer(kernel, kernel_args[i].type, type(a), adjoint) for i, a in enumerate(args))
+            kernel._launch_packers[cache_key] = packers
+
+        start = len(params)
+        try:
+            for i, a in enumerate(args):
+                packer = packers[i]
+                if packer is None:
+                    params.append(pack_arg(kernel, kernel_args[i].type, kernel_args[i].label, a, device, adjoint))
+                else:
+                    params.append(packer(a))
+            return
+        except Exception:
+            # repack through pack_arg(), which either handles the value or raises the usual error
+            del params[start:]
+
+    for i, a in enumerate(args):
+        params.append(pack_arg(kernel, kernel_args[i].type, kernel_args[i].label, a, device, adjoint))
+
+
 def _build_cpu_args_structs(kernel, hooks, params, adjoint):
     """Build the ArgsStruct (and AdjArgsStruct) for a CPU kernel launch.
 
@@ -9763,16 +10426,14 @@ def _build_cpu_args_structs(kernel, hooks, params, adjoint):
         else:
             ArgsStruct, fields = cached
 
-        args = ArgsStruct()
-        for i, field in enumerate(fields):
-            setattr(args, field[0], params[1 + i])
+        # positional construction fills all fields in one call instead of a setattr() per field
+        num_fields = len(fields)
+        args = ArgsStruct(*params[1 : 1 + num_fields])
 
         if not adjoint:
             return args, None
 
-        adj_args = AdjArgsStruct()
-        for i, field in enumerate(adj_fields):
-            setattr(adj_args, field[0], params[1 + len(fields) + i])
+        adj_args = AdjArgsStruct(*params[1 + num_fields : 1 + num_fields + len(adj_fields)])
         return args, adj_args
 
     # Slow path: build struct types and cache
@@ -9806,8 +10467,52 @@ def _build_cpu_args_structs(kernel, hooks, params, adjoint):
     return args, adj_args
 
 
+def _call_cpu_kernel(hooks, bounds, args, adj_args, num_threads: int):
+    """Run a CPU kernel entry point, splitting the launch across host threads when possible.
+
+    ``num_threads`` follows :attr:`warp.config.cpu_max_threads`: 1 runs on the calling
+    thread and values <= 0 use all hardware threads. Kernels without range entry points
+    (see :class:`KernelHooks`) always run on the calling thread.
+    """
+    if num_threads != 1 and bounds.size > 1:
+        range_func = hooks.forward_range if adj_args is None else hooks.backward_range
+        if range_func is not None:
+            runtime.core.wp_cpu_launch_kernel_parallel(
+                range_func,
+                ctypes.byref(bounds),
+                ctypes.byref(args),
+                None if adj_args is None else ctypes.byref(adj_args),
+                bounds.size,
+                num_threads,
+            )
+            return
+
+    if adj_args is None:
+        hooks.forward(ctypes.byref(bounds), ctypes.byref(args))
+    else:
+        hooks.backward(ctypes.byref(bounds), ctypes.byref(args), ctypes.byref(adj_args))
+
+
 # invoke a CPU kernel by passing the parameters as a ctypes structure
-def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool):
+def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool, num_threads: int = 1):
+    recorder = runtime.cpu_timing
+    if recorder is None or not recorder.filter & warp._src.utils.TIMING_KERNEL:
+        _invoke(kernel, hooks, params, adjoint, num_threads)
+        return
+
+    start = time.perf_counter_ns()
+    _invoke(kernel, hooks, params, adjoint, num_threads)
+    bounds = params[0]
+    recorder.record(
+        runtime.get_device("cpu"),
+        f"{'backward' if adjoint else 'forward'} kernel {kernel.key}",
+        warp._src.utils.TIMING_KERNEL,
+        start,
+        args={"dim": tuple(bounds.shape), "threads": num_threads},
+    )
+
+
+def _invoke(kernel, hooks, params: Sequence[Any], adjoint: bool, num_threads: int):
     # Build cache key from parameter types
     param_types = tuple(type(p) for p in params[1:])  # skip launch bounds
     cache_key = (param_types, adjoint)
@@ -9820,17 +10525,15 @@ def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool):
         else:
             ArgsStruct, fields = cached
 
-        args = ArgsStruct()
-        for i, field in enumerate(fields):
-            setattr(args, field[0], params[1 + i])
+        # positional construction fills all fields in one call instead of a setattr() per field
+        num_fields = len(fields)
+        args = ArgsStruct(*params[1 : 1 + num_fields])
 
         if not adjoint:
-            hooks.forward(ctypes.byref(params[0]), ctypes.byref(args))
+            _call_cpu_kernel(hooks, params[0], args, None, num_threads)
         else:
-            adj_args = AdjArgsStruct()
-            for i, field in enumerate(adj_fields):
-                setattr(adj_args, field[0], params[1 + len(fields) + i])
-            hooks.backward(ctypes.byref(params[0]), ctypes.byref(args), ctypes.byref(adj_args))
+            adj_args = AdjArgsStruct(*params[1 + num_fields : 1 + num_fields + len(adj_fields)])
+            _call_cpu_kernel(hooks, params[0], args, adj_args, num_threads)
         return
 
     # Slow path: build struct types and cache them
@@ -9849,7 +10552,7 @@ def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool):
 
     if not adjoint:
         kernel._invoke_cache[cache_key] = (ArgsStruct, fields)
-        hooks.forward(ctypes.byref(params[0]), ctypes.byref(args))
+        _call_cpu_kernel(hooks, params[0], args, None, num_threads)
 
     # for adjoint kernels the adjoint arguments are passed through a second struct
     else:
@@ -9868,7 +10571,7 @@ def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool):
             setattr(adj_args, name, params[1 + len(fields) + i])
 
         kernel._invoke_cache[cache_key] = (ArgsStruct, AdjArgsStruct, fields, adj_fields)
-        hooks.backward(ctypes.byref(params[0]), ctypes.byref(args), ctypes.byref(adj_args))
+        _call_cpu_kernel(hooks, params[0], args, adj_args, num_threads)
 
 
 def _build_cuda_kernel_params(params: Sequence[Any]):
@@ -9907,6 +10610,7 @@ class Launch:
         adjoint: bool = False,
         fwd_args: list[Any] | None = None,
         adj_args: list[Any] | None = None,
+        cpu_threads: int | None = None,
     ):
         # retain the module executable so it doesn't get unloaded
         self.module_exec = kernel.module.load(device, block_dim)
@@ -9978,6 +10682,10 @@ class Launch:
         self.adjoint: bool = adjoint
         """Whether to run the adjoint kernel instead of the forward kernel."""
 
+        self.cpu_threads: int | None = cpu_threads
+        """The number of host threads used to run the launch on a CPU device.
+        If ``None``, :attr:`warp.config.cpu_max_threads` is read at launch time."""
+
         self.grid_stride: bool = kernel.grid_stride
         """Whether the kernel uses a grid-stride loop (vs the lean 3D launch). Selects the grid shape."""
 
@@ -10210,7 +10918,13 @@ class Launch:
                     )
                 self._apic_record_cpu()
             else:
-                invoke(self.kernel, self.hooks, self.params, self.adjoint)
+                invoke(
+                    self.kernel,
+                    self.hooks,
+                    self.params,
+                    self.adjoint,
+                    warp.config.cpu_max_threads if self.cpu_threads is None else self.cpu_threads,
+                )
         else:
             if stream is None:
                 stream = self.device.stream
@@ -10405,6 +11119,7 @@ def launch(
     record_cmd: bool = False,
     max_blocks: int = 0,
     block_dim: int = 256,
+    cpu_threads: int | None = None,
 ):
     """Launch a Warp kernel on the target device
 
@@ -10432,6 +11147,10 @@ def launch(
           ``@wp.kernel(grid_stride=False)`` and ``max_blocks > 0`` raises
           a ``RuntimeError``.
         block_dim: The number of threads per block (always 1 for "cpu" devices).
+        cpu_threads: The number of host threads used to run the launch on a CPU device.
+          ``1`` runs on the calling thread and ``0`` or a negative value uses all hardware
+          threads. If ``None``, defaults to :attr:`warp.config.cpu_max_threads`.
+          Ignored for CUDA devices.
     """
 
     init()
@@ -10517,19 +11236,13 @@ def launch(
         # first param is the number of threads
         params = [bounds]
 
-        # converts arguments to kernel's expected ctypes and packs into params
-        def pack_args(args, params, adjoint=False):
-            for i, a in enumerate(args):
-                arg_type = kernel.adj.args[i].type
-                arg_name = kernel.adj.args[i].label
-
-                params.append(pack_arg(kernel, arg_type, arg_name, a, device, adjoint))
-
         # late bind
         hooks = module_exec.get_kernel_hooks(kernel)
 
-        pack_args(fwd_args, params, adjoint=False)
-        pack_args(adj_args, params, adjoint=True)
+        # converts arguments to kernel's expected ctypes and packs into params
+        _pack_launch_args(kernel, fwd_args, params, device, adjoint=False)
+        if adj_args:
+            _pack_launch_args(kernel, adj_args, params, device, adjoint=True)
 
         # Deterministic mode: redirect to the launcher that supplies the hidden
         # deterministic buffers. Backward kernels use the same path so generated
@@ -10611,6 +11324,7 @@ def launch(
                     adjoint=adjoint,
                     fwd_args=fwd_args,
                     adj_args=adj_args,
+                    cpu_threads=cpu_threads,
                 )
                 return launch
 
@@ -10655,7 +11369,9 @@ def launch(
                     ctypes.byref(apic_info),
                 )
             else:
-                invoke(kernel, hooks, params, adjoint)
+                invoke(
+                    kernel, hooks, params, adjoint, warp.config.cpu_max_threads if cpu_threads is None else cpu_threads
+                )
 
         else:
             kernel_args = [ctypes.c_void_p(ctypes.addressof(x)) for x in params]
@@ -11597,6 +12313,8 @@ def set_module_options(options: dict[str, Any], module: Any = None):
     * **mode**: The compilation mode to use, can be ``"debug"`` or ``"release"``, defaults to the value of ``warp.config.mode``.
     * **optimization_level**: Compiler optimization level (0-3). When ``None``, falls back to ``warp.config.optimization_level``; if that is also ``None``, uses target-specific defaults (``-O2`` for CPU, ``-O3`` for CUDA).
     * **cpu_compiler_flags**: CPU compiler flags (see ``warp.config.cpu_compiler_flags``), defaults to the global config value when ``None``.
+    * **cpu_simd_width**: Number of consecutive launch indices processed per batch by CPU forward kernels. The kernel body is inlined into a vectorization-friendly loop so that elementwise kernels can compile to SIMD instructions (e.g. AVX2 or AVX-512 with ``-march=native``); leftover indices run one at a time. Must be ``0`` (disabled, the default) or a power of two up to ``64``; ``8`` or ``16`` are typical choices for ``float32`` kernels.
+    * **cpu_incremental_build**: Compile each kernel of the module into its own CPU object file, cached by the kernel's content hash, so that editing one kernel only recompiles that kernel. Out-of-date kernels are compiled in parallel using ``warp.config.load_module_max_workers`` threads. If ``None`` (the default), defers to ``warp.config.cpu_incremental_build``.
     * **deterministic**: Determinism guarantee for supported atomic operations. Accepted values are ``warp.DeterministicMode.NOT_GUARANTEED``, ``warp.DeterministicMode.RUN_TO_RUN``, and ``warp.DeterministicMode.GPU_TO_GPU``. Defaults to the value of ``warp.config.deterministic`` when the module is created.
     * **deterministic_max_records**: Per-target, per-thread upper bound for deterministic scatter records. Defaults to ``0``, which means use the code-generated lower bound only. This is useful when dynamic loops or repeated visits to the same atomic site can emit more records than static analysis can prove.
     * **block_dim**: The default number of threads to assign to each block, defaults to ``256``.
@@ -13061,7 +13779,15 @@ def copy(
                     src.device.context, dst_ptr, src_ptr, bytes_to_copy, stream.cuda_stream
                 )
             else:
-                result = runtime.core.wp_memcpy_h2h(dst_ptr, src_ptr, bytes_to_copy)
+                recorder = runtime.cpu_timing
+                if recorder is None or not recorder.filter & warp._src.utils.TIMING_MEMCPY:
+                    result = runtime.core.wp_memcpy_h2h(dst_ptr, src_ptr, bytes_to_copy)
+                else:
+                    start = time.perf_counter_ns()
+                    result = runtime.core.wp_memcpy_h2h(dst_ptr, src_ptr, bytes_to_copy)
+                    recorder.record(
+                        src.device, "memcpy HtoH", warp._src.utils.TIMING_MEMCPY, start, args={"bytes": bytes_to_copy}
+                    )
 
         if not result:
             raise RuntimeError(f"Warp copy error: {runtime.get_error_string()}")
@@ -4,18 +4,19 @@
 import ast
 import bisect
 import hashlib
+import itertools
 import pickle
 import re
 import weakref
 from collections.abc import Callable
-from typing import Any, ClassVar, Optional
+from typing import Any, ClassVar, NamedTuple, Optional
 
 import warp as wp
 from warp._src.codegen import Struct, StructInstance, get_annotations
 from warp._src.fem.operator import Integrand
 from warp._src.fem.types import Domain, Field
 from warp._src.logger import log_warning
-from warp._src.types import get_type_code, type_repr, type_scalar_type, type_size, type_size_in_bytes, type_to_warp
+from warp._src.types import get_type_code, type_repr, type_size_in_bytes, type_to_warp
 
 _kernel_cache = {}
 _struct_cache = {}
@@ -437,9 +438,37 @@ class TemporaryStore:
     or can be set globally as the default store using :func:`set_default_temporary_store`.
 
     By default, there is no default temporary store, so that temporary allocations are not persisted.
+
+    Buffers are pooled by size in bytes for each device, so that a buffer released by a temporary
+    may be reused by subsequent temporaries of any data type.
+
+    Args:
+        max_resident_bytes: Maximum total size of the buffers held by the store. When exceeded, buffers that are
+          not currently borrowed are freed in least-recently-used order. Borrowed buffers are never freed,
+          so the resident size may temporarily exceed this limit. If ``None`` (default), buffers are never freed
+          until the store is cleared or destroyed.
     """
 
     _default_store: ClassVar[Optional["TemporaryStore"]] = None
+    _lru_clock: ClassVar[itertools.count] = itertools.count()
+
+    class Statistics(NamedTuple):
+        """Usage statistics of a :class:`TemporaryStore`, see :attr:`TemporaryStore.statistics`."""
+
+        hits: int
+        """Number of borrows served by a previously allocated buffer"""
+        misses: int
+        """Number of borrows that required a new allocation"""
+        trimmed: int
+        """Number of buffers freed to respect the resident size limit"""
+        resident_bytes: int
+        """Total size of the buffers currently held by the store, borrowed or not"""
+        peak_resident_bytes: int
+        """Largest value reached by ``resident_bytes``"""
+        borrowed_bytes: int
+        """Total size of the buffers currently borrowed"""
+        peak_borrowed_bytes: int
+        """Largest value reached by ``borrowed_bytes``"""
 
     class Pool:
         class Deleter:
@@ -456,20 +485,18 @@ class TemporaryStore:
                 if pool is not None:
                     pool.detach(temporary)
 
-        def __init__(self, dtype, device, pinned: bool):
-            self.dtype = dtype
+        def __init__(self, device, pinned: bool, store: "TemporaryStore"):
             self.device = device
             self.pinned = pinned
 
             self._pool: list[int] = []  # Currently available buffers for borrowing, ordered by size
-            self._pool_capacities: list[int] = []  # Sizes of available arrays for borrowing, ascending
+            self._pool_capacities: list[int] = []  # Sizes in bytes of available buffers for borrowing, ascending
+            self._lru: dict[int, int] = {}  # Available buffers, from least to most recently redeemed
             self._allocs: dict[int, tuple[int, object]] = {}  # ptr -> (capacity, deallocate)
 
-            self._dtype_size = type_size_in_bytes(dtype)
+            self._store = weakref.ref(store)
             self._deleter = TemporaryStore.Pool.Deleter(self)
 
-            # self._held_temporaries = set()  # Temporaries that are prevented from going out of scope
-
         def borrow(self, shape, dtype, requires_grad: bool):
             if requires_grad:
                 grad = self.borrow(shape=shape, dtype=dtype, requires_grad=False)
@@ -478,7 +505,7 @@ class TemporaryStore:
             else:
                 grad = None
 
-            capacity = self._dtype_size
+            capacity = type_size_in_bytes(dtype)
             if isinstance(shape, int):
                 capacity *= shape
             else:
@@ -493,12 +520,14 @@ class TemporaryStore:
                     a=self._pool_capacities,
                     x=capacity,
                 )
-                if index < len(self._pool):
-                    # Big enough array found, remove from pool
+                hit = index < len(self._pool)
+                if hit:
+                    # Big enough buffer found, remove from pool
                     ptr = self._pool.pop(index)
                     capacity = self._pool_capacities.pop(index)
+                    del self._lru[ptr]
                 else:
-                    # No big enough array found, allocate new one
+                    # No big enough buffer found, allocate new one
                     if len(self._pool) > 0:
                         grow_factor = 1.5
                         capacity = max(int(self._pool_capacities[-1] * grow_factor), capacity)
@@ -509,6 +538,10 @@ class TemporaryStore:
                     self._allocs[ptr] = (capacity, allocator.deallocate)
                 deleter = self._deleter
 
+                store = self._store()
+                if store is not None:
+                    store._on_borrow(capacity, hit)
+
             temporary = Temporary(
                 ptr=ptr,
                 capacity=capacity,
@@ -523,18 +556,50 @@ class TemporaryStore:
 
         def redeem(self, ptr: int):
             capacity, _ = self._allocs[ptr]
-            # Insert back array into available pool
+            # Insert back buffer into available pool
             index = bisect.bisect_left(
                 a=self._pool_capacities,
                 x=capacity,
             )
             self._pool.insert(index, ptr)
             self._pool_capacities.insert(index, capacity)
+            self._lru[ptr] = next(TemporaryStore._lru_clock)
+
+            store = self._store()
+            if store is not None:
+                store._on_redeem(capacity)
 
         def detach(self, array: Temporary):
-            _, deallocate = self._allocs.pop(array.ptr)
+            capacity, deallocate = self._allocs.pop(array.ptr)
             array.deleter = deallocate
 
+            store = self._store()
+            if store is not None:
+                store._on_detach(capacity)
+
+        def can_trim(self) -> bool:
+            # Freeing memory used by a graph being captured is not allowed
+            return len(self._lru) > 0 and not (self.device.is_cuda and self.device.is_capturing)
+
+        def least_recently_used(self) -> int:
+            return next(iter(self._lru.values()))
+
+        def trim(self) -> int:
+            """Free the least recently used available buffer and return its capacity."""
+            ptr = next(iter(self._lru))
+            del self._lru[ptr]
+
+            capacity, deallocate = self._allocs.pop(ptr)
+            index = bisect.bisect_left(a=self._pool_capacities, x=capacity)
+            index = self._pool.index(ptr, index)
+            del self._pool[index]
+            del self._pool_capacities[index]
+
+            with self.device.context_guard:
+                deallocate(ptr, capacity)
+
+            return capacity
+
         def __del__(self):
             for ptr, (capacity, deallocate) in self._allocs.items():
                 try:
@@ -544,13 +609,92 @@ class TemporaryStore:
                     # Suppress TypeError and AttributeError when callables become None during shutdown
                     pass
 
-    def __init__(self):
+    def __init__(self, max_resident_bytes: int | None = None):
+        self._max_resident_bytes = max_resident_bytes
         self.clear()
 
     def clear(self):
-        """Clear all cached temporary pools."""
+        """Clear all cached temporary pools and reset statistics."""
         self._temporaries = {}
 
+        self._hits = 0
+        self._misses = 0
+        self._trimmed = 0
+        self._resident_bytes = 0
+        self._peak_resident_bytes = 0
+        self._borrowed_bytes = 0
+        self._peak_borrowed_bytes = 0
+
+    @property
+    def max_resident_bytes(self) -> int | None:
+        """Maximum total size of the buffers held by the store, or ``None`` for no limit."""
+        return self._max_resident_bytes
+
+    @max_resident_bytes.setter
+    def max_resident_bytes(self, value: int | None):
+        self._max_resident_bytes = value
+        self.trim()
+
+    @property
+    def statistics(self) -> "TemporaryStore.Statistics":
+        """Current usage statistics of the store."""
+        return TemporaryStore.Statistics(
+            hits=self._hits,
+            misses=self._misses,
+            trimmed=self._trimmed,
+            resident_bytes=self._resident_bytes,
+            peak_resident_bytes=self._peak_resident_bytes,
+            borrowed_bytes=self._borrowed_bytes,
+            peak_borrowed_bytes=self._peak_borrowed_bytes,
+        )
+
+    def trim(self, max_resident_bytes: int | None = None):
+        """Free buffers that are not currently borrowed, in least-recently-used order, until the resident size
+        is at most ``max_resident_bytes``.
+
+        Args:
+            max_resident_bytes: Target resident size. If ``None``, uses :attr:`max_resident_bytes`;
+              if that is also ``None``, nothing is freed.
+        """
+
+        from warp._src.context import runtime  # noqa: PLC0415
+
+        if max_resident_bytes is None:
+            max_resident_bytes = self._max_resident_bytes
+        if max_resident_bytes is None or runtime._apic_capture is not None:
+            return
+
+        while self._resident_bytes > max_resident_bytes:
+            pools = [pool for pool in self._temporaries.values() if pool.can_trim()]
+            if not pools:
+                break
+
+            pool = min(pools, key=TemporaryStore.Pool.least_recently_used)
+            self._resident_bytes -= pool.trim()
+            self._trimmed += 1
+
+    def _on_borrow(self, capacity: int, hit: bool):
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+            self._resident_bytes += capacity
+            self._peak_resident_bytes = max(self._peak_resident_bytes, self._resident_bytes)
+
+        self._borrowed_bytes += capacity
+        self._peak_borrowed_bytes = max(self._peak_borrowed_bytes, self._borrowed_bytes)
+
+        if not hit:
+            self.trim()
+
+    def _on_redeem(self, capacity: int):
+        self._borrowed_bytes -= capacity
+        self.trim()
+
+    def _on_detach(self, capacity: int):
+        self._borrowed_bytes -= capacity
+        self._resident_bytes -= capacity
+
     def borrow(self, shape, dtype, pinned: bool = False, device=None, requires_grad: bool = False) -> Temporary:
         """Borrow a temporary array from the pool.
 
@@ -561,19 +705,30 @@ class TemporaryStore:
             device: Device on which to allocate the temporary.
             requires_grad: Whether to allocate a gradient array.
         """
+
         dtype = type_to_warp(dtype)
         device = wp.get_device(device)
 
-        type_length = type_size(dtype)
-        key = (dtype._type_, type_length, pinned, device.ordinal)
+        from warp._src.context import runtime  # noqa: PLC0415
+
+        # During APIC graph capture, bypass the recycling pool. The captured byte
+        # stream references buffers by pointer, so a borrowed temporary must not be
+        # handed back to a later borrow. A non-pool array -- its own allocator
+        # deleter, never entered into Pool._allocs -- is never re-issued; track_array()
+        # retains it via the capture's _regions for the graph's lifetime, and
+        # release()/detach() are suppressed while a capture is active (see
+        # _release_temporary).
+        if runtime._apic_capture is not None:
+            return TemporaryStore.add_temporary_convenience_methods(
+                Temporary(shape=shape, dtype=dtype, pinned=pinned, device=device, requires_grad=requires_grad)
+            )
+
+        key = (pinned, device.ordinal)
 
         try:
             pool = self._temporaries[key]
         except KeyError:
-            value_type = (
-                cached_vec_type(length=type_length, dtype=type_scalar_type(dtype)) if type_length > 1 else dtype
-            )
-            pool = TemporaryStore.Pool(value_type, device, pinned=pinned)
+            pool = TemporaryStore.Pool(device, pinned=pinned, store=self)
             self._temporaries[key] = pool
 
         res = TemporaryStore.add_temporary_convenience_methods(
@@ -655,19 +810,10 @@ def borrow_temporary(
         device: device on which the memory should be allocated; if ``None``, the current device will be used.
     """
 
-    from warp._src.context import runtime  # noqa: PLC0415
-
     if temporary_store is None:
         temporary_store = TemporaryStore._default_store
 
-    # During APIC graph capture, bypass the recycling pool. The captured byte
-    # stream references buffers by pointer, so a borrowed temporary must not be
-    # handed back to a later borrow. A non-pool array -- its own allocator
-    # deleter, never entered into Pool._allocs -- is never re-issued; track_array()
-    # retains it via the capture's _regions for the graph's lifetime, and
-    # release()/detach() are suppressed while a capture is active (see
-    # _release_temporary).
-    if temporary_store is None or runtime._apic_capture is not None:
+    if temporary_store is None:
         return TemporaryStore.add_temporary_convenience_methods(
             Temporary(shape=shape, dtype=dtype, pinned=pinned, device=device, requires_grad=requires_grad)
         )
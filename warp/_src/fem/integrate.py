@@ -50,8 +50,17 @@ from warp._src.fem.types import (
 from warp._src.fem.utils import type_zero_element
 from warp._src.logger import log_warning
 from warp._src.types import is_array, type_length, type_repr, type_scalar_type, type_size, type_to_warp
-from warp._src.utils import array_cast, array_scan
-from warp.sparse import BsrMatrix, bsr_axpy, bsr_compress, bsr_set_from_triplets, bsr_set_zero, bsr_zeros
+from warp._src.utils import array_cast, array_scan, radix_sort_pairs
+from warp.optim.linear import LinearOperator
+from warp.sparse import (
+    BsrMatrix,
+    bsr_axpy,
+    bsr_block_index,
+    bsr_compress,
+    bsr_set_from_triplets,
+    bsr_set_zero,
+    bsr_zeros,
+)
 
 __all__ = ["integrate", "interpolate"]
 
@@ -1401,6 +1410,182 @@ def _count_integrate_bsr_rows_from_sorted_rows(
     row_counts[row] = row_end - row_beg
 
 
+@wp.kernel(enable_backward=False)
+def _assembly_plan_triplet_blocks(
+    rows: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    row_count: int,
+    col_count: int,
+    invalid_block: int,
+    bsr_offsets: wp.array(dtype=int),
+    bsr_columns: wp.array(dtype=int),
+    triplet_blocks: wp.array(dtype=int),
+    triplet_indices: wp.array(dtype=int),
+):
+    i = wp.tid()
+
+    row = rows[i]
+    col = columns[i]
+
+    block = invalid_block
+    if row >= 0 and row < row_count and col >= 0 and col < col_count:
+        block_index = bsr_block_index(row, col, bsr_offsets, bsr_columns)
+        if block_index >= 0:
+            block = block_index
+
+    triplet_blocks[i] = block
+    triplet_indices[i] = i
+
+
+@wp.kernel(enable_backward=False)
+def _assembly_plan_block_offsets(
+    triplet_count: int,
+    sorted_blocks: wp.array(dtype=int),
+    block_offsets: wp.array(dtype=int),
+):
+    block = wp.tid()
+
+    if triplet_count == 0:
+        block_offsets[block] = 0
+        return
+
+    # wp.lower_bound() clamps to arr_end - 1
+    idx = wp.lower_bound(sorted_blocks, 0, triplet_count, block)
+    block_offsets[block] = wp.where(sorted_blocks[idx] < block, triplet_count, idx)
+
+
+@wp.kernel(enable_backward=False)
+def _assembly_plan_gather_values(
+    block_offsets: wp.array(dtype=int),
+    triplet_order: wp.array(dtype=int),
+    triplet_values: wp.array3d(dtype=Any),
+    block_values: wp.array3d(dtype=Any),
+):
+    block, i, j = wp.tid()
+
+    val = block_values.dtype(0)
+    for k in range(block_offsets[block], block_offsets[block + 1]):
+        val += triplet_values[triplet_order[k], i, j]
+
+    block_values[block, i, j] = val
+
+
+class AssemblyPlan:
+    """Reusable sparsity pattern and scatter map for the assembly of bilinear forms with :func:`integrate`.
+
+    A plan is passed to :func:`integrate` through ``bsr_options={"plan": plan}``. The first integration
+    builds the sparse matrix from triplets as usual, and records which block of the resulting matrix
+    each triplet contributes to. Subsequent integrations of the same form over the same discretization
+    only re-evaluate the integrand, then sum the triplet values directly into the blocks of the
+    recorded matrix. Sorting and compression are skipped entirely, no memory is allocated, and the
+    summation order is deterministic, so the replay path may be captured in a CUDA graph.
+
+    The plan owns the triplet buffers and the assembled matrix, which is returned by :func:`integrate`
+    when no ``output`` is provided. If an ``output`` matrix is provided for the recording call, the plan
+    records into that matrix, and the same matrix must be passed to subsequent calls (or ``output`` omitted).
+    With ``add=True``, the plan's matrix is assembled first and then added to ``output``.
+
+    The recorded pattern is only valid as long as the node topology of the test and trial spaces
+    is unchanged; call :meth:`reset` after modifying the geometry, partition, or restriction.
+    Plans do not propagate gradients from the matrix values back to the integrand's inputs,
+    and are only supported with the default ``"compact"`` matrix topology and triplet construction.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Discards the recorded pattern; the next integration will record it again."""
+        self.matrix: BsrMatrix | None = None
+        """Sparse matrix assembled by the plan, or ``None`` if no pattern has been recorded yet"""
+
+        self._key = None
+        self._triplet_rows = None
+        self._triplet_cols = None
+        self._triplet_values = None
+        self._triplet_order = None
+        self._block_offsets = None
+        self._block_values = None
+
+    @property
+    def is_recorded(self) -> bool:
+        """Whether the sparsity pattern and scatter map have been recorded."""
+        return self._key is not None
+
+    @property
+    def triplet_count(self) -> int:
+        """Number of candidate triplets evaluated by the integrand kernel at each assembly."""
+        return 0 if self._triplet_cols is None else self._triplet_cols.shape[0]
+
+    def _check_key(self, key):
+        if self._key != key:
+            raise ValueError(
+                "The integrand, fields, or output type differ from those used to record the assembly plan; "
+                "call AssemblyPlan.reset() or use a separate plan"
+            )
+
+    def _triplet_arrays(self, nnz: int, block_shape: tuple[int, int], dtype: type, device):
+        if self._triplet_cols is None:
+            self._triplet_rows = wp.empty(shape=(nnz,), dtype=int, device=device)
+            self._triplet_cols = wp.empty(shape=(nnz,), dtype=int, device=device)
+            self._triplet_values = wp.empty(shape=(nnz, *block_shape), dtype=dtype, device=device)
+
+        return self._triplet_rows, self._triplet_cols, self._triplet_values
+
+    def _record(self, key, matrix: BsrMatrix):
+        device = matrix.device
+        triplet_count = self.triplet_count
+        block_count = matrix.nnz_sync()
+
+        # Map each triplet to its destination block; triplets that do not land
+        # in the matrix are sent to a sentinel block sorted after all valid ones
+        triplet_blocks = wp.empty(shape=(2 * triplet_count,), dtype=int, device=device)
+        triplet_order = wp.empty(shape=(2 * triplet_count,), dtype=int, device=device)
+        wp.launch(
+            _assembly_plan_triplet_blocks,
+            dim=triplet_count,
+            device=device,
+            inputs=[
+                self._triplet_rows,
+                self._triplet_cols,
+                matrix.nrow,
+                matrix.ncol,
+                block_count,
+                matrix.offsets,
+                matrix.columns,
+                triplet_blocks,
+                triplet_order,
+            ],
+        )
+        radix_sort_pairs(triplet_blocks, triplet_order, count=triplet_count, end_bit=max(1, block_count.bit_length()))
+
+        block_offsets = wp.empty(shape=(block_count + 1,), dtype=int, device=device)
+        wp.launch(
+            _assembly_plan_block_offsets,
+            dim=block_count + 1,
+            device=device,
+            inputs=[triplet_count, triplet_blocks, block_offsets],
+        )
+
+        self._key = key
+        self.matrix = matrix
+        self._triplet_order = triplet_order[:triplet_count]
+        self._block_offsets = block_offsets
+        self._block_values = _bsr_values_as_3d_array(matrix.values[:block_count], matrix.block_shape)
+
+        # Row indices are not needed anymore once the scatter map is known,
+        # subsequent assemblies will skip writing them
+        self._triplet_rows = None
+
+    def _assemble(self):
+        wp.launch(
+            _assembly_plan_gather_values,
+            dim=self._block_values.shape,
+            device=self._block_values.device,
+            inputs=[self._block_offsets, self._triplet_order, self._triplet_values, self._block_values],
+        )
+
+
 def _launch_integrate_kernel(
     integrand: Integrand,
     kernel: wp.Kernel,
@@ -1645,9 +1830,31 @@ def _launch_integrate_kernel(
             raise RuntimeError(f"Output matrix blocks must have shape {getattr(block_type, '_shape_', (1, 1))}")
 
     sparse_bsr_options, capacity_policy, construction_policy = _normalize_fem_bsr_options(bsr_options)
+    plan = sparse_bsr_options.pop("plan", None)
     topology = sparse_bsr_options.get("topology", "compact")
     padded_bsr = topology == "padded"
 
+    if plan is not None:
+        if not isinstance(plan, AssemblyPlan):
+            raise TypeError(f"bsr_options['plan'] must be a fem.AssemblyPlan, got {type(plan).__name__}")
+        if topology != "compact":
+            raise ValueError("Assembly plans only support the 'compact' sparse matrix topology")
+        if construction_policy == _BSR_CONSTRUCTION_ROW_COMPRESS:
+            raise ValueError("Assembly plans are not compatible with bsr_options['construction']='row_compress'")
+
+        plan_key = (
+            kernel.key,
+            str(device),
+            nnz,
+            test.space_partition.node_count(),
+            trial.space_partition.node_count(),
+            block_type,
+        )
+        if plan.is_recorded:
+            plan._check_key(plan_key)
+            if output is not None and not add_to_output and output is not plan.matrix:
+                raise ValueError("The output matrix must be the one recorded by the assembly plan")
+
     if capacity_policy == _BSR_CAPACITY_REUSE:
         if add_to_output:
             raise RuntimeError("fem.integrate() does not support bsr_options['capacity']='reuse' with add=True")
@@ -1655,13 +1862,16 @@ def _launch_integrate_kernel(
             raise RuntimeError("fem.integrate() with bsr_options['capacity']='reuse' requires an output matrix")
 
     output_values_require_grad = isinstance(output, BsrMatrix) and output.values.requires_grad
-    row_compress_bsr = construction_policy in (_BSR_CONSTRUCTION_ROW_COMPRESS, _BSR_CONSTRUCTION_AUTO)
+    row_compress_bsr = plan is None and construction_policy in (_BSR_CONSTRUCTION_ROW_COMPRESS, _BSR_CONSTRUCTION_AUTO)
 
     # If we're doing row-local compression or padded assembly,
     # we need to pre-compute per-row capacity.
     bsr_result = None if add_to_output else output
 
-    if row_compress_bsr or padded_bsr:
+    if plan is not None and plan.is_recorded:
+        # The sparsity pattern is already known
+        bsr_result = plan.matrix
+    elif row_compress_bsr or padded_bsr:
         precomputed_offsets_topology = "compact" if nodal else "padded"
 
         if bsr_result is None:
@@ -1709,7 +1919,11 @@ def _launch_integrate_kernel(
             device=device,
         )
 
-    if row_compress_bsr:
+    if plan is not None:
+        triplet_rows, triplet_cols, triplet_values = plan._triplet_arrays(
+            nnz, (test.node_dof_count, trial.node_dof_count), dtype=output_dtype, device=device
+        )
+    elif row_compress_bsr:
         triplet_rows = None
         triplet_cols = bsr_result.columns[:nnz]
         triplet_values = _bsr_values_as_3d_array(bsr_result.values[:nnz], bsr_result.block_shape)
@@ -1847,7 +2061,19 @@ def _launch_integrate_kernel(
             device=device,
         )
 
-    if row_compress_bsr:
+    if plan is not None:
+        if plan.is_recorded:
+            plan._assemble()
+        else:
+            # Keep explicit zeros, as their values may change in subsequent assemblies
+            if capacity_policy == _BSR_CAPACITY_REUSE:
+                _require_bsr_capacity(bsr_result, nnz, "fem.integrate()")
+            sparse_bsr_options["prune_numerical_zeros"] = False
+            bsr_set_from_triplets(
+                bsr_result, rows=triplet_rows, columns=triplet_cols, values=triplet_values, **sparse_bsr_options
+            )
+            plan._record(plan_key, bsr_result)
+    elif row_compress_bsr:
         bsr_compress(bsr_result, inplace=not output_values_require_grad, **sparse_bsr_options)
     else:
         if capacity_policy == _BSR_CAPACITY_REUSE and topology == "compact":
@@ -1941,6 +2167,8 @@ def integrate(
           :func:`warp.sparse.bsr_compress()`. For row compression, :func:`warp.sparse.bsr_compress()`
           uses ``inplace=False`` when ``output.values.requires_grad`` is true; non-differentiable outputs use
           in-place compression for the lowest memory overhead.
+          For bilinear forms, ``plan`` accepts an :class:`AssemblyPlan` that records the sparsity pattern
+          on first use and reassembles only the matrix values on subsequent calls.
     """
     if fields is None:
         fields = {}
@@ -2072,6 +2300,107 @@ def integrate(
     )
 
 
+def integrate_operator(
+    integrand: Integrand,
+    domain: GeometryDomain | None = None,
+    quadrature: Quadrature | None = None,
+    fields: dict[str, FieldLike] | None = None,
+    values: dict[str, Any] | None = None,
+    accumulate_dtype: type = wp.float64,
+    device=None,
+    temporary_store: cache.TemporaryStore | None = None,
+    kernel_options: dict[str, Any] | None = None,
+    assembly: str | None = None,
+) -> LinearOperator:
+    """
+    Returns a matrix-free linear operator applying a bilinear form, without assembling its sparse matrix.
+
+    Each application of the operator to a vector ``x`` of trial degrees of freedom integrates the linear
+    form obtained by substituting the trial field with the discrete field whose degrees of freedom are ``x``.
+    This trades repeated integrand evaluations for the memory and bandwidth cost of storing the matrix,
+    which is usually favorable for high-order function spaces.
+    The result can be passed as the left-hand side of the iterative solvers from :mod:`warp.optim.linear`.
+
+    Args:
+        integrand: Bilinear form to be applied, must have :func:`integrand` decorator
+        domain: Integration domain. If None, deduced from fields
+        quadrature: Quadrature formula. If None, deduced from domain and fields degree.
+        fields: Discrete, test, and trial fields to be passed to the integrand. Must contain exactly one test and one trial field.
+        values: Additional variable values to be passed to the integrand. Arrays are captured by reference,
+          so their content may be modified between applications of the operator.
+        accumulate_dtype: Scalar type to be used for accumulating integration samples
+        device: Device on which to perform the integration
+        temporary_store: shared pool from which to allocate temporary arrays
+        kernel_options: Overloaded options to be passed to the kernel builder (e.g, ``{"enable_backward": True}``)
+        assembly: Strategy for assembling the linear form at each application, see :func:`integrate`.
+          The ``"dispatch"`` strategy evaluates the trial field once per quadrature point
+          instead of once per quadrature point and test node, which is usually the most efficient for high-order spaces.
+
+    Returns:
+        A :class:`warp.optim.linear.LinearOperator` with one row (resp. column) per scalar degree of freedom of the
+        test (resp. trial) space partition, operating on arrays of the test and trial spaces' ``dof_dtype``.
+    """
+    if fields is None:
+        fields = {}
+
+    if device is None:
+        device = wp.get_device()
+
+    if not isinstance(integrand, Integrand):
+        raise ValueError("integrand must be tagged with @warp.fem.integrand decorator")
+
+    arguments = _parse_integrand_arguments(integrand, fields)
+    if arguments.test_name is None or arguments.trial_name is None:
+        raise ValueError("fem.integrate_operator() requires a bilinear form with both a test and a trial field")
+
+    test = arguments.field_args[arguments.test_name]
+    trial = arguments.field_args[arguments.trial_name]
+    if test.domain != trial.domain:
+        raise ValueError("Incompatible test and trial domains")
+
+    # Substitute the trial field with a discrete field pointing to the operand
+    trial_field = trial.space.make_field(space_partition=trial.space_partition)
+    operator_fields = dict(fields)
+    operator_fields[arguments.trial_name] = trial_field
+
+    dof_dtype = test.space.dof_dtype
+    result = wp.empty(shape=test.space_partition.node_count(), dtype=dof_dtype, device=device)
+
+    def apply(x: wp.array, output: wp.array):
+        trial_field.dof_values = x
+        integrate(
+            integrand,
+            domain=domain,
+            quadrature=quadrature,
+            fields=operator_fields,
+            values=values,
+            accumulate_dtype=accumulate_dtype,
+            output=output,
+            device=device,
+            temporary_store=temporary_store,
+            kernel_options=kernel_options,
+            assembly=assembly,
+        )
+
+    def matvec(x: wp.array, y: wp.array, z: wp.array, alpha: float, beta: float):
+        if beta == 0.0 and z.ptr != x.ptr:
+            apply(x, z)
+            if alpha != 1.0:
+                array_axpy(x=z, y=z, alpha=alpha, beta=0.0)
+            return
+
+        apply(x, result)
+        if z.ptr != y.ptr and beta != 0.0:
+            wp.copy(src=y, dest=z)
+        array_axpy(x=result, y=z, alpha=alpha, beta=beta)
+
+    shape = (
+        test.space_partition.node_count() * test.node_dof_count,
+        trial.space_partition.node_count() * trial.node_dof_count,
+    )
+    return LinearOperator(shape, dof_dtype, device, matvec=matvec)
+
+
 def get_interpolate_at_nodes_function(
     integrand_func: wp.Function,
     domain: GeometryDomain,
@@ -2884,6 +3213,8 @@ def _launch_interpolate_kernel(
     elt_index_arg = domain.element_index_arg_value(device=device)
 
     sparse_bsr_options, capacity_policy, construction_policy = _normalize_fem_bsr_options(bsr_options)
+    if "plan" in sparse_bsr_options:
+        raise ValueError("fem.interpolate() does not support assembly plans")
     topology = sparse_bsr_options.get("topology", "compact")
     padded_bsr = topology == "padded"
     dest_values_require_grad = isinstance(dest, BsrMatrix) and dest.values.requires_grad
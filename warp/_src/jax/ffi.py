@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import collections
 import ctypes
+import functools
 import inspect
 import threading
 import traceback
@@ -18,6 +19,7 @@ from warp._src.context import (
     _build_launch_bounds,
     _raise_cuda_launch_error,
     _validate_cluster_launch,
+    invoke,
 )
 from warp._src.jax import get_jax_device
 from warp._src.logger import log_warning
@@ -230,13 +232,8 @@ class FfiKernel:
             out_id += 1
         self.input_output_aliases = input_output_aliases
 
-        # register the callback
-        jax = _get_jax()
-        FFI_CCALLFUNC = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.POINTER(XLA_FFI_CallFrame))
-        self.callback_func = FFI_CCALLFUNC(self.ffi_callback)
-        ffi_ccall_address = ctypes.cast(self.callback_func, ctypes.c_void_p)
-        ffi_capsule = jax.ffi.pycapsule(ffi_ccall_address.value)
-        jax.ffi.register_ffi_target(self.name, ffi_capsule, platform="CUDA")
+        # register the callbacks
+        self.callback_func, self.cpu_callback_func = register_ffi_targets(self.name, self.ffi_callback)
 
     def __call__(self, *args, output_dims=None, launch_dims=None, vmap_method=None):
         jax = _get_jax()
@@ -337,10 +334,8 @@ class FfiKernel:
                     dev = wp.device_from_jax(d)
                 except Exception:
                     # ignore unsupported devices like TPUs
-                    pass
-                # we only support CUDA devices for now
-                if dev.is_cuda:
-                    self.kernel.module.load(dev)
+                    continue
+                self.kernel.module.load(dev)
 
         # save launch data to be retrieved by callback
         launch_id = self.launch_id
@@ -351,7 +346,7 @@ class FfiKernel:
 
         return call(*args, launch_id=launch_id)
 
-    def ffi_callback(self, call_frame):
+    def ffi_callback(self, call_frame, is_cpu=False):
         try:
             # On the first call, XLA runtime will query the API version and traits
             # metadata using the |extension| field. Let us respond to that query
@@ -445,6 +440,17 @@ class FfiKernel:
                 launch_bounds = _build_launch_bounds(launch_dims, self.kernel.adj.kernel_dim)
                 kernel_params[0] = ctypes.addressof(launch_bounds)
 
+                if is_cpu:
+                    # launch directly on the XLA host buffers, the module is loaded on demand
+                    device = wp.get_device("cpu")
+                    if self.kernel.module.load(device) is None:
+                        raise RuntimeError(f"Failed to load module for kernel '{self.kernel.key}' on device {device}")
+                    hooks = self.kernel.module.get_kernel_hooks(self.kernel, device)
+                    assert hooks.forward, "Failed to find kernel entry point"
+
+                    invoke(self.kernel, hooks, [launch_bounds, *arg_refs], False, wp.config.cpu_max_threads)
+                    return None
+
                 # get device and stream
                 device = wp.get_cuda_device(get_device_ordinal_from_callframe(call_frame.contents))
                 stream = get_stream_from_callframe(call_frame.contents)
@@ -623,13 +629,8 @@ class FfiCallable:
             out_id += 1
         self.input_output_aliases = input_output_aliases
 
-        # register the callback
-        jax = _get_jax()
-        FFI_CCALLFUNC = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.POINTER(XLA_FFI_CallFrame))
-        self.callback_func = FFI_CCALLFUNC(self.ffi_callback)
-        ffi_ccall_address = ctypes.cast(self.callback_func, ctypes.c_void_p)
-        ffi_capsule = jax.ffi.pycapsule(ffi_ccall_address.value)
-        jax.ffi.register_ffi_target(self.name, ffi_capsule, platform="CUDA")
+        # register the callbacks
+        self.callback_func, self.cpu_callback_func = register_ffi_targets(self.name, self.ffi_callback)
 
     def __call__(self, *args, output_dims=None, vmap_method=None):
         jax = _get_jax()
@@ -720,10 +721,8 @@ class FfiCallable:
                     dev = wp.device_from_jax(d)
                 except Exception:
                     # ignore unsupported devices like TPUs
-                    pass
-                # we only support CUDA devices for now
-                if dev.is_cuda:
-                    module.load(dev)
+                    continue
+                module.load(dev)
 
         # save call data to be retrieved by callback
         call_id = self.call_id
@@ -731,7 +730,7 @@ class FfiCallable:
         self.call_id += 1
         return call(*args, call_id=call_id)
 
-    def ffi_callback(self, call_frame):
+    def ffi_callback(self, call_frame, is_cpu=False):
         try:
             # On the first call, XLA runtime will query the API version and traits
             # metadata using the |extension| field. Let us respond to that query
@@ -771,6 +770,14 @@ class FfiCallable:
                 assert num_inputs == self.num_inputs
                 assert num_outputs == self.num_outputs
 
+                if is_cpu:
+                    # graph modes only apply to CUDA, host callbacks always run the function directly
+                    device = wp.get_device("cpu")
+                    arg_list = self._build_arg_list(inputs, outputs, call_desc, device)
+                    with wp.ScopedDevice(device):
+                        self.func(*arg_list)
+                    return None
+
                 cuda_stream = get_stream_from_callframe(call_frame.contents)
                 device_ordinal = get_device_ordinal_from_callframe(call_frame.contents)
 
@@ -881,26 +888,7 @@ class FfiCallable:
                 stream = wp.Stream(device, cuda_stream=cuda_stream)
 
                 # reconstruct the argument list
-                arg_list = []
-
-                # input and in-out args
-                for i, arg in enumerate(self.input_args):
-                    if arg.is_array:
-                        buffer = inputs[i].contents
-                        shape = collapse_batch_dims(buffer.dims[: buffer.rank - arg.dtype_ndim], arg.type.ndim)
-                        arr = wp.array(ptr=buffer.data, dtype=arg.type.dtype, shape=shape, device=device)
-                        arg_list.append(arr)
-                    else:
-                        # scalar argument, get stashed value
-                        value = call_desc.static_inputs[arg.name]
-                        arg_list.append(value)
-
-                # pure output args (skip in-out FFI buffers)
-                for i, arg in enumerate(self.output_args):
-                    buffer = outputs[i + self.num_in_out].contents
-                    shape = collapse_batch_dims(buffer.dims[: buffer.rank - arg.dtype_ndim], arg.type.ndim)
-                    arr = wp.array(ptr=buffer.data, dtype=arg.type.dtype, shape=shape, device=device)
-                    arg_list.append(arr)
+                arg_list = self._build_arg_list(inputs, outputs, call_desc, device)
 
                 # call the Python function with reconstructed arguments
                 with wp.ScopedStream(stream, sync_enter=False):
@@ -1057,6 +1045,30 @@ class FfiCallable:
 
         return None
 
+    def _build_arg_list(self, inputs, outputs, call_desc, device):
+        arg_list = []
+
+        # input and in-out args
+        for i, arg in enumerate(self.input_args):
+            if arg.is_array:
+                buffer = inputs[i].contents
+                shape = collapse_batch_dims(buffer.dims[: buffer.rank - arg.dtype_ndim], arg.type.ndim)
+                arr = wp.array(ptr=buffer.data, dtype=arg.type.dtype, shape=shape, device=device)
+                arg_list.append(arr)
+            else:
+                # scalar argument, get stashed value
+                value = call_desc.static_inputs[arg.name]
+                arg_list.append(value)
+
+        # pure output args (skip in-out FFI buffers)
+        for i, arg in enumerate(self.output_args):
+            buffer = outputs[i + self.num_in_out].contents
+            shape = collapse_batch_dims(buffer.dims[: buffer.rank - arg.dtype_ndim], arg.type.ndim)
+            arr = wp.array(ptr=buffer.data, dtype=arg.type.dtype, shape=shape, device=device)
+            arg_list.append(arr)
+
+        return arg_list
+
     def _prepare_staging(self, arg_list, call_desc):
         # create staging arrays
         input_callback_arrays = []
@@ -1210,7 +1222,7 @@ def jax_kernel(
         - Scalars must be static arguments in JAX.
         - Input and input-output arguments must precede the output arguments in the ``kernel`` definition.
         - There must be at least one output or input-output argument.
-        - Only the CUDA backend is supported.
+        - Only the CPU and CUDA backends are supported.
         - ``output_dims`` and ``in_out_argnames`` are not supported when ``enable_backward=True``.
     """
 
@@ -1591,7 +1603,8 @@ def jax_callable(
         - Scalars must be static arguments in JAX.
         - Input and input-output arguments must precede the output arguments in the ``func`` definition.
         - There must be at least one output or input-output argument.
-        - Only the CUDA backend is supported.
+        - Only the CPU and CUDA backends are supported. On the CPU backend, ``graph_mode`` is ignored
+          and ``func`` is called directly on the XLA host buffers.
     """
 
     check_jax_version()
@@ -1749,6 +1762,26 @@ def register_ffi_callback(name: str, func: Callable, graph_compatible: bool = Tr
 #
 ###############################################################################
 
+
+def register_ffi_targets(name: str, callback: Callable) -> tuple:
+    """Register ``callback(call_frame, is_cpu)`` as the CUDA and CPU handler of an FFI target.
+
+    Returns the ctypes function objects, which must be kept alive for as long as the target is in use.
+    """
+    jax = _get_jax()
+
+    FFI_CCALLFUNC = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.POINTER(XLA_FFI_CallFrame))
+    cuda_callback_func = FFI_CCALLFUNC(callback)
+    cpu_callback_func = FFI_CCALLFUNC(functools.partial(callback, is_cpu=True))
+
+    for callback_func, platform in ((cuda_callback_func, "CUDA"), (cpu_callback_func, "cpu")):
+        ffi_ccall_address = ctypes.cast(callback_func, ctypes.c_void_p)
+        ffi_capsule = jax.ffi.pycapsule(ffi_ccall_address.value)
+        jax.ffi.register_ffi_target(name, ffi_capsule, platform=platform)
+
+    return cuda_callback_func, cpu_callback_func
+
+
 # ensure unique FFI callback names
 ffi_name_counts = {}
 
@@ -1,6 +1,11 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
+from typing import Any
+
+import numpy as np
+
 import warp as wp
 
 
@@ -200,3 +205,235 @@ class Adam:
             )
         else:
             raise RuntimeError("Params data type not supported in Adam step kernels.")
+
+
+@wp.kernel
+def fused_adam_increment_step_kernel(step: wp.array(dtype=int)):
+    step[0] = step[0] + 1
+
+
+@functools.cache
+def _create_fused_adam_step_kernel(scalar_type):
+    @wp.kernel(module="unique", enable_backward=False)
+    def fused_adam_step_kernel(
+        param_ptrs: wp.array(dtype=wp.uint64),
+        grad_ptrs: wp.array(dtype=wp.uint64),
+        offsets: wp.array(dtype=int),
+        m: wp.array(dtype=Any),
+        v: wp.array(dtype=Any),
+        step: wp.array(dtype=int),
+        lr: float,
+        beta1: float,
+        beta2: float,
+        eps: float,
+        weight_decay: float,
+    ):
+        i = wp.tid()
+
+        # locate the parameter array this flattened scalar belongs to
+        s = wp.lower_bound(offsets, i + 1) - 1
+        start = offsets[s]
+        count = offsets[s + 1] - start
+        j = i - start
+
+        params = wp.array(ptr=param_ptrs[s], shape=(count,), dtype=scalar_type)
+        g = wp.array(ptr=grad_ptrs[s], shape=(count,), dtype=scalar_type)
+
+        # the step counter has already been advanced, so it is the 1-based step index
+        t = m.dtype(step[0])
+        one = m.dtype(1.0)
+        b1 = m.dtype(beta1)
+        b2 = m.dtype(beta2)
+
+        gi = m.dtype(g[j])
+        pi = m.dtype(params[j])
+
+        # decoupled weight decay (AdamW)
+        pi = pi * (one - m.dtype(lr) * m.dtype(weight_decay))
+
+        mi = b1 * m[i] + (one - b1) * gi
+        vi = b2 * v[i] + (one - b2) * gi * gi
+        m[i] = mi
+        v[i] = vi
+
+        mhat = mi / (one - wp.pow(b1, t))
+        vhat = vi / (one - wp.pow(b2, t))
+        params[j] = scalar_type(pi - m.dtype(lr) * mhat / (wp.sqrt(vhat) + m.dtype(eps)))
+
+    return fused_adam_step_kernel
+
+
+class _FusedAdamGroup:
+    """Parameters sharing a scalar type, updated by a single fused launch."""
+
+    def __init__(self, scalar_type, params, device):
+        self.scalar_type = scalar_type
+        self.params = params
+
+        sizes = [param.size * wp._src.types.type_size(param.dtype) for param in params]
+        offsets = np.zeros(len(params) + 1, dtype=np.int32)
+        np.cumsum(sizes, out=offsets[1:])
+        self.size = int(offsets[-1])
+
+        self.offsets = wp.array(offsets, dtype=int, device=device)
+        self.param_ptrs = wp.array([param.ptr or 0 for param in params], dtype=wp.uint64, device=device)
+        self.grad_ptrs = wp.zeros(len(params), dtype=wp.uint64, device=device)
+        self.grad_ptrs_host = None
+
+        # moments are kept in fp32 for fp16 params, and in the parameter precision otherwise
+        moment_type = wp.float64 if scalar_type == wp.float64 else wp.float32
+        self.m = wp.zeros(self.size, dtype=moment_type, device=device)
+        self.v = wp.zeros(self.size, dtype=moment_type, device=device)
+
+        self.kernel = _create_fused_adam_step_kernel(scalar_type)
+
+    def set_grads(self, grads):
+        grad_ptrs = tuple(g.ptr or 0 for g in grads)
+        if grad_ptrs != self.grad_ptrs_host:
+            self.grad_ptrs.assign(np.array(grad_ptrs, dtype=np.uint64))
+            self.grad_ptrs_host = grad_ptrs
+
+
+class FusedAdam:
+    """Multi-tensor Adam optimizer with optional decoupled weight decay (AdamW).
+
+    Unlike :class:`Adam`, which launches one kernel per parameter array, this
+    optimizer flattens all parameters into a segment table and updates every
+    array sharing a scalar type with a single kernel launch. The step count is
+    kept in a device array and advanced by a kernel, so :meth:`step` can be
+    recorded once with :class:`warp.ScopedCapture` and replayed without baking
+    a fixed step index into the graph.
+
+    Parameters may use any float scalar type (:class:`warp.float16`,
+    :class:`warp.float32`, :class:`warp.float64`) or vector and matrix types
+    built from them. Moments are stored in fp32 for fp16 parameters and in the
+    parameter precision otherwise. All parameters must be contiguous and live on
+    the same device.
+
+    The interface is similar to `PyTorch's torch.optim.AdamW
+    <https://pytorch.org/docs/stable/generated/torch.optim.AdamW.html>`_ with
+    ``fused=True``. With ``weight_decay=0.0`` the update matches :class:`Adam`.
+
+    Args:
+        params: List of :class:`warp.array` objects to optimize. Can be ``None``
+            and set later via :meth:`set_params`.
+        lr: Learning rate (step size).
+        betas: Coefficients ``(beta1, beta2)`` for computing running averages of
+            the gradient and its square.
+        eps: Small constant added to denominator for numerical stability.
+        weight_decay: Decoupled weight decay coefficient. Each step scales the
+            parameters by ``1 - lr * weight_decay`` before the Adam update.
+
+    Note:
+        The gradient arrays are addressed through a pointer table that is only
+        re-uploaded when their addresses change. When capturing :meth:`step` in
+        a CUDA graph, run one step before capturing and keep passing the same
+        gradient arrays afterwards.
+    """
+
+    def __init__(self, params=None, lr=0.001, betas=(0.9, 0.999), eps=1e-08, weight_decay=0.0):
+        self.lr = lr
+        self.beta1 = betas[0]
+        self.beta2 = betas[1]
+        self.eps = eps
+        self.weight_decay = weight_decay
+        self.params = None
+        self.device = None
+        self.t = None  # device-side step counter
+        self._groups = []
+        self._layout = None
+        self.set_params(params)
+
+    def set_params(self, params):
+        """Set parameters to optimize and allocate moment buffers.
+
+        The moment buffers and step counter are preserved if the parameters keep
+        the same storage, dtype, and shape as before, and reset otherwise.
+
+        Args:
+            params: List of :class:`warp.array` objects to optimize, or ``None``.
+        """
+        self.params = params
+        if params is None or not isinstance(params, list) or len(params) == 0:
+            self._groups = []
+            self._layout = None
+            return
+
+        device = params[0].device
+        for param in params:
+            if param.device != device:
+                raise ValueError(
+                    f"All parameters of FusedAdam must be on the same device, got {device} and {param.device}"
+                )
+            if not param.is_contiguous:
+                raise ValueError("FusedAdam requires contiguous parameter arrays")
+            if wp._src.types.type_scalar_type(param.dtype) not in (wp.float16, wp.float32, wp.float64):
+                raise RuntimeError(f"Unsupported dtype for Warp FusedAdam optimizer: {param.dtype}")
+
+        layout = tuple((param.ptr, param.dtype, param.shape) for param in params)
+        if layout == self._layout and device == self.device:
+            return
+
+        self.device = device
+        self._layout = layout
+
+        groups = {}
+        for index, param in enumerate(params):
+            groups.setdefault(wp._src.types.type_scalar_type(param.dtype), []).append(index)
+        self._groups = [
+            (indices, _FusedAdamGroup(scalar_type, [params[i] for i in indices], device))
+            for scalar_type, indices in groups.items()
+        ]
+
+        self.t = wp.zeros(1, dtype=int, device=device)
+
+    def reset_internal_state(self):
+        """Reset moment buffers and step counter to zero."""
+        for _, group in self._groups:
+            group.m.zero_()
+            group.v.zero_()
+        if self.t is not None:
+            self.t.zero_()
+
+    def step(self, grad=None):
+        """Apply one fused Adam step using the provided gradients.
+
+        Args:
+            grad: List of gradient arrays matching ``params``. If ``None``, the
+                ``grad`` attribute of each parameter array is used.
+        """
+        assert self.params is not None
+
+        if grad is None:
+            grad = [param.grad for param in self.params]
+
+        if len(grad) != len(self.params):
+            raise ValueError(f"Expected {len(self.params)} gradient arrays, got {len(grad)}")
+        for param, g in zip(self.params, grad, strict=True):
+            if g is None or g.dtype != param.dtype or g.shape != param.shape or not g.is_contiguous:
+                raise ValueError("FusedAdam gradients must be contiguous arrays matching the parameter dtype and shape")
+
+        wp.launch(fused_adam_increment_step_kernel, dim=1, inputs=[self.t], device=self.device)
+
+        for indices, group in self._groups:
+            if group.size == 0:
+                continue
+            group.set_grads([grad[i] for i in indices])
+            wp.launch(
+                group.kernel,
+                dim=group.size,
+                inputs=[
+                    group.param_ptrs,
+                    group.grad_ptrs,
+                    group.offsets,
+                    group.m,
+                    group.v,
+                    self.t,
+                    self.lr,
+                    self.beta1,
+                    self.beta2,
+                    self.eps,
+                    self.weight_decay,
+                ],
+                device=self.device,
+            )
@@ -4,17 +4,22 @@
 import functools
 import math
 from collections.abc import Callable
-from typing import Any
+from typing import Any, NamedTuple
+
+import numpy as np
 
 import warp as wp
 import warp.sparse as sparse
+from warp._src.sparse import _as_3d_array, _bsr_row_end, _vec_array_view
 from warp._src.types import type_is_matrix, type_is_vector, type_length, type_scalar_type
 
 __all__ = [
     "CG",
     "CR",
     "GMRES",
+    "AMGPreconditioner",
     "BiCGSTAB",
+    "ILU0Preconditioner",
     "LinearOperator",
     "LinearSolverState",
     "aslinearoperator",
@@ -189,6 +194,12 @@ def preconditioner(A: _Matrix, ptype: str = "diag") -> LinearOperator:
 
          - ``"diag"``: Diagonal (a.k.a. Jacobi) preconditioner
          - ``"diag_abs"``: Similar to Jacobi, but using the absolute value of diagonal coefficients
+         - ``"amg"``: Smoothed-aggregation algebraic multigrid preconditioner with default settings,
+           only for :class:`warp.sparse.BsrMatrix`. See :class:`AMGPreconditioner`
+         - ``"ilu0"``: Incomplete LU factorization with zero fill-in, only for :class:`warp.sparse.BsrMatrix`.
+           See :class:`ILU0Preconditioner`
+         - ``"ic0"``: Incomplete Cholesky factorization with zero fill-in, for symmetric :class:`warp.sparse.BsrMatrix`.
+           Equivalent to ``"ilu0"``, whose factors are symmetric for symmetric matrices
          - ``"id"``: Identity (null) preconditioner
     """
 
@@ -196,6 +207,10 @@ def preconditioner(A: _Matrix, ptype: str = "diag") -> LinearOperator:
         return None
     if ptype in ("diag", "diag_abs"):
         return _make_jacobi_preconditioner(A, use_abs=ptype == "diag_abs")
+    if ptype == "amg":
+        return AMGPreconditioner(A)
+    if ptype in ("ilu0", "ic0"):
+        return ILU0Preconditioner(A)
 
     raise ValueError(f"Unsupported preconditioner type '{ptype}'")
 
@@ -227,6 +242,528 @@ def _make_jacobi_preconditioner(A: _Matrix, use_abs: bool) -> LinearOperator:
     return aslinearoperator(inv_diag)
 
 
+class AMGPreconditioner(LinearOperator):
+    """Smoothed-aggregation algebraic multigrid (SA-AMG) preconditioner for sparse matrices.
+
+    The multigrid hierarchy is built from the block sparsity graph of ``A``: block rows that are
+    strongly connected are grouped into aggregates using a parallel distance-two maximal independent set,
+    and the tentative piecewise-constant prolongator (one identity block per aggregated block row)
+    is smoothed with one weighted Jacobi iteration. Coarse operators are computed with the Galerkin
+    product :math:`A_{l+1} = P_l^T A_l P_l`, and the coarsest level is solved with a dense pseudo-inverse.
+
+    Applying the preconditioner performs one V-cycle, which only consists of kernel launches and sparse
+    matrix-vector products, so it can be captured in a CUDA graph along with the iterative solver.
+
+    When only the coefficients of ``A`` change but not its sparsity pattern, :meth:`update` recomputes the
+    numerical values of the hierarchy while keeping the aggregates and the sparsity of all levels.
+
+    Args:
+        A: Square sparse matrix with square blocks for which to build the preconditioner.
+            Block matrices are aggregated per block row, so each block row should correspond to one node.
+        max_levels: Maximum number of levels in the hierarchy, including the finest one.
+        coarse_size: Maximum number of scalar rows of the coarsest level. Coarsening stops once a level
+            is smaller than this size, and that level is solved with a dense pseudo-inverse. If coarsening
+            stops early on a larger level, the smoother is used on that level instead.
+        strength_threshold: Threshold :math:`\\theta` for strong connections between block rows ``i`` and ``j``,
+            defined as :math:`\\|A_{ij}\\| \\geq \\theta \\sqrt{\\|A_{ii}\\| \\|A_{jj}\\|}` with Frobenius block norms.
+        smoother: Relaxation applied before and after the coarse-grid correction, either ``"jacobi"``
+            for weighted point Jacobi or ``"chebyshev"`` for a Chebyshev polynomial of the Jacobi-preconditioned operator.
+        smoother_steps: Number of Jacobi sweeps, or degree of the Chebyshev polynomial, for each pre- and post-smoothing.
+        jacobi_weight: Weight of the Jacobi smoother and of the prolongator smoothing, relative to
+            the inverse of an upper bound of the spectral radius of :math:`D^{-1} A`.
+    """
+
+    def __init__(
+        self,
+        A: sparse.BsrMatrix,
+        max_levels: int = 10,
+        coarse_size: int = 256,
+        strength_threshold: float = 0.08,
+        smoother: str = "jacobi",
+        smoother_steps: int = 2,
+        jacobi_weight: float = 4.0 / 3.0,
+    ):
+        if not isinstance(A, sparse.BsrMatrix):
+            raise ValueError("AMG preconditioner requires a warp.sparse.BsrMatrix")
+        if A.nrow != A.ncol or A.block_shape[0] != A.block_shape[1]:
+            raise ValueError(f"AMG preconditioner requires a square matrix with square blocks, got {A.block_shape}")
+        if smoother not in ("jacobi", "chebyshev"):
+            raise ValueError(f"Unsupported AMG smoother '{smoother}'")
+        if max_levels < 1:
+            raise ValueError("max_levels must be at least 1")
+
+        super().__init__(A.shape, A.dtype, A.device, matvec=self._apply)
+
+        self._max_levels = max_levels
+        self._coarse_size = coarse_size
+        self._strength_threshold = strength_threshold
+        self._chebyshev = smoother == "chebyshev"
+        self._smoother_steps = smoother_steps
+        self._jacobi_weight = A.scalar_type(jacobi_weight)
+
+        self._levels: list[_AMGLevel] = []
+        self._coarse_inverse = None
+        self._coarse_solver = None
+        self._build(A)
+
+    @property
+    def num_levels(self) -> int:
+        """Number of levels in the multigrid hierarchy, including the finest one."""
+        return len(self._levels)
+
+    @property
+    def level_shapes(self) -> list[tuple[int, int]]:
+        """Shapes of the matrices of each level of the hierarchy, from finest to coarsest."""
+        return [level.A.shape for level in self._levels]
+
+    def update(self, A: sparse.BsrMatrix | None = None):
+        """Recompute the numerical values of the hierarchy after the coefficients of the fine matrix changed.
+
+        The aggregates and the sparsity patterns of the prolongation and coarse operators are kept, so the
+        sparsity pattern of the new matrix must be identical to the one the hierarchy was built with.
+
+        Args:
+            A: The matrix with updated coefficients. If ``None``, the matrix passed at construction is
+                assumed to have been modified in place.
+        """
+        if A is not None:
+            fine = self._levels[0].A
+            if A.shape != fine.shape or A.dtype != fine.dtype or A.device != fine.device:
+                raise ValueError("The updated matrix must have the same shape, dtype and device as the original one")
+            self._levels[0].A = A
+
+        for level in self._levels:
+            self._compute_smoother(level)
+            if level.P is not None:
+                self._compute_transfer(level, topology="masked")
+        self._compute_coarse_inverse()
+
+    def _build(self, A: sparse.BsrMatrix):
+        device = A.device
+        block_size = A.block_shape[0]
+
+        while True:
+            level = _AMGLevel(A)
+            self._levels.append(level)
+            self._compute_smoother(level)
+
+            if A.shape[0] <= self._coarse_size or len(self._levels) == self._max_levels:
+                break
+
+            aggregates, aggregate_count = self._aggregate(level)
+            if aggregate_count == 0 or aggregate_count == A.nrow:
+                break
+
+            # tentative prolongator, one identity block per aggregated block row
+            rows = wp.empty(A.nrow, dtype=int, device=device)
+            cols = wp.empty(A.nrow, dtype=int, device=device)
+            values = wp.empty((A.nrow, block_size, block_size), dtype=A.scalar_type, device=device)
+            wp.launch(
+                _amg_tentative_prolongator_triplets,
+                dim=(A.nrow, block_size),
+                device=device,
+                inputs=[aggregates, rows, cols, values],
+            )
+            level.T = sparse.bsr_zeros(A.nrow, aggregate_count, block_type=A.dtype, device=device)
+            sparse.bsr_set_from_triplets(level.T, rows, cols, values)
+
+            # prolongator smoothing operator I - w D^-1 A, with the topology of A plus its diagonal
+            level.S = sparse.bsr_identity(A.nrow, block_type=A.dtype, device=device)
+            sparse.bsr_axpy(A, level.S)
+            level.P = sparse.bsr_zeros(A.nrow, aggregate_count, block_type=A.dtype, device=device)
+            level.R = sparse.bsr_zeros(aggregate_count, A.nrow, block_type=A.dtype, device=device)
+            level.AP = sparse.bsr_zeros(A.nrow, aggregate_count, block_type=A.dtype, device=device)
+            A = sparse.bsr_zeros(aggregate_count, aggregate_count, block_type=A.dtype, device=device)
+            level.coarse_A = A
+            self._compute_transfer(level, topology="compact")
+
+        self._compute_coarse_inverse()
+
+    def _compute_smoother(self, level: "_AMGLevel"):
+        A = level.A
+        A_diag = sparse.bsr_get_diag(A)
+        wp.launch(
+            _amg_inverse_diagonal,
+            dim=(A.nrow, A.block_shape[0]),
+            device=A.device,
+            inputs=[_as_3d_array(A_diag, A.block_shape), level.inv_diag],
+        )
+        level.rho.zero_()
+        wp.launch(
+            _amg_spectral_radius_bound,
+            dim=(A.nrow, A.block_shape[0]),
+            device=A.device,
+            inputs=[A.offsets, A.row_counts, A.scalar_values, level.inv_diag, level.rho],
+        )
+
+    def _compute_transfer(self, level: "_AMGLevel", topology: str):
+        A = level.A
+        sparse.bsr_axpy(A, level.S, alpha=1.0, beta=0.0, topology="masked")
+        wp.launch(
+            _amg_smoothing_operator,
+            dim=(A.nrow, A.block_shape[0]),
+            device=A.device,
+            inputs=[
+                level.S.offsets,
+                level.S.row_counts,
+                level.S.columns,
+                level.S.scalar_values,
+                level.inv_diag,
+                level.rho,
+                self._jacobi_weight,
+            ],
+        )
+        sparse.bsr_mm(level.S, level.T, level.P, topology=topology)
+        sparse.bsr_set_transpose(level.R, level.P, topology=topology)
+        sparse.bsr_mm(A, level.P, level.AP, topology=topology)
+        sparse.bsr_mm(level.R, level.AP, level.coarse_A, topology=topology)
+
+    def _aggregate(self, level: "_AMGLevel") -> tuple[wp.array, int]:
+        A = level.A
+        device = A.device
+        n = A.nrow
+
+        # strength-of-connection graph, stored as a mask over the blocks of A
+        A_diag = sparse.bsr_get_diag(A)
+        strong = wp.empty(max(A.nnz, 1), dtype=int, device=device)
+        state = wp.empty(n, dtype=int, device=device)
+        wp.launch(
+            _amg_strength_graph,
+            dim=n,
+            device=device,
+            inputs=[
+                A.offsets,
+                A.row_counts,
+                A.columns,
+                A.scalar_values,
+                _as_3d_array(A_diag, A.block_shape),
+                A.scalar_type(self._strength_threshold),
+                strong,
+                state,
+            ],
+        )
+
+        # distance-two maximal independent set, the roots of the aggregates
+        keys = wp.empty(n, dtype=wp.int64, device=device)
+        max_keys = wp.empty(n, dtype=wp.int64, device=device)
+        max_keys_2 = wp.empty(n, dtype=wp.int64, device=device)
+        undecided = wp.empty(1, dtype=int, device=device)
+        for _ in range(n):
+            wp.launch(_amg_mis2_keys, dim=n, device=device, inputs=[state, keys])
+            wp.launch(
+                _amg_mis2_max, dim=n, device=device, inputs=[A.offsets, A.row_counts, A.columns, strong, keys, max_keys]
+            )
+            wp.launch(
+                _amg_mis2_max,
+                dim=n,
+                device=device,
+                inputs=[A.offsets, A.row_counts, A.columns, strong, max_keys, max_keys_2],
+            )
+            undecided.zero_()
+            wp.launch(_amg_mis2_update, dim=n, device=device, inputs=[keys, max_keys_2, state, undecided])
+            if undecided.numpy()[0] == 0:
+                break
+
+        roots = wp.empty(n, dtype=int, device=device)
+        wp.launch(_amg_root_flags, dim=n, device=device, inputs=[state, roots])
+        root_ids = wp.empty(n, dtype=int, device=device)
+        wp.utils.array_scan(roots, root_ids, inclusive=False)
+        aggregate_count = int(root_ids[n - 1 :].numpy()[0] + roots[n - 1 :].numpy()[0])
+
+        # attach the remaining block rows to the aggregate of a strongly connected root or aggregated neighbor
+        aggregates = wp.empty(n, dtype=int, device=device)
+        wp.launch(
+            _amg_aggregate_roots_neighbors,
+            dim=n,
+            device=device,
+            inputs=[A.offsets, A.row_counts, A.columns, strong, state, root_ids, aggregates],
+        )
+        final_aggregates = wp.empty(n, dtype=int, device=device)
+        wp.launch(
+            _amg_aggregate_remaining,
+            dim=n,
+            device=device,
+            inputs=[A.offsets, A.row_counts, A.columns, strong, aggregates, final_aggregates],
+        )
+
+        return final_aggregates, aggregate_count
+
+    def _compute_coarse_inverse(self):
+        A = self._levels[-1].A
+        if A.shape[0] > self._coarse_size:
+            return
+
+        inverse = np.linalg.pinv(_bsr_to_dense_numpy(A))
+        if self._coarse_inverse is None:
+            self._coarse_inverse = wp.array(inverse, dtype=A.scalar_type, device=A.device)
+            self._coarse_solver = aslinearoperator(self._coarse_inverse)
+        else:
+            # assign in place so that captured graphs remain valid
+            self._coarse_inverse.assign(inverse)
+
+    def _relax(self, level: "_AMGLevel", b: wp.array, x: wp.array, x_is_zero: bool, steps: int):
+        A = level.A
+        for step in range(steps):
+            wp.copy(src=b, dest=level.r)
+            if x_is_zero and step == 0:
+                x.zero_()
+            else:
+                sparse.bsr_mv(A, x, level.r, alpha=-1.0, beta=1.0)
+            wp.launch(
+                _amg_relax,
+                dim=x.shape[0],
+                device=A.device,
+                inputs=[level.r, level.inv_diag, level.rho, x, level.d, self._jacobi_weight, step, self._chebyshev],
+            )
+
+    def _cycle(self, index: int, b: wp.array, x: wp.array):
+        level = self._levels[index]
+
+        if index == len(self._levels) - 1:
+            if self._coarse_inverse is not None:
+                self._coarse_solver.matvec(b, b, x, 1.0, 0.0)
+            else:
+                self._relax(level, b, x, x_is_zero=True, steps=2 * self._smoother_steps)
+            return
+
+        self._relax(level, b, x, x_is_zero=True, steps=self._smoother_steps)
+
+        # restrict the residual, solve on the coarse level and correct
+        wp.copy(src=b, dest=level.r)
+        sparse.bsr_mv(level.A, x, level.r, alpha=-1.0, beta=1.0)
+        coarse = self._levels[index + 1]
+        sparse.bsr_mv(level.R, level.r, coarse.b, alpha=1.0, beta=0.0)
+        self._cycle(index + 1, coarse.b, coarse.x)
+        sparse.bsr_mv(level.P, coarse.x, x, alpha=1.0, beta=1.0)
+
+        self._relax(level, b, x, x_is_zero=False, steps=self._smoother_steps)
+
+    def _apply(self, x: wp.array, y: wp.array, z: wp.array, alpha: float, beta: float):
+        fine = self._levels[0]
+        self._cycle(0, _as_scalar_array(x), fine.x)
+
+        scalar_type = self.scalar_type
+        wp.launch(
+            _axpby_kernel,
+            dim=fine.x.shape[0],
+            device=self.device,
+            inputs=[fine.x, _as_scalar_array(y), _as_scalar_array(z), scalar_type(alpha), scalar_type(beta)],
+        )
+
+
+class _AMGLevel:
+    """Operators and work vectors of one level of an :class:`AMGPreconditioner` hierarchy."""
+
+    def __init__(self, A: sparse.BsrMatrix):
+        scalar_count = A.shape[0]
+        device = A.device
+        scalar_type = A.scalar_type
+
+        self.A = A
+        self.inv_diag = wp.empty(scalar_count, dtype=scalar_type, device=device)
+        self.rho = wp.empty(1, dtype=scalar_type, device=device)
+
+        self.b = wp.empty(scalar_count, dtype=scalar_type, device=device)
+        self.x = wp.empty(scalar_count, dtype=scalar_type, device=device)
+        self.r = wp.empty(scalar_count, dtype=scalar_type, device=device)
+        self.d = wp.empty(scalar_count, dtype=scalar_type, device=device)
+
+        self.T = None
+        self.S = None
+        self.P = None
+        self.R = None
+        self.AP = None
+        self.coarse_A = None
+
+
+def _bsr_to_dense_numpy(A: sparse.BsrMatrix) -> np.ndarray:
+    block_rows, block_cols = A.block_shape
+    offsets = A.offsets.numpy()
+    row_counts = None if A.row_counts is None else A.row_counts.numpy()
+    columns = A.columns.numpy()
+    values = A.scalar_values.numpy()
+
+    dense = np.zeros(A.shape, dtype=np.float64)
+    for row in range(A.nrow):
+        end = offsets[row + 1] if row_counts is None else offsets[row] + row_counts[row]
+        for block in range(offsets[row], end):
+            col = columns[block]
+            dense[
+                row * block_rows : (row + 1) * block_rows,
+                col * block_cols : (col + 1) * block_cols,
+            ] += values[block]
+    return dense
+
+
+class ILU0Preconditioner(LinearOperator):
+    """Incomplete LU factorization preconditioner with zero fill-in, ILU(0), for sparse matrices.
+
+    The factors :math:`L` (unit lower triangular) and :math:`U` (upper triangular) share the sparsity pattern of ``A``
+    and are stored together in a single :class:`warp.sparse.BsrMatrix`. Block matrices are factorized block-wise,
+    using the inverses of the diagonal blocks of :math:`U` as pivots.
+
+    Both the factorization and the triangular solves are parallelized with level scheduling: block rows are grouped
+    into levels such that the rows of a level only depend on rows of previous levels, and each level is processed with
+    one kernel launch. The number of launches per application thus grows with the depth of the dependency graph,
+    for instance with the diameter of the mesh for matrices assembled with the natural node ordering.
+
+    For symmetric matrices, the factors satisfy :math:`U = D L^T` with :math:`D` the block diagonal of :math:`U`,
+    so the preconditioner is the incomplete Cholesky factorization IC(0) in :math:`L D L^T` form and is symmetric,
+    which makes it suitable for :func:`cg` and :func:`cr`.
+
+    Applying the preconditioner only performs kernel launches, so it can be captured in a CUDA graph
+    along with the iterative solver. When only the coefficients of ``A`` change but not its sparsity pattern,
+    :meth:`update` recomputes the factorization without rebuilding the level schedules.
+
+    Args:
+        A: Square sparse matrix with square blocks to factorize. Every block row must contain a diagonal block,
+            and block columns must be sorted within rows, as is the case for matrices built with :mod:`warp.sparse`.
+    """
+
+    def __init__(self, A: sparse.BsrMatrix):
+        if not isinstance(A, sparse.BsrMatrix):
+            raise ValueError("ILU(0) preconditioner requires a warp.sparse.BsrMatrix")
+        if A.nrow != A.ncol or A.block_shape[0] != A.block_shape[1]:
+            raise ValueError(f"ILU(0) preconditioner requires a square matrix with square blocks, got {A.block_shape}")
+
+        super().__init__(A.shape, A.dtype, A.device, matvec=self._apply)
+
+        device = A.device
+        self._A = A
+        self._kernels = _create_ilu0_kernels(A.dtype)
+        self._vec_type = A.dtype if A.block_shape == (1, 1) else wp.types.vector(A.block_shape[0], A.scalar_type)
+
+        # the factors are stored in a compact copy of A
+        self._LU = sparse.bsr_copy(A)
+        LU = self._LU
+
+        self._diag_index = wp.empty(LU.nrow, dtype=int, device=device)
+        wp.launch(
+            _ilu0_diagonal_index,
+            dim=LU.nrow,
+            device=device,
+            inputs=[LU.offsets, LU.row_counts, LU.columns, self._diag_index],
+        )
+        if LU.nrow > 0 and int(self._diag_index.numpy().min()) < 0:
+            raise ValueError("ILU(0) preconditioner requires every block row to have a diagonal block")
+
+        self._lower_rows, self._lower_offsets = self._schedule(upper=False)
+        self._upper_rows, self._upper_offsets = self._schedule(upper=True)
+
+        self._inv_diag = wp.empty(LU.nrow, dtype=A.dtype, device=device)
+        self._y = wp.empty(LU.nrow, dtype=self._vec_type, device=device)
+        self._x = wp.empty(LU.nrow, dtype=self._vec_type, device=device)
+
+        self._factorize()
+
+    @property
+    def num_levels(self) -> tuple[int, int]:
+        """Number of levels of the lower and upper triangular solves."""
+        return len(self._lower_offsets) - 1, len(self._upper_offsets) - 1
+
+    def update(self, A: sparse.BsrMatrix | None = None):
+        """Recompute the factorization after the coefficients of the matrix changed.
+
+        The sparsity pattern of the new matrix must be identical to the one the preconditioner was built with.
+
+        Args:
+            A: The matrix with updated coefficients. If ``None``, the matrix passed at construction is
+                assumed to have been modified in place.
+        """
+        if A is not None:
+            if A.shape != self._A.shape or A.dtype != self._A.dtype or A.device != self._A.device:
+                raise ValueError("The updated matrix must have the same shape, dtype and device as the original one")
+            self._A = A
+
+        sparse.bsr_axpy(self._A, self._LU, alpha=1.0, beta=0.0, topology="masked")
+        self._factorize()
+
+    def _schedule(self, upper: bool) -> tuple[wp.array, list[int]]:
+        LU = self._LU
+        device = LU.device
+
+        # longest dependency path to each block row, iterated until stable
+        levels = wp.zeros(LU.nrow, dtype=int, device=device)
+        changed = wp.empty(1, dtype=int, device=device)
+        for _ in range(LU.nrow + 1):
+            changed.zero_()
+            wp.launch(
+                _ilu0_dependency_levels,
+                dim=LU.nrow,
+                device=device,
+                inputs=[LU.offsets, LU.row_counts, LU.columns, upper, levels, changed],
+            )
+            if changed.numpy()[0] == 0:
+                break
+
+        levels_np = levels.numpy()
+        rows = np.argsort(levels_np, kind="stable").astype(np.int32)
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(levels_np)))).tolist() if LU.nrow > 0 else [0]
+        return wp.array(rows, dtype=int, device=device), offsets
+
+    def _factorize(self):
+        LU = self._LU
+        for level in range(len(self._lower_offsets) - 1):
+            begin, end = self._lower_offsets[level], self._lower_offsets[level + 1]
+            wp.launch(
+                self._kernels.factorize,
+                dim=end - begin,
+                device=LU.device,
+                inputs=[
+                    begin,
+                    self._lower_rows,
+                    LU.offsets,
+                    LU.row_counts,
+                    LU.columns,
+                    self._diag_index,
+                    LU.values,
+                    self._inv_diag,
+                ],
+            )
+
+    def _apply(self, x: wp.array, y: wp.array, z: wp.array, alpha: float, beta: float):
+        LU = self._LU
+        b = _vec_array_view(x, self._vec_type, LU.shape[0])
+
+        for level in range(len(self._lower_offsets) - 1):
+            begin, end = self._lower_offsets[level], self._lower_offsets[level + 1]
+            wp.launch(
+                self._kernels.lower_solve,
+                dim=end - begin,
+                device=LU.device,
+                inputs=[begin, self._lower_rows, LU.offsets, LU.columns, self._diag_index, LU.values, b, self._y],
+            )
+
+        for level in range(len(self._upper_offsets) - 1):
+            begin, end = self._upper_offsets[level], self._upper_offsets[level + 1]
+            wp.launch(
+                self._kernels.upper_solve,
+                dim=end - begin,
+                device=LU.device,
+                inputs=[
+                    begin,
+                    self._upper_rows,
+                    LU.offsets,
+                    LU.row_counts,
+                    LU.columns,
+                    self._diag_index,
+                    LU.values,
+                    self._inv_diag,
+                    self._y,
+                    self._x,
+                ],
+            )
+
+        scalar_type = self.scalar_type
+        x_scalar = _as_scalar_array(self._x)
+        wp.launch(
+            _axpby_kernel,
+            dim=x_scalar.shape[0],
+            device=self.device,
+            inputs=[x_scalar, _as_scalar_array(y), _as_scalar_array(z), scalar_type(alpha), scalar_type(beta)],
+        )
+
+
 def _as_scalar_array(x: wp.array):
     scalar_type = type_scalar_type(x.dtype)
     if scalar_type == x.dtype:
@@ -2366,6 +2903,437 @@ def _gmres_add_active_entries_kernel(
         x[tid] += update[tid]
 
 
+# states of the block rows during aggregation
+_AMG_OUT = wp.constant(0)
+_AMG_UNDECIDED = wp.constant(1)
+_AMG_ROOT = wp.constant(2)
+
+
+@wp.kernel
+def _amg_inverse_diagonal(
+    diag_blocks: wp.array3d(dtype=Any),
+    inv_diag: wp.array(dtype=Any),
+):
+    i, s = wp.tid()
+    inv_diag[i * diag_blocks.shape[1] + s] = _inverse_diag_coefficient(diag_blocks[i, s, s], False)
+
+
+@wp.kernel
+def _amg_spectral_radius_bound(
+    A_offsets: wp.array(dtype=int),
+    A_row_counts: wp.array(dtype=int),
+    A_values: wp.array3d(dtype=Any),
+    inv_diag: wp.array(dtype=Any),
+    rho: wp.array(dtype=Any),
+):
+    # Gershgorin bound of the spectral radius of D^-1 A
+    row, s = wp.tid()
+
+    row_sum = rho.dtype(0.0)
+    for block in range(A_offsets[row], _bsr_row_end(A_offsets, A_row_counts, row)):
+        for c in range(A_values.shape[2]):
+            row_sum += wp.abs(A_values[block, s, c])
+
+    wp.atomic_max(rho, 0, row_sum * wp.abs(inv_diag[row * A_values.shape[1] + s]))
+
+
+@wp.func
+def _amg_block_norm_sq(values: wp.array3d(dtype=Any), block: int):
+    norm_sq = values.dtype(0.0)
+    for r in range(values.shape[1]):
+        for c in range(values.shape[2]):
+            norm_sq += values[block, r, c] * values[block, r, c]
+    return norm_sq
+
+
+@wp.kernel
+def _amg_strength_graph(
+    A_offsets: wp.array(dtype=int),
+    A_row_counts: wp.array(dtype=int),
+    A_columns: wp.array(dtype=int),
+    A_values: wp.array3d(dtype=Any),
+    diag_blocks: wp.array3d(dtype=Any),
+    theta: Any,
+    strong: wp.array(dtype=int),
+    state: wp.array(dtype=int),
+):
+    row = wp.tid()
+
+    row_diag = wp.sqrt(_amg_block_norm_sq(diag_blocks, row))
+    strong_count = int(0)
+
+    for block in range(A_offsets[row], _bsr_row_end(A_offsets, A_row_counts, row)):
+        col = A_columns[block]
+        is_strong = int(0)
+        if col != row:
+            norm_sq = _amg_block_norm_sq(A_values, block)
+            col_diag = wp.sqrt(_amg_block_norm_sq(diag_blocks, col))
+            if norm_sq > type(theta)(0.0) and norm_sq >= theta * theta * row_diag * col_diag:
+                is_strong = 1
+        strong[block] = is_strong
+        strong_count += is_strong
+
+    # block rows without strong connections are never aggregated
+    state[row] = wp.where(strong_count > 0, _AMG_UNDECIDED, _AMG_OUT)
+
+
+@wp.kernel
+def _amg_mis2_keys(state: wp.array(dtype=int), keys: wp.array(dtype=wp.int64)):
+    # order by state first, then random priority, then index
+    i = wp.tid()
+    priority = wp.randi(wp.rand_init(0x5A17, i)) & 0x3FFFFFFF
+    keys[i] = (wp.int64(state[i]) << wp.int64(61)) | (wp.int64(priority) << wp.int64(31)) | wp.int64(i)
+
+
+@wp.kernel
+def _amg_mis2_max(
+    A_offsets: wp.array(dtype=int),
+    A_row_counts: wp.array(dtype=int),
+    A_columns: wp.array(dtype=int),
+    strong: wp.array(dtype=int),
+    keys: wp.array(dtype=wp.int64),
+    max_keys: wp.array(dtype=wp.int64),
+):
+    row = wp.tid()
+
+    key = keys[row]
+    for block in range(A_offsets[row], _bsr_row_end(A_offsets, A_row_counts, row)):
+        if strong[block] != 0:
+            key = wp.max(key, keys[A_columns[block]])
+    max_keys[row] = key
+
+
+@wp.kernel
+def _amg_mis2_update(
+    keys: wp.array(dtype=wp.int64),
+    max_keys: wp.array(dtype=wp.int64),
+    state: wp.array(dtype=int),
+    undecided_count: wp.array(dtype=int),
+):
+    i = wp.tid()
+
+    if state[i] != _AMG_UNDECIDED:
+        return
+
+    if max_keys[i] == keys[i]:
+        state[i] = _AMG_ROOT
+    elif int(max_keys[i] >> wp.int64(61)) == _AMG_ROOT:
+        state[i] = _AMG_OUT
+    else:
+        wp.atomic_add(undecided_count, 0, 1)
+
+
+@wp.kernel
+def _amg_root_flags(state: wp.array(dtype=int), roots: wp.array(dtype=int)):
+    i = wp.tid()
+    roots[i] = wp.where(state[i] == _AMG_ROOT, 1, 0)
+
+
+@wp.kernel
+def _amg_aggregate_roots_neighbors(
+    A_offsets: wp.array(dtype=int),
+    A_row_counts: wp.array(dtype=int),
+    A_columns: wp.array(dtype=int),
+    strong: wp.array(dtype=int),
+    state: wp.array(dtype=int),
+    root_ids: wp.array(dtype=int),
+    aggregates: wp.array(dtype=int),
+):
+    row = wp.tid()
+
+    if state[row] == _AMG_ROOT:
+        aggregates[row] = root_ids[row]
+        return
+
+    aggregate = int(-1)
+    for block in range(A_offsets[row], _bsr_row_end(A_offsets, A_row_counts, row)):
+        col = A_columns[block]
+        if strong[block] != 0 and state[col] == _AMG_ROOT:
+            aggregate = root_ids[col]
+            break
+    aggregates[row] = aggregate
+
+
+@wp.kernel
+def _amg_aggregate_remaining(
+    A_offsets: wp.array(dtype=int),
+    A_row_counts: wp.array(dtype=int),
+    A_columns: wp.array(dtype=int),
+    strong: wp.array(dtype=int),
+    aggregates: wp.array(dtype=int),
+    final_aggregates: wp.array(dtype=int),
+):
+    row = wp.tid()
+
+    aggregate = aggregates[row]
+    if aggregate < 0:
+        for block in range(A_offsets[row], _bsr_row_end(A_offsets, A_row_counts, row)):
+            col = A_columns[block]
+            if strong[block] != 0 and aggregates[col] >= 0:
+                aggregate = aggregates[col]
+                break
+    final_aggregates[row] = aggregate
+
+
+@wp.kernel
+def _amg_tentative_prolongator_triplets(
+    aggregates: wp.array(dtype=int),
+    rows: wp.array(dtype=int),
+    cols: wp.array(dtype=int),
+    values: wp.array3d(dtype=Any),
+):
+    row, s = wp.tid()
+
+    aggregate = aggregates[row]
+    if s == 0:
+        rows[row] = row
+        cols[row] = wp.max(aggregate, 0)
+
+    # block rows that are not aggregated get a zero block, which is pruned
+    for c in range(values.shape[2]):
+        values[row, s, c] = wp.where(aggregate >= 0 and c == s, values.dtype(1.0), values.dtype(0.0))
+
+
+@wp.kernel
+def _amg_smoothing_operator(
+    S_offsets: wp.array(dtype=int),
+    S_row_counts: wp.array(dtype=int),
+    S_columns: wp.array(dtype=int),
+    S_values: wp.array3d(dtype=Any),
+    inv_diag: wp.array(dtype=Any),
+    rho: wp.array(dtype=Any),
+    weight: Any,
+):
+    # S := I - (weight / rho) D^-1 A, with S holding the coefficients of A on input
+    row, s = wp.tid()
+
+    zero = type(weight)(0.0)
+    scale = zero
+    if rho[0] > zero:
+        scale = -weight / rho[0] * inv_diag[row * S_values.shape[1] + s]
+
+    for block in range(S_offsets[row], _bsr_row_end(S_offsets, S_row_counts, row)):
+        is_diag = S_columns[block] == row
+        for c in range(S_values.shape[2]):
+            v = scale * S_values[block, s, c]
+            if is_diag and c == s:
+                v += type(weight)(1.0)
+            S_values[block, s, c] = v
+
+
+@wp.kernel
+def _amg_relax(
+    r: wp.array(dtype=Any),
+    inv_diag: wp.array(dtype=Any),
+    rho: wp.array(dtype=Any),
+    x: wp.array(dtype=Any),
+    d: wp.array(dtype=Any),
+    weight: Any,
+    step: int,
+    chebyshev: wp.bool,
+):
+    i = wp.tid()
+
+    zero = type(weight)(0.0)
+    upper = rho[0]
+    if upper <= zero:
+        return
+
+    z = inv_diag[i] * r[i]
+
+    if chebyshev:
+        # Chebyshev iteration on the spectrum interval [upper / 30, upper] of D^-1 A
+        lower = upper / type(weight)(30.0)
+        theta = type(weight)(0.5) * (upper + lower)
+        delta = type(weight)(0.5) * (upper - lower)
+        sigma = theta / delta
+
+        if step == 0:
+            update = z / theta
+        else:
+            rho_prev = type(weight)(1.0) / sigma
+            rho_cur = rho_prev
+            for _k in range(step):
+                rho_prev = rho_cur
+                rho_cur = type(weight)(1.0) / (type(weight)(2.0) * sigma - rho_prev)
+            update = rho_cur * rho_prev * d[i] + type(weight)(2.0) * rho_cur / delta * z
+
+        d[i] = update
+        x[i] += update
+    else:
+        x[i] += weight / upper * z
+
+
+@wp.kernel
+def _axpby_kernel(
+    x: wp.array(dtype=Any),
+    y: wp.array(dtype=Any),
+    z: wp.array(dtype=Any),
+    alpha: Any,
+    beta: Any,
+):
+    i = wp.tid()
+    zero = type(alpha)(0)
+    s = zero
+    if alpha != zero:
+        s += alpha * x[i]
+    if beta != zero:
+        s += beta * y[i]
+    z[i] = s
+
+
+@wp.kernel
+def _ilu0_diagonal_index(
+    offsets: wp.array(dtype=int),
+    row_counts: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    diag_index: wp.array(dtype=int),
+):
+    row = wp.tid()
+
+    index = int(-1)
+    for block in range(offsets[row], _bsr_row_end(offsets, row_counts, row)):
+        if columns[block] == row:
+            index = block
+    diag_index[row] = index
+
+
+@wp.kernel
+def _ilu0_dependency_levels(
+    offsets: wp.array(dtype=int),
+    row_counts: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    upper: wp.bool,
+    levels: wp.array(dtype=int),
+    changed: wp.array(dtype=int),
+):
+    row = wp.tid()
+    if upper:
+        # visit rows in reverse order so that a serial launch converges in one pass
+        row = levels.shape[0] - 1 - row
+
+    level = int(0)
+    for block in range(offsets[row], _bsr_row_end(offsets, row_counts, row)):
+        col = columns[block]
+        if (upper and col > row) or (not upper and col < row):
+            level = wp.max(level, levels[col] + 1)
+
+    if level > levels[row]:
+        wp.atomic_max(levels, row, level)
+        changed[0] = 1
+
+
+@functools.cache
+def _create_ilu0_kernels(block_type):
+    if type_is_matrix(block_type):
+        block_size = block_type._shape_[0]
+        scalar_type = type_scalar_type(block_type)
+
+        @wp.func
+        def block_inverse(m: block_type):
+            # Gauss-Jordan elimination without pivoting, zero pivots are replaced with one
+            a = block_type(m)
+            inv = wp.identity(n=block_size, dtype=scalar_type)
+            for c in range(block_size):
+                pivot = a[c, c]
+                if pivot == scalar_type(0.0):
+                    pivot = scalar_type(1.0)
+                for k in range(block_size):
+                    a[c, k] = a[c, k] / pivot
+                    inv[c, k] = inv[c, k] / pivot
+                for r in range(block_size):
+                    if r != c:
+                        f = a[r, c]
+                        for k in range(block_size):
+                            a[r, k] = a[r, k] - f * a[c, k]
+                            inv[r, k] = inv[r, k] - f * inv[c, k]
+            return inv
+
+    else:
+
+        @wp.func
+        def block_inverse(m: block_type):
+            return _inverse_diag_coefficient(m, False)
+
+    @wp.kernel(module="unique")
+    def factorize(
+        row_offset: int,
+        level_rows: wp.array(dtype=int),
+        offsets: wp.array(dtype=int),
+        row_counts: wp.array(dtype=int),
+        columns: wp.array(dtype=int),
+        diag_index: wp.array(dtype=int),
+        values: wp.array(dtype=block_type),
+        inv_diag: wp.array(dtype=block_type),
+    ):
+        row = level_rows[row_offset + wp.tid()]
+        row_end = _bsr_row_end(offsets, row_counts, row)
+
+        # IKJ variant, eliminating the lower blocks of the row in increasing column order
+        for block in range(offsets[row], diag_index[row]):
+            k = columns[block]
+            l_ik = values[block] * inv_diag[k]
+            values[block] = l_ik
+
+            # merge the remaining blocks of row i with the upper blocks of row k
+            k_block = diag_index[k] + 1
+            k_end = _bsr_row_end(offsets, row_counts, k)
+            for j_block in range(block + 1, row_end):
+                j = columns[j_block]
+                while k_block < k_end and columns[k_block] < j:
+                    k_block += 1
+                if k_block < k_end and columns[k_block] == j:
+                    values[j_block] = values[j_block] - l_ik * values[k_block]
+
+        inv_diag[row] = block_inverse(values[diag_index[row]])
+
+    @wp.kernel(module="unique")
+    def lower_solve(
+        row_offset: int,
+        level_rows: wp.array(dtype=int),
+        offsets: wp.array(dtype=int),
+        columns: wp.array(dtype=int),
+        diag_index: wp.array(dtype=int),
+        values: wp.array(dtype=block_type),
+        b: wp.array(dtype=Any),
+        y: wp.array(dtype=Any),
+    ):
+        row = level_rows[row_offset + wp.tid()]
+
+        s = b[row]
+        for block in range(offsets[row], diag_index[row]):
+            s -= values[block] * y[columns[block]]
+        y[row] = s
+
+    @wp.kernel(module="unique")
+    def upper_solve(
+        row_offset: int,
+        level_rows: wp.array(dtype=int),
+        offsets: wp.array(dtype=int),
+        row_counts: wp.array(dtype=int),
+        columns: wp.array(dtype=int),
+        diag_index: wp.array(dtype=int),
+        values: wp.array(dtype=block_type),
+        inv_diag: wp.array(dtype=block_type),
+        y: wp.array(dtype=Any),
+        x: wp.array(dtype=Any),
+    ):
+        row = level_rows[row_offset + wp.tid()]
+
+        s = y[row]
+        for block in range(diag_index[row] + 1, _bsr_row_end(offsets, row_counts, row)):
+            s -= values[block] * x[columns[block]]
+        x[row] = inv_diag[row] * s
+
+    return _ILU0Kernels(factorize, lower_solve, upper_solve)
+
+
+class _ILU0Kernels(NamedTuple):
+    factorize: wp.Kernel
+    lower_solve: wp.Kernel
+    upper_solve: wp.Kernel
+
+
 def _register_overloads():
     # Pre-register float32 and float64 overloads so the module can be AOT-compiled
     # without requiring a prior runtime launch.
@@ -2393,6 +3361,13 @@ def _register_overloads():
         wp.overload(_gmres_copy_hessenberg_column, {"src": a2, "H": a3})
         wp.overload(_gmres_update_x_kernel, {"scale": dtype, "y": a2, "V": a2, "x": a})
         wp.overload(_gmres_add_active_entries_kernel, {"update": a, "x": a})
+        wp.overload(_amg_inverse_diagonal, {"diag_blocks": a3, "inv_diag": a})
+        wp.overload(_amg_spectral_radius_bound, {"A_values": a3, "inv_diag": a, "rho": a})
+        wp.overload(_amg_strength_graph, {"A_values": a3, "diag_blocks": a3, "theta": dtype})
+        wp.overload(_amg_tentative_prolongator_triplets, {"values": a3})
+        wp.overload(_amg_smoothing_operator, {"S_values": a3, "inv_diag": a, "rho": a, "weight": dtype})
+        wp.overload(_amg_relax, {"r": a, "inv_diag": a, "rho": a, "x": a, "d": a, "weight": dtype})
+        wp.overload(_axpby_kernel, {"x": a, "y": a, "z": a, "alpha": dtype, "beta": dtype})
 
 
 _register_overloads()
@@ -8,6 +8,7 @@ import weakref
 from functools import cache
 from typing import Any, Generic, Literal, TypeVar
 
+import numpy as np
 from numpy import eye
 
 import warp as wp
@@ -34,6 +35,7 @@ __all__ = [
     "BSR_STATUS_ROW_CAPACITY_EXCEEDED",
     "BSR_STATUS_SUCCESS",
     "BsrMatrix",
+    "BsrSellMatrix",
     "bsr_assign",
     "bsr_axpy",
     "bsr_axpy_work_arrays",
@@ -48,6 +50,8 @@ __all__ = [
     "bsr_mm",
     "bsr_mm_work_arrays",
     "bsr_mv",
+    "bsr_permuted",
+    "bsr_rcm_permutation",
     "bsr_row_index",
     "bsr_scale",
     "bsr_set_diag",
@@ -55,8 +59,11 @@ __all__ = [
     "bsr_set_identity",
     "bsr_set_transpose",
     "bsr_set_zero",
+    "bsr_to_sell",
     "bsr_transposed",
     "bsr_zeros",
+    "permute_vector",
+    "unpermute_vector",
 ]
 
 
@@ -3269,10 +3276,31 @@ def _bsr_axpy_padded_finalize(
         y_row_counts[row] = block_count
 
 
+def _work_array(work_arrays, array: wp.array | None, size: int, dtype: type, requires_grad: bool = False) -> wp.array:
+    """Return ``array`` if it holds at least ``size`` elements, or a new one-dimensional work array otherwise."""
+
+    if array is not None and array.size >= size:
+        return array
+
+    temporary_store = work_arrays._temporary_store
+    if temporary_store is None:
+        return wp.empty(shape=(size,), dtype=dtype, device=work_arrays.device, requires_grad=requires_grad)
+
+    if array is not None:
+        array.release()
+    return temporary_store.borrow(shape=(size,), dtype=dtype, device=work_arrays.device, requires_grad=requires_grad)
+
+
 class bsr_axpy_work_arrays:
-    """Opaque structure for persisting :func:`bsr_axpy` temporary work buffers across calls."""
+    """Opaque structure for persisting :func:`bsr_axpy` temporary work buffers across calls.
 
-    def __init__(self):
+    Args:
+        temporary_store: Optional :class:`warp.fem.TemporaryStore` from which to borrow the work buffers,
+          so that their memory is accounted for and shared with other users of the store.
+    """
+
+    def __init__(self, temporary_store=None):
+        self._temporary_store = temporary_store
         self._reset(None)
 
     def _reset(self, device):
@@ -3286,13 +3314,12 @@ class bsr_axpy_work_arrays:
         if self.device != device:
             self._reset(device)
 
-        if self._sum_rows is None or self._sum_rows.size < sum_nnz:
-            self._sum_rows = wp.empty(shape=(sum_nnz), dtype=int, device=self.device)
-        if self._sum_cols is None or self._sum_cols.size < sum_nnz:
-            self._sum_cols = wp.empty(shape=(sum_nnz), dtype=int, device=self.device)
+        self._sum_rows = _work_array(self, self._sum_rows, sum_nnz, int)
+        self._sum_cols = _work_array(self, self._sum_cols, sum_nnz, int)
 
-        if self._old_y_values is None or self._old_y_values.size < y.nnz:
-            self._old_y_values = wp.empty_like(y.values[: y.nnz])
+        self._old_y_values = _work_array(
+            self, self._old_y_values, y.nnz, y.values.dtype, requires_grad=y.values.requires_grad
+        )
 
 
 def bsr_axpy(
@@ -3948,9 +3975,15 @@ def _bsr_mm_padded_topology(
 
 
 class bsr_mm_work_arrays:
-    """Opaque structure for persisting :func:`bsr_mm` temporary work buffers across calls."""
+    """Opaque structure for persisting :func:`bsr_mm` temporary work buffers across calls.
+
+    Args:
+        temporary_store: Optional :class:`warp.fem.TemporaryStore` from which to borrow the work buffers,
+          so that their memory is accounted for and shared with other users of the store.
+    """
 
-    def __init__(self):
+    def __init__(self, temporary_store=None):
+        self._temporary_store = temporary_store
         self._reset(None)
 
     def _reset(self, device):
@@ -3974,52 +4007,39 @@ class bsr_mm_work_arrays:
         # Allocations that do not depend on any computation
         self._copied_z_nnz = z.nnz if beta != 0.0 or z_aliasing else 0
 
-        if self._mm_row_min is None or self._mm_row_min.size < z.nrow + 1:
-            self._mm_row_min = wp.empty(shape=(z.nrow + 1,), dtype=int, device=self.device)
-        if self._mm_block_counts is None or self._mm_block_counts.size < x_nnz + 1:
-            self._mm_block_counts = wp.empty(shape=(x_nnz + 1,), dtype=int, device=self.device)
+        self._mm_row_min = _work_array(self, self._mm_row_min, z.nrow + 1, int)
+        self._mm_block_counts = _work_array(self, self._mm_block_counts, x_nnz + 1, int)
 
         if self._copied_z_nnz > 0:
-            if self._old_z_values is None or self._old_z_values.size < self._copied_z_nnz:
-                self._old_z_values = wp.empty(shape=(self._copied_z_nnz,), dtype=z.values.dtype, device=self.device)
+            self._old_z_values = _work_array(self, self._old_z_values, self._copied_z_nnz, z.values.dtype)
 
         if z_aliasing:
-            if self._old_z_columns is None or self._old_z_columns.size < z.nnz:
-                self._old_z_columns = wp.empty(shape=(z.nnz,), dtype=z.columns.dtype, device=self.device)
-            if self._old_z_offsets is None or self._old_z_offsets.size < z.nrow + 1:
-                self._old_z_offsets = wp.empty(shape=(z.nrow + 1,), dtype=z.offsets.dtype, device=self.device)
-            if self._old_z_row_counts is None or self._old_z_row_counts.size < z.nrow:
-                self._old_z_row_counts = wp.empty(shape=(z.nrow,), dtype=int, device=self.device)
+            self._old_z_columns = _work_array(self, self._old_z_columns, z.nnz, z.columns.dtype)
+            self._old_z_offsets = _work_array(self, self._old_z_offsets, z.nrow + 1, z.offsets.dtype)
+            self._old_z_row_counts = _work_array(self, self._old_z_row_counts, z.nrow, int)
 
     def _allocate_snapshot(self, device, z: BsrMatrix, rows: bool = False):
         if self.device != device:
             self._reset(device)
 
-        if self._old_z_values is None or self._old_z_values.size < z.nnz:
-            self._old_z_values = wp.empty(shape=(z.nnz,), dtype=z.values.dtype, device=self.device)
-        if self._old_z_columns is None or self._old_z_columns.size < z.nnz:
-            self._old_z_columns = wp.empty(shape=(z.nnz,), dtype=z.columns.dtype, device=self.device)
-        if self._old_z_row_counts is None or self._old_z_row_counts.size < z.nrow:
-            self._old_z_row_counts = wp.empty(shape=(z.nrow,), dtype=int, device=self.device)
-        if rows and (self._mm_rows is None or self._mm_rows.size < z.nnz):
-            self._mm_rows = wp.empty(shape=(z.nnz,), dtype=int, device=self.device)
+        self._old_z_values = _work_array(self, self._old_z_values, z.nnz, z.values.dtype)
+        self._old_z_columns = _work_array(self, self._old_z_columns, z.nnz, z.columns.dtype)
+        self._old_z_row_counts = _work_array(self, self._old_z_row_counts, z.nrow, int)
+        if rows:
+            self._mm_rows = _work_array(self, self._mm_rows, z.nnz, int)
 
     def _allocate_padded_topology(self, device, x_nnz: int):
         if self.device != device:
             self._reset(device)
 
-        if self._mm_y_cursors is None or self._mm_y_cursors.size < x_nnz:
-            self._mm_y_cursors = wp.empty(shape=(x_nnz,), dtype=int, device=self.device)
+        self._mm_y_cursors = _work_array(self, self._mm_y_cursors, x_nnz, int)
 
     def _allocate_stage_2(self, mm_nnz: int):
         # Allocations that depend on unmerged nnz estimate
         self._mm_nnz = mm_nnz
-        if self._mm_rows is None or self._mm_rows.size < mm_nnz:
-            self._mm_rows = wp.empty(shape=(mm_nnz,), dtype=int, device=self.device)
-        if self._mm_cols is None or self._mm_cols.size < mm_nnz:
-            self._mm_cols = wp.empty(shape=(mm_nnz,), dtype=int, device=self.device)
-        if self._mm_src_blocks is None or self._mm_src_blocks.size < mm_nnz:
-            self._mm_src_blocks = wp.empty(shape=(mm_nnz,), dtype=int, device=self.device)
+        self._mm_rows = _work_array(self, self._mm_rows, mm_nnz, int)
+        self._mm_cols = _work_array(self, self._mm_cols, mm_nnz, int)
+        self._mm_src_blocks = _work_array(self, self._mm_src_blocks, mm_nnz, int)
 
 
 def _bsr_mm_add_scaled_existing_values(
@@ -4581,6 +4601,474 @@ def bsr_mm(
     return z
 
 
+@wp.kernel(enable_backward=False)
+def _invert_permutation(permutation: wp.array(dtype=int), inverse: wp.array(dtype=int)):
+    i = wp.tid()
+    inverse[permutation[i]] = i
+
+
+@wp.kernel(enable_backward=False)
+def _bsr_permuted_triplets(
+    row_count: int,
+    offsets: wp.array(dtype=int),
+    row_counts: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    row_inverse: wp.array(dtype=int),
+    col_inverse: wp.array(dtype=int),
+    permuted_rows: wp.array(dtype=int),
+    permuted_cols: wp.array(dtype=int),
+):
+    block = wp.tid()
+
+    row = bsr_row_index(offsets, row_count, block, row_counts)
+    if row == -1:
+        # inactive block, discarded by bsr_set_from_triplets
+        permuted_rows[block] = -1
+        permuted_cols[block] = -1
+    else:
+        permuted_rows[block] = row_inverse[row]
+        permuted_cols[block] = col_inverse[columns[block]]
+
+
+@wp.kernel(enable_backward=False)
+def _permute_blocks(
+    block_size: int,
+    permutation: wp.array(dtype=int),
+    src: wp.array(dtype=Any),
+    dest: wp.array(dtype=Any),
+):
+    i, k = wp.tid()
+    dest[i * block_size + k] = src[permutation[i] * block_size + k]
+
+
+@wp.kernel(enable_backward=False)
+def _unpermute_blocks(
+    block_size: int,
+    permutation: wp.array(dtype=int),
+    src: wp.array(dtype=Any),
+    dest: wp.array(dtype=Any),
+):
+    i, k = wp.tid()
+    dest[permutation[i] * block_size + k] = src[i * block_size + k]
+
+
+def _csr_neighbors(indptr, indices, nodes):
+    """Gather the concatenated adjacency lists of ``nodes`` along with the rank of their source node."""
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    total = int(counts.sum())
+    ranks = np.repeat(np.arange(len(nodes)), counts)
+    positions = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(starts, counts)
+    return indices[positions], ranks
+
+
+def _bfs_levels(indptr, indices, start, stamps, stamp):
+    """Breadth-first level structure rooted at ``start``.
+
+    Reached nodes are marked by setting their entry in ``stamps`` to ``stamp``, which must
+    differ from the stamps of all previous searches.
+    """
+    stamps[start] = stamp
+    levels = [np.array([start])]
+    while True:
+        neighbors, _ = _csr_neighbors(indptr, indices, levels[-1])
+        neighbors = np.unique(neighbors[stamps[neighbors] != stamp])
+        if neighbors.size == 0:
+            return levels
+        stamps[neighbors] = stamp
+        levels.append(neighbors)
+
+
+def bsr_rcm_permutation(A: BsrMatrix) -> wp.array:
+    """Compute a reverse Cuthill-McKee ordering of the block rows of a square matrix.
+
+    The ordering reduces the bandwidth of the symmetrized sparsity pattern of ``A``, which
+    improves the memory locality of the ``x`` gathers in :func:`bsr_mv` and related operations.
+    Each connected component is traversed breadth-first from a pseudo-peripheral node, visiting
+    neighbors by increasing degree.
+
+    The ordering is computed on the host, which requires synchronizing with the matrix device.
+    It is meant to be computed once per sparsity pattern, and applied with :func:`bsr_permuted`,
+    :func:`permute_vector`, and :func:`unpermute_vector`.
+
+    Args:
+        A: Square sparse matrix.
+
+    Returns:
+        An integer array ``permutation`` on the same device as ``A``, such that block row ``i``
+        of the reordered matrix is block row ``permutation[i]`` of ``A``.
+    """
+    A, _ = _extract_matrix_and_scale(A)
+
+    if A.nrow != A.ncol:
+        raise ValueError(f"Reordering requires a square matrix, got {A.nrow}x{A.ncol} blocks")
+
+    n = A.nrow
+    offsets = A.offsets.numpy()[: n + 1]
+    if A.row_counts is None:
+        row_lengths = np.diff(offsets)
+    else:
+        row_lengths = A.row_counts.numpy()[:n]
+
+    # symmetrized adjacency graph, without self-loops
+    rows = np.repeat(np.arange(n), row_lengths)
+    positions = np.arange(rows.size) - np.repeat(np.cumsum(row_lengths) - row_lengths, row_lengths)
+    cols = A.columns.numpy()[np.repeat(offsets[:n], row_lengths) + positions]
+    off_diagonal = rows != cols
+    rows, cols = rows[off_diagonal], cols[off_diagonal]
+    edges = np.unique(np.concatenate((rows * n + cols, cols * n + rows)).astype(np.int64))
+    edge_rows = edges // n
+    indices = (edges - edge_rows * n).astype(np.int32)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(edge_rows, minlength=n), out=indptr[1:])
+    degrees = np.diff(indptr)
+
+    order = np.empty(n, dtype=np.int32)
+    visited = np.zeros(n, dtype=bool)
+
+    # isolated rows are components of their own, ordered first
+    isolated = np.flatnonzero(degrees == 0)
+    order[: isolated.size] = isolated
+    visited[isolated] = True
+    count = isolated.size
+
+    # each component starts from its unvisited node of lowest degree, found by walking a degree-sorted order
+    by_degree = np.argsort(degrees, kind="stable")
+    cursor = isolated.size
+
+    # the searches of the George-Liu iterations are told apart by stamp, so that they do not need to reset
+    stamps = np.zeros(n, dtype=np.int64)
+    stamp = 0
+
+    while count < n:
+        while visited[by_degree[cursor]]:
+            cursor += 1
+        start = by_degree[cursor]
+
+        # George-Liu search for a pseudo-peripheral starting node
+        stamp += 1
+        levels = _bfs_levels(indptr, indices, start, stamps, stamp)
+        while True:
+            last_level = levels[-1]
+            candidate = last_level[np.argmin(degrees[last_level])]
+            stamp += 1
+            candidate_levels = _bfs_levels(indptr, indices, candidate, stamps, stamp)
+            if len(candidate_levels) <= len(levels):
+                break
+            start, levels = candidate, candidate_levels
+
+        # Cuthill-McKee traversal: children are appended in parent order, by increasing degree
+        visited[start] = True
+        order[count] = start
+        count += 1
+        frontier = np.array([start])
+        while frontier.size > 0:
+            neighbors, ranks = _csr_neighbors(indptr, indices, frontier)
+            unvisited = ~visited[neighbors]
+            neighbors, ranks = neighbors[unvisited], ranks[unvisited]
+            neighbors = neighbors[np.lexsort((neighbors, degrees[neighbors], ranks))]
+            _, first = np.unique(neighbors, return_index=True)
+            frontier = neighbors[np.sort(first)]
+
+            visited[frontier] = True
+            order[count : count + frontier.size] = frontier
+            count += frontier.size
+
+    return wp.array(order[::-1], dtype=int, device=A.device)
+
+
+def bsr_permuted(
+    A: BsrMatrixOrExpression,
+    permutation: Array[int],
+    column_permutation: Array[int] | None = None,
+) -> BsrMatrix:
+    """Return a copy of ``A`` with permuted block rows and columns.
+
+    Block ``(i, j)`` of the result is block ``(permutation[i], column_permutation[j])`` of ``A``,
+    i.e. the result is ``P A Q^T`` for the permutation matrices ``P`` and ``Q``.
+    Vectors can be mapped to and from the permuted ordering with :func:`permute_vector`
+    and :func:`unpermute_vector`.
+
+    Args:
+        A: Matrix to permute.
+        permutation: Integer array of size ``A.nrow`` containing a permutation of the block rows.
+        column_permutation: Integer array of size ``A.ncol`` containing a permutation of the block columns.
+          If ``None``, ``A`` must be square and the block columns are permuted with ``permutation``.
+    """
+    A, A_scale = _extract_matrix_and_scale(A)
+
+    if column_permutation is None:
+        if A.nrow != A.ncol:
+            raise ValueError("A column permutation must be provided for non-square matrices")
+        column_permutation = permutation
+
+    if permutation.shape != (A.nrow,):
+        raise ValueError(f"Invalid row permutation shape, expected ({A.nrow},), got {permutation.shape}")
+    if column_permutation.shape != (A.ncol,):
+        raise ValueError(f"Invalid column permutation shape, expected ({A.ncol},), got {column_permutation.shape}")
+
+    device = A.device
+    row_inverse = wp.empty(A.nrow, dtype=int, device=device)
+    wp.launch(_invert_permutation, dim=A.nrow, device=device, inputs=[permutation, row_inverse])
+    if column_permutation is permutation:
+        col_inverse = row_inverse
+    else:
+        col_inverse = wp.empty(A.ncol, dtype=int, device=device)
+        wp.launch(_invert_permutation, dim=A.ncol, device=device, inputs=[column_permutation, col_inverse])
+
+    rows = wp.empty(A.nnz, dtype=int, device=device)
+    cols = wp.empty(A.nnz, dtype=int, device=device)
+    wp.launch(
+        _bsr_permuted_triplets,
+        dim=A.nnz,
+        device=device,
+        inputs=[A.nrow, A.offsets, A.row_counts, A.columns, row_inverse, col_inverse, rows, cols],
+    )
+
+    permuted = bsr_zeros(A.nrow, A.ncol, block_type=A.values.dtype, device=device)
+    permuted.values.requires_grad = A.requires_grad
+    bsr_set_from_triplets(permuted, rows, cols, A.values[: A.nnz], prune_numerical_zeros=False)
+
+    if A_scale != 1.0:
+        bsr_scale(permuted, A_scale)
+
+    return permuted
+
+
+def _permutation_vector_views(x: wp.array, permutation: wp.array, out: wp.array | None):
+    scalar_type = type_scalar_type(x.dtype)
+    scalar_count = x.size * type_size(x.dtype)
+    block_size = scalar_count // max(permutation.shape[0], 1)
+    if block_size * permutation.shape[0] != scalar_count:
+        raise ValueError(
+            f"Vector with {scalar_count} scalar coefficients cannot be split into {permutation.shape[0]} blocks"
+        )
+
+    if out is None:
+        out = wp.empty_like(x)
+    elif out.ptr == x.ptr:
+        raise ValueError("Permuted vectors cannot be computed in place")
+
+    x_view = _vec_array_view(x, scalar_type, expected_scalar_count=scalar_count)
+    out_view = _vec_array_view(out, scalar_type, expected_scalar_count=scalar_count)
+    return block_size, x_view, out, out_view
+
+
+def permute_vector(x: Array[Any], permutation: Array[int], out: Array[Any] | None = None) -> Array[Any]:
+    """Map a vector to a permuted ordering, ``out[i] = x[permutation[i]]``, and return ``out``.
+
+    This converts right-hand sides and initial guesses to the ordering of a matrix
+    obtained with :func:`bsr_permuted`. Each entry of ``permutation`` moves a contiguous block of
+    ``x.size * type_size(x.dtype) / permutation.size`` scalar coefficients, so that ``x`` may
+    be a scalar array or an array of vectors matching the matrix block size.
+
+    Args:
+        x: Vector to permute.
+        permutation: Integer array containing the permutation.
+        out: Output vector, with the same layout as ``x``. If ``None``, it will be allocated.
+          Must not alias ``x``.
+    """
+    block_size, x_view, out, out_view = _permutation_vector_views(x, permutation, out)
+    wp.launch(
+        _permute_blocks,
+        dim=(permutation.shape[0], block_size),
+        device=x.device,
+        inputs=[block_size, permutation, x_view, out_view],
+    )
+    return out
+
+
+def unpermute_vector(x: Array[Any], permutation: Array[int], out: Array[Any] | None = None) -> Array[Any]:
+    """Map a vector back from a permuted ordering, ``out[permutation[i]] = x[i]``, and return ``out``.
+
+    This is the inverse of :func:`permute_vector`, typically used to recover the solution of a
+    linear system solved with a matrix obtained from :func:`bsr_permuted`.
+
+    Args:
+        x: Vector in the permuted ordering.
+        permutation: Integer array containing the permutation.
+        out: Output vector, with the same layout as ``x``. If ``None``, it will be allocated.
+          Must not alias ``x``.
+    """
+    block_size, x_view, out, out_view = _permutation_vector_views(x, permutation, out)
+    wp.launch(
+        _unpermute_blocks,
+        dim=(permutation.shape[0], block_size),
+        device=x.device,
+        inputs=[block_size, permutation, x_view, out_view],
+    )
+    return out
+
+
+@wp.kernel(enable_backward=False)
+def _bsr_sell_gather_values(
+    block_indices: wp.array(dtype=int),
+    src: wp.array(dtype=Any),
+    dest: wp.array(dtype=Any),
+):
+    slot = wp.tid()
+    block = block_indices[slot]
+    if block >= 0:
+        dest[slot] = src[block]
+
+
+class BsrSellMatrix(Generic[_BlockType]):
+    """Sliced ELLPACK (SELL-C-sigma) copy of a :class:`BsrMatrix`, for use with :func:`bsr_mv`.
+
+    Rows of blocks are grouped in chunks of ``chunk_size`` consecutive rows, after sorting rows by decreasing
+    length within windows of ``sigma`` rows. Each chunk stores as many blocks per row as its longest row,
+    in a column-major layout so that consecutive rows of a chunk access consecutive memory locations.
+    This layout is most efficient for matrices with near-uniform row lengths, as reported by :attr:`fill_ratio`.
+
+    Should not be constructed directly but through :func:`bsr_to_sell`.
+
+    Attributes:
+        source (BsrMatrix): The matrix from which the sliced layout was built.
+        nnz (int): Number of non-zero blocks.
+        chunk_size (int): Number of rows per chunk.
+        sigma (int): Size of the windows within which rows are sorted by length.
+        row_order (Array[int]): Block row stored at each chunk lane, or ``-1`` for padding lanes.
+        chunk_offsets (Array[int]): Array of size ``1 + chunk_count`` containing the first storage slot of each chunk.
+        columns (Array[int]): Block column index for each storage slot, or ``-1`` for padding slots.
+        values (Array[BlockType]): Block values for each storage slot.
+        block_indices (Array[int]): Index of the block of ``source`` stored in each slot, or ``-1`` for padding slots.
+    """
+
+    @property
+    def nrow(self) -> int:
+        """Number of rows of blocks."""
+        return self.source.nrow
+
+    @property
+    def ncol(self) -> int:
+        """Number of columns of blocks."""
+        return self.source.ncol
+
+    @property
+    def scalar_type(self) -> Scalar:
+        """Scalar type for individual block coefficients."""
+        return self.source.scalar_type
+
+    @property
+    def block_shape(self) -> tuple[int, int]:
+        """Shape of the individual blocks."""
+        return self.source.block_shape
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Shape of the matrix."""
+        return self.source.shape
+
+    @property
+    def dtype(self) -> type:
+        """Data type for individual block values."""
+        return self.source.dtype
+
+    @property
+    def device(self) -> wp._src.context.Device:
+        """Device on which the arrays are allocated."""
+        return self.columns.device
+
+    @property
+    def slot_count(self) -> int:
+        """Number of storage slots, including padding."""
+        return self.columns.shape[0]
+
+    @property
+    def fill_ratio(self) -> float:
+        """Fraction of storage slots holding a non-zero block."""
+        return self.nnz / max(self.slot_count, 1)
+
+    @property
+    def scalar_values(self) -> wp.array:
+        """Access the ``values`` array as a 3d scalar array."""
+        values_view = _as_3d_array(self.values, self.block_shape)
+        values_view._ref = self.values  # keep ref in case we're garbage collected
+        return values_view
+
+    def update_values(self) -> None:
+        """Copy the block values of :attr:`source` into the sliced layout.
+
+        The sparsity pattern of :attr:`source` must not have changed since the
+        layout was built. This operation is graph-capturable.
+        """
+        wp.launch(
+            _bsr_sell_gather_values,
+            dim=self.slot_count,
+            device=self.device,
+            inputs=[self.block_indices, self.source.values, self.values],
+        )
+
+
+def bsr_to_sell(A: BsrMatrix[BlockType], chunk_size: int = 32, sigma: int = 256) -> BsrSellMatrix[BlockType]:
+    """Build a sliced ELLPACK (SELL-C-sigma) copy of a matrix for faster matrix-vector products.
+
+    The returned :class:`BsrSellMatrix` can be passed to :func:`bsr_mv` in place of ``A``.
+    Its sparsity pattern is computed on the host, which requires synchronizing with the matrix device;
+    after changing the values (but not the sparsity pattern) of ``A``,
+    call :meth:`BsrSellMatrix.update_values` to refresh the copy.
+
+    Args:
+        A: Matrix to convert.
+        chunk_size: Number of consecutive rows of blocks sharing the same storage width.
+          Typically a multiple of the warp size on CUDA devices.
+        sigma: Size of the windows of rows within which rows are sorted by decreasing length,
+          which reduces padding. Sorting is disabled with ``sigma=1``.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if sigma < 1:
+        raise ValueError(f"sigma must be positive, got {sigma}")
+
+    n = A.nrow
+    offsets = A.offsets.numpy()[: n + 1]
+    if A.row_counts is None:
+        row_lengths = np.diff(offsets)
+    else:
+        row_lengths = A.row_counts.numpy()[:n]
+
+    # sort rows by decreasing length within each sigma-window
+    order = np.lexsort((-row_lengths, np.arange(n) // sigma)).astype(np.int32)
+
+    chunk_count = (n + chunk_size - 1) // chunk_size
+    lane_count = chunk_count * chunk_size
+    row_order = np.full(lane_count, -1, dtype=np.int32)
+    row_order[:n] = order
+    lane_lengths = np.zeros(lane_count, dtype=np.int64)
+    lane_lengths[:n] = row_lengths[order]
+
+    chunk_widths = lane_lengths.reshape(chunk_count, chunk_size).max(axis=1, initial=0)
+    chunk_offsets = np.zeros(chunk_count + 1, dtype=np.int64)
+    np.cumsum(chunk_widths * chunk_size, out=chunk_offsets[1:])
+    slot_count = int(chunk_offsets[-1])
+
+    # storage slot of the j-th block of the row at lane p is chunk_offsets[p // chunk_size] + j * chunk_size + p % chunk_size
+    lanes = np.repeat(np.arange(lane_count), lane_lengths)
+    blocks = np.arange(lanes.size) - np.repeat(np.cumsum(lane_lengths) - lane_lengths, lane_lengths)
+    slots = chunk_offsets[lanes // chunk_size] + blocks * chunk_size + lanes % chunk_size
+
+    block_indices = np.full(slot_count, -1, dtype=np.int32)
+    block_indices[slots] = offsets[row_order[lanes]] + blocks
+    columns = np.full(slot_count, -1, dtype=np.int32)
+    columns[slots] = A.columns.numpy()[block_indices[slots]]
+
+    device = A.device
+    sell = BsrSellMatrix()
+    sell.source = A
+    sell.nnz = int(lanes.size)
+    sell.chunk_size = int(chunk_size)
+    sell.sigma = int(sigma)
+    sell.row_order = wp.array(row_order, dtype=int, device=device)
+    sell.chunk_offsets = wp.array(chunk_offsets.astype(np.int32), dtype=int, device=device)
+    sell.block_indices = wp.array(block_indices, dtype=int, device=device)
+    sell.columns = wp.array(columns, dtype=int, device=device)
+    sell.values = wp.zeros(slot_count, dtype=A.values.dtype, device=device)
+
+    sell.update_values()
+
+    return sell
+
+
 @cache
 def make_bsr_mv_kernel(block_cols: int):
 
@@ -4672,6 +5160,54 @@ def make_bsr_mv_tiled_kernel(tile_size: int):
     return bsr_mv_tiled_kernel
 
 
+@cache
+def make_bsr_sell_mv_kernel(block_cols: int, chunk_size: int):
+
+    @wp.kernel(enable_backward=False, module="unique")
+    def bsr_sell_mv_kernel(
+        alpha: Any,
+        row_order: wp.array(dtype=int),
+        chunk_offsets: wp.array(dtype=int),
+        columns: wp.array(dtype=int),
+        values: wp.array3d(dtype=Any),
+        x: wp.array(dtype=Any),
+        beta: Any,
+        y: wp.array(dtype=Any),
+    ):
+        # lanes vary fastest so that consecutive threads access consecutive storage slots
+        subrow, lane = wp.tid()
+
+        row = row_order[lane]
+        if row == -1:
+            return
+
+        block_rows = values.shape[1]
+        yi = row * block_rows + subrow
+
+        scalar_zero = type(alpha)(0)
+        v = scalar_zero
+
+        if alpha != scalar_zero:
+            chunk = lane // chunk_size
+            beg = chunk_offsets[chunk] + lane - chunk * chunk_size
+            end = chunk_offsets[chunk + 1]
+            for slot in range(beg, end, chunk_size):
+                col = columns[slot]
+                if col == -1:
+                    break
+                xs = col * block_cols
+                for c in range(wp.static(block_cols)):
+                    v += values[slot, subrow, c] * x[xs + c]
+            v *= alpha
+
+        if beta != scalar_zero:
+            v += beta * y[yi]
+
+        y[yi] = v
+
+    return bsr_sell_mv_kernel
+
+
 @cache
 def make_bsr_mv_transpose_kernel(block_rows: int):
 
@@ -4748,7 +5284,7 @@ def _vec_array_view(array: wp.array, dtype: type, expected_scalar_count: int) ->
 
 
 def bsr_mv(
-    A: BsrMatrixOrExpression[BlockType[Rows, Cols, Scalar]],
+    A: BsrMatrixOrExpression[BlockType[Rows, Cols, Scalar]] | BsrSellMatrix[BlockType[Rows, Cols, Scalar]],
     x: Array[Vector[Scalar, Cols] | Scalar],
     y: Array[Vector[Scalar, Rows] | Scalar] | None = None,
     alpha: Scalar = 1.0,
@@ -4762,7 +5298,9 @@ def bsr_mv(
     The ``x`` and ``y`` vectors are allowed to alias.
 
     Args:
-        A: Read-only, left matrix operand of the matrix-vector product.
+        A: Read-only, left matrix operand of the matrix-vector product. May also be a sliced ELLPACK
+          copy of a matrix obtained from :func:`bsr_to_sell`, in which case the non-transposed product
+          uses the sliced layout.
         x: Read-only, right vector operand of the matrix-vector product.
         y: Mutable affine operand and result vector. If ``y`` is not provided, it will be allocated and treated as zero.
         alpha: Uniform scaling factor for ``x``. If zero, ``x`` will not be read and may be left uninitialized.
@@ -4776,7 +5314,12 @@ def bsr_mv(
           use tiles using using an heuristic based on the matrix shape and number of non-zeros..
     """
 
-    A, A_scale = _extract_matrix_and_scale(A)
+    if isinstance(A, BsrSellMatrix):
+        sell = None if transpose else A
+        A, A_scale = A.source, 1.0
+    else:
+        sell = None
+        A, A_scale = _extract_matrix_and_scale(A)
     alpha *= A_scale
 
     if transpose:
@@ -4852,6 +5395,13 @@ def bsr_mv(
                 dim=(A.nnz, block_shape[0]),
                 inputs=[alpha, A.nrow, A.offsets, A.row_counts, A.columns, A.scalar_values, x_view, y_view],
             )
+    elif sell is not None:
+        wp.launch(
+            kernel=make_bsr_sell_mv_kernel(block_cols=block_shape[1], chunk_size=sell.chunk_size),
+            device=A.values.device,
+            dim=(block_shape[0], sell.row_order.shape[0]),
+            inputs=[alpha, sell.row_order, sell.chunk_offsets, sell.columns, sell.scalar_values, x_view, beta, y_view],
+        )
     elif use_tiles:
         wp.launch(
             kernel=make_bsr_mv_tiled_kernel(tile_size),
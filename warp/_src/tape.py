@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import math
 from collections import defaultdict, namedtuple
 
 import warp as wp
@@ -44,6 +45,9 @@ class Tape:
         self.launches = []
         self.scopes = []
 
+        # arrays used by recorded Python functions, indexed by launch position
+        self._func_arrays = {}
+
         self.loss = None
 
     def __enter__(self):
@@ -81,13 +85,7 @@ class Tape:
         # if scalar loss is specified then initialize
         # a 'seed' array for it, with gradient of one
         if loss:
-            if loss.size > 1 or wp._src.types.type_size(loss.dtype) > 1:
-                raise RuntimeError("Can only return gradients for scalar loss functions.")
-
-            if not loss.requires_grad:
-                raise RuntimeError(
-                    "Scalar loss arrays should have requires_grad=True set before calling Tape.backward()"
-                )
+            _check_scalar_loss(loss)
 
             # set the seed grad to 1.0
             loss.grad.fill_(1.0)
@@ -109,16 +107,7 @@ class Tape:
                 launch()
 
             else:
-                # kernel option takes precedence over module option
-                enable_backward = launch[0].options.get("enable_backward")
-                if enable_backward is False:
-                    msg = f"Running the tape backwards may produce incorrect gradients because recorded kernel {launch[0].key} is configured with the option 'enable_backward=False'."
-                    log_warning(msg)
-                elif enable_backward is None:
-                    enable_backward = launch[0].module.options.get("enable_backward")
-                    if enable_backward is False:
-                        msg = f"Running the tape backwards may produce incorrect gradients because recorded kernel {launch[0].key} is defined in a module with the option 'enable_backward=False' set."
-                        log_warning(msg)
+                enable_backward = _launch_enable_backward(launch)
 
                 kernel = launch[0]
                 dim = launch[1]
@@ -153,6 +142,186 @@ class Tape:
                         block_dim=block_dim,
                     )
 
+    def compile_backward(
+        self,
+        loss: wp.array | None = None,
+        grads: dict[wp.array, wp.array] | None = None,
+        inputs: list[wp.array] | None = None,
+        zero_grads: bool = True,
+        capture: bool = False,
+    ) -> CompiledBackward:
+        """Compile the backward pass of the recorded operations into a replayable object.
+
+        Recorded operations whose outputs have no path to ``loss`` (or to the arrays
+        in ``grads``) are pruned, as are operations that do not depend on ``inputs``
+        when given. The adjoint arguments of the remaining launches are resolved and
+        packed once, so that ``CompiledBackward.launch()`` replays the backward pass
+        without per-launch Python overhead. With ``capture=True``, the backward pass is
+        additionally captured into a graph (a CUDA graph or a CPU APIC graph).
+
+        Dependencies are determined from the memory ranges of the arrays passed to each
+        recorded launch. Arrays passed as ``outputs`` are assumed to be the only ones
+        written by a kernel; launches that do not specify any output array are assumed to
+        write all of their array arguments. Python functions recorded with
+        :meth:`record_func` are considered to both read and write the arrays they were
+        recorded with.
+
+        The compiled backward pass refers to the arrays recorded on the tape and must be
+        recompiled after the tape is reset or re-recorded.
+
+        Args:
+            loss: A single-element array holding the loss value whose gradient is to be computed.
+            grads: A dictionary mapping Warp arrays to their incoming gradients. The gradients
+                are copied into the arrays' ``grad`` each time the backward pass is replayed.
+            inputs: Arrays whose gradients are requested. If given, operations that do not
+                depend on any of these arrays are also pruned.
+            zero_grads: Whether to zero the gradients accumulated by the compiled operations
+                before each replay, similarly to calling :meth:`zero` before :meth:`backward`.
+            capture: Whether to capture the compiled backward pass into a graph.
+
+        Returns:
+            The compiled backward pass.
+        """
+        seeds = []
+        seed_ops = []
+        seed_grads = set()
+
+        if loss is not None:
+            _check_scalar_loss(loss)
+            seeds.append(loss)
+            seed_ops.append(lambda: loss.grad.fill_(1.0))
+
+        if grads:
+            for a, g in grads.items():
+                if a.grad is None:
+                    a.grad = g
+                else:
+                    seed_ops.append(lambda a=a, g=g: a.grad.assign(g))
+                seeds.append(a)
+                seed_grads.add(id(a.grad))
+
+        if not seeds:
+            raise ValueError("Tape.compile_backward() requires a loss array or a dictionary of output gradients")
+
+        # forward pass: find the operations that depend on the requested inputs
+        depends_on_inputs = None
+        if inputs is not None:
+            reachable = _MemoryRanges(inputs)
+            depends_on_inputs = []
+            for index, launch in enumerate(self.launches):
+                if callable(launch):
+                    arrays = self._func_arrays.get(index)
+                    if arrays is None:
+                        reachable.add_all()
+                        depends = True
+                    else:
+                        depends = reachable.overlaps(arrays)
+                        if depends:
+                            reachable.add(arrays)
+                else:
+                    read_arrays, written_arrays = _launch_arrays(launch)
+                    depends = reachable.overlaps(read_arrays)
+                    if depends:
+                        reachable.add(written_arrays)
+                depends_on_inputs.append(depends)
+
+        # backward pass: find the operations through which gradients flow
+        live = _MemoryRanges(seeds)
+        kept = []
+        for index in reversed(range(len(self.launches))):
+            launch = self.launches[index]
+            if depends_on_inputs is not None and not depends_on_inputs[index]:
+                continue
+
+            if callable(launch):
+                arrays = self._func_arrays.get(index)
+                if arrays is None:
+                    live.add_all()
+                elif not live.overlaps(arrays):
+                    continue
+                else:
+                    live.add(arrays)
+            else:
+                read_arrays, written_arrays = _launch_arrays(launch)
+                if not live.overlaps(written_arrays):
+                    continue
+                live.add(read_arrays)
+                live.add(written_arrays)
+
+            kept.append(index)
+
+        steps = []
+        devices = []
+        grad_arrays = {}
+
+        def track_grad(adj):
+            if isinstance(adj, wp.array):
+                grad_arrays.setdefault(id(adj), adj)
+            elif wp._src.types.is_struct(adj):
+                for name, var in adj._cls.vars.items():
+                    if wp._src.types.matches_array_class(var.type, wp.array) or isinstance(
+                        var.type, wp._src.codegen.Struct
+                    ):
+                        track_grad(getattr(adj, name))
+
+        for index in kept:
+            launch = self.launches[index]
+            if callable(launch):
+                for a in self._func_arrays.get(index, ()):
+                    track_grad(self.get_adjoint(a))
+                steps.append(launch)
+                continue
+
+            kernel, dim, max_blocks, launch_inputs, launch_outputs, device, block_dim = launch[:7]
+            adj_inputs = [self.get_adjoint(a) for a in launch_inputs]
+            adj_outputs = [self.get_adjoint(a) for a in launch_outputs]
+            for adj in (*adj_inputs, *adj_outputs):
+                track_grad(adj)
+
+            if device not in devices:
+                devices.append(device)
+
+            if not _launch_enable_backward(launch):
+                continue
+
+            steps.append(
+                wp.launch(
+                    kernel=kernel,
+                    dim=dim,
+                    inputs=launch_inputs,
+                    outputs=launch_outputs,
+                    adj_inputs=adj_inputs,
+                    adj_outputs=adj_outputs,
+                    device=device,
+                    adjoint=True,
+                    max_blocks=max_blocks,
+                    block_dim=block_dim,
+                    record_tape=False,
+                    record_cmd=True,
+                )
+            )
+
+        for a in seeds:
+            if a.device not in devices:
+                devices.append(a.device)
+
+        zero_arrays = []
+        if zero_grads:
+            zero_arrays = [g for key, g in grad_arrays.items() if key not in seed_grads]
+
+        compiled = CompiledBackward(
+            steps=steps,
+            zero_arrays=zero_arrays,
+            seed_ops=seed_ops,
+            devices=devices,
+            num_recorded=len(self.launches),
+        )
+
+        if capture:
+            compiled.capture()
+
+        return compiled
+
     # record a kernel launch on the tape
     def record_launch(self, kernel, dim, max_blocks, inputs, outputs, device, block_dim=0, metadata=None):
         if metadata is None:
@@ -168,6 +337,7 @@ class Tape:
             arrays (list): A list of arrays that are used by the backward function. The tape keeps track of these to be able to zero their gradients in Tape.zero()
         """
         self.launches.append(backward)
+        self._func_arrays[len(self.launches) - 1] = list(arrays)
 
         for a in arrays:
             if isinstance(a, wp.array) and a.grad:
@@ -177,6 +347,87 @@ class Tape:
                     f"Array {a} is not of type wp.array or is missing a gradient array. Set array parameter requires_grad=True during instantiation."
                 )
 
+    def checkpoint(self, fn, *args, **kwargs):
+        """Run ``fn(*args, **kwargs)`` as a checkpointed segment of this tape.
+
+        The launches issued by ``fn`` are not recorded. Instead, the arrays passed
+        as arguments are snapshotted and a single entry is recorded on the tape that,
+        during :meth:`backward`, restores the snapshots, recomputes ``fn`` under a
+        temporary tape, and back-propagates through the recomputed launches.
+        Intermediate arrays allocated inside ``fn`` are therefore released after the
+        forward pass and only live again while their segment is being differentiated,
+        trading extra forward computation for a lower peak memory footprint.
+
+        Array arguments may be passed directly or inside tuples and lists.
+        ``fn`` must be deterministic and should return the arrays it produces (a single
+        array or a tuple/list of arrays); gradients of returned arrays are routed to
+        the arrays returned during the forward pass. Arrays that ``fn`` modifies in
+        place must be among its arguments so that they can be restored before
+        recomputation.
+
+        The tape must be active (i.e. this method must be called inside a ``with tape:`` block).
+
+        Args:
+            fn: The function computing the segment.
+            args: Positional arguments forwarded to ``fn``.
+            kwargs: Keyword arguments forwarded to ``fn``.
+
+        Returns:
+            The value returned by ``fn``.
+        """
+        runtime = wp._src.context.runtime
+        if runtime.tape is not self:
+            raise RuntimeError("Warp: Error, Tape.checkpoint() must be called while the tape is active")
+
+        inputs = _flatten_arrays((args, kwargs))
+
+        # suspend recording while taking snapshots and running the forward segment
+        runtime.tape = None
+        try:
+            snapshots = [wp.clone(a, requires_grad=False) for a in inputs]
+            result = fn(*args, **kwargs)
+        finally:
+            runtime.tape = self
+
+        outputs = _flatten_arrays(result)
+
+        def restore():
+            for a, s in zip(inputs, snapshots, strict=True):
+                wp.copy(a, s)
+
+        def backward():
+            saved_tape = runtime.tape
+            runtime.tape = None
+            try:
+                restore()
+
+                sub = Tape()
+                runtime.tape = sub
+                try:
+                    recomputed = fn(*args, **kwargs)
+                finally:
+                    runtime.tape = None
+
+                for new, old in zip(_flatten_arrays(recomputed), outputs, strict=True):
+                    if new is not old and old.grad is not None:
+                        new.grad = old.grad
+
+                sub.backward()
+
+                # leave the inputs in their pre-segment state for the remaining launches
+                restore()
+            finally:
+                runtime.tape = saved_tape
+
+        self.launches.append(backward)
+        self._func_arrays[len(self.launches) - 1] = [a for a in (*inputs, *outputs) if a.grad is not None]
+
+        for a in (*inputs, *outputs):
+            if a.grad is not None:
+                self.gradients[a] = a.grad
+
+        return result
+
     def record_scope_begin(self, scope_name, metadata=None):
         """
         Begin a scope on the tape to group operations together. Scopes are only used in the visualization functions.
@@ -281,6 +532,7 @@ class Tape:
         """
         self.launches = []
         self.scopes = []
+        self._func_arrays = {}
         self.zero()
         if wp.config.verify_autograd_array_access:
             self._reset_array_read_flags()
@@ -387,6 +639,282 @@ class Tape:
         )
 
 
+def _check_scalar_loss(loss):
+    if loss.size > 1 or wp._src.types.type_size(loss.dtype) > 1:
+        raise RuntimeError("Can only return gradients for scalar loss functions.")
+
+    if not loss.requires_grad:
+        raise RuntimeError("Scalar loss arrays should have requires_grad=True set before calling Tape.backward()")
+
+
+def _launch_enable_backward(launch):
+    """Return whether the adjoint of a recorded kernel launch should be evaluated, warning if it is disabled."""
+    # kernel option takes precedence over module option
+    enable_backward = launch[0].options.get("enable_backward")
+    if enable_backward is False:
+        msg = f"Running the tape backwards may produce incorrect gradients because recorded kernel {launch[0].key} is configured with the option 'enable_backward=False'."
+        log_warning(msg)
+    elif enable_backward is None:
+        enable_backward = launch[0].module.options.get("enable_backward")
+        if enable_backward is False:
+            msg = f"Running the tape backwards may produce incorrect gradients because recorded kernel {launch[0].key} is defined in a module with the option 'enable_backward=False' set."
+            log_warning(msg)
+
+    return enable_backward
+
+
+def _differentiable_arrays(values, arrays=None):
+    """Collect the arrays with gradients among kernel arguments, including struct members."""
+    if arrays is None:
+        arrays = []
+
+    for value in values:
+        if wp._src.types.is_array(value):
+            if value.grad is not None:
+                arrays.append(value)
+        elif wp._src.types.is_struct(value):
+            _differentiable_arrays([getattr(value, name) for name in value._cls.vars], arrays)
+
+    return arrays
+
+
+def _launch_arrays(launch):
+    """Return the differentiable arrays read and written by a recorded kernel launch."""
+    inputs, outputs = launch[3], launch[4]
+    if any(wp._src.types.is_array(a) or wp._src.types.is_struct(a) for a in outputs):
+        read_arrays = _differentiable_arrays(inputs)
+        written_arrays = _differentiable_arrays(outputs)
+    else:
+        read_arrays = written_arrays = _differentiable_arrays(inputs)
+
+    return read_arrays, written_arrays
+
+
+class _MemoryRanges:
+    """Set of device memory ranges used to track data dependencies between recorded operations."""
+
+    def __init__(self, arrays=()):
+        self.ranges = []
+        self.all = False
+        self.add(arrays)
+
+    @staticmethod
+    def _range(a):
+        if isinstance(a, wp.array):
+            if a.ptr is None or a.size == 0:
+                return (a.device, 0, 0)
+            extent = wp._src.types.type_size_in_bytes(a.dtype)
+            for dim, stride in zip(a.shape, a.strides, strict=True):
+                extent += (dim - 1) * abs(stride)
+            return (a.device, a.ptr, a.ptr + extent)
+        if isinstance(a, wp.indexedarray):
+            return _MemoryRanges._range(a.data)
+
+        # unknown array kind, assume it may alias anything
+        return None
+
+    def add_all(self):
+        self.all = True
+
+    def add(self, arrays):
+        for a in arrays:
+            r = self._range(a)
+            if r is None:
+                self.all = True
+            elif r[1] < r[2]:
+                self.ranges.append(r)
+
+    def overlaps(self, arrays):
+        if not arrays:
+            return False
+        if self.all:
+            return True
+
+        for a in arrays:
+            r = self._range(a)
+            if r is None:
+                return True
+            device, begin, end = r
+            for other_device, other_begin, other_end in self.ranges:
+                if begin < other_end and other_begin < end and device == other_device:
+                    return True
+
+        return False
+
+
+class CompiledBackward:
+    """A backward pass compiled with :meth:`Tape.compile_backward`.
+
+    Holds the pruned sequence of adjoint launches with pre-packed arguments,
+    and optionally a graph capturing it.
+    """
+
+    def __init__(self, steps, zero_arrays, seed_ops, devices, num_recorded):
+        self.steps = steps
+        self.zero_arrays = zero_arrays
+        self.seed_ops = seed_ops
+        self.devices = devices
+        self.num_recorded = num_recorded
+
+        self.graph = None
+        """The captured graph, if :meth:`capture` was called."""
+
+    @property
+    def num_launches(self) -> int:
+        """The number of adjoint launches and recorded functions evaluated by the backward pass."""
+        return len(self.steps)
+
+    @property
+    def num_pruned(self) -> int:
+        """The number of recorded operations that were pruned from the backward pass."""
+        return self.num_recorded - len(self.steps)
+
+    def _run(self):
+        for g in self.zero_arrays:
+            g.zero_()
+
+        for op in self.seed_ops:
+            op()
+
+        for step in self.steps:
+            if callable(step):
+                step()
+            else:
+                step.launch()
+
+    def capture(self):
+        """Capture the backward pass into a graph that is replayed by :meth:`launch`.
+
+        All operations must run on a single device. Recorded Python functions are
+        executed during the capture, so only the Warp operations they issue are replayed.
+        """
+        if len(self.devices) != 1:
+            raise RuntimeError(
+                f"Cannot capture a backward pass spanning {len(self.devices)} devices, expected a single device"
+            )
+
+        device = self.devices[0]
+        with wp.ScopedCapture(device=device, force_module_load=False) as capture:
+            self._run()
+
+        self.graph = capture.graph
+
+    def launch(self):
+        """Evaluate the backward pass, replaying the captured graph if available."""
+        if self.graph is not None:
+            wp.capture_launch(self.graph)
+        else:
+            self._run()
+
+
+def _flatten_arrays(value, arrays=None, seen=None):
+    """Collect the unique Warp arrays contained in ``value`` (possibly nested in tuples, lists, and dicts)."""
+    if arrays is None:
+        arrays = []
+        seen = set()
+
+    if isinstance(value, wp.array):
+        if id(value) not in seen:
+            seen.add(id(value))
+            arrays.append(value)
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _flatten_arrays(v, arrays, seen)
+    elif isinstance(value, dict):
+        for v in value.values():
+            _flatten_arrays(v, arrays, seen)
+
+    return arrays
+
+
+def checkpoint(fn, *args, **kwargs):
+    """Evaluate ``fn(*args, **kwargs)`` as a gradient checkpoint of the active tape.
+
+    When a :class:`Tape` is recording, this is equivalent to :meth:`Tape.checkpoint`:
+    intermediate state computed by ``fn`` is discarded and recomputed during the
+    backward pass. Outside of a tape, ``fn`` is simply called.
+
+    Example
+    -------
+
+    .. code-block:: python
+
+        def layer(x, w):
+            h = wp.empty_like(x, requires_grad=True)
+            y = wp.empty_like(x, requires_grad=True)
+            wp.launch(matvec, dim=n, inputs=[w, x], outputs=[h])
+            wp.launch(activation, dim=n, inputs=[h], outputs=[y])
+            return y
+
+
+        with tape:
+            y = wp.checkpoint(layer, x, w)  # ``h`` is not kept alive for the backward pass
+            wp.launch(loss_kernel, dim=n, inputs=[y], outputs=[loss])
+
+        tape.backward(loss)
+
+    Args:
+        fn: The function computing the segment.
+        args: Positional arguments forwarded to ``fn``.
+        kwargs: Keyword arguments forwarded to ``fn``.
+
+    Returns:
+        The value returned by ``fn``.
+    """
+    tape = wp._src.context.runtime.tape
+    if tape is None:
+        return fn(*args, **kwargs)
+
+    return tape.checkpoint(fn, *args, **kwargs)
+
+
+def checkpoint_loop(fn, state, num_steps: int, checkpoints: int | None = None):
+    """Run ``num_steps`` iterations of ``state = fn(step, state)`` with a multilevel checkpointing schedule.
+
+    The step range is split into ``checkpoints`` segments, each evaluated with
+    :func:`checkpoint`, so that only the state at the segment boundaries is kept
+    for the backward pass. Recomputing a segment during the backward pass splits
+    it again recursively, in the spirit of binomial (revolve) schedules: with ``c``
+    checkpoints and ``N`` steps, at most ``c`` snapshots are alive per level of
+    recursion and every step is recomputed at most ``ceil(log_c(N))`` times.
+    Segments that have no more than ``checkpoints`` steps are recorded normally.
+
+    Outside of a tape, the loop is simply executed.
+
+    Args:
+        fn: Function ``fn(step, state) -> state`` advancing the state by one step. The state
+            may be a single array or a (nested) tuple/list of arrays.
+        state: The initial state.
+        num_steps: The number of steps to run.
+        checkpoints: The number of segments each range of steps is split into.
+            Defaults to ``ceil(sqrt(num_steps))``, bounding the number of recomputations
+            per step to two. Must be at least 2.
+
+    Returns:
+        The final state.
+    """
+    if checkpoints is None:
+        checkpoints = max(2, math.ceil(math.sqrt(num_steps)))
+    elif checkpoints < 2:
+        raise ValueError(f"checkpoints must be at least 2, got {checkpoints}")
+
+    def run(begin, end, state):
+        count = end - begin
+        if count <= checkpoints or wp._src.context.runtime.tape is None:
+            for step in range(begin, end):
+                state = fn(step, state)
+            return state
+
+        for i in range(checkpoints):
+            segment_begin = begin + (count * i) // checkpoints
+            segment_end = begin + (count * (i + 1)) // checkpoints
+            state = checkpoint(run, segment_begin, segment_end, state)
+
+        return state
+
+    return run(0, num_steps, state)
+
+
 class TapeVisitor:
     def emit_array_node(self, arr: wp.array, label: str, active_scope_stack: list[str], indent_level: int):
         pass
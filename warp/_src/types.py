@@ -4181,7 +4181,15 @@ class array(Array[DType, NDim]):
         self._apic_ensure_tracked()
         if self.is_contiguous:
             # simple memset is usually faster than generic fill
-            self.device.memset(self.ptr, 0, self.size * type_size_in_bytes(self.dtype))
+            byte_count = self.size * type_size_in_bytes(self.dtype)
+            with warp._src.utils.ScopedCpuActivity(
+                self.device,
+                "memset",
+                warp._src.utils.TIMING_MEMSET,
+                args={"bytes": byte_count},
+                active=self.device.is_cpu,
+            ):
+                self.device.memset(self.ptr, 0, byte_count)
         else:
             self.fill_(0)
         self.mark_init()
@@ -4267,7 +4275,14 @@ class array(Array[DType, NDim]):
                     "APIC capture does not yet support fill_() with values larger than 3968 bytes on CUDA arrays; "
                     "use a smaller element type or move the fill outside the capture."
                 )
-            self.device.memtile(self.ptr, cvalue_ptr, cvalue_size, self.size)
+            with warp._src.utils.ScopedCpuActivity(
+                self.device,
+                "memset",
+                warp._src.utils.TIMING_MEMSET,
+                args={"bytes": self.size * cvalue_size},
+                active=self.device.is_cpu,
+            ):
+                self.device.memtile(self.ptr, cvalue_ptr, cvalue_size, self.size)
         else:
             # The non-contiguous fill path (wp_array_fill_host / wp_array_fill_device)
             # does not record into the APIC byte stream, so it would silently execute
@@ -5647,6 +5662,10 @@ class Bvh:
             support. If ``"lbvh"`` is selected for a CPU tree, a warning message will be issued, and the constructor
             will automatically fall back to ``"sah"``.
 
+            The ``"sah"`` and ``"median"`` constructors build large trees on up to :attr:`warp.config.cpu_max_threads`
+            host threads, both here and in :meth:`rebuild`. The upper levels are split with parallel binning and the
+            remaining subtrees are built concurrently; the resulting tree is identical to the single-threaded build.
+
             The ``leaf_size`` parameter controls the number of primitives (AABBs) stored in each leaf node of the BVH.
             This parameter can have a considerable impact on query performance, and the optimal value depends on the
             types of queries that will be performed:
@@ -6778,7 +6797,7 @@ class Volume:
     ) -> Volume:
         """Create a :class:`Volume` object from a dense 3D NumPy array.
 
-        This function is only supported for CUDA devices.
+        This function is supported on CPU and CUDA devices.
 
         Args:
             min_world: The 3D coordinate of the lower corner of the volume.
@@ -6786,7 +6805,7 @@ class Volume:
                 coordinates. Can be a scalar for isotropic voxels or a 3-element
                 sequence ``(sx, sy, sz)`` for anisotropic voxels.
             bg_value: Background value
-            device: The CUDA device to create the volume on, e.g.: ``"cuda"`` or ``"cuda:0"``.
+            device: The device to create the volume on, e.g. ``"cpu"``, ``"cuda"``, or ``"cuda:0"``.
 
         Returns:
             A ``warp.Volume`` object.
@@ -6873,7 +6892,7 @@ class Volume:
     ) -> Volume:
         """Allocate a new Volume based on the bounding box defined by min and max.
 
-        This function is only supported for CUDA devices.
+        This function is supported on CPU and CUDA devices.
 
         Allocate a volume that is large enough to contain voxels [min[0], min[1], min[2]] - [max[0], max[1], max[2]], inclusive.
         If points_in_world_space is true, then min and max are first converted to index space using the given voxel size
@@ -6890,7 +6909,7 @@ class Volume:
             bg_value: Value of unallocated voxels of the volume, also defines the volume's type,
               a :class:`warp.vec3` volume is created if this is `array-like`, otherwise a float volume is created
             translation: Translation between the index and world spaces.
-            device: The CUDA device to create the volume on, e.g.: ``"cuda"`` or ``"cuda:0"``.
+            device: The device to create the volume on, e.g. ``"cpu"``, ``"cuda"``, or ``"cuda:0"``.
         """
         voxel_size = cls._normalize_voxel_size(voxel_size)
 
@@ -6901,15 +6920,8 @@ class Volume:
 
         tile_min = np.array(min, dtype=np.int32) // 8
         tile_max = np.array(max, dtype=np.int32) // 8
-        tiles = np.array(
-            [
-                [i, j, k]
-                for i in range(tile_min[0], tile_max[0] + 1)
-                for j in range(tile_min[1], tile_max[1] + 1)
-                for k in range(tile_min[2], tile_max[2] + 1)
-            ],
-            dtype=np.int32,
-        )
+        tile_ranges = [np.arange(tile_min[d], tile_max[d] + 1, dtype=np.int32) for d in range(3)]
+        tiles = np.stack(np.meshgrid(*tile_ranges, indexing="ij"), axis=-1).reshape(-1, 3)
         tile_points = array(tiles * 8, device=device)
 
         return cls.allocate_by_tiles(tile_points, voxel_size, bg_value, translation, device)
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import cProfile
 import gc
+import json
 import os
 import sys
 import threading
@@ -853,14 +854,433 @@ def broadcast_shapes(shapes: list[tuple[int]]) -> tuple[int]:
     return ref
 
 
+def _map_type_to_code(wp_type, referenced_modules: dict[str, ModuleType]) -> str:
+    """Return the string representation of a given Warp type for code generated by :func:`map`."""
+    import builtins  # noqa: PLC0415
+
+    from .codegen import Struct  # noqa: PLC0415
+    from .types import (  # noqa: PLC0415
+        is_array,
+        type_is_matrix,
+        type_is_quaternion,
+        type_is_transformation,
+        type_is_vector,
+    )
+
+    def type_to_code(wp_type) -> str:
+        if is_array(wp_type):
+            return f"warp.array(ndim={wp_type.ndim}, dtype={type_to_code(wp_type.dtype)})"
+        if isinstance(wp_type, Struct):
+            key = f"{wp_type.__module__}.{wp_type.key}"
+            module = sys.modules.get(wp_type.__module__, None)
+            if module is not None:
+                referenced_modules[wp_type.__module__] = module
+            return key
+        if type_is_transformation(wp_type):
+            return f"warp.types.transformation(dtype={type_to_code(wp_type._wp_scalar_type_)})"
+        if type_is_quaternion(wp_type):
+            return f"warp.types.quaternion(dtype={type_to_code(wp_type._wp_scalar_type_)})"
+        if type_is_vector(wp_type):
+            return f"warp.types.vector(length={wp_type._shape_[0]}, dtype={type_to_code(wp_type._wp_scalar_type_)})"
+        if type_is_matrix(wp_type):
+            return f"warp.types.matrix(shape=({wp_type._shape_[0]}, {wp_type._shape_[1]}), dtype={type_to_code(wp_type._wp_scalar_type_)})"
+        if wp_type == builtins.bool:
+            return "bool"
+        if wp_type == builtins.float:
+            return "float"
+        if wp_type == builtins.int:
+            return "int"
+
+        name = getattr(wp_type, "__name__", None)
+        if name is None:
+            return type_repr(wp_type)
+        name = getattr(wp_type, "__qualname__", name)
+        module = getattr(wp_type, "__module__", None)
+        if module is not None:
+            referenced_modules[wp_type.__module__] = module
+        return wp_type.__module__ + "." + name
+
+    return type_to_code(wp_type)
+
+
+def _map_value_type(value):
+    """Return the Warp type of a non-array :func:`map` input."""
+    from .codegen import StructInstance  # noqa: PLC0415
+    from .types import type_to_warp  # noqa: PLC0415
+
+    dtype = type(value)
+    if issubclass(dtype, StructInstance):
+        # a struct
+        return value._cls
+    return type_to_warp(dtype)
+
+
+def _map_resolve_function(func: Callable | wp.Function) -> tuple[wp.Function, str, warp._src.context.Module]:
+    """Return the Warp function, its name, and the module used for the kernels generated by :func:`map`."""
+    module = None
+    if isinstance(func, wp.Function):
+        func_name = func.key
+        wp_func = func
+    else:
+        # check if op is a callable function
+        if not callable(func):
+            raise TypeError("func must be a callable function or a warp.Function")
+        wp_func, module = create_warp_function(func)
+        func_name = wp_func.key
+    if module is None:
+        module = warp._src.context.get_module(f"map_{func_name}")
+    return wp_func, func_name, module
+
+
+def _map_output_dtypes(wp_func: wp.Function, func_name: str, arg_types: dict[str, Any]) -> tuple:
+    """Resolve the overload of ``wp_func`` for ``arg_types`` and return the types of its return values."""
+    func = wp_func.get_overload(list(arg_types.values()), {})
+    if func is None:
+        raise TypeError(
+            f"Function {func_name} does not support the provided argument types {', '.join(type_repr(t) for t in arg_types.values())}"
+        )
+
+    arg_values = {}
+    if func.value_type is not None:
+        out_dtype = func.value_type
+    elif func.value_func is not None:
+        out_dtype = func.value_func(arg_types, arg_values)
+    else:
+        func.build(None)
+        out_dtype = func.value_func(arg_types, arg_values)
+
+    if out_dtype is None:
+        raise TypeError("The provided function must return a value")
+
+    if isinstance(out_dtype, (tuple, list)):
+        return tuple(out_dtype)
+    return (out_dtype,)
+
+
+def _map_create_outputs(out, out_dtypes: tuple, out_shape: tuple[int], requires_grad: bool, device) -> list:
+    """Validate the ``out`` argument of :func:`map`, or allocate the output arrays if it is ``None``."""
+    from .codegen import Adjoint  # noqa: PLC0415
+    from .types import is_array  # noqa: PLC0415
+
+    if out is None:
+        outputs = []
+        for dtype in out_dtypes:
+            rg = requires_grad and Adjoint.is_differentiable_value_type(dtype)
+            outputs.append(wp.empty(out_shape, dtype=dtype, requires_grad=rg, device=device))
+    elif len(out_dtypes) == 1 and is_array(out):
+        if not types_equal(out.dtype, out_dtypes[0]):
+            raise TypeError(
+                f"Output array dtype {type_repr(out.dtype)} does not match expected dtype {type_repr(out_dtypes[0])}"
+            )
+        if out.shape != out_shape:
+            raise TypeError(f"Output array shape {out.shape} does not match expected shape {out_shape}")
+        outputs = [out]
+    elif len(out_dtypes) > 1:
+        if isinstance(out, tuple) or isinstance(out, list):
+            if len(out) != len(out_dtypes):
+                raise TypeError(
+                    f"Number of provided output arrays ({len(out)}) does not match expected number of function outputs ({len(out_dtypes)})"
+                )
+            for i, a in enumerate(out):
+                if not types_equal(a.dtype, out_dtypes[i]):
+                    raise TypeError(
+                        f"Output array {i} dtype {type_repr(a.dtype)} does not match expected dtype {type_repr(out_dtypes[i])}"
+                    )
+                if a.shape != out_shape:
+                    raise TypeError(f"Output array {i} shape {a.shape} does not match expected shape {out_shape}")
+            outputs = list(out)
+        else:
+            raise TypeError(
+                f"Invalid output provided, expected {len(out_dtypes)} Warp arrays with shape {out_shape} and dtypes ({', '.join(type_repr(t) for t in out_dtypes)})"
+            )
+    else:
+        raise TypeError(f"Invalid output provided, expected a Warp array with shape {out_shape}")
+
+    return outputs
+
+
+def _map_output_type_descriptor(out) -> Any:
+    """Return the part of the :func:`map` cache key that depends on the type of the ``out`` argument."""
+    from .types import is_array  # noqa: PLC0415
+
+    # Only differentiate when output is not a regular array (e.g., indexedarray)
+    # since out=None creates regular arrays and should share cache with explicit array outputs
+    def get_output_type_descriptor(o):
+        type_name = type(o).__name__
+        return type_name if type_name != "array" else None
+
+    if out is None:
+        return None  # Will use default 'array' type
+    if is_array(out):
+        return get_output_type_descriptor(out)
+    if isinstance(out, (tuple, list)):
+        descriptors = tuple(get_output_type_descriptor(o) for o in out)
+        # Only include if any output is non-array type
+        return descriptors if any(d is not None for d in descriptors) else None
+    return None
+
+
+class ArrayExpression:
+    """A deferred element-wise expression over Warp arrays.
+
+    Array expressions are returned by :func:`warp.map` when called with ``lazy=True``
+    or with another expression as input. They record the mapped functions and their inputs
+    instead of launching a kernel, and support the same arithmetic operators as
+    :class:`warp.array`, which extend the expression.
+
+    Calling :meth:`eval` fuses the whole expression into a single generated kernel that
+    reads every input array once and writes only the final result, without materializing
+    intermediate arrays. Fused kernels are cached by the structure of the expression and the
+    types of its inputs, so evaluating an expression of the same form again reuses the kernel.
+
+    .. testcode::
+
+        a = wp.array([1.0, 2.0, 3.0], dtype=wp.float32)
+        b = wp.array([4.0, 5.0, 6.0], dtype=wp.float32)
+        expr = wp.map(wp.mul, a, 2.0, lazy=True)
+        expr = (expr + b) * a  # still deferred
+        print(expr.eval())
+
+    .. testoutput::
+
+        [ 6. 18. 36.]
+
+    Attributes:
+        dtype: The data type of the expression's elements.
+        shape: The shape of the expression after broadcasting its inputs.
+        ndim: The number of dimensions of the expression.
+        device: The device the expression is evaluated on.
+        requires_grad: Whether the evaluated array requires gradients.
+    """
+
+    def __init__(
+        self,
+        func: wp.Function,
+        inputs: tuple,
+        dtype: type,
+        shape: tuple[int, ...],
+        device: warp._src.context.Device,
+        requires_grad: bool,
+    ):
+        self._func = func
+        self._inputs = inputs
+        self.dtype = dtype
+        self.shape = shape
+        self.ndim = len(shape)
+        self.device = device
+        self.requires_grad = requires_grad
+
+    def __repr__(self):
+        return f"ArrayExpression({self._func.key}, shape={self.shape}, dtype={type_repr(self.dtype)})"
+
+    def eval(self, out: Array[DType] | None = None, block_dim: int = 256) -> Array[DType]:
+        """Evaluate the expression with a single fused kernel launch.
+
+        Args:
+            out: Optional output array to store the result. If ``None``, a new array is allocated.
+            block_dim: The number of threads per block for the kernel launch.
+
+        Returns:
+            The array holding the result of the expression.
+        """
+        return _map_fused(self._func, self._inputs, (self.dtype,), self.shape, out, False, block_dim, self.device)
+
+    def numpy(self) -> np.ndarray:
+        """Evaluate the expression and return the result as a NumPy array."""
+        return self.eval().numpy()
+
+    def __add__(self, other) -> ArrayExpression:
+        return map(wp.add, self, other)  # type: ignore
+
+    def __radd__(self, other) -> ArrayExpression:
+        return map(wp.add, other, self)  # type: ignore
+
+    def __sub__(self, other) -> ArrayExpression:
+        return map(wp.sub, self, other)  # type: ignore
+
+    def __rsub__(self, other) -> ArrayExpression:
+        return map(wp.sub, other, self)  # type: ignore
+
+    def __mul__(self, other) -> ArrayExpression:
+        return map(wp.mul, self, other)  # type: ignore
+
+    def __rmul__(self, other) -> ArrayExpression:
+        return map(wp.mul, other, self)  # type: ignore
+
+    def __truediv__(self, other) -> ArrayExpression:
+        return map(wp.div, self, other)  # type: ignore
+
+    def __rtruediv__(self, other) -> ArrayExpression:
+        return map(wp.div, other, self)  # type: ignore
+
+    def __floordiv__(self, other) -> ArrayExpression:
+        return map(wp.floordiv, self, other)  # type: ignore
+
+    def __rfloordiv__(self, other) -> ArrayExpression:
+        return map(wp.floordiv, other, self)  # type: ignore
+
+    def __mod__(self, other) -> ArrayExpression:
+        return map(wp.mod, self, other)  # type: ignore
+
+    def __rmod__(self, other) -> ArrayExpression:
+        return map(wp.mod, other, self)  # type: ignore
+
+    def __pow__(self, other) -> ArrayExpression:
+        return map(wp.pow, self, other)  # type: ignore
+
+    def __rpow__(self, other) -> ArrayExpression:
+        return map(wp.pow, other, self)  # type: ignore
+
+    def __neg__(self) -> ArrayExpression:
+        return map(wp.neg, self)  # type: ignore
+
+    def __pos__(self) -> ArrayExpression:
+        return map(wp.pos, self)  # type: ignore
+
+
+def _map_fused(
+    wp_func: wp.Function,
+    inputs: tuple,
+    out_dtypes: tuple,
+    out_shape: tuple[int, ...],
+    out,
+    return_kernel: bool,
+    block_dim: int,
+    device,
+):
+    """Evaluate ``wp_func`` over ``inputs``, fusing any :class:`ArrayExpression` inputs into one kernel."""
+    import hashlib  # noqa: PLC0415
+
+    from .types import is_array  # noqa: PLC0415
+
+    referenced_modules: dict[str, ModuleType] = {}
+
+    # flatten the expression DAG into kernel arguments and local variables, visiting
+    # shared sub-expressions and repeated arrays only once
+    leaves = []
+    leaf_indices = {}
+    funcs = []
+    expr_vars = {}
+    lines = []
+    structure = []
+
+    def visit(value) -> str:
+        if isinstance(value, ArrayExpression):
+            var = expr_vars.get(id(value))
+            if var is None:
+                args = [visit(i) for i in value._inputs]
+                var = f"__v_{len(funcs)}"
+                lines.append(f"{var} = map_func_{len(funcs)}({', '.join(args)})")
+                structure.append((value._func.key, tuple(args)))
+                funcs.append(value._func)
+                expr_vars[id(value)] = var
+            return var
+
+        index = leaf_indices.get(id(value)) if is_array(value) else None
+        if index is None:
+            index = len(leaves)
+            leaves.append(value)
+            if is_array(value):
+                leaf_indices[id(value)] = index
+        return f"__a_{index}"
+
+    root_args = [visit(i) for i in inputs]
+    structure.append((wp_func.key, tuple(root_args)))
+
+    tids = [f"__tid_{i}" for i in range(len(out_shape))]
+    kernel_args = []
+    load_args = []
+    leaf_descriptors = []
+    for index, leaf in enumerate(leaves):
+        if is_array(leaf):
+            array_type_name = type(leaf).__name__
+            kernel_args.append(
+                f"__in_{index}: wp.{array_type_name}(dtype={_map_type_to_code(leaf.dtype, referenced_modules)}, ndim={leaf.ndim})"
+            )
+            indices = []
+            for i in range(1, leaf.ndim + 1):
+                indices.append("0" if leaf.shape[-i] == 1 else tids[-i])
+            load_args.append(f"__a_{index} = __in_{index}[{', '.join(reversed(indices))}]")
+            broadcast_mask = tuple(d == 1 for d in leaf.shape)
+            leaf_descriptors.append((True, array_type_name, leaf.dtype, leaf.ndim, broadcast_mask))
+        else:
+            kernel_args.append(f"__a_{index}: {_map_type_to_code(type(leaf), referenced_modules)}")
+            leaf_descriptors.append((False, _map_value_type(leaf)))
+
+    outputs = _map_create_outputs(
+        out,
+        out_dtypes,
+        out_shape,
+        any(getattr(a, "requires_grad", False) for a in leaves if is_array(a)),
+        device,
+    )
+
+    cache_key = (
+        "fused",
+        tuple(structure),
+        tuple(leaf_descriptors),
+        len(out_shape),
+        _map_output_type_descriptor(out),
+    )
+    cached = map_cache.get(cache_key)
+    if cached is not None:
+        _, kernel = cached
+    else:
+        for i, o in enumerate(outputs):
+            kernel_args.append(
+                f"__out_{i}: wp.{type(o).__name__}(dtype={_map_type_to_code(o.dtype, referenced_modules)}, ndim={o.ndim})"
+            )
+
+        body = [f"{', '.join(tids)} = wp.tid()", *load_args, *lines]
+        call = f"map_func_root({', '.join(root_args)})"
+        if len(outputs) == 1:
+            body.append(f"__out_0[{', '.join(tids)}] = {call}")
+        else:
+            body.append(f"{', '.join(f'__o_{i}' for i in range(len(outputs)))} = {call}")
+            body.extend(f"__out_{i}[{', '.join(tids)}] = __o_{i}" for i in range(len(outputs)))
+
+        code = f"def map_kernel({', '.join(kernel_args)}):\n" + "".join(f"    {line}\n" for line in body)
+
+        # name the module after the generated code and the functions it calls, so that
+        # fused kernels of different expressions never share a module
+        func_keys = [f.key for f in funcs] + [wp_func.key]
+        digest = hashlib.sha256((code + repr(func_keys)).encode("utf-8")).hexdigest()[:16]
+        module = warp._src.context.get_module(f"map_fused_{digest}")
+
+        namespace = {"wp": wp, "warp": wp, "Any": Any, "map_func_root": wp_func} | referenced_modules
+        for i, f in enumerate(funcs):
+            namespace[f"map_func_{i}"] = f
+        exec(code, namespace)
+
+        kernel = wp.Kernel(namespace["map_kernel"], key="map_kernel", source=code, module=module)
+        map_cache[cache_key] = (out_dtypes, kernel)
+
+    if return_kernel:
+        return kernel
+
+    wp.launch(
+        kernel,
+        dim=out_shape,
+        inputs=leaves,
+        outputs=outputs,
+        block_dim=block_dim,
+        device=device,
+    )
+
+    if len(outputs) == 1:
+        return outputs[0]
+    return outputs
+
+
 def map(
     func: Callable | wp.Function,
-    *inputs: Array[DType] | Any,
+    *inputs: Array[DType] | ArrayExpression | Any,
     out: Array[DType] | list[Array[DType]] | None = None,
     return_kernel: bool = False,
     block_dim: int = 256,
     device: DeviceLike = None,
-) -> Array[DType] | list[Array[DType]] | wp.Kernel:
+    lazy: bool = False,
+) -> Array[DType] | list[Array[DType]] | wp.Kernel | ArrayExpression:
     """Map a function over the elements of one or more arrays.
 
     You can use a Warp function, a regular Python function, or a lambda expression to map it to a set of arrays.
@@ -931,90 +1351,39 @@ def map(
     if any of the input arrays have it set to ``True`` and the respective output array's ``dtype`` is a type that
     supports differentiation.
 
+    If ``lazy`` is True, or if any of the inputs is an :class:`warp.ArrayExpression`, no kernel is launched.
+    Instead, an :class:`warp.ArrayExpression` is returned that records the mapping and can be combined with
+    further :func:`map` calls and arithmetic operators. Evaluating the expression fuses the whole chain of
+    functions into a single kernel, which avoids allocating and writing intermediate arrays:
+
+    .. testcode::
+
+        a = wp.array([1.0, 2.0, 3.0], dtype=wp.float32)
+        b = wp.array([4.0, 5.0, 6.0], dtype=wp.float32)
+        expr = wp.map(wp.sin, a, lazy=True) * b + 1.0
+        result = expr.eval()  # one kernel launch
+
+    Expressions are evaluated immediately if an ``out`` argument is given, if the function
+    returns multiple values, or if ``return_kernel`` is True.
+
     Args:
         func: The function to map over the arrays.
-        *inputs: The input arrays or values to pass to the function.
+        *inputs: The input arrays, array expressions, or values to pass to the function.
         out: Optional output array(s) to store the result(s). If None, the output array(s) will be created automatically.
         return_kernel: If True, only return the generated kernel without performing the mapping operation.
         block_dim: The number of threads per block for the kernel launch.
         device: The device on which to run the kernel.
+        lazy: If True, defer the mapping and return an :class:`warp.ArrayExpression`.
 
     Returns:
-        array | list[array] | Kernel:
+        array | list[array] | Kernel | ArrayExpression:
             The resulting array(s) of the mapping. If ``return_kernel`` is True, only returns the kernel used for mapping.
+            If the mapping is deferred, returns the unevaluated expression.
     """
 
-    import builtins  # noqa: PLC0415
+    from .types import is_array  # noqa: PLC0415
 
-    from .codegen import Adjoint, Struct, StructInstance  # noqa: PLC0415
-    from .types import (  # noqa: PLC0415
-        is_array,
-        type_is_matrix,
-        type_is_quaternion,
-        type_is_transformation,
-        type_is_vector,
-        type_repr,
-        type_to_warp,
-        types_equal,
-    )
-
-    # mapping from struct name to its Python definition
-    referenced_modules: dict[str, ModuleType] = {}
-
-    def type_to_code(wp_type) -> str:
-        """Return the string representation of a given Warp type."""
-        if is_array(wp_type):
-            return f"warp.array(ndim={wp_type.ndim}, dtype={type_to_code(wp_type.dtype)})"
-        if isinstance(wp_type, Struct):
-            key = f"{wp_type.__module__}.{wp_type.key}"
-            module = sys.modules.get(wp_type.__module__, None)
-            if module is not None:
-                referenced_modules[wp_type.__module__] = module
-            return key
-        if type_is_transformation(wp_type):
-            return f"warp.types.transformation(dtype={type_to_code(wp_type._wp_scalar_type_)})"
-        if type_is_quaternion(wp_type):
-            return f"warp.types.quaternion(dtype={type_to_code(wp_type._wp_scalar_type_)})"
-        if type_is_vector(wp_type):
-            return f"warp.types.vector(length={wp_type._shape_[0]}, dtype={type_to_code(wp_type._wp_scalar_type_)})"
-        if type_is_matrix(wp_type):
-            return f"warp.types.matrix(shape=({wp_type._shape_[0]}, {wp_type._shape_[1]}), dtype={type_to_code(wp_type._wp_scalar_type_)})"
-        if wp_type == builtins.bool:
-            return "bool"
-        if wp_type == builtins.float:
-            return "float"
-        if wp_type == builtins.int:
-            return "int"
-
-        name = getattr(wp_type, "__name__", None)
-        if name is None:
-            return type_repr(wp_type)
-        name = getattr(wp_type, "__qualname__", name)
-        module = getattr(wp_type, "__module__", None)
-        if module is not None:
-            referenced_modules[wp_type.__module__] = module
-        return wp_type.__module__ + "." + name
-
-    def get_warp_type(value):
-        dtype = type(value)
-        if issubclass(dtype, StructInstance):
-            # a struct
-            return value._cls
-        return type_to_warp(dtype)
-
-    module = None
-    out_dtypes = None
-    if isinstance(func, wp.Function):
-        func_name = func.key
-        wp_func = func
-    else:
-        # check if op is a callable function
-        if not callable(func):
-            raise TypeError("func must be a callable function or a warp.Function")
-        wp_func, module = create_warp_function(func)
-        func_name = wp_func.key
-    if module is None:
-        module = warp._src.context.get_module(f"map_{func_name}")
+    wp_func, func_name, module = _map_resolve_function(func)
 
     arg_names = list(wp_func.input_types.keys())
 
@@ -1023,9 +1392,14 @@ def map(
             f"Number of input arguments ({len(inputs)}) does not match expected number of function arguments ({len(arg_names)})"
         )
 
+    if lazy or any(isinstance(inp, ArrayExpression) for inp in inputs):
+        return _map_lazy(wp_func, func_name, inputs, out, return_kernel, block_dim, device)
+
+    # mapping from struct name to its Python definition
+    referenced_modules: dict[str, ModuleType] = {}
+
     # Build input descriptors and arg_types for cache lookup
     arg_types = {}
-    arg_values = {}
     input_descriptors = []
     for i, arg_name in enumerate(arg_names):
         if is_array(inputs[i]):
@@ -1038,27 +1412,11 @@ def map(
             input_descriptors.append((True, type(inputs[i]).__name__, inputs[i].dtype, inputs[i].ndim, broadcast_mask))
         else:
             # we pass the input value directly to the function
-            warp_type = get_warp_type(inputs[i])
+            warp_type = _map_value_type(inputs[i])
             arg_types[arg_name] = warp_type
             input_descriptors.append((False, warp_type))
 
-    # Build output type descriptors for cache key
-    # Only differentiate when output is not a regular array (e.g., indexedarray)
-    # since out=None creates regular arrays and should share cache with explicit array outputs
-    def get_output_type_descriptor(o):
-        type_name = type(o).__name__
-        return type_name if type_name != "array" else None
-
-    if out is None:
-        output_type_descriptor = None  # Will use default 'array' type
-    elif is_array(out):
-        output_type_descriptor = get_output_type_descriptor(out)
-    elif isinstance(out, (tuple, list)):
-        descriptors = tuple(get_output_type_descriptor(o) for o in out)
-        # Only include if any output is non-array type
-        output_type_descriptor = descriptors if any(d is not None for d in descriptors) else None
-    else:
-        output_type_descriptor = None
+    output_type_descriptor = _map_output_type_descriptor(out)
 
     # Check unified cache for output types and kernel
     cache_key = (func_name, tuple(input_descriptors), output_type_descriptor)
@@ -1068,29 +1426,7 @@ def map(
         out_dtypes, kernel = cached
     else:
         # Compute output types (expensive)
-        func_or_none = wp_func.get_overload(list(arg_types.values()), {})
-        if func_or_none is None:
-            raise TypeError(
-                f"Function {func_name} does not support the provided argument types {', '.join(type_repr(t) for t in arg_types.values())}"
-            )
-        func = func_or_none
-
-        if func.value_type is not None:
-            out_dtype = func.value_type
-        elif func.value_func is not None:
-            out_dtype = func.value_func(arg_types, arg_values)
-        else:
-            func.build(None)
-            out_dtype = func.value_func(arg_types, arg_values)
-
-        if out_dtype is None:
-            raise TypeError("The provided function must return a value")
-
-        if isinstance(out_dtype, (tuple, list)):
-            out_dtypes = tuple(out_dtype)
-        else:
-            out_dtypes = (out_dtype,)
-
+        out_dtypes = _map_output_dtypes(wp_func, func_name, arg_types)
         kernel = None  # Will be generated below
 
     # gather the arrays in the inputs to determine the output shape
@@ -1100,38 +1436,8 @@ def map(
     # broadcast the shapes of the arrays
     out_shape = broadcast_shapes(array_shapes)
 
-    if out is None:
-        requires_grad = any(getattr(a, "requires_grad", False) for a in inputs if is_array(a))
-        outputs = []
-        for dtype in out_dtypes:
-            rg = requires_grad and Adjoint.is_differentiable_value_type(dtype)
-            outputs.append(wp.empty(out_shape, dtype=dtype, requires_grad=rg, device=device))
-    elif len(out_dtypes) == 1 and is_array(out):
-        if not types_equal(out.dtype, out_dtypes[0]):
-            raise TypeError(
-                f"Output array dtype {type_repr(out.dtype)} does not match expected dtype {type_repr(out_dtypes[0])}"
-            )
-        if out.shape != out_shape:
-            raise TypeError(f"Output array shape {out.shape} does not match expected shape {out_shape}")
-        outputs = [out]
-    elif len(out_dtypes) > 1:
-        if isinstance(out, tuple) or isinstance(out, list):
-            if len(out) != len(out_dtypes):
-                raise TypeError(
-                    f"Number of provided output arrays ({len(out)}) does not match expected number of function outputs ({len(out_dtypes)})"
-                )
-            for i, a in enumerate(out):
-                if not types_equal(a.dtype, out_dtypes[i]):
-                    raise TypeError(
-                        f"Output array {i} dtype {type_repr(a.dtype)} does not match expected dtype {type_repr(out_dtypes[i])}"
-                    )
-                if a.shape != out_shape:
-                    raise TypeError(f"Output array {i} shape {a.shape} does not match expected shape {out_shape}")
-            outputs = list(out)
-        else:
-            raise TypeError(
-                f"Invalid output provided, expected {len(out_dtypes)} Warp arrays with shape {out_shape} and dtypes ({', '.join(type_repr(t) for t in out_dtypes)})"
-            )
+    requires_grad = any(getattr(a, "requires_grad", False) for a in inputs if is_array(a))
+    outputs = _map_create_outputs(out, out_dtypes, out_shape, requires_grad, device)
 
     # Generate kernel if not cached
     if kernel is None:
@@ -1157,7 +1463,7 @@ def map(
                 arr_name = f"{arg_name}_array"
                 array_type_name = type(inp).__name__
                 kernel_args.append(
-                    f"{arr_name}: wp.{array_type_name}(dtype={type_to_code(inp.dtype)}, ndim={inp.ndim})"
+                    f"{arr_name}: wp.{array_type_name}(dtype={_map_type_to_code(inp.dtype, referenced_modules)}, ndim={inp.ndim})"
                 )
                 shape = inp.shape
                 indices = []
@@ -1169,9 +1475,11 @@ def map(
 
                 load_args.append(f"{arg_name} = {arr_name}[{', '.join(reversed(indices))}]")
             else:
-                kernel_args.append(f"{arg_name}: {type_to_code(type(inp))}")
+                kernel_args.append(f"{arg_name}: {_map_type_to_code(type(inp), referenced_modules)}")
         for i, o in enumerate(outputs):
-            kernel_args.append(f"__out_{i}: wp.{type(o).__name__}(dtype={type_to_code(o.dtype)}, ndim={o.ndim})")
+            kernel_args.append(
+                f"__out_{i}: wp.{type(o).__name__}(dtype={_map_type_to_code(o.dtype, referenced_modules)}, ndim={o.ndim})"
+            )
         code = code.format(
             func_name=func_name,
             kernel_args=", ".join(kernel_args),
@@ -1205,6 +1513,43 @@ def map(
     return o
 
 
+def _map_lazy(
+    wp_func: wp.Function,
+    func_name: str,
+    inputs: tuple,
+    out,
+    return_kernel: bool,
+    block_dim: int,
+    device: DeviceLike,
+):
+    """Build an :class:`ArrayExpression` node for :func:`map`, or evaluate it right away if it cannot be deferred."""
+    from .types import is_array  # noqa: PLC0415
+
+    arg_types = {}
+    array_shapes = []
+    for arg_name, inp in zip(wp_func.input_types.keys(), inputs, strict=True):
+        if isinstance(inp, ArrayExpression) or is_array(inp):
+            arg_types[arg_name] = inp.dtype
+            array_shapes.append(inp.shape)
+            if device is None:
+                device = inp.device
+        else:
+            arg_types[arg_name] = _map_value_type(inp)
+
+    if len(array_shapes) == 0:
+        raise ValueError("map requires at least one warp.array input")
+    out_shape = broadcast_shapes(array_shapes)
+    device = warp._src.context.get_device(device)
+
+    out_dtypes = _map_output_dtypes(wp_func, func_name, arg_types)
+
+    if out is None and len(out_dtypes) == 1 and not return_kernel:
+        requires_grad = any(getattr(inp, "requires_grad", False) for inp in inputs)
+        return ArrayExpression(wp_func, tuple(inputs), out_dtypes[0], out_shape, device, requires_grad)
+
+    return _map_fused(wp_func, tuple(inputs), out_dtypes, out_shape, out, return_kernel, block_dim, device)
+
+
 # code snippet for invoking cProfile
 # cp = cProfile.Profile()
 # cp.enable()
@@ -1429,8 +1774,11 @@ TIMING_MEMSET = 8
 TIMING_GRAPH = 16
 """Timing flag for CUDA graph launches."""
 
+TIMING_MODULE = 32
+"""Timing flag for module code generation, compilation, and loading (host activity timing only)."""
+
 TIMING_ALL = 0xFFFFFFFF
-"""Timing flag to capture all CUDA activities."""
+"""Timing flag to capture all activities."""
 
 
 # timer utils
@@ -1459,6 +1807,7 @@ class ScopedTimer:
         cuda_filter: int = 0,
         report_func: Callable[[list[TimingResult], str], None] | None = None,
         skip_tape: bool = False,
+        cpu_filter: int = 0,
     ):
         """Context manager object for a timer
 
@@ -1475,11 +1824,12 @@ class ScopedTimer:
             report_func: A callback function to print the activity report.
               If ``None``,  :func:`warp.timing_print` will be used.
             skip_tape: If true, the timer will not be recorded in the tape
+            cpu_filter: Filter flags for host activity timing, e.g. ``warp.TIMING_KERNEL`` or ``warp.TIMING_ALL``
 
         Attributes:
             extra_msg (str): Can be set to a string that will be added to the printout at context exit.
             elapsed (float): The duration of the ``with`` block used with this object
-            timing_results (list[TimingResult]): The list of activity timing results, if collection was requested using ``cuda_filter``
+            timing_results (list[TimingResult]): The list of activity timing results, if collection was requested using ``cuda_filter`` or ``cpu_filter``
         """
         self.name = name
         self.active = active and self.enabled
@@ -1492,6 +1842,7 @@ class ScopedTimer:
         self.skip_tape = skip_tape
         self.elapsed = 0.0
         self.cuda_filter = cuda_filter
+        self.cpu_filter = cpu_filter
         self.report_func = report_func or wp.timing_print
         self.extra_msg = ""  # Can be used to add to the message printed at manager exit
 
@@ -1509,9 +1860,9 @@ class ScopedTimer:
             if self.synchronize:
                 wp.synchronize()
 
-            if self.cuda_filter:
-                # begin CUDA activity collection, synchronizing if needed
-                timing_begin(self.cuda_filter, synchronize=not self.synchronize)
+            if self.cuda_filter or self.cpu_filter:
+                # begin activity collection, synchronizing if needed
+                timing_begin(self.cuda_filter, synchronize=not self.synchronize, cpu_filter=self.cpu_filter)
 
             if self.detailed:
                 self.cp = cProfile.Profile()
@@ -1551,8 +1902,8 @@ class ScopedTimer:
                 self.cp.disable()
                 self.cp.print_stats(sort="tottime")
 
-            if self.cuda_filter:
-                # end CUDA activity collection, synchronizing if needed
+            if self.cuda_filter or self.cpu_filter:
+                # end activity collection, synchronizing if needed
                 self.timing_results = timing_end(synchronize=not self.synchronize)
             else:
                 self.timing_results = []
@@ -1937,7 +2288,7 @@ def check_p2p():
 class TimingResult:
     """Timing result for a single activity."""
 
-    def __init__(self, device, name, filter, elapsed):
+    def __init__(self, device, name, filter, elapsed, start=None, args=None):
         self.device: warp._src.context.Device = device
         """The device where the activity was recorded."""
 
@@ -1950,19 +2301,77 @@ class TimingResult:
         self.elapsed: float = elapsed
         """The elapsed time in milliseconds."""
 
+        self.start: float | None = start
+        """The start time in milliseconds on the :func:`time.perf_counter` clock for host activities,
+        or ``None`` for CUDA activities."""
+
+        self.args: dict[str, Any] | None = args
+        """Additional information about the activity, such as kernel launch dimensions, or ``None``."""
+
+
+class _CpuActivityRecorder:
+    """Collects host activities selected by ``filter`` between :func:`timing_begin` and :func:`timing_end`."""
+
+    def __init__(self, filter: int):
+        self.filter = filter
+        self.results: list[TimingResult] = []
+
+    def record(self, device, name: str, filter: int, start_ns: int, args: dict[str, Any] | None = None):
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        self.results.append(
+            TimingResult(device, name, filter, elapsed_ns / 1000000.0, start=start_ns / 1000000.0, args=args)
+        )
+
+
+class ScopedCpuActivity:
+    """Context manager recording the enclosed block as a host activity when host activity timing is enabled.
+
+    Args:
+        device: The device on which the activity is performed.
+        name: The activity name, or a callable returning it, evaluated at exit.
+        filter: The type of activity (e.g., ``warp.TIMING_KERNEL``).
+        args: Additional information about the activity.
+        active: Whether the activity should be recorded at all.
+    """
+
+    __slots__ = ("args", "device", "filter", "name", "recorder", "start")
+
+    def __init__(self, device, name: str | Callable[[], str], filter: int, args=None, active: bool = True):
+        recorder = warp._src.context.runtime.cpu_timing if active else None
+        self.recorder = recorder if recorder is not None and recorder.filter & filter else None
+        if self.recorder is not None:
+            self.device = device
+            self.name = name
+            self.filter = filter
+            self.args = args
+
+    def __enter__(self):
+        if self.recorder is not None:
+            self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.recorder is not None:
+            name = self.name() if callable(self.name) else self.name
+            self.recorder.record(self.device, name, self.filter, self.start, args=self.args)
+
 
-def timing_begin(cuda_filter: int = TIMING_ALL, synchronize: bool = True) -> None:
+def timing_begin(cuda_filter: int = TIMING_ALL, synchronize: bool = True, cpu_filter: int = 0) -> None:
     """Begin detailed activity timing.
 
     Parameters:
         cuda_filter: Filter flags for CUDA activity timing, e.g. ``warp.TIMING_KERNEL`` or ``warp.TIMING_ALL``
         synchronize: Whether to synchronize all CUDA devices before timing starts
+        cpu_filter: Filter flags for host activity timing, e.g. ``warp.TIMING_KERNEL`` or ``warp.TIMING_ALL``.
+          Host activities include kernel launches, memory copies and sets on CPU devices, as well as
+          module loading and compilation for all devices (``warp.TIMING_MODULE``).
     """
 
     if synchronize:
         warp.synchronize()
 
     warp._src.context.runtime.core.wp_cuda_timing_begin(cuda_filter)
+    warp._src.context.runtime.cpu_timing = _CpuActivityRecorder(cpu_filter) if cpu_filter else None
 
 
 def timing_end(synchronize: bool = True) -> list[TimingResult]:
@@ -1973,11 +2382,15 @@ def timing_end(synchronize: bool = True) -> list[TimingResult]:
 
     Returns:
         A list of :class:`TimingResult` objects for all recorded activities.
+        CUDA activities are listed first in issue order, followed by host activities in start order.
     """
 
     if synchronize:
         warp.synchronize()
 
+    cpu_timing = warp._src.context.runtime.cpu_timing
+    warp._src.context.runtime.cpu_timing = None
+
     # get result count
     count = warp._src.context.runtime.core.wp_cuda_timing_get_result_count()
 
@@ -2008,6 +2421,10 @@ def timing_end(synchronize: bool = True) -> list[TimingResult]:
 
         results.append(TimingResult(device, name, filter, elapsed))
 
+    if cpu_timing is not None:
+        # activities are recorded when they finish, which differs from their start order when nested or concurrent
+        results.extend(sorted(cpu_timing.results, key=lambda r: r.start))
+
     return results
 
 
@@ -2039,7 +2456,10 @@ def timing_print(results: list[TimingResult], indent: str = "") -> None:
     activity_width = max_name_len + 1
     activity_dashes = "-" * activity_width
 
-    print(f"{indent}CUDA timeline:")
+    # host activities carry a start time, keep the historical headers for CUDA-only results
+    title = "CUDA" if all(r.start is None for r in results) else "Activity"
+
+    print(f"{indent}{title} timeline:")
     print(f"{indent}----------------+---------+{activity_dashes}")
     print(f"{indent}Time            | Device  | Activity")
     print(f"{indent}----------------+---------+{activity_dashes}")
@@ -2061,7 +2481,7 @@ def timing_print(results: list[TimingResult], indent: str = "") -> None:
         print(f"{indent}{r.elapsed:12.6f} ms | {r.device.alias:7s} | {r.name}")
 
     print()
-    print(f"{indent}CUDA activity summary:")
+    print(f"{indent}{title} summary:")
     print(f"{indent}----------------+---------+{activity_dashes}")
     print(f"{indent}Total time      | Count   | Activity")
     print(f"{indent}----------------+---------+{activity_dashes}")
@@ -2069,7 +2489,7 @@ def timing_print(results: list[TimingResult], indent: str = "") -> None:
         print(f"{indent}{agg.elapsed:12.6f} ms | {agg.count:7d} | {name}")
 
     print()
-    print(f"{indent}CUDA device summary:")
+    print(f"{indent}{title} device summary:")
     print(f"{indent}----------------+---------+{activity_dashes}")
     print(f"{indent}Total time      | Count   | Device")
     print(f"{indent}----------------+---------+{activity_dashes}")
@@ -2077,6 +2497,82 @@ def timing_print(results: list[TimingResult], indent: str = "") -> None:
         print(f"{indent}{agg.elapsed:12.6f} ms | {agg.count:7d} | {device}")
 
 
+_TIMING_CATEGORIES = {
+    TIMING_KERNEL: "kernel",
+    TIMING_KERNEL_BUILTIN: "builtin",
+    TIMING_MEMCPY: "memcpy",
+    TIMING_MEMSET: "memset",
+    TIMING_GRAPH: "graph",
+    TIMING_MODULE: "module",
+}
+
+
+def timing_to_chrome_trace(results: list[TimingResult], path: str | os.PathLike | None = None) -> dict[str, Any]:
+    """Convert timing results to the Chrome trace event format.
+
+    The returned trace can be loaded in ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`__.
+    Host activities are placed on a ``Host`` process using their recorded start times.
+    CUDA activities do not carry absolute timestamps, so they are placed on a ``CUDA`` process and laid out
+    back-to-back in issue order for each device, starting at the earliest host activity.
+
+    Parameters:
+        results: List of :class:`TimingResult` objects, e.g., as returned by :func:`warp.timing_end`.
+        path: If not ``None``, the file to which the trace is written as JSON.
+
+    Returns:
+        A dictionary following the Chrome trace event format.
+    """
+
+    host_pid = 0
+    cuda_pid = 1
+
+    host_starts = [r.start for r in results if r.start is not None]
+    origin = min(host_starts) if host_starts else 0.0
+
+    events = []
+    thread_ids = {}
+    cuda_clocks = {}
+
+    for r in results:
+        if r.start is not None:
+            pid = host_pid
+            start = r.start
+        else:
+            pid = cuda_pid
+            start = cuda_clocks.get(r.device.alias, origin)
+            cuda_clocks[r.device.alias] = start + r.elapsed
+
+        tid = thread_ids.setdefault((pid, r.device.alias), len(thread_ids))
+
+        event = {
+            "name": r.name,
+            "cat": _TIMING_CATEGORIES.get(r.filter, "other"),
+            "ph": "X",
+            "ts": (start - origin) * 1000.0,
+            "dur": r.elapsed * 1000.0,
+            "pid": pid,
+            "tid": tid,
+        }
+        if r.args:
+            event["args"] = {key: list(value) if isinstance(value, tuple) else value for key, value in r.args.items()}
+        events.append(event)
+
+    metadata = []
+    for pid, process_name in ((host_pid, "Host"), (cuda_pid, "CUDA")):
+        if any(key[0] == pid for key in thread_ids):
+            metadata.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": process_name}})
+    for (pid, alias), tid in thread_ids.items():
+        metadata.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": alias}})
+
+    trace = {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    if path is not None:
+        with open(path, "w") as f:
+            json.dump(trace, f)
+
+    return trace
+
+
 class ScopedMemoryTracker:
     """Context manager that tracks memory allocations across all devices.
 
@@ -64,6 +64,15 @@ def _warn_deprecated_config_access(name: str) -> None:
         _deprecated_quiet_warning_seen = True
 
 
+def _set_native_cpu_max_threads(value: int) -> None:
+    # The native host algorithms (sort, scan, run-length encode, BVH and volume builds) keep their own copy of the
+    # thread count. Before wp.init() there is nothing to update; Runtime pushes the value itself.
+    context = _sys.modules.get("warp._src.context")
+    runtime = getattr(context, "runtime", None)
+    if runtime is not None:
+        runtime.core.wp_cpu_set_max_threads(value)
+
+
 class _ConfigModule(_types.ModuleType):
     def __getattribute__(self, name):
         if name in ("verbose", "quiet"):
@@ -77,6 +86,10 @@ class _ConfigModule(_types.ModuleType):
             raise ValueError(
                 f"warp.config.launch_array_access_mode must be a warp.config.LaunchArrayAccessMode value, got {value!r}"
             )
+        if name == "cpu_max_threads":
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TypeError(f"warp.config.cpu_max_threads must be an int, got {value!r}")
+            _set_native_cpu_max_threads(value)
         if name == "deterministic" and not isinstance(value, DeterministicMode):
             raise ValueError(f"warp.config.deterministic must be a warp.DeterministicMode value, got {value!r}")
         super().__setattr__(name, value)
@@ -253,6 +266,41 @@ base path to prevent cache collisions between different Warp versions.
 Note: Subdirectories prefixed with ``wp_`` will be created in this location.
 """
 
+compile_lock_timeout: float | None = 600.0
+"""Maximum time in seconds to wait for another process compiling the same module.
+
+Processes that share :attr:`kernel_cache_dir` coordinate through advisory lock files
+(``wp_*.lock``) in the cache directory, so that only one of them compiles a given module
+binary while the others wait and then load the cached result. Locks held by a process
+that exited or crashed are released by the operating system.
+
+If the lock is still held after this many seconds, the waiting process compiles the module
+itself. ``None`` waits indefinitely. Locking is skipped when :attr:`cache_kernels` is ``False``.
+"""
+
+kernel_cache_shared_dir: str | None = None
+"""Directory path of a shared kernel cache tier, checked before compiling a module.
+
+Set this to a directory that many processes can read, such as a local directory shared by
+the workers on a host or a network file system mount. When a compiled module is not found
+in :attr:`kernel_cache_dir`, Warp loads it from the shared tier instead of compiling it.
+As with :attr:`kernel_cache_dir`, a version-specific subdirectory is appended to the path.
+
+The shared tier is treated as read-only unless this process has write access to it: then
+freshly built binaries and their metadata are also promoted to the shared tier, one file
+at a time through an atomic rename, so that other processes can reuse them. Modules with
+the ``"strip_hash"`` option enabled never use the shared tier.
+"""
+
+kernel_cache_max_bytes: int | None = None
+"""Maximum total size in bytes of the compiled modules in :attr:`kernel_cache_dir`.
+
+When set, the least recently used cache entries are evicted after each module compilation
+until the cache fits within this limit (see :func:`warp.prune_kernel_cache`). Entries used
+within the last minute are never evicted, so the cache may temporarily exceed the limit.
+``None`` (the default) lets the cache grow without bound.
+"""
+
 cuda_output: str | None = None
 """Preferred CUDA output format for kernel compilation.
 
@@ -455,6 +503,58 @@ load_module_max_workers: int | None = 0
 For ``wp.load_module()`` and ``wp.force_load()``, if the ``max_workers`` parameter is not specified,
 the default number of worker threads is determined by this setting. ``0`` means serial loading.
 If ``None``, Warp determines the behavior (currently equal to ``min(os.cpu_count(), 4)``).
+
+The same setting controls how many kernels of a module are compiled concurrently when
+:attr:`cpu_incremental_build` is enabled.
+"""
+
+cpu_incremental_build: bool = False
+"""Compile CPU modules as one object file per kernel.
+
+When enabled, each kernel is generated into its own translation unit that contains only the
+functions and structs it references. The compiled object is cached in :attr:`kernel_cache_dir`
+under the kernel's content hash, so after editing one kernel in a large module only that kernel
+is recompiled on the next load; unchanged kernels reuse their cached objects. Out-of-date kernels
+are compiled in parallel using :attr:`load_module_max_workers` worker threads (set it to ``None``
+or a positive value to enable parallel compilation). The object of the previous version of an
+edited kernel is removed from the cache when its replacement is compiled.
+
+Each object is loaded as a separate CPU module, so a cold build of a module with many kernels
+compiles the shared headers once per kernel. Precompiled headers
+(:attr:`use_precompiled_headers`, enabled by default) keep this overhead small.
+
+This setting can be overridden per module with the ``"cpu_incremental_build"`` module option.
+It has no effect on CUDA modules.
+"""
+
+cpu_max_threads: int = 1
+"""Default number of host threads used to execute a CPU kernel launch.
+
+``1`` (the default) runs every launch on the calling thread. Larger values split the launch
+indices across a shared work-stealing thread pool, and ``0`` or a negative value uses all
+hardware threads. Individual launches can override this setting with the ``cpu_threads``
+argument of :func:`wp.launch() <warp.launch>`.
+
+The same thread count is used by the host implementations of :func:`wp.utils.radix_sort_pairs()
+<warp.utils.radix_sort_pairs>`, :func:`wp.utils.segmented_sort_pairs() <warp.utils.segmented_sort_pairs>`,
+:func:`wp.utils.array_scan() <warp.utils.array_scan>`, and :func:`wp.utils.runlength_encode()
+<warp.utils.runlength_encode>` on large CPU arrays. Parallel floating-point scans add values in a
+different order than the serial scan, so results can differ in the last bits. The ``"sah"`` and
+``"median"`` constructors of CPU :class:`wp.Bvh <warp.Bvh>` and :class:`wp.Mesh <warp.Mesh>` objects
+also build large trees with this many threads, producing the same tree as the serial build, and
+CPU :class:`wp.Volume <warp.Volume>` allocations and rebuilds construct their topology in parallel.
+
+Kernels that use tiles, and modules compiled with a ``"deterministic"`` mode other than
+``wp.DeterministicMode.NOT_GUARANTEED``, always run on a single thread. Atomic operations
+remain correct when a launch is split across threads, but the order in which
+floating-point contributions are accumulated is not fixed.
+
+When :func:`wp.capture_launch() <warp.capture_launch>` replays a CPU graph captured with
+``apic=True`` and this setting allows more than one thread, operations that touch disjoint
+arrays are replayed concurrently, while operations that share an allocation keep their recorded
+order. Launches with ``wp.uint64`` arguments (such as mesh, volume, or BVH ids), kernels that use
+tiles, and conditional nodes are always ordered against every other operation. With ``1``, graphs
+replay serially in recorded order.
 """
 
 deterministic: DeterministicMode = DeterministicMode.NOT_GUARANTEED
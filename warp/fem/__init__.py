@@ -28,6 +28,7 @@ See Also:
 # top-level `warp/__init__.py`, so they are in effect before these imports run.
 
 from warp._src.fem.geometry.adaptive_nanogrid import AdaptiveNanogrid as AdaptiveNanogrid
+from warp._src.fem.integrate import AssemblyPlan as AssemblyPlan
 from warp._src.fem.space.basis_space import BasisSpace as BasisSpace
 from warp._src.fem.domain import BoundarySides as BoundarySides
 from warp._src.fem.geometry.partition import CellBasedGeometryPartition as CellBasedGeometryPartition
@@ -110,6 +111,7 @@ from warp._src.fem.operator import grad_outer as grad_outer
 from warp._src.fem.operator import inner as inner
 from warp._src.fem.operator import integrand as integrand
 from warp._src.fem.integrate import integrate as integrate
+from warp._src.fem.integrate import integrate_operator as integrate_operator
 from warp._src.fem.integrate import interpolate as interpolate
 from warp._src.fem.operator import jump as jump
 from warp._src.fem.operator import lookup as lookup
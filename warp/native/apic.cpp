@@ -20,8 +20,10 @@
 #include "apic_internal.h"
 #include "error.h"
 #include "mesh.h"
+#include "thread_pool.h"
 
 #include <algorithm>
+#include <atomic>
 #include <cassert>
 #include <cstddef>  // offsetof
 #include <cstdint>  // SIZE_MAX
@@ -29,6 +31,7 @@
 #include <cstdlib>
 #include <cstring>
 #include <string>
+#include <tuple>
 
 // ============================================================================
 // Thread-local Recording State
@@ -54,6 +57,10 @@ void wp_apic_begin_recording(APICState* state, int is_cpu)
         state->is_cpu = (is_cpu != 0);
         // The stream is about to be (re)built; any prior validation is stale.
         state->operations_validated = false;
+        {
+            std::lock_guard<std::mutex> lock(state->cpu_replay_schedule.mutex);
+            state->cpu_replay_schedule.reset();
+        }
         g_apic_state = state;
     }
 }
@@ -327,7 +334,8 @@ void apic_record_kernel_launch(
     const APICLaunchPtrLocation* relocs,
     uint32_t num_relocs,
     const uint8_t* value_data,
-    uint32_t value_data_size
+    uint32_t value_data_size,
+    uint8_t flags
 )
 {
     if (!state)
@@ -359,6 +367,7 @@ void apic_record_kernel_launch(
     rec.smem_bytes = smem_bytes;
     rec.is_forward = is_forward ? 1 : 0;
     rec.cluster_dim = cluster_dim > 0 ? static_cast<uint8_t>(cluster_dim) : 1;
+    rec.flags = flags;
     rec.kernel_key_len = static_cast<uint16_t>(key_len);
     rec.module_hash_len = static_cast<uint16_t>(hash_len);
     rec.num_params = static_cast<uint16_t>(num_params);
@@ -1708,523 +1717,821 @@ static bool apic_cpu_replay_stream(
     ResolvePtrFn resolve_ptr,
     RemapHandleFn remap_handle,
     FindKernelFn find_kernel
+);
+
+// Grow-only heap scratch for the packed kernel args buffers, reused across the
+// kernel-launch ops replayed by one thread instead of a per-op malloc/free.
+// Heap-backed (not stack) to keep the stack shallow for the kernel's own tile
+// storage; reused to avoid per-launch allocator churn on launch-dense graphs
+// (e.g. diffsim_bear replays ~10^5 launches per iteration).
+struct APICReplayScratch {
+    std::vector<uint8_t> fwd;
+    std::vector<uint8_t> adj;
+};
+
+// Replay the single operation starting at `ptr`. `i` is the operation's index
+// in its stream and is only used for diagnostics. The stream was validated at
+// close time (wp_apic_end_recording or wp_apic_load_graph) via
+// apic_validate_operation_stream — no per-op bounds checks needed here.
+template <typename ResolvePtrFn, typename RemapHandleFn, typename FindKernelFn>
+static bool apic_cpu_replay_op(
+    const uint8_t* ptr,
+    uint32_t i,
+    ResolvePtrFn resolve_ptr,
+    RemapHandleFn remap_handle,
+    FindKernelFn find_kernel,
+    APICReplayScratch& scratch
 )
 {
-    // Stream was validated at close time (wp_apic_end_recording or
-    // wp_apic_load_graph) via apic_validate_operation_stream — no per-op
-    // bounds checks needed here.
-    const uint8_t* ptr = stream_data;
-
-    // Grow-only heap scratch reused across all kernel-launch ops in this stream,
-    // replacing per-op malloc/free of the args buffers. Heap-backed (not stack)
-    // to keep the stack shallow for the kernel's own tile storage; reused to
-    // avoid per-launch allocator churn on launch-dense graphs (e.g. diffsim_bear
-    // replays ~10^5 launches per iteration).
-    std::vector<uint8_t> fwd_scratch;
-    std::vector<uint8_t> adj_scratch;
-
-    for (uint32_t i = 0; i < operation_count; i++) {
-        const APICOpHeader* header = reinterpret_cast<const APICOpHeader*>(ptr);
+    const APICOpHeader* header = reinterpret_cast<const APICOpHeader*>(ptr);
+
+    switch (header->op_type) {
+    case APIC_OP_KERNEL_LAUNCH: {
+        const APICLaunchRecord* rec = reinterpret_cast<const APICLaunchRecord*>(ptr);
+        const uint8_t* var_data = ptr + sizeof(APICLaunchRecord);
+        std::string key_str(reinterpret_cast<const char*>(var_data), rec->kernel_key_len);
+        // The module hash recorded alongside the key disambiguates same-key
+        // kernels compiled into distinct modules (see apic_kernel_map_key).
+        std::string module_hash_str(
+            reinterpret_cast<const char*>(var_data + rec->kernel_key_len), rec->module_hash_len
+        );
 
-        switch (header->op_type) {
-        case APIC_OP_KERNEL_LAUNCH: {
-            const APICLaunchRecord* rec = reinterpret_cast<const APICLaunchRecord*>(ptr);
-            const uint8_t* var_data = ptr + sizeof(APICLaunchRecord);
-            std::string key_str(reinterpret_cast<const char*>(var_data), rec->kernel_key_len);
-            // The module hash recorded alongside the key disambiguates same-key
-            // kernels compiled into distinct modules (see apic_kernel_map_key).
-            std::string module_hash_str(
-                reinterpret_cast<const char*>(var_data + rec->kernel_key_len), rec->module_hash_len
-            );
+        const uint16_t adj_count = rec->is_forward ? 0u : rec->num_params;
+        const APICLaunchParamRecord* fwd_bindings
+            = reinterpret_cast<const APICLaunchParamRecord*>(var_data + rec->kernel_key_len + rec->module_hash_len);
+        const APICLaunchParamRecord* adj_bindings = reinterpret_cast<const APICLaunchParamRecord*>(
+            reinterpret_cast<const uint8_t*>(fwd_bindings) + rec->num_params * sizeof(APICLaunchParamRecord)
+        );
+        const APICLaunchPtrLocation* relocs = reinterpret_cast<const APICLaunchPtrLocation*>(
+            reinterpret_cast<const uint8_t*>(adj_bindings) + adj_count * sizeof(APICLaunchParamRecord)
+        );
+        const uint8_t* value_data
+            = reinterpret_cast<const uint8_t*>(relocs) + rec->num_relocs * sizeof(APICLaunchPtrLocation);
+
+        // Sum forward num_relocs so the adjoint pack call can start its
+        // reloc cursor in the right place. The validator guarantees
+        // fwd_relocs + adj_relocs == rec->num_relocs.
+        uint32_t fwd_reloc_count = 0;
+        for (uint16_t j = 0; j < rec->num_params; j++)
+            fwd_reloc_count += fwd_bindings[j].num_relocs;
+
+        void* func = find_kernel(key_str, module_hash_str, rec->is_forward);
+        if (!func) {
+            fprintf(stderr, "APIC: Error - CPU kernel not found: %s\n", key_str.c_str());
+            return false;
+        }
 
-            const uint16_t adj_count = rec->is_forward ? 0u : rec->num_params;
-            const APICLaunchParamRecord* fwd_bindings
-                = reinterpret_cast<const APICLaunchParamRecord*>(var_data + rec->kernel_key_len + rec->module_hash_len);
-            const APICLaunchParamRecord* adj_bindings = reinterpret_cast<const APICLaunchParamRecord*>(
-                reinterpret_cast<const uint8_t*>(fwd_bindings) + rec->num_params * sizeof(APICLaunchParamRecord)
-            );
-            const APICLaunchPtrLocation* relocs = reinterpret_cast<const APICLaunchPtrLocation*>(
-                reinterpret_cast<const uint8_t*>(adj_bindings) + adj_count * sizeof(APICLaunchParamRecord)
-            );
-            const uint8_t* value_data
-                = reinterpret_cast<const uint8_t*>(relocs) + rec->num_relocs * sizeof(APICLaunchPtrLocation);
-
-            // Sum forward num_relocs so the adjoint pack call can start its
-            // reloc cursor in the right place. The validator guarantees
-            // fwd_relocs + adj_relocs == rec->num_relocs.
-            uint32_t fwd_reloc_count = 0;
-            for (uint16_t j = 0; j < rec->num_params; j++)
-                fwd_reloc_count += fwd_bindings[j].num_relocs;
-
-            void* func = find_kernel(key_str, module_hash_str, rec->is_forward);
-            if (!func) {
-                fprintf(stderr, "APIC: Error - CPU kernel not found: %s\n", key_str.c_str());
-                return false;
-            }
+        // Build launch_bounds_t<N> with the per-N layout expected by the
+        // generated kernel entry point.
+        int ndim = rec->ndim;
+        if (ndim < 1)
+            ndim = 1;
+        if (ndim > APIC_LAUNCH_MAX_DIMS)
+            ndim = APIC_LAUNCH_MAX_DIMS;
+
+        size_t size_offset = apic_detail::launch_bounds_size_offset(ndim);
+        size_t coord_mult_offset = apic_detail::launch_bounds_coord_mult_offset(ndim);
+        size_t bounds_size = apic_detail::launch_bounds_storage_size(ndim);
+
+        constexpr size_t bounds_capacity = apic_detail::launch_bounds_storage_size(APIC_LAUNCH_MAX_DIMS);
+        alignas(wp::launch_bounds_t<APIC_LAUNCH_MAX_DIMS>) uint8_t bounds_buf[bounds_capacity];
+        memset(bounds_buf, 0, bounds_size);
+        uint64_t shape_size = 1;
+        for (int d = 0; d < ndim; d++)
+            reinterpret_cast<int*>(bounds_buf)[d] = rec->shape[d];
+        for (int d = 0; d < ndim; d++)
+            shape_size *= static_cast<uint64_t>(rec->shape[d]);
+        *reinterpret_cast<size_t*>(bounds_buf + size_offset) = rec->size;
+        size_t coord_mult = 1;
+        if (shape_size > 0 && rec->size > shape_size) {
+            uint64_t mult = rec->size / shape_size;
+            coord_mult = static_cast<size_t>(mult);
+        }
+        *reinterpret_cast<size_t*>(bounds_buf + coord_mult_offset) = coord_mult;
+
+        // Build forward args buffer in the reused heap scratch (grow-only).
+        // Heap-backed (not stack) to keep the stack shallow before calling
+        // into the kernel — the kernel itself may allocate a 256 KB
+        // tile_shared_storage_t on its own stack frame.
+        size_t fwd_total = apic_args_buf_size(fwd_bindings, rec->num_params);
+        size_t fwd_need = fwd_total > 0 ? fwd_total : size_t(1);
+        if (scratch.fwd.size() < fwd_need)
+            scratch.fwd.resize(fwd_need);
+        uint8_t* fwd_buf = scratch.fwd.data();
+        if (!apic_pack_args_buf(
+                fwd_buf, fwd_total, fwd_bindings, rec->num_params, value_data, relocs, resolve_ptr, remap_handle
+            )) {
+            fprintf(stderr, "APIC: Error - forward arg packing failed at operation %u\n", i);
+            return false;
+        }
 
-            // Build launch_bounds_t<N> with the per-N layout expected by the
-            // generated kernel entry point.
-            int ndim = rec->ndim;
-            if (ndim < 1)
-                ndim = 1;
-            if (ndim > APIC_LAUNCH_MAX_DIMS)
-                ndim = APIC_LAUNCH_MAX_DIMS;
-
-            size_t size_offset = apic_detail::launch_bounds_size_offset(ndim);
-            size_t coord_mult_offset = apic_detail::launch_bounds_coord_mult_offset(ndim);
-            size_t bounds_size = apic_detail::launch_bounds_storage_size(ndim);
-
-            constexpr size_t bounds_capacity = apic_detail::launch_bounds_storage_size(APIC_LAUNCH_MAX_DIMS);
-            alignas(wp::launch_bounds_t<APIC_LAUNCH_MAX_DIMS>) uint8_t bounds_buf[bounds_capacity];
-            memset(bounds_buf, 0, bounds_size);
-            uint64_t shape_size = 1;
-            for (int d = 0; d < ndim; d++)
-                reinterpret_cast<int*>(bounds_buf)[d] = rec->shape[d];
-            for (int d = 0; d < ndim; d++)
-                shape_size *= static_cast<uint64_t>(rec->shape[d]);
-            *reinterpret_cast<size_t*>(bounds_buf + size_offset) = rec->size;
-            size_t coord_mult = 1;
-            if (shape_size > 0 && rec->size > shape_size) {
-                uint64_t mult = rec->size / shape_size;
-                coord_mult = static_cast<size_t>(mult);
-            }
-            *reinterpret_cast<size_t*>(bounds_buf + coord_mult_offset) = coord_mult;
-
-            // Build forward args buffer in the reused heap scratch (grow-only).
-            // Heap-backed (not stack) to keep the stack shallow before calling
-            // into the kernel — the kernel itself may allocate a 256 KB
-            // tile_shared_storage_t on its own stack frame.
-            size_t fwd_total = apic_args_buf_size(fwd_bindings, rec->num_params);
-            size_t fwd_need = fwd_total > 0 ? fwd_total : size_t(1);
-            if (fwd_scratch.size() < fwd_need)
-                fwd_scratch.resize(fwd_need);
-            uint8_t* fwd_buf = fwd_scratch.data();
-            if (!apic_pack_args_buf(
-                    fwd_buf, fwd_total, fwd_bindings, rec->num_params, value_data, relocs, resolve_ptr, remap_handle
+        // Build adjoint args buffer when this is a backward kernel.
+        // wp_cpu_launch_kernel selects the backward ABI by adj_args != nullptr,
+        // so a zero-param backward kernel still needs a (1-byte sentinel) adj_buf.
+        size_t adj_total = 0;
+        uint8_t* adj_buf = nullptr;
+        if (!rec->is_forward) {
+            adj_total = apic_args_buf_size(adj_bindings, adj_count);
+            size_t adj_need = adj_total > 0 ? adj_total : size_t(1);
+            if (scratch.adj.size() < adj_need)
+                scratch.adj.resize(adj_need);
+            adj_buf = scratch.adj.data();
+            if (adj_total > 0
+                && !apic_pack_args_buf(
+                    adj_buf, adj_total, adj_bindings, adj_count, value_data, relocs + fwd_reloc_count, resolve_ptr,
+                    remap_handle
                 )) {
-                fprintf(stderr, "APIC: Error - forward arg packing failed at operation %u\n", i);
+                fprintf(stderr, "APIC: Error - adjoint arg packing failed at operation %u\n", i);
                 return false;
             }
+        }
 
-            // Build adjoint args buffer when this is a backward kernel.
-            // wp_cpu_launch_kernel selects the backward ABI by adj_args != nullptr,
-            // so a zero-param backward kernel still needs a (1-byte sentinel) adj_buf.
-            size_t adj_total = 0;
-            uint8_t* adj_buf = nullptr;
-            if (!rec->is_forward) {
-                adj_total = apic_args_buf_size(adj_bindings, adj_count);
-                size_t adj_need = adj_total > 0 ? adj_total : size_t(1);
-                if (adj_scratch.size() < adj_need)
-                    adj_scratch.resize(adj_need);
-                adj_buf = adj_scratch.data();
-                if (adj_total > 0
-                    && !apic_pack_args_buf(
-                        adj_buf, adj_total, adj_bindings, adj_count, value_data, relocs + fwd_reloc_count, resolve_ptr,
-                        remap_handle
-                    )) {
-                    fprintf(stderr, "APIC: Error - adjoint arg packing failed at operation %u\n", i);
-                    return false;
-                }
-            }
+        // Replay via the same wp_cpu_launch_kernel that captured this op.
+        // apic_info=nullptr is safe: g_apic_state is null during replay, so
+        // the recording branch in wp_cpu_launch_kernel is a no-op and the
+        // execute branch fires.
+        wp_cpu_launch_kernel(func, bounds_buf, fwd_buf, adj_buf, /*apic_info=*/nullptr);
+        break;
+    }
 
-            // Replay via the same wp_cpu_launch_kernel that captured this op.
-            // apic_info=nullptr is safe: g_apic_state is null during replay, so
-            // the recording branch in wp_cpu_launch_kernel is a no-op and the
-            // execute branch fires.
-            wp_cpu_launch_kernel(func, bounds_buf, fwd_buf, adj_buf, /*apic_info=*/nullptr);
-            break;
+    case APIC_OP_MEMCPY_D2D: {
+        const APICMemcpyD2DRecord* rec = reinterpret_cast<const APICMemcpyD2DRecord*>(ptr);
+        void* dst = resolve_ptr(rec->dst_region_id, rec->dst_offset, rec->size);
+        const void* src = resolve_ptr(rec->src_region_id, rec->src_offset, rec->size);
+        if (!dst || !src) {
+            fprintf(stderr, "APIC: Error - memcpy pointer resolution failed at operation %u\n", i);
+            return false;
         }
+        // "D2D" on CPU is host-to-host — replay via wp_memcpy_h2h.
+        if (!wp_memcpy_h2h(dst, const_cast<void*>(src), rec->size))
+            return false;
+        break;
+    }
 
-        case APIC_OP_MEMCPY_D2D: {
-            const APICMemcpyD2DRecord* rec = reinterpret_cast<const APICMemcpyD2DRecord*>(ptr);
-            void* dst = resolve_ptr(rec->dst_region_id, rec->dst_offset, rec->size);
-            const void* src = resolve_ptr(rec->src_region_id, rec->src_offset, rec->size);
-            if (!dst || !src) {
-                fprintf(stderr, "APIC: Error - memcpy pointer resolution failed at operation %u\n", i);
-                return false;
-            }
-            // "D2D" on CPU is host-to-host — replay via wp_memcpy_h2h.
-            if (!wp_memcpy_h2h(dst, const_cast<void*>(src), rec->size))
-                return false;
-            break;
+    case APIC_OP_MEMSET: {
+        const APICMemsetRecord* rec = reinterpret_cast<const APICMemsetRecord*>(ptr);
+        void* dst = resolve_ptr(rec->region_id, rec->offset, rec->size);
+        if (!dst) {
+            fprintf(stderr, "APIC: Error - memset pointer resolution failed at operation %u\n", i);
+            return false;
         }
+        if (!wp_memset_host(dst, rec->value, rec->size))
+            return false;
+        break;
+    }
 
-        case APIC_OP_MEMSET: {
-            const APICMemsetRecord* rec = reinterpret_cast<const APICMemsetRecord*>(ptr);
-            void* dst = resolve_ptr(rec->region_id, rec->offset, rec->size);
-            if (!dst) {
-                fprintf(stderr, "APIC: Error - memset pointer resolution failed at operation %u\n", i);
-                return false;
-            }
-            if (!wp_memset_host(dst, rec->value, rec->size))
-                return false;
-            break;
+    case APIC_OP_MEMTILE: {
+        const APICMemtileRecord* rec = reinterpret_cast<const APICMemtileRecord*>(ptr);
+        const void* value = ptr + sizeof(APICMemtileRecord);
+        uint64_t total_bytes = rec->count * rec->srcsize;
+        void* dst = resolve_ptr(rec->region_id, rec->offset, total_bytes);
+        if (!dst) {
+            fprintf(stderr, "APIC: Error - memtile pointer resolution failed at operation %u\n", i);
+            return false;
         }
-
-        case APIC_OP_MEMTILE: {
-            const APICMemtileRecord* rec = reinterpret_cast<const APICMemtileRecord*>(ptr);
-            const void* value = ptr + sizeof(APICMemtileRecord);
-            uint64_t total_bytes = rec->count * rec->srcsize;
-            void* dst = resolve_ptr(rec->region_id, rec->offset, total_bytes);
-            if (!dst) {
-                fprintf(stderr, "APIC: Error - memtile pointer resolution failed at operation %u\n", i);
-                return false;
+        // g_apic_state is null during replay, so this call executes
+        // the actual memtile instead of re-recording it.
+        wp_memtile_host(dst, value, rec->srcsize, rec->count);
+        break;
+    }
+
+    case APIC_OP_ALLOC:
+        break;
+
+    case APIC_OP_SCAN: {
+        const APICScanRecord* rec = reinterpret_cast<const APICScanRecord*>(ptr);
+        size_t scalar_size = apic_type_size(rec->dtype);
+        size_t src_bytes = apic_strided_access_bytes(rec->length, rec->in_stride, rec->type_len, scalar_size);
+        size_t dst_bytes = apic_strided_access_bytes(rec->length, rec->out_stride, rec->type_len, scalar_size);
+        void* dst = resolve_ptr(rec->dst_region_id, rec->dst_offset, dst_bytes);
+        const void* src = resolve_ptr(rec->src_region_id, rec->src_offset, src_bytes);
+        if (!dst || !src) {
+            fprintf(stderr, "APIC: Error - scan pointer resolution failed at operation %u\n", i);
+            return false;
+        }
+        // g_apic_state is null during replay, so these calls execute
+        // (not record). Same entry points the user-facing
+        // wp.utils.array_scan() dispatches to.
+        if (rec->dtype == APIC_TYPE_INT32) {
+            wp_array_scan_int_host(
+                reinterpret_cast<uint64_t>(src), reinterpret_cast<uint64_t>(dst), static_cast<int>(rec->length),
+                rec->in_stride, rec->out_stride, rec->type_len, rec->inclusive != 0
+            );
+        } else if (rec->dtype == APIC_TYPE_INT64) {
+            wp_array_scan_int64_host(
+                reinterpret_cast<uint64_t>(src), reinterpret_cast<uint64_t>(dst), static_cast<int>(rec->length),
+                rec->in_stride, rec->out_stride, rec->type_len, rec->inclusive != 0
+            );
+        } else if (rec->dtype == APIC_TYPE_FLOAT32) {
+            wp_array_scan_float_host(
+                reinterpret_cast<uint64_t>(src), reinterpret_cast<uint64_t>(dst), static_cast<int>(rec->length),
+                rec->in_stride, rec->out_stride, rec->type_len, rec->inclusive != 0
+            );
+        } else {
+            wp_array_scan_double_host(
+                reinterpret_cast<uint64_t>(src), reinterpret_cast<uint64_t>(dst), static_cast<int>(rec->length),
+                rec->in_stride, rec->out_stride, rec->type_len, rec->inclusive != 0
+            );
+        }
+        break;
+    }
+
+    case APIC_OP_SEGMENTED_SORT: {
+        const APICSegmentedSortRecord* rec = reinterpret_cast<const APICSegmentedSortRecord*>(ptr);
+        size_t key_size = (rec->dtype == APIC_TYPE_INT32 ? sizeof(int32_t) : sizeof(float));
+        // keys/values buffers span 2*count elements (sort scratch).
+        size_t keys_bytes = static_cast<size_t>(2) * rec->count * key_size;
+        size_t values_bytes = static_cast<size_t>(2) * rec->count * sizeof(int32_t);
+        // Inferred-end captures alias segment_end into the start array (same
+        // region), so the start region spans num_segments+1 entries; explicit-end
+        // captures use two separate num_segments-entry arrays (distinct regions).
+        // Match the span recorded at capture.
+        bool segments_inferred_end = (rec->segstart_region_id == rec->segend_region_id);
+        size_t segstart_bytes
+            = (static_cast<size_t>(rec->num_segments) + (segments_inferred_end ? 1 : 0)) * sizeof(int32_t);
+        size_t segend_bytes = static_cast<size_t>(rec->num_segments) * sizeof(int32_t);
+        void* keys = resolve_ptr(rec->keys_region_id, rec->keys_offset, keys_bytes);
+        void* values = resolve_ptr(rec->values_region_id, rec->values_offset, values_bytes);
+        void* segstart = resolve_ptr(rec->segstart_region_id, rec->segstart_offset, segstart_bytes);
+        void* segend = resolve_ptr(rec->segend_region_id, rec->segend_offset, segend_bytes);
+        if (!keys || !values || !segstart || !segend) {
+            fprintf(stderr, "APIC: Error - segmented-sort pointer resolution failed at operation %u\n", i);
+            return false;
+        }
+        // g_apic_state is null during replay, so these calls execute the
+        // real sort instead of re-recording. Same entry points the
+        // user-facing wp.utils.segmented_sort_pairs() dispatches to.
+        if (rec->dtype == APIC_TYPE_INT32) {
+            wp_segmented_sort_pairs_int_host(
+                reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
+                reinterpret_cast<uint64_t>(segstart), reinterpret_cast<uint64_t>(segend),
+                static_cast<int>(rec->num_segments)
+            );
+        } else {
+            wp_segmented_sort_pairs_float_host(
+                reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
+                reinterpret_cast<uint64_t>(segstart), reinterpret_cast<uint64_t>(segend),
+                static_cast<int>(rec->num_segments)
+            );
+        }
+        break;
+    }
+
+    case APIC_OP_RADIX_SORT: {
+        const APICRadixSortRecord* rec = reinterpret_cast<const APICRadixSortRecord*>(ptr);
+        size_t key_size = apic_type_size(rec->dtype);
+        size_t keys_bytes = static_cast<size_t>(2) * rec->count * key_size;
+        size_t values_bytes = static_cast<size_t>(2) * rec->count * static_cast<size_t>(rec->value_size);
+        void* keys = resolve_ptr(rec->keys_region_id, rec->keys_offset, keys_bytes);
+        void* values = resolve_ptr(rec->values_region_id, rec->values_offset, values_bytes);
+        if (!keys || !values) {
+            fprintf(stderr, "APIC: Error - radix-sort pointer resolution failed at operation %u\n", i);
+            return false;
+        }
+        // g_apic_state is null during replay, so these calls execute the
+        // real sort. Same entry points wp.utils.radix_sort_pairs() uses.
+        if (rec->dtype == APIC_TYPE_INT32) {
+            wp_radix_sort_pairs_int_host(
+                reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
+                rec->begin_bit, rec->end_bit, rec->value_size
+            );
+        } else if (rec->dtype == APIC_TYPE_UINT32) {
+            wp_radix_sort_pairs_uint_host(
+                reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
+                rec->begin_bit, rec->end_bit, rec->value_size
+            );
+        } else if (rec->dtype == APIC_TYPE_INT64) {
+            wp_radix_sort_pairs_int64_host(
+                reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
+                rec->begin_bit, rec->end_bit, rec->value_size
+            );
+        } else if (rec->dtype == APIC_TYPE_UINT64) {
+            wp_radix_sort_pairs_uint64_host(
+                reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
+                rec->begin_bit, rec->end_bit, rec->value_size
+            );
+        } else if (rec->dtype == APIC_TYPE_FLOAT32) {
+            wp_radix_sort_pairs_float_host(
+                reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
+                rec->begin_bit, rec->end_bit, rec->value_size
+            );
+        } else {
+            wp_radix_sort_pairs_double_host(
+                reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
+                rec->begin_bit, rec->end_bit, rec->value_size
+            );
+        }
+        break;
+    }
+
+    case APIC_OP_RUNLENGTH_ENCODE: {
+        const APICRunlengthEncodeRecord* rec = reinterpret_cast<const APICRunlengthEncodeRecord*>(ptr);
+        size_t n = rec->value_count;
+        size_t in_bytes = n * sizeof(int32_t);
+        void* values = resolve_ptr(rec->values_region_id, rec->values_offset, in_bytes);
+        // run_values / run_lengths hold up to value_count entries.
+        void* run_values = resolve_ptr(rec->run_values_region_id, rec->run_values_offset, in_bytes);
+        void* run_lengths = resolve_ptr(rec->run_lengths_region_id, rec->run_lengths_offset, in_bytes);
+        void* run_count = resolve_ptr(rec->run_count_region_id, rec->run_count_offset, sizeof(int32_t));
+        if (!values || !run_values || !run_lengths || !run_count) {
+            fprintf(stderr, "APIC: Error - runlength-encode pointer resolution failed at operation %u\n", i);
+            return false;
+        }
+        // g_apic_state is null during replay, so this executes the real
+        // encode. Same entry point wp.utils.runlength_encode() uses.
+        wp_runlength_encode_int_host(
+            reinterpret_cast<uint64_t>(values), reinterpret_cast<uint64_t>(run_values),
+            reinterpret_cast<uint64_t>(run_lengths), reinterpret_cast<uint64_t>(run_count),
+            static_cast<int>(rec->value_count)
+        );
+        break;
+    }
+
+    case APIC_OP_BSR_FROM_TRIPLETS: {
+        const APICBsrFromTripletsRecord* rec = reinterpret_cast<const APICBsrFromTripletsRecord*>(ptr);
+        size_t nnz = static_cast<size_t>(rec->nnz_upper_bound);
+        size_t int_bytes = nnz * sizeof(int32_t);
+        size_t rowp1_bytes = (static_cast<size_t>(rec->row_count) + 1) * sizeof(int32_t);
+        size_t values_bytes
+            = nnz * static_cast<size_t>(rec->block_size) * static_cast<size_t>(rec->scalar_size_in_bytes);
+
+        void* tpl_nnz = rec->tpl_nnz_region_id >= 0
+            ? resolve_ptr(rec->tpl_nnz_region_id, rec->tpl_nnz_offset, sizeof(int32_t))
+            : nullptr;
+        void* tpl_rows = resolve_ptr(rec->tpl_rows_region_id, rec->tpl_rows_offset, int_bytes);
+        void* tpl_columns = resolve_ptr(rec->tpl_columns_region_id, rec->tpl_columns_offset, int_bytes);
+        void* tpl_values = rec->tpl_values_region_id >= 0
+            ? resolve_ptr(rec->tpl_values_region_id, rec->tpl_values_offset, values_bytes)
+            : nullptr;
+        void* summed_block_offsets
+            = resolve_ptr(rec->summed_block_offsets_region_id, rec->summed_block_offsets_offset, int_bytes);
+        void* summed_block_indices
+            = resolve_ptr(rec->summed_block_indices_region_id, rec->summed_block_indices_offset, int_bytes);
+        void* bsr_offsets = resolve_ptr(rec->bsr_offsets_region_id, rec->bsr_offsets_offset, rowp1_bytes);
+        void* bsr_row_counts = rec->bsr_row_counts_region_id >= 0
+            ? resolve_ptr(
+                  rec->bsr_row_counts_region_id, rec->bsr_row_counts_offset,
+                  static_cast<size_t>(rec->row_count) * sizeof(int32_t)
+              )
+            : nullptr;
+        size_t bsr_columns_bytes = int_bytes;
+        if (bsr_offsets && rec->masked_topology != 0)
+            bsr_columns_bytes = std::max(
+                bsr_columns_bytes,
+                static_cast<size_t>(reinterpret_cast<const int*>(bsr_offsets)[rec->row_count]) * sizeof(int32_t)
+            );
+        void* bsr_columns = resolve_ptr(rec->bsr_columns_region_id, rec->bsr_columns_offset, bsr_columns_bytes);
+        void* bsr_nnz = rec->bsr_nnz_region_id >= 0
+            ? resolve_ptr(rec->bsr_nnz_region_id, rec->bsr_nnz_offset, sizeof(int32_t))
+            : nullptr;
+
+        if (!tpl_rows || !tpl_columns || !summed_block_offsets || !summed_block_indices || !bsr_offsets || !bsr_columns
+            || (rec->tpl_nnz_region_id >= 0 && !tpl_nnz) || (rec->tpl_values_region_id >= 0 && !tpl_values)
+            || (rec->bsr_row_counts_region_id >= 0 && !bsr_row_counts) || (rec->bsr_nnz_region_id >= 0 && !bsr_nnz)) {
+            fprintf(stderr, "APIC: Error - bsr-from-triplets pointer resolution failed at operation %u\n", i);
+            return false;
+        }
+        // g_apic_state is null during replay, so this executes the real
+        // topology build. Same entry point wp.sparse.bsr_set_from_triplets uses.
+        wp_bsr_matrix_from_triplets_host(
+            rec->block_size, rec->scalar_size_in_bytes, rec->row_count, rec->col_count, rec->nnz_upper_bound,
+            reinterpret_cast<const int*>(tpl_nnz), reinterpret_cast<const int*>(tpl_rows),
+            reinterpret_cast<const int*>(tpl_columns), tpl_values, rec->scalar_zero_mask, rec->masked_topology != 0,
+            reinterpret_cast<int*>(summed_block_offsets), reinterpret_cast<int*>(summed_block_indices),
+            reinterpret_cast<int*>(bsr_offsets), reinterpret_cast<const int*>(bsr_row_counts),
+            reinterpret_cast<int*>(bsr_columns), reinterpret_cast<int*>(bsr_nnz), nullptr
+        );
+        break;
+    }
+
+    case APIC_OP_BSR_TRANSPOSE: {
+        const APICBsrTransposeRecord* rec = reinterpret_cast<const APICBsrTransposeRecord*>(ptr);
+        size_t nnz = static_cast<size_t>(rec->nnz_upper_bound);
+        size_t int_bytes = nnz * sizeof(int32_t);
+        size_t rowp1_bytes = (static_cast<size_t>(rec->row_count) + 1) * sizeof(int32_t);
+        size_t colp1_bytes = (static_cast<size_t>(rec->col_count) + 1) * sizeof(int32_t);
+        void* bsr_offsets = resolve_ptr(rec->bsr_offsets_region_id, rec->bsr_offsets_offset, rowp1_bytes);
+        void* bsr_row_counts = rec->bsr_row_counts_region_id >= 0
+            ? resolve_ptr(
+                  rec->bsr_row_counts_region_id, rec->bsr_row_counts_offset,
+                  static_cast<size_t>(rec->row_count) * sizeof(int32_t)
+              )
+            : nullptr;
+        void* bsr_columns = resolve_ptr(rec->bsr_columns_region_id, rec->bsr_columns_offset, int_bytes);
+        void* t_offsets = resolve_ptr(rec->transposed_offsets_region_id, rec->transposed_offsets_offset, colp1_bytes);
+        void* t_row_counts = rec->transposed_row_counts_region_id >= 0
+            ? resolve_ptr(
+                  rec->transposed_row_counts_region_id, rec->transposed_row_counts_offset,
+                  static_cast<size_t>(rec->col_count) * sizeof(int32_t)
+              )
+            : nullptr;
+        if (!bsr_offsets || !bsr_columns || !t_offsets || (rec->bsr_row_counts_region_id >= 0 && !bsr_row_counts)
+            || (rec->transposed_row_counts_region_id >= 0 && !t_row_counts)) {
+            fprintf(stderr, "APIC: Error - bsr-transpose pointer resolution failed at operation %u\n", i);
+            return false;
+        }
+        // Restore the padded destination's row-capacity offsets recorded at
+        // capture time, so replay reconstructs the destination even if the
+        // caller reset its offsets buffer before capture_launch. Compact
+        // transposes recompute the offsets and carry no tail (GH-1587).
+        // This must happen before sizing the destination spans below: the
+        // recorded tail, not the (possibly reset) live offsets, is the
+        // authoritative capacity layout.
+        size_t transposed_capacity_bytes = int_bytes;
+        if (rec->transposed_row_counts_region_id >= 0) {
+            size_t tail_bytes = static_cast<size_t>(rec->header.total_size) - sizeof(APICBsrTransposeRecord);
+            if (tail_bytes >= colp1_bytes) {
+                memcpy(t_offsets, ptr + sizeof(APICBsrTransposeRecord), colp1_bytes);
+                // The transpose touches the destination columns only within
+                // the padded capacity (offsets[col_count] blocks), which may
+                // be smaller than the source's nnz upper bound. Match the
+                // span claimed at capture so resolution is bounds-checked
+                // against the destination's real extent.
+                int32_t capacity = reinterpret_cast<const int32_t*>(t_offsets)[rec->col_count];
+                transposed_capacity_bytes = capacity > 0 ? static_cast<size_t>(capacity) * sizeof(int32_t) : 0;
             }
-            // g_apic_state is null during replay, so this call executes
-            // the actual memtile instead of re-recording it.
-            wp_memtile_host(dst, value, rec->srcsize, rec->count);
-            break;
         }
+        void* t_columns
+            = resolve_ptr(rec->transposed_columns_region_id, rec->transposed_columns_offset, transposed_capacity_bytes);
+        // block_indices carries the sorted source blocks (up to nnz entries)
+        // and, for padded destinations, per-slot gap markers up to the
+        // destination capacity.
+        void* block_indices = resolve_ptr(
+            rec->block_indices_region_id, rec->block_indices_offset, std::max(int_bytes, transposed_capacity_bytes)
+        );
+        void* status = rec->status_region_id >= 0
+            ? resolve_ptr(rec->status_region_id, rec->status_offset, sizeof(int32_t))
+            : nullptr;
+        if (!t_columns || !block_indices || (rec->status_region_id >= 0 && !status)) {
+            fprintf(stderr, "APIC: Error - bsr-transpose pointer resolution failed at operation %u\n", i);
+            return false;
+        }
+        // g_apic_state is null during replay, so this executes the real
+        // transpose. Same entry point wp.sparse.bsr_set_transpose uses.
+        wp_bsr_transpose_host(
+            rec->row_count, rec->col_count, rec->nnz_upper_bound, reinterpret_cast<const int*>(bsr_offsets),
+            reinterpret_cast<const int*>(bsr_row_counts), reinterpret_cast<const int*>(bsr_columns),
+            reinterpret_cast<int*>(t_offsets), reinterpret_cast<int*>(t_row_counts), reinterpret_cast<int*>(t_columns),
+            reinterpret_cast<int*>(block_indices), reinterpret_cast<int*>(status)
+        );
+        break;
+    }
 
-        case APIC_OP_ALLOC:
-            break;
+    case APIC_OP_IF: {
+        const APICCondRecord* rec = reinterpret_cast<const APICCondRecord*>(ptr);
+        const uint8_t* branch_a = ptr + sizeof(APICCondRecord);
+        const uint8_t* branch_b = branch_a + rec->branch_a_size;
 
-        case APIC_OP_SCAN: {
-            const APICScanRecord* rec = reinterpret_cast<const APICScanRecord*>(ptr);
-            size_t scalar_size = apic_type_size(rec->dtype);
-            size_t src_bytes = apic_strided_access_bytes(rec->length, rec->in_stride, rec->type_len, scalar_size);
-            size_t dst_bytes = apic_strided_access_bytes(rec->length, rec->out_stride, rec->type_len, scalar_size);
-            void* dst = resolve_ptr(rec->dst_region_id, rec->dst_offset, dst_bytes);
-            const void* src = resolve_ptr(rec->src_region_id, rec->src_offset, src_bytes);
-            if (!dst || !src) {
-                fprintf(stderr, "APIC: Error - scan pointer resolution failed at operation %u\n", i);
-                return false;
-            }
-            // g_apic_state is null during replay, so these calls execute
-            // (not record). Same entry points the user-facing
-            // wp.utils.array_scan() dispatches to.
-            if (rec->dtype == APIC_TYPE_INT32) {
-                wp_array_scan_int_host(
-                    reinterpret_cast<uint64_t>(src), reinterpret_cast<uint64_t>(dst), static_cast<int>(rec->length),
-                    rec->in_stride, rec->out_stride, rec->type_len, rec->inclusive != 0
-                );
-            } else if (rec->dtype == APIC_TYPE_INT64) {
-                wp_array_scan_int64_host(
-                    reinterpret_cast<uint64_t>(src), reinterpret_cast<uint64_t>(dst), static_cast<int>(rec->length),
-                    rec->in_stride, rec->out_stride, rec->type_len, rec->inclusive != 0
-                );
-            } else if (rec->dtype == APIC_TYPE_FLOAT32) {
-                wp_array_scan_float_host(
-                    reinterpret_cast<uint64_t>(src), reinterpret_cast<uint64_t>(dst), static_cast<int>(rec->length),
-                    rec->in_stride, rec->out_stride, rec->type_len, rec->inclusive != 0
-                );
-            } else {
-                wp_array_scan_double_host(
-                    reinterpret_cast<uint64_t>(src), reinterpret_cast<uint64_t>(dst), static_cast<int>(rec->length),
-                    rec->in_stride, rec->out_stride, rec->type_len, rec->inclusive != 0
-                );
-            }
-            break;
+        // Read condition value (int32) from the captured region. The
+        // resolver verifies the full int32_t fits at cond_offset, so a
+        // malformed .wrp cannot drive an out-of-bounds read here.
+        void* cond_ptr = resolve_ptr(rec->cond_region_id, rec->cond_offset, sizeof(int32_t));
+        if (!cond_ptr) {
+            fprintf(stderr, "APIC: Error - cond pointer resolution failed at operation %u\n", i);
+            return false;
         }
+        int32_t cond_value = *reinterpret_cast<const int32_t*>(cond_ptr);
 
-        case APIC_OP_SEGMENTED_SORT: {
-            const APICSegmentedSortRecord* rec = reinterpret_cast<const APICSegmentedSortRecord*>(ptr);
-            size_t key_size = (rec->dtype == APIC_TYPE_INT32 ? sizeof(int32_t) : sizeof(float));
-            // keys/values buffers span 2*count elements (sort scratch).
-            size_t keys_bytes = static_cast<size_t>(2) * rec->count * key_size;
-            size_t values_bytes = static_cast<size_t>(2) * rec->count * sizeof(int32_t);
-            // Inferred-end captures alias segment_end into the start array (same
-            // region), so the start region spans num_segments+1 entries; explicit-end
-            // captures use two separate num_segments-entry arrays (distinct regions).
-            // Match the span recorded at capture.
-            bool segments_inferred_end = (rec->segstart_region_id == rec->segend_region_id);
-            size_t segstart_bytes
-                = (static_cast<size_t>(rec->num_segments) + (segments_inferred_end ? 1 : 0)) * sizeof(int32_t);
-            size_t segend_bytes = static_cast<size_t>(rec->num_segments) * sizeof(int32_t);
-            void* keys = resolve_ptr(rec->keys_region_id, rec->keys_offset, keys_bytes);
-            void* values = resolve_ptr(rec->values_region_id, rec->values_offset, values_bytes);
-            void* segstart = resolve_ptr(rec->segstart_region_id, rec->segstart_offset, segstart_bytes);
-            void* segend = resolve_ptr(rec->segend_region_id, rec->segend_offset, segend_bytes);
-            if (!keys || !values || !segstart || !segend) {
-                fprintf(stderr, "APIC: Error - segmented-sort pointer resolution failed at operation %u\n", i);
+        if (cond_value && rec->branch_a_size > 0) {
+            if (!apic_cpu_replay_stream(
+                    branch_a, rec->branch_a_size, rec->branch_a_op_count, resolve_ptr, remap_handle, find_kernel
+                ))
                 return false;
-            }
-            // g_apic_state is null during replay, so these calls execute the
-            // real sort instead of re-recording. Same entry points the
-            // user-facing wp.utils.segmented_sort_pairs() dispatches to.
-            if (rec->dtype == APIC_TYPE_INT32) {
-                wp_segmented_sort_pairs_int_host(
-                    reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    reinterpret_cast<uint64_t>(segstart), reinterpret_cast<uint64_t>(segend),
-                    static_cast<int>(rec->num_segments)
-                );
-            } else {
-                wp_segmented_sort_pairs_float_host(
-                    reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    reinterpret_cast<uint64_t>(segstart), reinterpret_cast<uint64_t>(segend),
-                    static_cast<int>(rec->num_segments)
-                );
-            }
-            break;
-        }
-
-        case APIC_OP_RADIX_SORT: {
-            const APICRadixSortRecord* rec = reinterpret_cast<const APICRadixSortRecord*>(ptr);
-            size_t key_size = apic_type_size(rec->dtype);
-            size_t keys_bytes = static_cast<size_t>(2) * rec->count * key_size;
-            size_t values_bytes = static_cast<size_t>(2) * rec->count * static_cast<size_t>(rec->value_size);
-            void* keys = resolve_ptr(rec->keys_region_id, rec->keys_offset, keys_bytes);
-            void* values = resolve_ptr(rec->values_region_id, rec->values_offset, values_bytes);
-            if (!keys || !values) {
-                fprintf(stderr, "APIC: Error - radix-sort pointer resolution failed at operation %u\n", i);
+        } else if (!cond_value && rec->branch_b_size > 0) {
+            if (!apic_cpu_replay_stream(
+                    branch_b, rec->branch_b_size, rec->branch_b_op_count, resolve_ptr, remap_handle, find_kernel
+                ))
                 return false;
-            }
-            // g_apic_state is null during replay, so these calls execute the
-            // real sort. Same entry points wp.utils.radix_sort_pairs() uses.
-            if (rec->dtype == APIC_TYPE_INT32) {
-                wp_radix_sort_pairs_int_host(
-                    reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    rec->begin_bit, rec->end_bit, rec->value_size
-                );
-            } else if (rec->dtype == APIC_TYPE_UINT32) {
-                wp_radix_sort_pairs_uint_host(
-                    reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    rec->begin_bit, rec->end_bit, rec->value_size
-                );
-            } else if (rec->dtype == APIC_TYPE_INT64) {
-                wp_radix_sort_pairs_int64_host(
-                    reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    rec->begin_bit, rec->end_bit, rec->value_size
-                );
-            } else if (rec->dtype == APIC_TYPE_UINT64) {
-                wp_radix_sort_pairs_uint64_host(
-                    reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    rec->begin_bit, rec->end_bit, rec->value_size
-                );
-            } else if (rec->dtype == APIC_TYPE_FLOAT32) {
-                wp_radix_sort_pairs_float_host(
-                    reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    rec->begin_bit, rec->end_bit, rec->value_size
-                );
-            } else {
-                wp_radix_sort_pairs_double_host(
-                    reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    rec->begin_bit, rec->end_bit, rec->value_size
-                );
-            }
-            break;
         }
+        break;
+    }
 
-        case APIC_OP_RUNLENGTH_ENCODE: {
-            const APICRunlengthEncodeRecord* rec = reinterpret_cast<const APICRunlengthEncodeRecord*>(ptr);
-            size_t n = rec->value_count;
-            size_t in_bytes = n * sizeof(int32_t);
-            void* values = resolve_ptr(rec->values_region_id, rec->values_offset, in_bytes);
-            // run_values / run_lengths hold up to value_count entries.
-            void* run_values = resolve_ptr(rec->run_values_region_id, rec->run_values_offset, in_bytes);
-            void* run_lengths = resolve_ptr(rec->run_lengths_region_id, rec->run_lengths_offset, in_bytes);
-            void* run_count = resolve_ptr(rec->run_count_region_id, rec->run_count_offset, sizeof(int32_t));
-            if (!values || !run_values || !run_lengths || !run_count) {
-                fprintf(stderr, "APIC: Error - runlength-encode pointer resolution failed at operation %u\n", i);
-                return false;
-            }
-            // g_apic_state is null during replay, so this executes the real
-            // encode. Same entry point wp.utils.runlength_encode() uses.
-            wp_runlength_encode_int_host(
-                reinterpret_cast<uint64_t>(values), reinterpret_cast<uint64_t>(run_values),
-                reinterpret_cast<uint64_t>(run_lengths), reinterpret_cast<uint64_t>(run_count),
-                static_cast<int>(rec->value_count)
-            );
-            break;
-        }
+    case APIC_OP_WHILE: {
+        const APICCondRecord* rec = reinterpret_cast<const APICCondRecord*>(ptr);
+        const uint8_t* body = ptr + sizeof(APICCondRecord);
 
-        case APIC_OP_BSR_FROM_TRIPLETS: {
-            const APICBsrFromTripletsRecord* rec = reinterpret_cast<const APICBsrFromTripletsRecord*>(ptr);
-            size_t nnz = static_cast<size_t>(rec->nnz_upper_bound);
-            size_t int_bytes = nnz * sizeof(int32_t);
-            size_t rowp1_bytes = (static_cast<size_t>(rec->row_count) + 1) * sizeof(int32_t);
-            size_t values_bytes
-                = nnz * static_cast<size_t>(rec->block_size) * static_cast<size_t>(rec->scalar_size_in_bytes);
-
-            void* tpl_nnz = rec->tpl_nnz_region_id >= 0
-                ? resolve_ptr(rec->tpl_nnz_region_id, rec->tpl_nnz_offset, sizeof(int32_t))
-                : nullptr;
-            void* tpl_rows = resolve_ptr(rec->tpl_rows_region_id, rec->tpl_rows_offset, int_bytes);
-            void* tpl_columns = resolve_ptr(rec->tpl_columns_region_id, rec->tpl_columns_offset, int_bytes);
-            void* tpl_values = rec->tpl_values_region_id >= 0
-                ? resolve_ptr(rec->tpl_values_region_id, rec->tpl_values_offset, values_bytes)
-                : nullptr;
-            void* summed_block_offsets
-                = resolve_ptr(rec->summed_block_offsets_region_id, rec->summed_block_offsets_offset, int_bytes);
-            void* summed_block_indices
-                = resolve_ptr(rec->summed_block_indices_region_id, rec->summed_block_indices_offset, int_bytes);
-            void* bsr_offsets = resolve_ptr(rec->bsr_offsets_region_id, rec->bsr_offsets_offset, rowp1_bytes);
-            void* bsr_row_counts = rec->bsr_row_counts_region_id >= 0
-                ? resolve_ptr(
-                      rec->bsr_row_counts_region_id, rec->bsr_row_counts_offset,
-                      static_cast<size_t>(rec->row_count) * sizeof(int32_t)
-                  )
-                : nullptr;
-            size_t bsr_columns_bytes = int_bytes;
-            if (bsr_offsets && rec->masked_topology != 0)
-                bsr_columns_bytes = std::max(
-                    bsr_columns_bytes,
-                    static_cast<size_t>(reinterpret_cast<const int*>(bsr_offsets)[rec->row_count]) * sizeof(int32_t)
-                );
-            void* bsr_columns = resolve_ptr(rec->bsr_columns_region_id, rec->bsr_columns_offset, bsr_columns_bytes);
-            void* bsr_nnz = rec->bsr_nnz_region_id >= 0
-                ? resolve_ptr(rec->bsr_nnz_region_id, rec->bsr_nnz_offset, sizeof(int32_t))
-                : nullptr;
-
-            if (!tpl_rows || !tpl_columns || !summed_block_offsets || !summed_block_indices || !bsr_offsets
-                || !bsr_columns || (rec->tpl_nnz_region_id >= 0 && !tpl_nnz)
-                || (rec->tpl_values_region_id >= 0 && !tpl_values)
-                || (rec->bsr_row_counts_region_id >= 0 && !bsr_row_counts)
-                || (rec->bsr_nnz_region_id >= 0 && !bsr_nnz)) {
-                fprintf(stderr, "APIC: Error - bsr-from-triplets pointer resolution failed at operation %u\n", i);
-                return false;
-            }
-            // g_apic_state is null during replay, so this executes the real
-            // topology build. Same entry point wp.sparse.bsr_set_from_triplets uses.
-            wp_bsr_matrix_from_triplets_host(
-                rec->block_size, rec->scalar_size_in_bytes, rec->row_count, rec->col_count, rec->nnz_upper_bound,
-                reinterpret_cast<const int*>(tpl_nnz), reinterpret_cast<const int*>(tpl_rows),
-                reinterpret_cast<const int*>(tpl_columns), tpl_values, rec->scalar_zero_mask, rec->masked_topology != 0,
-                reinterpret_cast<int*>(summed_block_offsets), reinterpret_cast<int*>(summed_block_indices),
-                reinterpret_cast<int*>(bsr_offsets), reinterpret_cast<const int*>(bsr_row_counts),
-                reinterpret_cast<int*>(bsr_columns), reinterpret_cast<int*>(bsr_nnz), nullptr
-            );
-            break;
+        void* cond_ptr = resolve_ptr(rec->cond_region_id, rec->cond_offset, sizeof(int32_t));
+        if (!cond_ptr) {
+            fprintf(stderr, "APIC: Error - cond pointer resolution failed at operation %u\n", i);
+            return false;
         }
-
-        case APIC_OP_BSR_TRANSPOSE: {
-            const APICBsrTransposeRecord* rec = reinterpret_cast<const APICBsrTransposeRecord*>(ptr);
-            size_t nnz = static_cast<size_t>(rec->nnz_upper_bound);
-            size_t int_bytes = nnz * sizeof(int32_t);
-            size_t rowp1_bytes = (static_cast<size_t>(rec->row_count) + 1) * sizeof(int32_t);
-            size_t colp1_bytes = (static_cast<size_t>(rec->col_count) + 1) * sizeof(int32_t);
-            void* bsr_offsets = resolve_ptr(rec->bsr_offsets_region_id, rec->bsr_offsets_offset, rowp1_bytes);
-            void* bsr_row_counts = rec->bsr_row_counts_region_id >= 0
-                ? resolve_ptr(
-                      rec->bsr_row_counts_region_id, rec->bsr_row_counts_offset,
-                      static_cast<size_t>(rec->row_count) * sizeof(int32_t)
-                  )
-                : nullptr;
-            void* bsr_columns = resolve_ptr(rec->bsr_columns_region_id, rec->bsr_columns_offset, int_bytes);
-            void* t_offsets
-                = resolve_ptr(rec->transposed_offsets_region_id, rec->transposed_offsets_offset, colp1_bytes);
-            void* t_row_counts = rec->transposed_row_counts_region_id >= 0
-                ? resolve_ptr(
-                      rec->transposed_row_counts_region_id, rec->transposed_row_counts_offset,
-                      static_cast<size_t>(rec->col_count) * sizeof(int32_t)
-                  )
-                : nullptr;
-            if (!bsr_offsets || !bsr_columns || !t_offsets || (rec->bsr_row_counts_region_id >= 0 && !bsr_row_counts)
-                || (rec->transposed_row_counts_region_id >= 0 && !t_row_counts)) {
-                fprintf(stderr, "APIC: Error - bsr-transpose pointer resolution failed at operation %u\n", i);
+        // The body's first kernel is responsible for updating the
+        // condition int32; we re-read it after each iteration.
+        uint32_t guard = 0;
+        const uint32_t guard_limit = 1u << 24;  // sanity bound to break runaway loops
+        while (*reinterpret_cast<const volatile int32_t*>(cond_ptr)) {
+            if (rec->branch_a_size == 0)
+                break;
+            if (!apic_cpu_replay_stream(
+                    body, rec->branch_a_size, rec->branch_a_op_count, resolve_ptr, remap_handle, find_kernel
+                ))
                 return false;
-            }
-            // Restore the padded destination's row-capacity offsets recorded at
-            // capture time, so replay reconstructs the destination even if the
-            // caller reset its offsets buffer before capture_launch. Compact
-            // transposes recompute the offsets and carry no tail (GH-1587).
-            // This must happen before sizing the destination spans below: the
-            // recorded tail, not the (possibly reset) live offsets, is the
-            // authoritative capacity layout.
-            size_t transposed_capacity_bytes = int_bytes;
-            if (rec->transposed_row_counts_region_id >= 0) {
-                size_t tail_bytes = static_cast<size_t>(rec->header.total_size) - sizeof(APICBsrTransposeRecord);
-                if (tail_bytes >= colp1_bytes) {
-                    memcpy(t_offsets, ptr + sizeof(APICBsrTransposeRecord), colp1_bytes);
-                    // The transpose touches the destination columns only within
-                    // the padded capacity (offsets[col_count] blocks), which may
-                    // be smaller than the source's nnz upper bound. Match the
-                    // span claimed at capture so resolution is bounds-checked
-                    // against the destination's real extent.
-                    int32_t capacity = reinterpret_cast<const int32_t*>(t_offsets)[rec->col_count];
-                    transposed_capacity_bytes = capacity > 0 ? static_cast<size_t>(capacity) * sizeof(int32_t) : 0;
-                }
-            }
-            void* t_columns = resolve_ptr(
-                rec->transposed_columns_region_id, rec->transposed_columns_offset, transposed_capacity_bytes
-            );
-            // block_indices carries the sorted source blocks (up to nnz entries)
-            // and, for padded destinations, per-slot gap markers up to the
-            // destination capacity.
-            void* block_indices = resolve_ptr(
-                rec->block_indices_region_id, rec->block_indices_offset, std::max(int_bytes, transposed_capacity_bytes)
-            );
-            void* status = rec->status_region_id >= 0
-                ? resolve_ptr(rec->status_region_id, rec->status_offset, sizeof(int32_t))
-                : nullptr;
-            if (!t_columns || !block_indices || (rec->status_region_id >= 0 && !status)) {
-                fprintf(stderr, "APIC: Error - bsr-transpose pointer resolution failed at operation %u\n", i);
+            if (++guard >= guard_limit) {
+                fprintf(stderr, "APIC: Error - APIC_OP_WHILE exceeded guard limit at operation %u\n", i);
                 return false;
             }
-            // g_apic_state is null during replay, so this executes the real
-            // transpose. Same entry point wp.sparse.bsr_set_transpose uses.
-            wp_bsr_transpose_host(
-                rec->row_count, rec->col_count, rec->nnz_upper_bound, reinterpret_cast<const int*>(bsr_offsets),
-                reinterpret_cast<const int*>(bsr_row_counts), reinterpret_cast<const int*>(bsr_columns),
-                reinterpret_cast<int*>(t_offsets), reinterpret_cast<int*>(t_row_counts),
-                reinterpret_cast<int*>(t_columns), reinterpret_cast<int*>(block_indices), reinterpret_cast<int*>(status)
-            );
-            break;
         }
+        break;
+    }
 
-        case APIC_OP_IF: {
-            const APICCondRecord* rec = reinterpret_cast<const APICCondRecord*>(ptr);
-            const uint8_t* branch_a = ptr + sizeof(APICCondRecord);
-            const uint8_t* branch_b = branch_a + rec->branch_a_size;
+    default:
+        fprintf(stderr, "APIC: Error - unsupported CPU replay op type %u\n", unsigned(header->op_type));
+        break;
+    }
+
+    return true;
+}
+
+template <typename ResolvePtrFn, typename RemapHandleFn, typename FindKernelFn>
+static bool apic_cpu_replay_stream(
+    const uint8_t* stream_data,
+    size_t stream_size,
+    uint32_t operation_count,
+    ResolvePtrFn resolve_ptr,
+    RemapHandleFn remap_handle,
+    FindKernelFn find_kernel
+)
+{
+    const uint8_t* ptr = stream_data;
+    APICReplayScratch scratch;
+
+    for (uint32_t i = 0; i < operation_count; i++) {
+        if (!apic_cpu_replay_op(ptr, i, resolve_ptr, remap_handle, find_kernel, scratch))
+            return false;
+
+        ptr += reinterpret_cast<const APICOpHeader*>(ptr)->total_size;
+    }
+
+    return true;
+}
+
+// ============================================================================
+// Concurrent CPU Graph Replay
+// ============================================================================
 
-            // Read condition value (int32) from the captured region. The
-            // resolver verifies the full int32_t fits at cond_offset, so a
-            // malformed .wrp cannot drive an out-of-bounds read here.
-            void* cond_ptr = resolve_ptr(rec->cond_region_id, rec->cond_offset, sizeof(int32_t));
-            if (!cond_ptr) {
-                fprintf(stderr, "APIC: Error - cond pointer resolution failed at operation %u\n", i);
+struct APICRegionAccess {
+    int32_t region_id;
+    bool write;
+};
+
+// Collect the memory regions a top-level operation reads and writes. Returns
+// false if the operation may touch memory that is not described by region
+// ids, in which case it is ordered against every other operation. Kernel
+// launches are conservatively treated as writing every region they reference.
+static bool apic_collect_op_accesses(const uint8_t* ptr, std::vector<APICRegionAccess>& accesses)
+{
+    accesses.clear();
+
+    const APICOpHeader* header = reinterpret_cast<const APICOpHeader*>(ptr);
+    switch (header->op_type) {
+    case APIC_OP_KERNEL_LAUNCH: {
+        const APICLaunchRecord* rec = reinterpret_cast<const APICLaunchRecord*>(ptr);
+        if (!(rec->flags & APIC_LAUNCH_FLAG_TRACKED_ACCESS))
+            return false;
+
+        const uint16_t adj_count = rec->is_forward ? 0u : rec->num_params;
+        const APICLaunchPtrLocation* relocs = reinterpret_cast<const APICLaunchPtrLocation*>(
+            ptr + sizeof(APICLaunchRecord) + rec->kernel_key_len + rec->module_hash_len
+            + (rec->num_params + adj_count) * sizeof(APICLaunchParamRecord)
+        );
+        for (uint32_t r = 0; r < rec->num_relocs; r++) {
+            if (relocs[r].kind == APIC_RELOC_DATA_PTR)
+                accesses.push_back({ relocs[r].region_id, true });
+            else if (relocs[r].kind == APIC_RELOC_HANDLE && relocs[r].region_offset != 0)
                 return false;
-            }
-            int32_t cond_value = *reinterpret_cast<const int32_t*>(cond_ptr);
+        }
+        return true;
+    }
 
-            if (cond_value && rec->branch_a_size > 0) {
-                if (!apic_cpu_replay_stream(
-                        branch_a, rec->branch_a_size, rec->branch_a_op_count, resolve_ptr, remap_handle, find_kernel
-                    ))
-                    return false;
-            } else if (!cond_value && rec->branch_b_size > 0) {
-                if (!apic_cpu_replay_stream(
-                        branch_b, rec->branch_b_size, rec->branch_b_op_count, resolve_ptr, remap_handle, find_kernel
-                    ))
-                    return false;
-            }
-            break;
+    case APIC_OP_MEMCPY_D2D: {
+        const APICMemcpyD2DRecord* rec = reinterpret_cast<const APICMemcpyD2DRecord*>(ptr);
+        accesses.push_back({ rec->src_region_id, false });
+        accesses.push_back({ rec->dst_region_id, true });
+        return true;
+    }
+
+    case APIC_OP_MEMSET:
+        accesses.push_back({ reinterpret_cast<const APICMemsetRecord*>(ptr)->region_id, true });
+        return true;
+
+    case APIC_OP_MEMTILE:
+        accesses.push_back({ reinterpret_cast<const APICMemtileRecord*>(ptr)->region_id, true });
+        return true;
+
+    case APIC_OP_ALLOC:
+        return true;
+
+    case APIC_OP_SCAN: {
+        const APICScanRecord* rec = reinterpret_cast<const APICScanRecord*>(ptr);
+        accesses.push_back({ rec->src_region_id, false });
+        accesses.push_back({ rec->dst_region_id, true });
+        return true;
+    }
+
+    case APIC_OP_SEGMENTED_SORT: {
+        const APICSegmentedSortRecord* rec = reinterpret_cast<const APICSegmentedSortRecord*>(ptr);
+        accesses.push_back({ rec->segstart_region_id, false });
+        accesses.push_back({ rec->segend_region_id, false });
+        accesses.push_back({ rec->keys_region_id, true });
+        accesses.push_back({ rec->values_region_id, true });
+        return true;
+    }
+
+    case APIC_OP_RADIX_SORT: {
+        const APICRadixSortRecord* rec = reinterpret_cast<const APICRadixSortRecord*>(ptr);
+        accesses.push_back({ rec->keys_region_id, true });
+        accesses.push_back({ rec->values_region_id, true });
+        return true;
+    }
+
+    case APIC_OP_RUNLENGTH_ENCODE: {
+        const APICRunlengthEncodeRecord* rec = reinterpret_cast<const APICRunlengthEncodeRecord*>(ptr);
+        accesses.push_back({ rec->values_region_id, false });
+        accesses.push_back({ rec->run_values_region_id, true });
+        accesses.push_back({ rec->run_lengths_region_id, true });
+        accesses.push_back({ rec->run_count_region_id, true });
+        return true;
+    }
+
+    default:
+        // BSR topology ops and conditionals (which replay nested streams)
+        // keep stream order.
+        return false;
+    }
+}
+
+// Map region ids to conflict keys. Regions whose byte ranges overlap share a
+// key, so operations on aliasing regions are ordered as if they used the same
+// region. `extents` holds (region_id, begin, end) triples.
+static std::unordered_map<int32_t, int32_t>
+apic_region_conflict_keys(std::vector<std::tuple<uint64_t, uint64_t, int32_t>> extents)
+{
+    std::sort(extents.begin(), extents.end());
+
+    std::unordered_map<int32_t, int32_t> keys;
+    int32_t group_key = -1;
+    uint64_t group_end = 0;
+    for (const auto& [begin, end, region_id] : extents) {
+        if (group_key < 0 || begin >= group_end) {
+            group_key = region_id;
+            group_end = end;
+        } else {
+            group_end = std::max(group_end, end);
         }
+        keys[region_id] = group_key;
+    }
+    return keys;
+}
 
-        case APIC_OP_WHILE: {
-            const APICCondRecord* rec = reinterpret_cast<const APICCondRecord*>(ptr);
-            const uint8_t* body = ptr + sizeof(APICCondRecord);
+static std::unordered_map<int32_t, int32_t> apic_region_conflict_keys(const APICState* state)
+{
+    std::vector<std::tuple<uint64_t, uint64_t, int32_t>> extents;
+    for (size_t i = 1; i < state->regions_by_id.size(); i++) {
+        const auto& entry = state->regions_by_id[i];
+        if (entry.valid)
+            extents.emplace_back(entry.base_ptr, entry.base_ptr + entry.size, static_cast<int32_t>(i));
+    }
+    return apic_region_conflict_keys(std::move(extents));
+}
 
-            void* cond_ptr = resolve_ptr(rec->cond_region_id, rec->cond_offset, sizeof(int32_t));
-            if (!cond_ptr) {
-                fprintf(stderr, "APIC: Error - cond pointer resolution failed at operation %u\n", i);
-                return false;
+static std::unordered_map<int32_t, int32_t> apic_region_conflict_keys(const APICGraph* graph)
+{
+    std::vector<std::tuple<uint64_t, uint64_t, int32_t>> extents;
+    for (const auto& [region_id, memory] : graph->regions) {
+        if (memory.ptr) {
+            uint64_t base = reinterpret_cast<uint64_t>(memory.ptr);
+            extents.emplace_back(base, base + memory.size, static_cast<int32_t>(region_id));
+        }
+    }
+    return apic_region_conflict_keys(std::move(extents));
+}
+
+// Assign every top-level operation the lowest level after all operations it
+// depends on: a read depends on the last write to the region, a write on the
+// last write and on all reads since. Operations with unknown accesses act as
+// barriers. Operations within a level keep their stream order.
+static void apic_build_cpu_replay_schedule(
+    APICReplaySchedule& schedule,
+    const uint8_t* stream_data,
+    uint32_t operation_count,
+    const std::unordered_map<int32_t, int32_t>& conflict_keys
+)
+{
+    std::vector<uint32_t> levels(operation_count);
+    std::vector<size_t> offsets(operation_count);
+    std::unordered_map<int32_t, uint32_t> last_write;  // region key -> level + 1
+    std::unordered_map<int32_t, uint32_t> last_read;  // region key -> level + 1
+    std::vector<APICRegionAccess> accesses;
+    uint32_t barrier = 0;  // operations must be placed at level >= barrier
+    uint32_t num_levels = 0;
+
+    auto conflict_key = [&conflict_keys](int32_t region_id) {
+        auto it = conflict_keys.find(region_id);
+        return it != conflict_keys.end() ? it->second : region_id;
+    };
+
+    const uint8_t* ptr = stream_data;
+    for (uint32_t i = 0; i < operation_count; i++) {
+        offsets[i] = static_cast<size_t>(ptr - stream_data);
+
+        uint32_t level;
+        if (!apic_collect_op_accesses(ptr, accesses)) {
+            level = num_levels;
+            barrier = level + 1;
+        } else {
+            level = barrier;
+            for (const APICRegionAccess& access : accesses) {
+                const int32_t key = conflict_key(access.region_id);
+                auto write_it = last_write.find(key);
+                if (write_it != last_write.end())
+                    level = std::max(level, write_it->second);
+                if (access.write) {
+                    auto read_it = last_read.find(key);
+                    if (read_it != last_read.end())
+                        level = std::max(level, read_it->second);
+                }
             }
-            // The body's first kernel is responsible for updating the
-            // condition int32; we re-read it after each iteration.
-            uint32_t guard = 0;
-            const uint32_t guard_limit = 1u << 24;  // sanity bound to break runaway loops
-            while (*reinterpret_cast<const volatile int32_t*>(cond_ptr)) {
-                if (rec->branch_a_size == 0)
-                    break;
-                if (!apic_cpu_replay_stream(
-                        body, rec->branch_a_size, rec->branch_a_op_count, resolve_ptr, remap_handle, find_kernel
-                    ))
-                    return false;
-                if (++guard >= guard_limit) {
-                    fprintf(stderr, "APIC: Error - APIC_OP_WHILE exceeded guard limit at operation %u\n", i);
-                    return false;
+            for (const APICRegionAccess& access : accesses) {
+                const int32_t key = conflict_key(access.region_id);
+                if (access.write) {
+                    last_write[key] = level + 1;
+                    last_read.erase(key);
+                } else {
+                    uint32_t& read_level = last_read[key];
+                    read_level = std::max(read_level, level + 1);
                 }
             }
-            break;
         }
 
-        default:
-            fprintf(stderr, "APIC: Error - unsupported CPU replay op type %u\n", unsigned(header->op_type));
-            break;
+        levels[i] = level;
+        num_levels = std::max(num_levels, level + 1);
+        ptr += reinterpret_cast<const APICOpHeader*>(ptr)->total_size;
+    }
+
+    // stable counting sort of the operations by level
+    schedule.level_offsets.assign(num_levels + 1, 0);
+    for (uint32_t i = 0; i < operation_count; i++)
+        schedule.level_offsets[levels[i] + 1]++;
+    for (uint32_t l = 0; l < num_levels; l++)
+        schedule.level_offsets[l + 1] += schedule.level_offsets[l];
+
+    std::vector<uint32_t> cursor(schedule.level_offsets.begin(), schedule.level_offsets.end() - 1);
+    schedule.op_offsets.resize(operation_count);
+    schedule.op_indices.resize(operation_count);
+    for (uint32_t i = 0; i < operation_count; i++) {
+        const uint32_t slot = cursor[levels[i]]++;
+        schedule.op_offsets[slot] = offsets[i];
+        schedule.op_indices[slot] = i;
+    }
+
+    schedule.serial = (num_levels == operation_count);
+    schedule.built = true;
+}
+
+// Replay the levels of `schedule` in order, running the operations of each
+// level concurrently on up to `num_threads` host threads. Operations inside a
+// level run single-threaded, since nested parallel_for() calls are serial.
+template <typename ResolvePtrFn, typename RemapHandleFn, typename FindKernelFn>
+static bool apic_cpu_replay_schedule(
+    const uint8_t* stream_data,
+    const APICReplaySchedule& schedule,
+    int num_threads,
+    ResolvePtrFn resolve_ptr,
+    RemapHandleFn remap_handle,
+    FindKernelFn find_kernel
+)
+{
+    APICReplayScratch scratch;
+
+    for (size_t l = 0; l + 1 < schedule.level_offsets.size(); l++) {
+        const uint32_t begin = schedule.level_offsets[l];
+        const uint32_t end = schedule.level_offsets[l + 1];
+
+        // a lone operation runs on the calling thread, where host algorithms can still use the pool
+        if (end - begin == 1) {
+            if (!apic_cpu_replay_op(
+                    stream_data + schedule.op_offsets[begin], schedule.op_indices[begin], resolve_ptr, remap_handle,
+                    find_kernel, scratch
+                ))
+                return false;
+            continue;
         }
 
-        ptr += header->total_size;
+        std::atomic<bool> ok { true };
+        wp::parallel_for(end - begin, 1, num_threads, [&](size_t first, size_t last) {
+            APICReplayScratch local_scratch;
+            for (size_t k = begin + first; k < begin + last; k++) {
+                if (!ok.load(std::memory_order_relaxed))
+                    return;
+                if (!apic_cpu_replay_op(
+                        stream_data + schedule.op_offsets[k], schedule.op_indices[k], resolve_ptr, remap_handle,
+                        find_kernel, local_scratch
+                    ))
+                    ok.store(false, std::memory_order_relaxed);
+            }
+        });
+        if (!ok.load())
+            return false;
     }
 
     return true;
@@ -2250,6 +2557,26 @@ static bool apic_cpu_replay_container(Container* c, Resolver resolve, HandleRema
             return nullptr;
         return is_forward ? it->second.forward_fn : it->second.backward_fn;
     };
+
+    // With more than one host thread, independent operations replay
+    // concurrently; otherwise (or if every operation depends on the previous
+    // one) the stream replays serially in recorded order.
+    const int num_threads = wp::cpu_algorithm_threads();
+    if (num_threads > 1) {
+        APICReplaySchedule& schedule = c->cpu_replay_schedule;
+        {
+            std::lock_guard<std::mutex> lock(schedule.mutex);
+            if (!schedule.built)
+                apic_build_cpu_replay_schedule(
+                    schedule, c->operation_stream.data(), c->operation_count, apic_region_conflict_keys(c)
+                );
+        }
+        if (!schedule.serial)
+            return apic_cpu_replay_schedule(
+                c->operation_stream.data(), schedule, num_threads, resolve, remap_handle, find_kernel
+            );
+    }
+
     return apic_cpu_replay_stream(
         c->operation_stream.data(), c->operation_stream.size(), c->operation_count, resolve, remap_handle, find_kernel
     );
@@ -16,6 +16,7 @@
 #include <cstdio>
 #include <cstring>
 #include <map>
+#include <mutex>
 #include <string>
 #include <unordered_map>
 #include <vector>
@@ -166,6 +167,33 @@ struct APICCPUKernel {
     void* backward_fn = nullptr;
 };
 
+// ============================================================================
+// APICReplaySchedule — dependency levels for concurrent CPU replay
+// ============================================================================
+
+// Top-level operations of a CPU operation stream grouped into levels: every
+// operation depends only on operations in earlier levels, so the operations
+// of one level can replay concurrently. Built lazily on the first concurrent
+// replay (see apic_build_cpu_replay_schedule in apic.cpp) and reset whenever
+// the stream is re-recorded.
+struct APICReplaySchedule {
+    std::mutex mutex;  // Guards lazy construction
+    bool built = false;
+    bool serial = true;  // True if no two operations can run concurrently
+    std::vector<size_t> op_offsets;  // Byte offset of each operation, grouped by level
+    std::vector<uint32_t> op_indices;  // Stream index of each operation (diagnostics)
+    std::vector<uint32_t> level_offsets;  // Level L spans [level_offsets[L], level_offsets[L + 1])
+
+    void reset()
+    {
+        built = false;
+        serial = true;
+        op_offsets.clear();
+        op_indices.clear();
+        level_offsets.clear();
+    }
+};
+
 // ============================================================================
 // APICState — recording state
 // ============================================================================
@@ -228,6 +256,9 @@ struct APICState {
     // CPU kernel function pointers (registered during capture for replay)
     std::unordered_map<std::string, APICCPUKernel> cpu_kernels;
 
+    // Concurrent CPU replay schedule for operation_stream
+    APICReplaySchedule cpu_replay_schedule;
+
     void append_bytes(const void* data, size_t sz)
     {
         size_t offset = operation_stream.size();
@@ -264,7 +295,8 @@ void apic_record_kernel_launch(
     const APICLaunchPtrLocation* relocs,
     uint32_t num_relocs,
     const uint8_t* value_data,
-    uint32_t value_data_size
+    uint32_t value_data_size,
+    uint8_t flags
 );
 
 void apic_record_memcpy_d2d(
@@ -458,6 +490,9 @@ struct APICGraph {
 
     std::unordered_map<std::string, APICCPUKernel> cpu_kernels;
 
+    // Concurrent CPU replay schedule for operation_stream
+    APICReplaySchedule cpu_replay_schedule;
+
 #ifdef __CUDACC__
     CUgraph cuda_graph = nullptr;
     CUgraphExec cuda_graph_exec = nullptr;
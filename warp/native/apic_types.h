@@ -64,6 +64,16 @@ enum APICRelocKind : uint8_t {
     APIC_RELOC_NULL = 3,  // Explicit zero (null array data/grad, absent indexedarray dim).
 };
 
+// Kernel-launch record flags (APICLaunchRecord::flags / APICLaunchInfo::flags).
+enum APICLaunchFlags : uint8_t {
+    // Every byte the kernel can access is reached through a DATA_PTR
+    // relocation of its launch parameters (no raw uint64 addresses, handles,
+    // or shared tile storage). CPU replay may run such a launch concurrently
+    // with operations that touch disjoint regions; launches without the flag,
+    // including all records written before it existed, keep stream order.
+    APIC_LAUNCH_FLAG_TRACKED_ACCESS = 1 << 0,
+};
+
 // =============================================================================
 // WRP File Header
 // =============================================================================
@@ -177,7 +187,8 @@ struct APICLaunchRecord {
     int32_t grid_stride;  // 1 = grid-stride loop kernel, 0 = lean 3D kernel
     uint8_t is_forward;  // 1 for forward pass, 0 for backward
     uint8_t cluster_dim;  // 1D CTA cluster size, or 0 for older records
-    uint8_t _pad1[2];
+    uint8_t flags;  // APICLaunchFlags, or 0 for older records
+    uint8_t _pad1;
 
     // Variable data sizes
     uint16_t kernel_key_len;  // Length of kernel_key string
@@ -488,7 +499,8 @@ struct APICLaunchInfo {
     const char* kernel_key;  // Kernel identifier string
     const char* module_hash;  // Module hash string
     uint8_t is_forward;  // 1 for forward, 0 for backward
-    uint8_t _pad[7];  // Align params to 8 bytes
+    uint8_t flags;  // APICLaunchFlags
+    uint8_t _pad[6];  // Align params to 8 bytes
     const APICLaunchParamRecord* params;  // Forward parameter bindings
     int32_t num_params;  // Number of forward parameter bindings
     int32_t kernel_dim;  // Kernel launch dimensionality (1-4), from kernel.adj.kernel_dim
@@ -1944,6 +1944,14 @@ inline CUDA_CALLABLE int block_dim()
 #endif
 }
 
+// 1-D tid() without the truncation warning, for callers that already keep index within int range
+// (batched CPU kernels, see the "cpu_simd_width" module option)
+template <int N> inline CUDA_CALLABLE int tid_unchecked(size_t index, const launch_bounds_t<N>& bounds)
+{
+    launch_coord_t coord = launch_coord(index, bounds);
+    return static_cast<int>(coord.i);
+}
+
 template <int N> inline CUDA_CALLABLE int tid(size_t index, const launch_bounds_t<N>& bounds)
 {
     // For the 1-D tid() we need to warn the user if we're about to provide a truncated index
@@ -1954,8 +1962,7 @@ template <int N> inline CUDA_CALLABLE int tid(size_t index, const launch_bounds_
     }
 #endif
 
-    launch_coord_t coord = launch_coord(index, bounds);
-    return static_cast<int>(coord.i);
+    return tid_unchecked(index, bounds);
 }
 
 template <int N> inline CUDA_CALLABLE_DEVICE void tid(int& i, int& j, size_t index, const launch_bounds_t<N>& bounds)
@@ -2056,12 +2063,32 @@ CUDA_CALLABLE inline int slice_get_length(const slice_t& slice)
     return 0;
 }
 
+// Host read-modify-write helper. CPU kernels may execute on several threads at
+// once (see warp.config.cpu_max_threads), so host atomics apply op() through a
+// compare-and-swap loop on the value's bit pattern and return the previous value.
+template <typename T, typename Op> inline CUDA_CALLABLE T cpu_atomic_rmw(T* address, Op op)
+{
+#if !defined(__CUDA_ARCH__) && (defined(__clang__) || defined(__GNUC__))
+    T old;
+    __atomic_load(address, &old, __ATOMIC_RELAXED);
+    T desired = op(old);
+    while (!__atomic_compare_exchange(address, &old, &desired, true, __ATOMIC_RELAXED, __ATOMIC_RELAXED))
+        desired = op(old);
+    return old;
+#else
+    T old = *address;
+    *address = op(old);
+    return old;
+#endif
+}
+
 template <typename T> inline CUDA_CALLABLE T atomic_add(T* buf, T value)
 {
 #if !defined(__CUDA_ARCH__)
-    T old = buf[0];
-    buf[0] += value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](T old) {
+        old += value;
+        return old;
+    });
 #else
     return atomicAdd(buf, value);
 #endif
@@ -2070,9 +2097,10 @@ template <typename T> inline CUDA_CALLABLE T atomic_add(T* buf, T value)
 template <> inline CUDA_CALLABLE int64 atomic_add(int64* buf, int64 value)
 {
 #if !defined(__CUDA_ARCH__)
-    int64 old = buf[0];
-    buf[0] += value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](int64 old) {
+        old += value;
+        return old;
+    });
 #else  // CUDA compiled by NVRTC
     unsigned long long int* buf_as_ull = (unsigned long long int*)buf;
     unsigned long long int unsigned_value = static_cast<unsigned long long int>(value);
@@ -2084,9 +2112,10 @@ template <> inline CUDA_CALLABLE int64 atomic_add(int64* buf, int64 value)
 template <> inline CUDA_CALLABLE float16 atomic_add(float16* buf, float16 value)
 {
 #if !defined(__CUDA_ARCH__)
-    float16 old = buf[0];
-    buf[0] += value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](float16 old) {
+        old += value;
+        return old;
+    });
 #else  // CUDA compiled by NVRTC
 #if __CUDA_ARCH__ >= 700
 #if defined(__clang__)  // CUDA compiled by Clang
@@ -2119,9 +2148,10 @@ template <> inline CUDA_CALLABLE float16 atomic_add(float16* buf, float16 value)
 template <> inline CUDA_CALLABLE bfloat16 atomic_add(bfloat16* buf, bfloat16 value)
 {
 #if !defined(__CUDA_ARCH__)
-    bfloat16 old = buf[0];
-    buf[0] += value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](bfloat16 old) {
+        old += value;
+        return old;
+    });
 #elif __CUDA_ARCH__ >= 900
     bfloat16 old;
     asm volatile("atom.add.noftz.bf16 %0, [%1], %2;" : "=h"(old.u) : "l"(buf), "h"(value.u) : "memory");
@@ -2151,9 +2181,10 @@ template <> inline CUDA_CALLABLE bfloat16 atomic_add(bfloat16* buf, bfloat16 val
 template <> inline CUDA_CALLABLE float64 atomic_add(float64* buf, float64 value)
 {
 #if !defined(__CUDA_ARCH__)
-    float64 old = buf[0];
-    buf[0] += value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](float64 old) {
+        old += value;
+        return old;
+    });
 #elif defined(__clang__)  // CUDA compiled by Clang
     return atomicAdd(buf, value);
 #else  // CUDA compiled by NVRTC
@@ -2184,9 +2215,7 @@ template <typename T> inline CUDA_CALLABLE T atomic_min(T* address, T val)
 #if defined(__CUDA_ARCH__)
     return atomicMin(address, val);
 #else
-    T old = *address;
-    *address = min(old, val);
-    return old;
+    return cpu_atomic_rmw(address, [val](T old) { return min(old, val); });
 #endif
 }
 
@@ -2219,9 +2248,7 @@ template <> inline CUDA_CALLABLE float atomic_min(float* address, float val)
     return __int_as_float(old);
 
 #else
-    float old = *address;
-    *address = min(old, val);
-    return old;
+    return cpu_atomic_rmw(address, [val](float old) { return min(old, val); });
 #endif
 }
 
@@ -2245,9 +2272,7 @@ template <> inline CUDA_CALLABLE double atomic_min(double* address, double val)
     return __longlong_as_double(old);
 
 #else
-    double old = *address;
-    *address = min(old, val);
-    return old;
+    return cpu_atomic_rmw(address, [val](double old) { return min(old, val); });
 #endif
 }
 
@@ -2256,9 +2281,7 @@ template <> inline CUDA_CALLABLE double atomic_min(double* address, double val)
 template <> inline CUDA_CALLABLE bfloat16 atomic_min(bfloat16* buf, bfloat16 val)
 {
 #if !defined(__CUDA_ARCH__)
-    bfloat16 old = buf[0];
-    buf[0] = min(old, val);
-    return old;
+    return cpu_atomic_rmw(buf, [val](bfloat16 old) { return min(old, val); });
 #elif __CUDA_ARCH__ >= 700
     // 16-bit atomicCAS is available on compute capability >= 7.0
     unsigned short int* address_as_ushort = reinterpret_cast<unsigned short int*>(buf);
@@ -2293,9 +2316,7 @@ template <typename T> inline CUDA_CALLABLE T atomic_max(T* address, T val)
 #if defined(__CUDA_ARCH__)
     return atomicMax(address, val);
 #else
-    T old = *address;
-    *address = max(old, val);
-    return old;
+    return cpu_atomic_rmw(address, [val](T old) { return max(old, val); });
 #endif
 }
 
@@ -2319,9 +2340,7 @@ template <> inline CUDA_CALLABLE float atomic_max(float* address, float val)
     return __int_as_float(old);
 
 #else
-    float old = *address;
-    *address = max(old, val);
-    return old;
+    return cpu_atomic_rmw(address, [val](float old) { return max(old, val); });
 #endif
 }
 
@@ -2345,9 +2364,7 @@ template <> inline CUDA_CALLABLE double atomic_max(double* address, double val)
     return __longlong_as_double(old);
 
 #else
-    double old = *address;
-    *address = max(old, val);
-    return old;
+    return cpu_atomic_rmw(address, [val](double old) { return max(old, val); });
 #endif
 }
 
@@ -2356,9 +2373,7 @@ template <> inline CUDA_CALLABLE double atomic_max(double* address, double val)
 template <> inline CUDA_CALLABLE bfloat16 atomic_max(bfloat16* buf, bfloat16 val)
 {
 #if !defined(__CUDA_ARCH__)
-    bfloat16 old = buf[0];
-    buf[0] = max(old, val);
-    return old;
+    return cpu_atomic_rmw(buf, [val](bfloat16 old) { return max(old, val); });
 #elif __CUDA_ARCH__ >= 700
     // 16-bit atomicCAS is available on compute capability >= 7.0
     unsigned short int* address_as_ushort = reinterpret_cast<unsigned short int*>(buf);
@@ -2410,11 +2425,7 @@ template <typename T> inline CUDA_CALLABLE T atomic_cas(T* address, T compare, T
 #if defined(__CUDA_ARCH__)
     return atomicCAS(address, compare, val);
 #else
-    T old = *address;
-    if (old == compare) {
-        *address = val;
-    }
-    return old;
+    return cpu_atomic_rmw(address, [compare, val](T old) { return old == compare ? val : old; });
 #endif
 }
 
@@ -2426,11 +2437,7 @@ template <> inline CUDA_CALLABLE float atomic_cas(float* address, float compare,
     auto result = atomicCAS(reinterpret_cast<unsigned int*>(address), compare_bits, val_bits);
     return __uint_as_float(result);
 #else
-    float old = *address;
-    if (old == compare) {
-        *address = val;
-    }
-    return old;
+    return cpu_atomic_rmw(address, [compare, val](float old) { return old == compare ? val : old; });
 #endif
 }
 
@@ -2442,11 +2449,7 @@ template <> inline CUDA_CALLABLE double atomic_cas(double* address, double compa
     auto result = atomicCAS(reinterpret_cast<unsigned long long int*>(address), compare_bits, val_bits);
     return __longlong_as_double(static_cast<long long int>(result));
 #else
-    double old = *address;
-    if (old == compare) {
-        *address = val;
-    }
-    return old;
+    return cpu_atomic_rmw(address, [compare, val](double old) { return old == compare ? val : old; });
 #endif
 }
 
@@ -2459,11 +2462,7 @@ template <> inline CUDA_CALLABLE int64 atomic_cas(int64* address, int64 compare,
     );
     return static_cast<int64>(result);
 #else
-    int64 old = *address;
-    if (old == compare) {
-        *address = val;
-    }
-    return old;
+    return cpu_atomic_rmw(address, [compare, val](int64 old) { return old == compare ? val : old; });
 #endif
 }
 
@@ -2472,9 +2471,7 @@ template <typename T> inline CUDA_CALLABLE T atomic_exch(T* address, T val)
 #if defined(__CUDA_ARCH__)
     return atomicExch(address, val);
 #else
-    T old = *address;
-    *address = val;
-    return old;
+    return cpu_atomic_rmw(address, [val](T) { return val; });
 #endif
 }
 
@@ -2485,9 +2482,7 @@ template <> inline CUDA_CALLABLE double atomic_exch(double* address, double val)
     auto result = atomicExch(reinterpret_cast<unsigned long long int*>(address), val_bits);
     return __longlong_as_double(static_cast<long long int>(result));
 #else
-    double old = *address;
-    *address = val;
-    return old;
+    return cpu_atomic_rmw(address, [val](double) { return val; });
 #endif
 }
 
@@ -2498,9 +2493,7 @@ template <> inline CUDA_CALLABLE int64 atomic_exch(int64* address, int64 val)
         = atomicExch(reinterpret_cast<unsigned long long int*>(address), static_cast<unsigned long long int>(val));
     return static_cast<int64>(result);
 #else
-    int64 old = *address;
-    *address = val;
-    return old;
+    return cpu_atomic_rmw(address, [val](int64) { return val; });
 #endif
 }
 
@@ -2524,9 +2517,10 @@ template <typename T> inline CUDA_CALLABLE T atomic_and(T* buf, T value)
 #if defined(__CUDA_ARCH__)
     return atomicAnd(buf, value);
 #else
-    T old = buf[0];
-    buf[0] &= value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](T old) {
+        old &= value;
+        return old;
+    });
 #endif
 }
 
@@ -2535,9 +2529,10 @@ template <typename T> inline CUDA_CALLABLE T atomic_or(T* buf, T value)
 #if defined(__CUDA_ARCH__)
     return atomicOr(buf, value);
 #else
-    T old = buf[0];
-    buf[0] |= value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](T old) {
+        old |= value;
+        return old;
+    });
 #endif
 }
 
@@ -2546,9 +2541,10 @@ template <typename T> inline CUDA_CALLABLE T atomic_xor(T* buf, T value)
 #if defined(__CUDA_ARCH__)
     return atomicXor(buf, value);
 #else
-    T old = buf[0];
-    buf[0] ^= value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](T old) {
+        old ^= value;
+        return old;
+    });
 #endif
 }
 
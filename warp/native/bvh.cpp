@@ -6,6 +6,7 @@
 #include "bvh.h"
 #include "cuda_util.h"
 #include "error.h"
+#include "thread_pool.h"
 
 #include <algorithm>
 #include <cassert>
@@ -21,6 +22,11 @@ namespace wp {
 
 /////////////////////////////////////////////////////////////////////////////////////////////
 
+// Primitive ranges shorter than this are reduced (bounds, SAH bins) on a single thread.
+constexpr int kParallelReduceMinSize = 1 << 15;
+// Ranges with at most this many primitives are built as a single subtree by one thread.
+constexpr int kParallelSubtreeMinSize = 1 << 12;
+
 class TopDownBVHBuilder {
 public:
     void build(BVH& bvh, const vec3* lowers, const vec3* uppers, int n, int in_constructor_type, int* groups);
@@ -29,7 +35,10 @@ public:
 private:
     void initialize_empty(BVH& bvh);
 
-    bounds3 calc_bounds(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end);
+    bounds3
+    calc_bounds(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end, int num_threads = 1);
+    void build_root(BVH& bvh, const vec3* lowers, const vec3* uppers, int n);
+    void build_parallel(BVH& bvh, const vec3* lowers, const vec3* uppers, int n, int num_threads);
     int build_recursive(
         BVH& bvh,
         const vec3* lowers,
@@ -40,6 +49,15 @@ private:
         int parent,
         int assigned_node = -1
     );
+    int split_range(
+        const vec3* lowers,
+        const vec3* uppers,
+        int* indices,
+        int start,
+        int end,
+        bounds3 range_bounds,
+        int num_threads = 1
+    );
     int
     partition_median(const vec3* lowers, const vec3* uppers, int* indices, int start, int end, bounds3 range_bounds);
     int
@@ -51,7 +69,8 @@ private:
         int start,
         int end,
         bounds3 range_bounds,
-        int& split_axis
+        int& split_axis,
+        int num_threads = 1
     );
     void build_with_groups(BVH& bvh, const vec3* lowers, const vec3* uppers, const int* groups, int n);
     int constructor_type = -1;
@@ -264,7 +283,7 @@ void TopDownBVHBuilder::build(
     if (groups) {
         build_with_groups(bvh, lowers, uppers, groups, n);
     } else {
-        build_recursive(bvh, lowers, uppers, 0, n, 0, -1);
+        build_root(bvh, lowers, uppers, n);
     }
 }
 
@@ -292,20 +311,56 @@ void TopDownBVHBuilder::rebuild(BVH& bvh, int in_constructor_type)
     if (bvh.item_groups) {
         build_with_groups(bvh, bvh.item_lowers, bvh.item_uppers, bvh.item_groups, bvh.num_items);
     } else {
-        build_recursive(bvh, bvh.item_lowers, bvh.item_uppers, 0, bvh.num_items, 0, -1);
+        build_root(bvh, bvh.item_lowers, bvh.item_uppers, bvh.num_items);
     }
 }
 
 
-bounds3 TopDownBVHBuilder::calc_bounds(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end)
+// Reduce [start, end) into a T by calling body(begin, end, partial) on chunks of the range and folding the
+// partials together with merge(result, partial). Short ranges are reduced on the calling thread. The builder
+// only reduces with min/max/add, which are exact, so the result does not depend on the thread count.
+template <typename T, typename Body, typename Merge>
+static T parallel_reduce_range(int start, int end, int num_threads, const Body& body, const Merge& merge)
 {
-    bounds3 u;
+    T result;
 
-    for (int i = start; i < end; ++i) {
-        u.add_bounds(lowers[indices[i]], uppers[indices[i]]);
+    const int n = end - start;
+    if (num_threads <= 1 || n < kParallelReduceMinSize) {
+        body(start, end, result);
+        return result;
     }
 
-    return u;
+    const size_t grain = parallel_for_grain(size_t(n), num_threads, kParallelReduceMinSize / 4);
+    const size_t num_chunks = (size_t(n) + grain - 1) / grain;
+
+    std::vector<T> partials(num_chunks);
+    parallel_for(num_chunks, 1, num_threads, [&](size_t first, size_t last) {
+        for (size_t c = first; c < last; ++c) {
+            const int chunk_start = start + int(c * grain);
+            const int chunk_end = std::min(end, chunk_start + int(grain));
+            body(chunk_start, chunk_end, partials[c]);
+        }
+    });
+
+    for (size_t c = 0; c < num_chunks; ++c)
+        merge(result, partials[c]);
+
+    return result;
+}
+
+bounds3 TopDownBVHBuilder::calc_bounds(
+    const vec3* lowers, const vec3* uppers, const int* indices, int start, int end, int num_threads
+)
+{
+    return parallel_reduce_range<bounds3>(
+        start, end, num_threads,
+        [&](int first, int last, bounds3& u) {
+            for (int i = first; i < last; ++i) {
+                u.add_bounds(lowers[indices[i]], uppers[indices[i]]);
+            }
+        },
+        [](bounds3& u, const bounds3& partial) { u = bounds_union(u, partial); }
+    );
 }
 
 struct PartitionPredicateMedian {
@@ -401,23 +456,25 @@ float TopDownBVHBuilder::partition_sah_indices(
     int start,
     int end,
     bounds3 range_bounds,
-    int& split_axis
+    int& split_axis,
+    int num_threads
 )
 {
-    int buckets_counts[SAH_NUM_BUCKETS];
-    bounds3 buckets[SAH_NUM_BUCKETS];
     float left_areas[SAH_NUM_BUCKETS - 1];
     float right_areas[SAH_NUM_BUCKETS - 1];
 
     assert(end - start >= 2);
 
-    int n = end - start;
-
-    bounds3 centroid_bounds;
-    for (int i = start; i < end; ++i) {
-        vec3 item_center = 0.5f * (lowers[indices[i]] + uppers[indices[i]]);
-        centroid_bounds.add_point(item_center);
-    }
+    bounds3 centroid_bounds = parallel_reduce_range<bounds3>(
+        start, end, num_threads,
+        [&](int first, int last, bounds3& u) {
+            for (int i = first; i < last; ++i) {
+                vec3 item_center = 0.5f * (lowers[indices[i]] + uppers[indices[i]]);
+                u.add_point(item_center);
+            }
+        },
+        [](bounds3& u, const bounds3& partial) { u = bounds_union(u, partial); }
+    );
     vec3 edges = centroid_bounds.edges();
 
     split_axis = longest_axis(edges);
@@ -433,26 +490,49 @@ float TopDownBVHBuilder::partition_sah_indices(
         return range_start;
     }
 
-    std::fill(buckets_counts, buckets_counts + SAH_NUM_BUCKETS, 0);
-    for (int item_idx = start; item_idx < end; item_idx++) {
-        vec3 item_center = 0.5f * (lowers[indices[item_idx]] + uppers[indices[item_idx]]);
-        int bucket_idx = SAH_NUM_BUCKETS * (item_center[split_axis] - range_start) / (range_end - range_start);
-        // clamp into valid range [0, SAH_NUM_BUCKETS-1]
-        if (bucket_idx < 0)
-            bucket_idx = 0;
-        if (bucket_idx >= SAH_NUM_BUCKETS)
-            bucket_idx = SAH_NUM_BUCKETS - 1;
+    struct Buckets {
+        Buckets() { std::fill(counts, counts + SAH_NUM_BUCKETS, 0); }
 
-        bounds3 item_bound(lowers[indices[item_idx]], uppers[indices[item_idx]]);
+        int counts[SAH_NUM_BUCKETS];
+        bounds3 bounds[SAH_NUM_BUCKETS];
+    };
 
-        if (buckets_counts[bucket_idx]) {
-            buckets[bucket_idx] = bounds_union(item_bound, buckets[bucket_idx]);
-        } else {
-            buckets[bucket_idx] = item_bound;
+    const Buckets binned = parallel_reduce_range<Buckets>(
+        start, end, num_threads,
+        [&](int first, int last, Buckets& b) {
+            for (int item_idx = first; item_idx < last; item_idx++) {
+                vec3 item_center = 0.5f * (lowers[indices[item_idx]] + uppers[indices[item_idx]]);
+                int bucket_idx = SAH_NUM_BUCKETS * (item_center[split_axis] - range_start) / (range_end - range_start);
+                // clamp into valid range [0, SAH_NUM_BUCKETS-1]
+                if (bucket_idx < 0)
+                    bucket_idx = 0;
+                if (bucket_idx >= SAH_NUM_BUCKETS)
+                    bucket_idx = SAH_NUM_BUCKETS - 1;
+
+                bounds3 item_bound(lowers[indices[item_idx]], uppers[indices[item_idx]]);
+
+                if (b.counts[bucket_idx]) {
+                    b.bounds[bucket_idx] = bounds_union(item_bound, b.bounds[bucket_idx]);
+                } else {
+                    b.bounds[bucket_idx] = item_bound;
+                }
+
+                b.counts[bucket_idx]++;
+            }
+        },
+        [](Buckets& b, const Buckets& partial) {
+            for (int i = 0; i < SAH_NUM_BUCKETS; ++i) {
+                if (!partial.counts[i])
+                    continue;
+
+                b.bounds[i] = b.counts[i] ? bounds_union(b.bounds[i], partial.bounds[i]) : partial.bounds[i];
+                b.counts[i] += partial.counts[i];
+            }
         }
+    );
 
-        buckets_counts[bucket_idx]++;
-    }
+    const int* buckets_counts = binned.counts;
+    const bounds3* buckets = binned.bounds;
 
     bounds3 left;
     bounds3 right;
@@ -506,6 +586,205 @@ float TopDownBVHBuilder::partition_sah_indices(
 }
 
 
+int TopDownBVHBuilder::split_range(
+    const vec3* lowers, const vec3* uppers, int* indices, int start, int end, bounds3 range_bounds, int num_threads
+)
+{
+    // Partition indices[start, end) in place and return the first index of the right half.
+    int split = -1;
+    if (constructor_type == BVH_CONSTRUCTOR_SAH)
+    // SAH constructor
+    {
+        int split_axis = -1;
+        float split_point
+            = partition_sah_indices(lowers, uppers, indices, start, end, range_bounds, split_axis, num_threads);
+        auto boundary = std::partition(indices + start, indices + end, [&](int i) {
+            return 0.5f * (lowers[i] + uppers[i])[split_axis] < split_point;
+        });
+
+        split = std::distance(indices + start, boundary) + start;
+    } else if (constructor_type == BVH_CONSTRUCTOR_MEDIAN)
+    // Median constructor
+    {
+        split = partition_median(lowers, uppers, indices, start, end, range_bounds);
+    } else {
+        printf("Unknown type of BVH constructor: %d!\n", constructor_type);
+        return -1;
+    }
+
+    if (split == start || split == end) {
+        // partitioning failed, split down the middle
+        split = (start + end) / 2;
+    }
+
+    return split;
+}
+
+
+void TopDownBVHBuilder::build_root(BVH& bvh, const vec3* lowers, const vec3* uppers, int n)
+{
+    const int num_threads = cpu_algorithm_threads();
+
+    if (num_threads > 1 && n > kParallelSubtreeMinSize)
+        build_parallel(bvh, lowers, uppers, n, num_threads);
+    else
+        build_recursive(bvh, lowers, uppers, 0, n, 0, -1);
+}
+
+
+void TopDownBVHBuilder::build_parallel(BVH& bvh, const vec3* lowers, const vec3* uppers, int n, int num_threads)
+{
+    // Breakdown of the multi-threaded build:
+    // 1. Split the top of the tree on the calling thread, binning large ranges in parallel, until the
+    // remaining ranges are small enough to be handed out as independent subtrees.
+    // 2. Build the subtrees concurrently with build_recursive() into private node buffers. Each subtree
+    // only touches its own slice of primitive_indices.
+    // 3. Number the top nodes and subtrees in depth-first order and splice the subtrees into the tree.
+    // Every split is computed exactly as in the serial build, so the resulting tree is identical.
+
+    struct TopNode {
+        bounds3 bounds;
+        int depth;
+        int left;
+        int right;
+        int subtree;
+    };
+
+    struct Subtree {
+        int start;
+        int end;
+        int depth;
+        int parent;
+        int offset;
+        int num_nodes;
+        int num_leaf_nodes;
+        int max_depth;
+        std::vector<BVHPackedNodeHalf> node_lowers;
+        std::vector<BVHPackedNodeHalf> node_uppers;
+        std::vector<int> node_parents;
+    };
+
+    // aim for several subtrees per thread so that work stealing can balance uneven splits
+    const int subtree_size = std::max(kParallelSubtreeMinSize, n / (8 * num_threads));
+
+    std::vector<TopNode> top_nodes;
+    std::vector<Subtree> subtrees;
+
+    // 1. Split the top of the tree
+    std::function<int(int, int, int)> split_top = [&](int start, int end, int depth) -> int {
+        const int count = end - start;
+        const int top_index = int(top_nodes.size());
+        top_nodes.push_back({ bounds3(), depth, -1, -1, -1 });
+
+        if (count <= subtree_size || count <= bvh.leaf_size || depth >= BVH_QUERY_STACK_SIZE) {
+            Subtree subtree {};
+            subtree.start = start;
+            subtree.end = end;
+            subtree.depth = depth;
+            top_nodes[top_index].subtree = int(subtrees.size());
+            subtrees.push_back(std::move(subtree));
+            return top_index;
+        }
+
+        const bounds3 b = calc_bounds(lowers, uppers, bvh.primitive_indices, start, end, num_threads);
+        const int split = split_range(lowers, uppers, bvh.primitive_indices, start, end, b, num_threads);
+
+        const int left = split_top(start, split, depth + 1);
+        const int right = split_top(split, end, depth + 1);
+
+        top_nodes[top_index].bounds = b;
+        top_nodes[top_index].left = left;
+        top_nodes[top_index].right = right;
+        return top_index;
+    };
+
+    split_top(0, n, 0);
+
+    // 2. Build the subtrees
+    parallel_for(subtrees.size(), 1, num_threads, [&](size_t first, size_t last) {
+        for (size_t i = first; i < last; ++i) {
+            Subtree& subtree = subtrees[i];
+            const int max_nodes = 2 * (subtree.end - subtree.start) - 1;
+
+            subtree.node_lowers.resize(max_nodes);
+            subtree.node_uppers.resize(max_nodes);
+            subtree.node_parents.resize(max_nodes);
+
+            BVH local;
+            memset(&local, 0, sizeof(BVH));
+            local.node_lowers = subtree.node_lowers.data();
+            local.node_uppers = subtree.node_uppers.data();
+            local.node_parents = subtree.node_parents.data();
+            local.primitive_indices = bvh.primitive_indices;
+            local.max_nodes = max_nodes;
+            local.leaf_size = bvh.leaf_size;
+
+            build_recursive(local, lowers, uppers, subtree.start, subtree.end, subtree.depth, -1);
+
+            subtree.num_nodes = local.num_nodes;
+            subtree.num_leaf_nodes = local.num_leaf_nodes;
+            subtree.max_depth = local.max_depth;
+        }
+    });
+
+    // 3. Number the nodes in the same depth-first order as the serial build
+    bvh.num_nodes = 0;
+    bvh.num_leaf_nodes = 0;
+
+    std::function<int(int, int)> place = [&](int top_index, int parent) -> int {
+        const TopNode& top = top_nodes[top_index];
+        const int node_index = bvh.num_nodes;
+
+        if (top.subtree >= 0) {
+            Subtree& subtree = subtrees[top.subtree];
+            subtree.offset = node_index;
+            subtree.parent = parent;
+
+            bvh.num_nodes += subtree.num_nodes;
+            bvh.num_leaf_nodes += subtree.num_leaf_nodes;
+            bvh.max_depth = std::max(bvh.max_depth, subtree.max_depth);
+            return node_index;
+        }
+
+        bvh.num_nodes++;
+        bvh.max_depth = std::max(bvh.max_depth, top.depth);
+
+        const int left_child = place(top.left, node_index);
+        const int right_child = place(top.right, node_index);
+
+        bvh.node_lowers[node_index] = make_node(top.bounds.lower, left_child, false);
+        bvh.node_uppers[node_index] = make_node(top.bounds.upper, right_child, false);
+        bvh.node_parents[node_index] = parent;
+        return node_index;
+    };
+
+    place(0, -1);
+
+    parallel_for(subtrees.size(), 1, num_threads, [&](size_t first, size_t last) {
+        for (size_t i = first; i < last; ++i) {
+            const Subtree& subtree = subtrees[i];
+
+            for (int j = 0; j < subtree.num_nodes; ++j) {
+                BVHPackedNodeHalf lower = subtree.node_lowers[j];
+                BVHPackedNodeHalf upper = subtree.node_uppers[j];
+
+                // leaves reference primitive ranges, which are already global
+                if (!lower.b) {
+                    lower.i += subtree.offset;
+                    upper.i += subtree.offset;
+                }
+
+                const int parent = subtree.node_parents[j];
+
+                bvh.node_lowers[subtree.offset + j] = lower;
+                bvh.node_uppers[subtree.offset + j] = upper;
+                bvh.node_parents[subtree.offset + j] = parent >= 0 ? parent + subtree.offset : subtree.parent;
+            }
+        }
+    });
+}
+
+
 int TopDownBVHBuilder::build_recursive(
     BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, int depth, int parent, int assigned_node
 )
@@ -535,30 +814,9 @@ int TopDownBVHBuilder::build_recursive(
         return node_index;
     }
 
-    int split = -1;
-    if (constructor_type == BVH_CONSTRUCTOR_SAH)
-    // SAH constructor
-    {
-        int split_axis = -1;
-        float split_point = partition_sah_indices(lowers, uppers, bvh.primitive_indices, start, end, b, split_axis);
-        auto boundary = std::partition(bvh.primitive_indices + start, bvh.primitive_indices + end, [&](int i) {
-            return 0.5f * (lowers[i] + uppers[i])[split_axis] < split_point;
-        });
-
-        split = std::distance(bvh.primitive_indices + start, boundary) + start;
-    } else if (constructor_type == BVH_CONSTRUCTOR_MEDIAN)
-    // Median constructor
-    {
-        split = partition_median(lowers, uppers, bvh.primitive_indices, start, end, b);
-    } else {
-        printf("Unknown type of BVH constructor: %d!\n", constructor_type);
+    int split = split_range(lowers, uppers, bvh.primitive_indices, start, end, b);
+    if (split < 0)
         return -1;
-    }
-
-    if (split == start || split == end) {
-        // partitioning failed, split down the middle
-        split = (start + end) / 2;
-    }
 
     int left_child = build_recursive(bvh, lowers, uppers, start, split, depth + 1, node_index);
     int right_child = build_recursive(bvh, lowers, uppers, split, end, depth + 1, node_index);
@@ -6,8 +6,10 @@
 #include "apic.h"
 #include "apic_internal.h"
 #include "apic_types.h"
+#include "thread_pool.h"
 
 #include <cstdint>
+#include <vector>
 
 // Record a host run-length-encode into the active APIC byte stream; returns
 // true if recorded (and therefore should NOT execute now). Mirrors the sort
@@ -42,6 +44,67 @@ apic_capture_runlength_encode(uint64_t values, uint64_t run_values, uint64_t run
     return true;
 }
 
+// Inputs shorter than this are encoded serially; below it the fork/join cost outweighs the gain.
+static constexpr int kParallelRunlengthEncodeMinSize = 1 << 16;
+
+// Two-pass parallel encoder: count the runs that start in each block, scan the counts into
+// output offsets, then let each block emit its runs. A run that crosses into the next block
+// is emitted entirely by the block where it starts, so every input element is visited at most
+// twice overall.
+template <typename T>
+void runlength_encode_host_parallel(
+    int n, const T* values, T* run_values, int* run_lengths, int* run_count, int num_threads
+)
+{
+    const int num_blocks = num_threads;
+    auto block_begin = [=](int b) { return int(int64_t(n) * b / num_blocks); };
+
+    std::vector<int> block_offsets(num_blocks + 1, 0);
+
+    wp::parallel_for(num_blocks, 1, num_threads, [&](size_t first, size_t last) {
+        for (size_t b = first; b < last; ++b) {
+            const int begin = block_begin(int(b));
+            const int end = block_begin(int(b) + 1);
+
+            int count = 0;
+            for (int i = begin; i < end; ++i)
+                count += (i == 0 || !(values[i] == values[i - 1])) ? 1 : 0;
+
+            block_offsets[b + 1] = count;
+        }
+    });
+
+    for (int b = 0; b < num_blocks; ++b)
+        block_offsets[b + 1] += block_offsets[b];
+
+    wp::parallel_for(num_blocks, 1, num_threads, [&](size_t first, size_t last) {
+        for (size_t b = first; b < last; ++b) {
+            const int end = block_begin(int(b) + 1);
+
+            int run = block_offsets[b];
+            int i = block_begin(int(b));
+
+            // skip the tail of a run that started in an earlier block
+            while (i < end && i > 0 && values[i] == values[i - 1])
+                ++i;
+
+            while (i < end) {
+                int j = i + 1;
+                while (j < n && values[j] == values[i])
+                    ++j;
+
+                run_values[run] = values[i];
+                run_lengths[run] = j - i;
+                ++run;
+
+                i = j;
+            }
+        }
+    });
+
+    *run_count = block_offsets[num_blocks];
+}
+
 template <typename T>
 void runlength_encode_host(int n, const T* values, T* run_values, int* run_lengths, int* run_count)
 {
@@ -50,6 +113,12 @@ void runlength_encode_host(int n, const T* values, T* run_values, int* run_lengt
         return;
     }
 
+    const int num_threads = wp::cpu_algorithm_threads();
+    if (num_threads > 1 && n >= kParallelRunlengthEncodeMinSize) {
+        runlength_encode_host_parallel(n, values, run_values, run_lengths, run_count, num_threads);
+        return;
+    }
+
     const T* end = values + n;
 
     *run_count = 1;
@@ -4,6 +4,35 @@
 #include "warp.h"
 
 #include "scan.h"
+#include "thread_pool.h"
+
+#include <vector>
+
+namespace {
+
+// Inputs shorter than this are scanned serially; below it the fork/join cost outweighs the gain.
+constexpr int kParallelScanMinSize = 1 << 16;
+
+// Scan component k of elements [begin, end) starting from sum.
+template <typename T>
+void scan_range(
+    const T* values_in, T* values_out, int begin, int end, int in_stride, int out_stride, int k, T sum, bool inclusive
+)
+{
+    for (int i = begin; i < end; ++i) {
+        const T value = values_in[i * in_stride + k];
+
+        if (inclusive) {
+            sum += value;
+            values_out[i * out_stride + k] = sum;
+        } else {
+            values_out[i * out_stride + k] = sum;
+            sum += value;
+        }
+    }
+}
+
+}  // anonymous namespace
 
 template <typename T>
 void scan_host(
@@ -19,21 +48,57 @@ void scan_host(
     const int in_stride = in_byte_stride / sizeof(T);
     const int out_stride = out_byte_stride / sizeof(T);
 
-    for (int k = 0; k < type_length; ++k) {
-        T sum = T(0);
+    const int num_threads = wp::cpu_algorithm_threads();
+
+    if (num_threads <= 1 || n < kParallelScanMinSize) {
+        for (int k = 0; k < type_length; ++k)
+            scan_range(values_in, values_out, 0, n, in_stride, out_stride, k, T(0), inclusive);
+        return;
+    }
 
-        for (int i = 0; i < n; ++i) {
-            const T value = values_in[i * in_stride + k];
+    // Blocked two-pass scan: reduce each block, scan the block totals, then scan every
+    // block again starting from its offset. Reading element i before writing it keeps
+    // this valid for in-place scans.
+    const int num_blocks = num_threads;
+    auto block_begin = [=](int b) { return int(int64_t(n) * b / num_blocks); };
 
-            if (inclusive) {
-                sum += value;
-                values_out[i * out_stride + k] = sum;
-            } else {
-                values_out[i * out_stride + k] = sum;
-                sum += value;
+    std::vector<T> block_sums(size_t(num_blocks) * type_length, T(0));
+
+    wp::parallel_for(num_blocks, 1, num_threads, [&](size_t first, size_t last) {
+        for (size_t b = first; b < last; ++b) {
+            const int begin = block_begin(int(b));
+            const int end = block_begin(int(b) + 1);
+
+            for (int k = 0; k < type_length; ++k) {
+                T sum = T(0);
+                for (int i = begin; i < end; ++i)
+                    sum += values_in[i * in_stride + k];
+                block_sums[b * type_length + k] = sum;
             }
         }
+    });
+
+    for (int k = 0; k < type_length; ++k) {
+        T sum = T(0);
+        for (int b = 0; b < num_blocks; ++b) {
+            const T block_sum = block_sums[b * type_length + k];
+            block_sums[b * type_length + k] = sum;
+            sum += block_sum;
+        }
     }
+
+    wp::parallel_for(num_blocks, 1, num_threads, [&](size_t first, size_t last) {
+        for (size_t b = first; b < last; ++b) {
+            const int begin = block_begin(int(b));
+            const int end = block_begin(int(b) + 1);
+
+            for (int k = 0; k < type_length; ++k)
+                scan_range(
+                    values_in, values_out, begin, end, in_stride, out_stride, k, block_sums[b * type_length + k],
+                    inclusive
+                );
+        }
+    });
 }
 
 template <typename T> void scan_host(const T* values_in, T* values_out, int n, bool inclusive)
@@ -9,9 +9,12 @@
 #include "error.h"
 #include "sort.h"
 #include "string.h"
+#include "thread_pool.h"
 
 #include <cassert>
 #include <cstdint>
+#include <utility>
+#include <vector>
 
 template <int Size> struct SortPayload {
     uint8_t data[Size];
@@ -82,6 +85,109 @@ static bool apic_capture_radix_sort(
     return true;
 }
 
+// Inputs shorter than this are sorted serially; below it the fork/join cost outweighs the gain.
+static constexpr int kParallelRadixSortMinSize = 1 << 16;
+
+// Multi-threaded LSD radix sort with 8-bit digits. Each pass splits the input into one
+// contiguous block per thread, builds per-block digit histograms in parallel, turns them
+// into per-block output offsets (digit-major, block-minor), and scatters every block in
+// parallel. Blocks keep their input order within a digit, so the sort stays stable.
+template <typename KeyType, typename ValueType, typename RadixKeyType, typename KeyToRadix>
+void radix_sort_pairs_host_parallel(
+    KeyType* keys,
+    ValueType* values,
+    int n,
+    int offset_to_scratch_memory,
+    int begin_bit,
+    int end_bit,
+    KeyToRadix key_to_radix,
+    int num_threads
+)
+{
+    constexpr int digitBits = 8;
+    constexpr int bucketCount = 1 << digitBits;
+
+    const int num_blocks = num_threads;
+    auto block_begin = [=](int b) { return int(int64_t(n) * b / num_blocks); };
+
+    std::vector<int> offsets(size_t(num_blocks) * bucketCount);
+
+    KeyType* readKeys = keys;
+    ValueType* readValues = values;
+    KeyType* writeKeys = keys + offset_to_scratch_memory;
+    ValueType* writeValues = values + offset_to_scratch_memory;
+
+    for (int shift = begin_bit; shift < end_bit; shift += digitBits) {
+        const int passBits = (end_bit - shift) < digitBits ? (end_bit - shift) : digitBits;
+        const RadixKeyType mask = (RadixKeyType(1) << passBits) - 1;
+
+        wp::parallel_for(num_blocks, 1, num_threads, [&](size_t first, size_t last) {
+            for (size_t b = first; b < last; ++b) {
+                int* hist = offsets.data() + b * bucketCount;
+                memset(hist, 0, sizeof(int) * bucketCount);
+
+                const int end = block_begin(int(b) + 1);
+                for (int i = block_begin(int(b)); i < end; ++i)
+                    ++hist[(key_to_radix(readKeys[i]) >> shift) & mask];
+            }
+        });
+
+        // convert the histograms to output offsets in-place, skipping passes where every
+        // key has the same digit since they would not change the order
+        bool single_digit = false;
+        int off = 0;
+        for (int d = 0; d < bucketCount; ++d) {
+            int digit_count = 0;
+            for (int b = 0; b < num_blocks; ++b) {
+                int& entry = offsets[size_t(b) * bucketCount + d];
+                const int count = entry;
+                entry = off;
+                off += count;
+                digit_count += count;
+            }
+
+            if (digit_count == n) {
+                single_digit = true;
+                break;
+            }
+        }
+
+        if (single_digit)
+            continue;
+
+        wp::parallel_for(num_blocks, 1, num_threads, [&](size_t first, size_t last) {
+            for (size_t b = first; b < last; ++b) {
+                int* offset = offsets.data() + b * bucketCount;
+
+                const int end = block_begin(int(b) + 1);
+                for (int i = block_begin(int(b)); i < end; ++i) {
+                    const KeyType k = readKeys[i];
+                    const int dst = offset[(key_to_radix(k) >> shift) & mask]++;
+
+                    writeKeys[dst] = k;
+                    writeValues[dst] = readValues[i];
+                }
+            }
+        });
+
+        std::swap(readKeys, writeKeys);
+        std::swap(readValues, writeValues);
+    }
+
+    // an odd number of scatter passes leaves the result in the scratch half
+    if (readKeys != keys) {
+        wp::parallel_for(num_blocks, 1, num_threads, [&](size_t first, size_t last) {
+            for (size_t b = first; b < last; ++b) {
+                const int begin = block_begin(int(b));
+                const int count = block_begin(int(b) + 1) - begin;
+
+                memcpy(keys + begin, readKeys + begin, sizeof(KeyType) * count);
+                memcpy(values + begin, readValues + begin, sizeof(ValueType) * count);
+            }
+        });
+    }
+}
+
 // Only integer keys (bit count 32 or 64) are supported. Floats need to get converted into int first. see
 // radix_float_to_int.
 template <typename KeyType, typename ValueType, typename RadixKeyType, typename KeyToRadix>
@@ -102,6 +208,14 @@ void radix_sort_pairs_host(
         return;
     }
 
+    const int num_threads = wp::cpu_algorithm_threads();
+    if (num_threads > 1 && n >= kParallelRadixSortMinSize) {
+        radix_sort_pairs_host_parallel<KeyType, ValueType, RadixKeyType>(
+            keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, key_to_radix, num_threads
+        );
+        return;
+    }
+
     const int requestedPasses = (end_bit - begin_bit + 15) / 16;
     const int numPasses = requestedPasses < maxPasses ? requestedPasses : maxPasses;
 
@@ -303,26 +417,41 @@ void radix_sort_pairs_host(double* keys, int* values, int n, int begin_bit, int
     radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int));
 }
 
+// Segments are independent, so with enough of them each thread sorts whole segments;
+// otherwise the segments are sorted one after another, each using all threads.
+template <typename KeyType>
+void segmented_sort_pairs_host_impl(
+    KeyType* keys, int* values, int n, int* segment_start_indices, int* segment_end_indices, int num_segments
+)
+{
+    auto sort_segments = [&](size_t first, size_t last) {
+        for (size_t i = first; i < last; ++i) {
+            const int start = segment_start_indices[i];
+            const int end = segment_end_indices[i];
+            radix_sort_pairs_host(keys + start, values + start, end - start, n, 0, 32, sizeof(int));
+        }
+    };
+
+    const int num_threads = wp::cpu_algorithm_threads();
+    if (num_threads > 1 && num_segments >= num_threads && n >= kParallelRadixSortMinSize) {
+        wp::parallel_for(num_segments, wp::parallel_for_grain(num_segments, num_threads), num_threads, sort_segments);
+    } else {
+        sort_segments(0, num_segments);
+    }
+}
+
 void segmented_sort_pairs_host(
     float* keys, int* values, int n, int* segment_start_indices, int* segment_end_indices, int num_segments
 )
 {
-    for (int i = 0; i < num_segments; ++i) {
-        const int start = segment_start_indices[i];
-        const int end = segment_end_indices[i];
-        radix_sort_pairs_host(keys + start, values + start, end - start, n, 0, 32, sizeof(int));
-    }
+    segmented_sort_pairs_host_impl(keys, values, n, segment_start_indices, segment_end_indices, num_segments);
 }
 
 void segmented_sort_pairs_host(
     int* keys, int* values, int n, int* segment_start_indices, int* segment_end_indices, int num_segments
 )
 {
-    for (int i = 0; i < num_segments; ++i) {
-        const int start = segment_start_indices[i];
-        const int end = segment_end_indices[i];
-        radix_sort_pairs_host(keys + start, values + start, end - start, n, 0, 32, sizeof(int));
-    }
+    segmented_sort_pairs_host_impl(keys, values, n, segment_start_indices, segment_end_indices, num_segments);
 }
 
 
@@ -0,0 +1,210 @@
+// SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: Apache-2.0
+
+#include "thread_pool.h"
+
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <cstdint>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#if !defined(_WIN32)
+#include <unistd.h>
+#endif
+
+namespace {
+
+// One contiguous slice of the iteration space. The owner and any thieves claim
+// chunks from the front with fetch_add, so a slice never needs to be re-split.
+struct alignas(64) Partition {
+    std::atomic<size_t> next;
+    size_t end;
+};
+
+struct Job {
+    wp::parallel_for_fn fn;
+    void* context;
+    size_t grain;
+    int num_partitions;
+    Partition* partitions;
+};
+
+std::atomic<int> g_cpu_max_threads { 1 };
+
+// Set on pool workers and on the calling thread while it executes a job, so
+// nested parallel_for() calls degrade to serial loops instead of deadlocking.
+thread_local bool t_in_parallel_region = false;
+
+void run_partitions(const Job& job, int self)
+{
+    // drain our own partition first, then steal from the others in round-robin order
+    for (int k = 0; k < job.num_partitions; ++k) {
+        Partition& partition = job.partitions[(self + k) % job.num_partitions];
+
+        for (;;) {
+            const size_t begin = partition.next.fetch_add(job.grain, std::memory_order_relaxed);
+            if (begin >= partition.end)
+                break;
+
+            job.fn(begin, std::min(begin + job.grain, partition.end), job.context);
+        }
+    }
+}
+
+class ThreadPool {
+public:
+    // Run a job on the calling thread plus (job.num_partitions - 1) workers.
+    void run(const Job& job)
+    {
+        // only one parallel region runs at a time; concurrent callers queue up here
+        std::lock_guard<std::mutex> launch_lock(launch_mutex);
+
+        const int num_workers = job.num_partitions - 1;
+        while (int(workers.size()) < num_workers) {
+            const int index = int(workers.size()) + 1;
+            workers.emplace_back([this, index] { worker_main(index); });
+        }
+
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            current = &job;
+            num_active = num_workers;
+            num_pending = num_workers;
+            ++generation;
+        }
+        start_cv.notify_all();
+
+        t_in_parallel_region = true;
+        run_partitions(job, 0);
+        t_in_parallel_region = false;
+
+        std::unique_lock<std::mutex> lock(mutex);
+        done_cv.wait(lock, [this] { return num_pending == 0; });
+        current = nullptr;
+    }
+
+private:
+    void worker_main(int index)
+    {
+        t_in_parallel_region = true;
+
+        uint64_t seen_generation = 0;
+        for (;;) {
+            const Job* job = nullptr;
+            {
+                std::unique_lock<std::mutex> lock(mutex);
+                start_cv.wait(lock, [&] { return generation != seen_generation; });
+                seen_generation = generation;
+
+                // workers beyond the requested thread count sit this job out
+                if (index > num_active)
+                    continue;
+
+                job = current;
+            }
+
+            run_partitions(*job, index);
+
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                if (--num_pending == 0)
+                    done_cv.notify_one();
+            }
+        }
+    }
+
+    std::mutex launch_mutex;
+    std::mutex mutex;
+    std::condition_variable start_cv;
+    std::condition_variable done_cv;
+    std::vector<std::thread> workers;
+    const Job* current = nullptr;
+    uint64_t generation = 0;
+    int num_active = 0;
+    int num_pending = 0;
+};
+
+ThreadPool& get_thread_pool()
+{
+    // The pool is intentionally leaked: joining workers from a static destructor
+    // during process shutdown can deadlock, and idle workers cost nothing.
+    static std::mutex pool_mutex;
+    static ThreadPool* pool = nullptr;
+#if !defined(_WIN32)
+    // worker threads do not survive fork(), so a forked child starts a fresh pool
+    static pid_t pool_pid = 0;
+#endif
+
+    std::lock_guard<std::mutex> lock(pool_mutex);
+#if !defined(_WIN32)
+    if (pool && pool_pid != getpid())
+        pool = nullptr;
+    pool_pid = getpid();
+#endif
+    if (!pool)
+        pool = new ThreadPool();
+
+    return *pool;
+}
+
+}  // anonymous namespace
+
+namespace wp {
+
+int cpu_hardware_threads()
+{
+    const unsigned int n = std::thread::hardware_concurrency();
+    return n > 0 ? int(n) : 1;
+}
+
+int cpu_resolve_thread_count(int num_threads) { return num_threads <= 0 ? cpu_hardware_threads() : num_threads; }
+
+int cpu_max_threads() { return g_cpu_max_threads.load(std::memory_order_relaxed); }
+
+void cpu_set_max_threads(int num_threads) { g_cpu_max_threads.store(num_threads, std::memory_order_relaxed); }
+
+int cpu_algorithm_threads() { return t_in_parallel_region ? 1 : cpu_resolve_thread_count(cpu_max_threads()); }
+
+void parallel_for(size_t count, size_t grain, int num_threads, parallel_for_fn fn, void* context)
+{
+    if (count == 0)
+        return;
+
+    if (grain == 0)
+        grain = 1;
+
+    const size_t num_chunks = (count + grain - 1) / grain;
+
+    num_threads = cpu_resolve_thread_count(num_threads);
+    if (size_t(num_threads) > num_chunks)
+        num_threads = int(num_chunks);
+
+    if (num_threads <= 1 || t_in_parallel_region) {
+        fn(0, count, context);
+        return;
+    }
+
+    // split on chunk boundaries so every claimed chunk is grain-aligned
+    std::vector<Partition> partitions(num_threads);
+    for (int i = 0; i < num_threads; ++i) {
+        const size_t first_chunk = num_chunks * size_t(i) / size_t(num_threads);
+        const size_t last_chunk = num_chunks * size_t(i + 1) / size_t(num_threads);
+
+        partitions[i].next.store(first_chunk * grain, std::memory_order_relaxed);
+        partitions[i].end = std::min(count, last_chunk * grain);
+    }
+
+    Job job;
+    job.fn = fn;
+    job.context = context;
+    job.grain = grain;
+    job.num_partitions = num_threads;
+    job.partitions = partitions.data();
+
+    get_thread_pool().run(job);
+}
+
+}  // namespace wp
@@ -0,0 +1,57 @@
+// SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: Apache-2.0
+
+#pragma once
+
+#include <cstddef>
+
+namespace wp {
+
+// Body of a parallel loop, called with a half-open index range [begin, end).
+typedef void (*parallel_for_fn)(size_t begin, size_t end, void* context);
+
+// Number of hardware threads reported by the host (at least 1).
+int cpu_hardware_threads();
+
+// Resolve a requested host thread count: values <= 0 select all hardware threads.
+int cpu_resolve_thread_count(int num_threads);
+
+// Thread count used by the built-in host algorithms (radix sort, scan, run-length
+// encode, BVH and volume construction), mirrored from warp.config.cpu_max_threads. Defaults to 1 (serial).
+int cpu_max_threads();
+void cpu_set_max_threads(int num_threads);
+
+// Thread count a host algorithm should use when called from the current thread:
+// cpu_max_threads() resolved against the hardware, or 1 inside a parallel region.
+int cpu_algorithm_threads();
+
+// Run fn over [0, count) on up to num_threads host threads.
+//
+// The range is split into one contiguous partition per participating thread.
+// Each thread claims grain-sized chunks from the front of its own partition and,
+// once that is exhausted, steals chunks from the other partitions, so uneven
+// per-index costs are balanced without giving up locality in the common case.
+// The calling thread always participates; the call returns after every chunk
+// has been processed. Calls made from inside a parallel region, or with
+// num_threads <= 1, run serially on the calling thread.
+void parallel_for(size_t count, size_t grain, int num_threads, parallel_for_fn fn, void* context);
+
+template <typename Body> void parallel_for(size_t count, size_t grain, int num_threads, const Body& body)
+{
+    struct Trampoline {
+        static void call(size_t begin, size_t end, void* context) { (*static_cast<const Body*>(context))(begin, end); }
+    };
+
+    parallel_for(count, grain, num_threads, &Trampoline::call, const_cast<Body*>(&body));
+}
+
+// Default chunk size for splitting count items across num_threads threads:
+// roughly eight chunks per thread so that stealing has something to balance.
+inline size_t parallel_for_grain(size_t count, int num_threads, size_t min_grain = 1)
+{
+    const size_t chunks = size_t(num_threads > 1 ? num_threads : 1) * 8;
+    size_t grain = (count + chunks - 1) / chunks;
+    return grain < min_grain ? min_grain : grain;
+}
+
+}  // namespace wp
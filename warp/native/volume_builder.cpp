@@ -3,11 +3,13 @@
 
 #include "warp.h"
 
+#include "thread_pool.h"
 #include "volume_builder.h"
 
 #include <algorithm>
 #include <cstring>
 #include <limits>
+#include <utility>
 #include <vector>
 
 namespace {
@@ -61,12 +63,82 @@ rebuild_point_to_coord(const void* points, size_t tid, bool points_in_world_spac
     return reinterpret_cast<const nanovdb::Coord*>(points)[tid];
 }
 
+// Point sets shorter than this are converted to keys and sorted on the calling thread.
+constexpr size_t kParallelPointsMinSize = 1 << 14;
+// Node loops over fewer nodes than this run on the calling thread.
+constexpr size_t kParallelNodesMinSize = 64;
+
+// Call body(i) for every i in [0, count), on up to cpu_algorithm_threads() threads when count >= min_size.
+// Loop bodies only write to the node (or key) they are given, so the result does not depend on the thread count.
+template <typename Body> void host_for(size_t count, size_t min_size, const Body& body)
+{
+    const int num_threads = count >= min_size ? wp::cpu_algorithm_threads() : 1;
+    wp::parallel_for(count, wp::parallel_for_grain(count, num_threads), num_threads, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; ++i) {
+            body(i);
+        }
+    });
+}
+
+void rebuild_sort(std::vector<uint64_t>& keys)
+{
+    const size_t n = keys.size();
+    const int num_threads = n >= kParallelPointsMinSize ? wp::cpu_algorithm_threads() : 1;
+    if (num_threads <= 1) {
+        std::sort(keys.begin(), keys.end());
+        return;
+    }
+
+    // sort equal-sized runs concurrently, then merge neighboring runs pairwise until one run is left
+    const size_t num_runs = size_t(num_threads) * 2;
+    const size_t run_size = (n + num_runs - 1) / num_runs;
+    wp::parallel_for(num_runs, 1, num_threads, [&](size_t first, size_t last) {
+        for (size_t r = first; r < last; ++r) {
+            const size_t begin = std::min(n, r * run_size);
+            const size_t end = std::min(n, begin + run_size);
+            std::sort(keys.begin() + begin, keys.begin() + end);
+        }
+    });
+
+    std::vector<uint64_t> merged(n);
+    for (size_t width = run_size; width < n; width *= 2) {
+        const size_t num_pairs = (n + 2 * width - 1) / (2 * width);
+        wp::parallel_for(num_pairs, 1, num_threads, [&](size_t first, size_t last) {
+            for (size_t p = first; p < last; ++p) {
+                const size_t begin = p * 2 * width;
+                const size_t mid = std::min(n, begin + width);
+                const size_t end = std::min(n, begin + 2 * width);
+                std::merge(
+                    keys.begin() + begin, keys.begin() + mid, keys.begin() + mid, keys.begin() + end,
+                    merged.begin() + begin
+                );
+            }
+        });
+        keys.swap(merged);
+    }
+}
+
 void rebuild_sort_unique(std::vector<uint64_t>& keys)
 {
-    std::sort(keys.begin(), keys.end());
+    rebuild_sort(keys);
     keys.erase(std::unique(keys.begin(), keys.end()), keys.end());
 }
 
+void rebuild_drop_invalid_keys(std::vector<uint64_t>& keys)
+{
+    // invalid keys sort last
+    keys.erase(std::lower_bound(keys.begin(), keys.end(), REBUILD_INVALID_KEY), keys.end());
+}
+
+// Index range of the sorted child keys whose parent key (child key >> shift) equals parent_key.
+std::pair<size_t, size_t>
+rebuild_child_range(const std::vector<uint64_t>& child_keys, uint64_t parent_key, uint32_t shift)
+{
+    const auto begin = std::lower_bound(child_keys.begin(), child_keys.end(), parent_key << shift);
+    const auto end = std::lower_bound(begin, child_keys.end(), (parent_key + 1u) << shift);
+    return { size_t(begin - child_keys.begin()), size_t(end - child_keys.begin()) };
+}
+
 bool rebuild_count_points(
     HostRebuildScratch& scratch,
     const void* points,
@@ -84,57 +156,59 @@ bool rebuild_count_points(
     scratch = {};
     scratch.active_voxel_grid = active_voxel_grid;
 
-    std::vector<uint64_t> keys;
-    keys.reserve(num_points);
-    for (size_t i = 0; i < num_points; ++i) {
-        if (point_mask && point_mask[i] == 0) {
-            continue;
-        }
-
-        keys.push_back(rebuild_upper_key_from_coord(rebuild_point_to_coord(points, i, points_in_world_space, map)));
-    }
-    if (keys.empty()) {
-        return true;
-    }
+    // masked points map to invalid keys, which sort last and are dropped
+    std::vector<uint64_t> keys(num_points);
+    host_for(num_points, kParallelPointsMinSize, [&](size_t i) {
+        keys[i] = (point_mask && point_mask[i] == 0)
+            ? REBUILD_INVALID_KEY
+            : rebuild_upper_key_from_coord(rebuild_point_to_coord(points, i, points_in_world_space, map));
+    });
     scratch.upper_keys = keys;
     rebuild_sort_unique(scratch.upper_keys);
+    rebuild_drop_invalid_keys(scratch.upper_keys);
+    if (scratch.upper_keys.empty()) {
+        return true;
+    }
 
-    keys.clear();
-    for (size_t i = 0; i < num_points; ++i) {
+    host_for(num_points, kParallelPointsMinSize, [&](size_t i) {
         if (point_mask && point_mask[i] == 0) {
-            continue;
+            keys[i] = REBUILD_INVALID_KEY;
+            return;
         }
 
         const nanovdb::Coord ijk = rebuild_point_to_coord(points, i, points_in_world_space, map);
         const uint64_t upper_key = rebuild_upper_key_from_coord(ijk);
         const auto iter = std::lower_bound(scratch.upper_keys.begin(), scratch.upper_keys.end(), upper_key);
         if (iter == scratch.upper_keys.end() || *iter != upper_key) {
-            keys.push_back(REBUILD_INVALID_KEY);
+            keys[i] = REBUILD_INVALID_KEY;
         } else {
-            keys.push_back(rebuild_hierarchy_key(uint32_t(iter - scratch.upper_keys.begin()), ijk));
+            keys[i] = rebuild_hierarchy_key(uint32_t(iter - scratch.upper_keys.begin()), ijk);
         }
-    }
-    std::sort(keys.begin(), keys.end());
-    while (!keys.empty() && keys.back() == REBUILD_INVALID_KEY) {
-        keys.pop_back();
-    }
+    });
+    rebuild_sort(keys);
+    rebuild_drop_invalid_keys(keys);
     if (keys.empty()) {
         return false;
     }
 
+    // the keys are sorted, so the voxel, leaf, and lower keys derived from them are sorted as well
     if (active_voxel_grid) {
         scratch.voxel_keys = keys;
-        rebuild_sort_unique(scratch.voxel_keys);
+        scratch.voxel_keys.erase(
+            std::unique(scratch.voxel_keys.begin(), scratch.voxel_keys.end()), scratch.voxel_keys.end()
+        );
     }
 
     scratch.leaf_keys.resize(keys.size());
     scratch.lower_keys.resize(keys.size());
-    for (size_t i = 0; i < keys.size(); ++i) {
+    host_for(keys.size(), kParallelPointsMinSize, [&](size_t i) {
         scratch.leaf_keys[i] = keys[i] >> 9u;
         scratch.lower_keys[i] = keys[i] >> 21u;
-    }
-    rebuild_sort_unique(scratch.leaf_keys);
-    rebuild_sort_unique(scratch.lower_keys);
+    });
+    scratch.leaf_keys.erase(std::unique(scratch.leaf_keys.begin(), scratch.leaf_keys.end()), scratch.leaf_keys.end());
+    scratch.lower_keys.erase(
+        std::unique(scratch.lower_keys.begin(), scratch.lower_keys.end()), scratch.lower_keys.end()
+    );
 
     scratch.counts[REBUILD_COUNT_LEAF] = uint32_t(scratch.leaf_keys.size());
     scratch.counts[REBUILD_COUNT_LOWER] = uint32_t(scratch.lower_keys.size());
@@ -255,7 +329,8 @@ void rebuild_init_grid_tree_root(HostRebuildGridData& data)
 void rebuild_build_upper_nodes(HostRebuildGridData& data)
 {
     const uint32_t upper_count = data.scratch->counts[REBUILD_COUNT_UPPER];
-    for (uint32_t tid = 0; tid < upper_count; ++tid) {
+    host_for(upper_count, kParallelNodesMinSize, [&](size_t i) {
+        const uint32_t tid = uint32_t(i);
         const pnanovdb_root_handle_t root = data.getRoot();
         const pnanovdb_upper_handle_t upper = data.getUpper(tid);
         const nanovdb::Coord ijk = rebuild_upper_key_to_coord(data.scratch->upper_keys[tid]);
@@ -272,7 +347,7 @@ void rebuild_build_upper_nodes(HostRebuildGridData& data)
         pnanovdb_write_uint64(data.buf, pnanovdb_address_offset(upper.address, PNANOVDB_UPPER_OFF_FLAGS), 0u);
         rebuild_clear_mask_words(data, upper.address, PNANOVDB_UPPER_OFF_VALUE_MASK, PNANOVDB_UPPER_TABLE_COUNT / 64u);
         rebuild_clear_mask_words(data, upper.address, PNANOVDB_UPPER_OFF_CHILD_MASK, PNANOVDB_UPPER_TABLE_COUNT / 64u);
-    }
+    });
 }
 
 void rebuild_set_upper_background_values(HostRebuildGridData& data)
@@ -282,29 +357,29 @@ void rebuild_set_upper_background_values(HostRebuildGridData& data)
     }
 
     const uint32_t upper_count = data.scratch->counts[REBUILD_COUNT_UPPER];
-    for (uint32_t upper_id = 0; upper_id < upper_count; ++upper_id) {
-        const pnanovdb_upper_handle_t upper = data.getUpper(upper_id);
+    host_for(upper_count, 1, [&](size_t upper_id) {
+        const pnanovdb_upper_handle_t upper = data.getUpper(uint32_t(upper_id));
         for (uint32_t n = 0; n < PNANOVDB_UPPER_TABLE_COUNT; ++n) {
             rebuild_write_background(data, pnanovdb_upper_get_table_address(data.grid_type, data.buf, upper, n));
         }
-    }
+    });
 }
 
 void rebuild_build_lower_nodes(HostRebuildGridData& data)
 {
     const uint32_t lower_count = data.scratch->counts[REBUILD_COUNT_LOWER];
     const uint32_t upper_count = data.scratch->counts[REBUILD_COUNT_UPPER];
-    for (uint32_t tid = 0; tid < lower_count; ++tid) {
+    host_for(lower_count, kParallelNodesMinSize, [&](size_t i) {
+        const uint32_t tid = uint32_t(i);
         const uint64_t lower_key = data.scratch->lower_keys[tid];
         const uint32_t upper_id = uint32_t(lower_key >> 15u);
         if (upper_id >= upper_count) {
-            continue;
+            return;
         }
 
         const pnanovdb_upper_handle_t upper = data.getUpper(upper_id);
         const pnanovdb_lower_handle_t lower = data.getLower(tid);
         const uint32_t upper_offset = uint32_t(lower_key & 32767u);
-        rebuild_set_mask_on(data, upper.address, PNANOVDB_UPPER_OFF_CHILD_MASK, upper_offset);
         pnanovdb_upper_set_table_child(
             data.grid_type, data.buf, upper, upper_offset,
             int64_t(lower.address.byte_offset) - int64_t(upper.address.byte_offset)
@@ -321,7 +396,17 @@ void rebuild_build_lower_nodes(HostRebuildGridData& data)
         pnanovdb_write_uint64(data.buf, pnanovdb_address_offset(lower.address, PNANOVDB_LOWER_OFF_FLAGS), 0u);
         rebuild_clear_mask_words(data, lower.address, PNANOVDB_LOWER_OFF_VALUE_MASK, PNANOVDB_LOWER_TABLE_COUNT / 64u);
         rebuild_clear_mask_words(data, lower.address, PNANOVDB_LOWER_OFF_CHILD_MASK, PNANOVDB_LOWER_TABLE_COUNT / 64u);
-    }
+    });
+
+    // child masks are shared by all children of a node, so each upper node sets the bits of its own lower nodes
+    host_for(upper_count, kParallelNodesMinSize, [&](size_t upper_id) {
+        const pnanovdb_upper_handle_t upper = data.getUpper(uint32_t(upper_id));
+        const std::pair<size_t, size_t> children = rebuild_child_range(data.scratch->lower_keys, upper_id, 15u);
+        for (size_t tid = children.first; tid < children.second; ++tid) {
+            const uint32_t upper_offset = uint32_t(data.scratch->lower_keys[tid] & 32767u);
+            rebuild_set_mask_on(data, upper.address, PNANOVDB_UPPER_OFF_CHILD_MASK, upper_offset);
+        }
+    });
 }
 
 void rebuild_set_lower_background_values(HostRebuildGridData& data)
@@ -331,31 +416,32 @@ void rebuild_set_lower_background_values(HostRebuildGridData& data)
     }
 
     const uint32_t lower_count = data.scratch->counts[REBUILD_COUNT_LOWER];
-    for (uint32_t lower_id = 0; lower_id < lower_count; ++lower_id) {
-        const pnanovdb_lower_handle_t lower = data.getLower(lower_id);
+    host_for(lower_count, kParallelNodesMinSize, [&](size_t lower_id) {
+        const pnanovdb_lower_handle_t lower = data.getLower(uint32_t(lower_id));
         for (uint32_t n = 0; n < PNANOVDB_LOWER_TABLE_COUNT; ++n) {
             rebuild_write_background(data, pnanovdb_lower_get_table_address(data.grid_type, data.buf, lower, n));
         }
-    }
+    });
 }
 
 void rebuild_build_leaf_nodes(HostRebuildGridData& data, bool active_voxel_grid)
 {
     const uint32_t leaf_count = data.scratch->counts[REBUILD_COUNT_LEAF];
-    for (uint32_t tid = 0; tid < leaf_count; ++tid) {
+    const uint32_t lower_count = data.scratch->counts[REBUILD_COUNT_LOWER];
+    host_for(leaf_count, kParallelNodesMinSize, [&](size_t i) {
+        const uint32_t tid = uint32_t(i);
         const uint64_t leaf_key = data.scratch->leaf_keys[tid];
         const uint64_t lower_key = leaf_key >> 12u;
         const auto lower_iter
             = std::lower_bound(data.scratch->lower_keys.begin(), data.scratch->lower_keys.end(), lower_key);
         if (lower_iter == data.scratch->lower_keys.end() || *lower_iter != lower_key) {
-            continue;
+            return;
         }
 
         const uint32_t lower_id = uint32_t(lower_iter - data.scratch->lower_keys.begin());
         const pnanovdb_lower_handle_t lower = data.getLower(lower_id);
         const pnanovdb_leaf_handle_t leaf = data.getLeaf(tid);
         const uint32_t lower_offset = uint32_t(leaf_key & 4095u);
-        rebuild_set_mask_on(data, lower.address, PNANOVDB_LOWER_OFF_CHILD_MASK, lower_offset);
         pnanovdb_lower_set_table_child(
             data.grid_type, data.buf, lower, lower_offset,
             int64_t(leaf.address.byte_offset) - int64_t(lower.address.byte_offset)
@@ -395,7 +481,18 @@ void rebuild_build_leaf_nodes(HostRebuildGridData& data, bool active_voxel_grid)
             }
             pnanovdb_leaf_set_bbox_dif_and_flags(data.buf, leaf, 0x00070707u | (2u << 24u));
         }
-    }
+    });
+
+    // each lower node sets the child mask bits of its own leaves
+    host_for(lower_count, kParallelNodesMinSize, [&](size_t lower_id) {
+        const pnanovdb_lower_handle_t lower = data.getLower(uint32_t(lower_id));
+        const std::pair<size_t, size_t> children
+            = rebuild_child_range(data.scratch->leaf_keys, data.scratch->lower_keys[lower_id], 12u);
+        for (size_t tid = children.first; tid < children.second; ++tid) {
+            const uint32_t lower_offset = uint32_t(data.scratch->leaf_keys[tid] & 4095u);
+            rebuild_set_mask_on(data, lower.address, PNANOVDB_LOWER_OFF_CHILD_MASK, lower_offset);
+        }
+    });
 }
 
 void rebuild_set_leaf_values(HostRebuildGridData& data)
@@ -405,42 +502,43 @@ void rebuild_set_leaf_values(HostRebuildGridData& data)
     }
 
     const uint32_t leaf_count = data.scratch->counts[REBUILD_COUNT_LEAF];
-    for (uint32_t leaf_id = 0; leaf_id < leaf_count; ++leaf_id) {
-        const pnanovdb_leaf_handle_t leaf = data.getLeaf(leaf_id);
+    host_for(leaf_count, kParallelNodesMinSize, [&](size_t leaf_id) {
+        const pnanovdb_leaf_handle_t leaf = data.getLeaf(uint32_t(leaf_id));
         for (uint32_t n = 0; n < PNANOVDB_LEAF_TABLE_COUNT; ++n) {
             rebuild_write_background(data, pnanovdb_leaf_get_table_address(data.grid_type, data.buf, leaf, n));
         }
-    }
+    });
 }
 
 void rebuild_set_active_voxels(HostRebuildGridData& data, std::vector<uint32_t>& leaf_active_counts)
 {
     const uint32_t leaf_count = data.scratch->counts[REBUILD_COUNT_LEAF];
     leaf_active_counts.assign(leaf_count, 0u);
-    for (uint64_t voxel_key : data.scratch->voxel_keys) {
-        const uint64_t leaf_key = voxel_key >> 9u;
-        const auto leaf_iter
-            = std::lower_bound(data.scratch->leaf_keys.begin(), data.scratch->leaf_keys.end(), leaf_key);
-        if (leaf_iter == data.scratch->leaf_keys.end() || *leaf_iter != leaf_key) {
-            continue;
+    host_for(leaf_count, kParallelNodesMinSize, [&](size_t leaf_id) {
+        const pnanovdb_leaf_handle_t leaf = data.getLeaf(uint32_t(leaf_id));
+        const std::pair<size_t, size_t> voxels
+            = rebuild_child_range(data.scratch->voxel_keys, data.scratch->leaf_keys[leaf_id], 9u);
+        for (size_t i = voxels.first; i < voxels.second; ++i) {
+            const uint32_t offset = uint32_t(data.scratch->voxel_keys[i] & 511u);
+            rebuild_set_mask_on(data, leaf.address, PNANOVDB_LEAF_OFF_VALUE_MASK, offset);
         }
-
-        const uint32_t leaf_id = uint32_t(leaf_iter - data.scratch->leaf_keys.begin());
-        const pnanovdb_leaf_handle_t leaf = data.getLeaf(leaf_id);
-        const uint32_t offset = uint32_t(voxel_key & 511u);
-        rebuild_set_mask_on(data, leaf.address, PNANOVDB_LEAF_OFF_VALUE_MASK, offset);
-        ++leaf_active_counts[leaf_id];
-    }
+        leaf_active_counts[leaf_id] = uint32_t(voxels.second - voxels.first);
+    });
 }
 
 void rebuild_finalize_onindex_leaves(HostRebuildGridData& data, const std::vector<uint32_t>& leaf_active_counts)
 {
     const uint32_t leaf_count = data.scratch->counts[REBUILD_COUNT_LEAF];
+    std::vector<uint64_t> active_offsets(leaf_count);
     uint64_t active_prefix = 0u;
     for (uint32_t tid = 0; tid < leaf_count; ++tid) {
-        const pnanovdb_leaf_handle_t leaf = data.getLeaf(tid);
-        pnanovdb_write_uint64(data.buf, rebuild_leaf_index_offset_address(data, leaf), 1u + active_prefix);
+        active_offsets[tid] = active_prefix;
         active_prefix += leaf_active_counts[tid];
+    }
+
+    host_for(leaf_count, kParallelNodesMinSize, [&](size_t tid) {
+        const pnanovdb_leaf_handle_t leaf = data.getLeaf(uint32_t(tid));
+        pnanovdb_write_uint64(data.buf, rebuild_leaf_index_offset_address(data, leaf), 1u + active_offsets[tid]);
 
         uint64_t prefix = nanovdb::util::countOn(
             pnanovdb_read_uint64(data.buf, pnanovdb_address_offset(leaf.address, PNANOVDB_LEAF_OFF_VALUE_MASK))
@@ -454,15 +552,15 @@ void rebuild_finalize_onindex_leaves(HostRebuildGridData& data, const std::vecto
         }
         pnanovdb_write_uint64(data.buf, rebuild_leaf_index_prefix_address(data, leaf), prefix);
         rebuild_update_leaf_bbox(data, leaf);
-    }
+    });
 }
 
 void rebuild_reset_bboxes(HostRebuildGridData& data)
 {
     rebuild_set_invalid_bbox(data, data.getRoot().address);
-    for (uint32_t i = 0; i < data.scratch->counts[REBUILD_COUNT_LOWER]; ++i) {
-        rebuild_set_invalid_bbox(data, data.getLower(i).address);
-    }
+    host_for(data.scratch->counts[REBUILD_COUNT_LOWER], kParallelNodesMinSize, [&](size_t i) {
+        rebuild_set_invalid_bbox(data, data.getLower(uint32_t(i)).address);
+    });
     for (uint32_t i = 0; i < data.scratch->counts[REBUILD_COUNT_UPPER]; ++i) {
         rebuild_set_invalid_bbox(data, data.getUpper(i).address);
     }
@@ -470,41 +568,40 @@ void rebuild_reset_bboxes(HostRebuildGridData& data)
 
 void rebuild_propagate_leaf_bboxes(HostRebuildGridData& data)
 {
-    const uint32_t lower_count = data.scratch->counts[REBUILD_COUNT_LOWER];
-    for (uint32_t tid = 0; tid < data.scratch->counts[REBUILD_COUNT_LEAF]; ++tid) {
-        const pnanovdb_leaf_handle_t leaf = data.getLeaf(tid);
-        if (!rebuild_is_onindex_grid(data.grid_type)) {
-            rebuild_update_leaf_bbox(data, leaf);
-        }
+    if (!rebuild_is_onindex_grid(data.grid_type)) {
+        host_for(data.scratch->counts[REBUILD_COUNT_LEAF], kParallelNodesMinSize, [&](size_t tid) {
+            rebuild_update_leaf_bbox(data, data.getLeaf(uint32_t(tid)));
+        });
+    }
 
-        const uint64_t lower_key = data.scratch->leaf_keys[tid] >> 12u;
-        const auto lower_iter
-            = std::lower_bound(data.scratch->lower_keys.begin(), data.scratch->lower_keys.end(), lower_key);
-        if (lower_iter != data.scratch->lower_keys.end() && *lower_iter == lower_key) {
-            const uint32_t lower_id = uint32_t(lower_iter - data.scratch->lower_keys.begin());
+    // each lower node gathers the bounds of its own leaves
+    host_for(data.scratch->counts[REBUILD_COUNT_LOWER], kParallelNodesMinSize, [&](size_t lower_id) {
+        const pnanovdb_lower_handle_t lower = data.getLower(uint32_t(lower_id));
+        const std::pair<size_t, size_t> children
+            = rebuild_child_range(data.scratch->leaf_keys, data.scratch->lower_keys[lower_id], 12u);
+        for (size_t tid = children.first; tid < children.second; ++tid) {
+            const pnanovdb_leaf_handle_t leaf = data.getLeaf(uint32_t(tid));
             rebuild_expand_bbox(
-                data, data.getLower(lower_id).address, pnanovdb_leaf_get_bbox_min(data.buf, leaf),
-                rebuild_leaf_bbox_max(data.buf, leaf)
+                data, lower.address, pnanovdb_leaf_get_bbox_min(data.buf, leaf), rebuild_leaf_bbox_max(data.buf, leaf)
             );
         }
-    }
+    });
 }
 
 void rebuild_propagate_lower_bboxes(HostRebuildGridData& data)
 {
-    const uint32_t upper_count = data.scratch->counts[REBUILD_COUNT_UPPER];
-    for (uint32_t tid = 0; tid < data.scratch->counts[REBUILD_COUNT_LOWER]; ++tid) {
-        const uint64_t upper_key = data.scratch->lower_keys[tid] >> 15u;
-        if (upper_key >= upper_count) {
-            continue;
+    // each upper node gathers the bounds of its own lower nodes
+    host_for(data.scratch->counts[REBUILD_COUNT_UPPER], kParallelNodesMinSize, [&](size_t upper_id) {
+        const pnanovdb_upper_handle_t upper = data.getUpper(uint32_t(upper_id));
+        const std::pair<size_t, size_t> children = rebuild_child_range(data.scratch->lower_keys, upper_id, 15u);
+        for (size_t tid = children.first; tid < children.second; ++tid) {
+            const pnanovdb_lower_handle_t lower = data.getLower(uint32_t(tid));
+            rebuild_expand_bbox(
+                data, upper.address, pnanovdb_lower_get_bbox_min(data.buf, lower),
+                pnanovdb_lower_get_bbox_max(data.buf, lower)
+            );
         }
-
-        const pnanovdb_lower_handle_t lower = data.getLower(tid);
-        rebuild_expand_bbox(
-            data, data.getUpper(uint32_t(upper_key)).address, pnanovdb_lower_get_bbox_min(data.buf, lower),
-            pnanovdb_lower_get_bbox_max(data.buf, lower)
-        );
-    }
+    });
 }
 
 void rebuild_propagate_upper_bboxes(HostRebuildGridData& data)
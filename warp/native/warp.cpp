@@ -17,6 +17,7 @@
 #include "error.h"
 #include "exports.h"
 #include "scan.h"
+#include "thread_pool.h"
 #include "version.h"
 
 #include <stdlib.h>
@@ -280,11 +281,37 @@ void wp_cpu_launch_kernel(void* func, void* bounds, void* args, void* adj_args,
             launch_size, 0, 0, 0, 1,
             0,  // max_blocks, block_dim, grid_stride, cluster_dim, smem_bytes (not applicable for CPU)
             apic_info->params, apic_info->num_params, apic_info->adj_params, apic_info->relocs, apic_info->num_relocs,
-            apic_info->value_data, apic_info->value_data_size
+            apic_info->value_data, apic_info->value_data_size, apic_info->flags
         );
     }
 }
 
+void wp_cpu_launch_kernel_parallel(void* func, void* bounds, void* args, void* adj_args, size_t size, int num_threads)
+{
+    typedef void (*kernel_fn_forward_range)(void*, void*, size_t, size_t);
+    typedef void (*kernel_fn_backward_range)(void*, void*, void*, size_t, size_t);
+
+    if (!func || size == 0)
+        return;
+
+    num_threads = wp::cpu_resolve_thread_count(num_threads);
+    const size_t grain = wp::parallel_for_grain(size, num_threads);
+
+    if (adj_args) {
+        wp::parallel_for(size, grain, num_threads, [=](size_t begin, size_t end) {
+            ((kernel_fn_backward_range)func)(bounds, args, adj_args, begin, end);
+        });
+    } else {
+        wp::parallel_for(size, grain, num_threads, [=](size_t begin, size_t end) {
+            ((kernel_fn_forward_range)func)(bounds, args, begin, end);
+        });
+    }
+}
+
+int wp_cpu_hardware_threads() { return wp::cpu_hardware_threads(); }
+
+void wp_cpu_set_max_threads(int num_threads) { wp::cpu_set_max_threads(num_threads); }
+
 bool wp_memcpy_h2h(void* dest, void* src, size_t n)
 {
     // During capture, record only — don't execute (matches CUDA graph semantics)
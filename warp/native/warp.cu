@@ -5623,7 +5623,7 @@ size_t wp_cuda_launch_kernel(
                 state, apic_info->kernel_key, apic_info->module_hash, apic_info->is_forward, shape, ndim, launch_size,
                 max_blocks, block_dim, grid_stride, cluster_dim, shared_memory_bytes, apic_info->params,
                 apic_info->num_params, apic_info->adj_params, apic_info->relocs, apic_info->num_relocs,
-                apic_info->value_data, apic_info->value_data_size
+                apic_info->value_data, apic_info->value_data_size, apic_info->flags
             );
         }
     }
@@ -878,6 +878,17 @@ WP_API bool wp_cuda_compile_solver(
 // CPU kernel launch with optional APIC recording
 WP_API void wp_cpu_launch_kernel(void* func, void* bounds, void* args, void* adj_args, const APICLaunchInfo* apic_info);
 
+// Multi-threaded CPU kernel launch: splits [0, size) across up to num_threads host
+// threads (<= 0 selects all hardware threads), calling the generated range entry point
+// func(bounds, args, begin, end), or func(bounds, args, adj_args, begin, end) when adj_args is set.
+WP_API void
+wp_cpu_launch_kernel_parallel(void* func, void* bounds, void* args, void* adj_args, size_t size, int num_threads);
+
+// Number of hardware threads available for multi-threaded CPU execution
+WP_API int wp_cpu_hardware_threads();
+// Thread count for host sort, scan and run-length encode (<= 0 selects all hardware threads)
+WP_API void wp_cpu_set_max_threads(int num_threads);
+
 WP_API void* wp_cuda_load_module(void* context, const char* ptx);
 WP_API void wp_cuda_unload_module(void* context, void* module);
 WP_API void* wp_cuda_get_kernel(void* context, void* module, const char* name);
@@ -3,9 +3,9 @@
 
 """Optimization algorithms for gradient descent and linear systems.
 
-This module provides gradient-based optimizers (:class:`Adam`, :class:`SGD`) for
-updating arrays based on computed gradients. The :mod:`warp.optim.linear` submodule
-provides iterative linear solvers.
+This module provides gradient-based optimizers (:class:`Adam`, :class:`FusedAdam`,
+:class:`SGD`) for updating arrays based on computed gradients. The
+:mod:`warp.optim.linear` submodule provides iterative linear solvers.
 
 Usage:
     This module must be explicitly imported::
@@ -19,6 +19,7 @@ Usage:
 # top-level `warp/__init__.py`, so they are in effect before these imports run.
 
 from warp._src.optim.adam import Adam as Adam
+from warp._src.optim.adam import FusedAdam as FusedAdam
 from warp._src.optim.sgd import SGD as SGD
 
 from . import linear as linear
@@ -5,15 +5,18 @@
 
 This module provides GPU-accelerated iterative methods for solving linear systems,
 including conjugate gradient (CG), biconjugate gradient stabilized (BiCGSTAB), conjugate
-residual (CR), and generalized minimal residual (GMRES) methods.
+residual (CR), and generalized minimal residual (GMRES) methods, as well as Jacobi, incomplete
+factorization (ILU(0)/IC(0)), and algebraic multigrid (AMG) preconditioners.
 """
 
 # isort: skip_file
 
+from warp._src.optim.linear import AMGPreconditioner as AMGPreconditioner
 from warp._src.optim.linear import BiCGSTAB as BiCGSTAB
 from warp._src.optim.linear import CG as CG
 from warp._src.optim.linear import CR as CR
 from warp._src.optim.linear import GMRES as GMRES
+from warp._src.optim.linear import ILU0Preconditioner as ILU0Preconditioner
 from warp._src.optim.linear import LinearOperator as LinearOperator
 from warp._src.optim.linear import LinearSolverState as LinearSolverState
 from warp._src.optim.linear import aslinearoperator as aslinearoperator
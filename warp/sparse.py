@@ -29,6 +29,7 @@ from warp._src.sparse import bsr_mm_work_arrays as bsr_mm_work_arrays
 from warp._src.sparse import BSR_STATUS_ROW_CAPACITY_EXCEEDED as BSR_STATUS_ROW_CAPACITY_EXCEEDED
 from warp._src.sparse import BSR_STATUS_SUCCESS as BSR_STATUS_SUCCESS
 from warp._src.sparse import BsrMatrix as BsrMatrix
+from warp._src.sparse import BsrSellMatrix as BsrSellMatrix
 from warp._src.sparse import bsr_assign as bsr_assign
 from warp._src.sparse import bsr_axpy as bsr_axpy
 from warp._src.sparse import bsr_block_index as bsr_block_index
@@ -41,6 +42,8 @@ from warp._src.sparse import bsr_identity as bsr_identity
 from warp._src.sparse import bsr_matrix_t as bsr_matrix_t
 from warp._src.sparse import bsr_mm as bsr_mm
 from warp._src.sparse import bsr_mv as bsr_mv
+from warp._src.sparse import bsr_permuted as bsr_permuted
+from warp._src.sparse import bsr_rcm_permutation as bsr_rcm_permutation
 from warp._src.sparse import bsr_row_index as bsr_row_index
 from warp._src.sparse import bsr_scale as bsr_scale
 from warp._src.sparse import bsr_set_diag as bsr_set_diag
@@ -48,5 +51,8 @@ from warp._src.sparse import bsr_set_from_triplets as bsr_set_from_triplets
 from warp._src.sparse import bsr_set_identity as bsr_set_identity
 from warp._src.sparse import bsr_set_transpose as bsr_set_transpose
 from warp._src.sparse import bsr_set_zero as bsr_set_zero
+from warp._src.sparse import bsr_to_sell as bsr_to_sell
 from warp._src.sparse import bsr_transposed as bsr_transposed
 from warp._src.sparse import bsr_zeros as bsr_zeros
+from warp._src.sparse import permute_vector as permute_vector
+from warp._src.sparse import unpermute_vector as unpermute_vector
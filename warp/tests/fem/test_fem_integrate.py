@@ -2,10 +2,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import unittest
+from unittest import mock
 
 import numpy as np
 
 import warp as wp
+import warp._src.fem.integrate
 import warp.fem as fem
 from warp.fem import (
     D,
@@ -73,6 +75,11 @@ def grad_decomposition(s: Sample, u: Field, v: Field):
     return wp.length_sq(grad(u, s) * v(s) - D(u, s) * v(s) - wp.cross(curl(u, s), v(s)))
 
 
+@integrand
+def diffusion_mass_form(s: Sample, u: Field, v: Field):
+    return fem.linalg.generalized_inner(grad(u, s), grad(v, s)) + fem.linalg.generalized_inner(u(s), v(s))
+
+
 @integrand
 def scaled_bilinear_form(s: Sample, u: Field, v: Field, scale: wp.array(dtype=float)):
     return u(s) * v(s) * scale[0]
@@ -712,6 +719,199 @@ def test_capturability(test, device):
         assert_np_equal(A.columns.numpy()[:nnz_ref], columns_ref)
 
 
+def test_assembly_plan(test, device):
+    with wp.ScopedDevice(device):
+        geo = fem.Grid2D(res=wp.vec2i(3))
+        space = fem.make_polynomial_space(geo, degree=2)
+        test_field = fem.make_test(space)
+        trial_field = fem.make_trial(space)
+        fields = {"v": test_field, "u": trial_field}
+        scale = wp.ones(1, dtype=float)
+
+        x = wp.array(np.linspace(1.0, 2.0, space.node_count(), dtype=np.float32), dtype=float)
+
+        for assembly in ("generic", "dispatch", "nodal"):
+
+            def assemble(assembly=assembly, **kwargs):
+                return fem.integrate(
+                    scaled_bilinear_form,
+                    fields=fields,
+                    values={"scale": scale},
+                    output_dtype=float,
+                    assembly=assembly,
+                    kernel_options={"enable_backward": False},
+                    **kwargs,
+                )
+
+            plan = fem.AssemblyPlan()
+            scale.fill_(1.0)
+            matrix = assemble(bsr_options={"plan": plan})
+            test.assertTrue(plan.is_recorded)
+            test.assertIs(matrix, plan.matrix)
+            assert_np_equal((matrix @ x).numpy(), (assemble() @ x).numpy(), tol=1.0e-5)
+
+            columns_ptr = matrix.columns.ptr
+            values_ptr = matrix.values.ptr
+
+            # Subsequent assemblies do not rebuild the topology
+            scale.fill_(2.0)
+            with mock.patch.object(
+                warp._src.fem.integrate, "bsr_set_from_triplets", wraps=warp._src.fem.integrate.bsr_set_from_triplets
+            ) as set_from_triplets:
+                test.assertIs(assemble(output=matrix, bsr_options={"plan": plan}), matrix)
+                test.assertEqual(set_from_triplets.call_count, 0)
+            test.assertEqual(matrix.columns.ptr, columns_ptr)
+            test.assertEqual(matrix.values.ptr, values_ptr)
+            assert_np_equal((matrix @ x).numpy(), (assemble() @ x).numpy(), tol=1.0e-5)
+
+            # Replay is capturable
+            scale.fill_(3.0)
+            with wp.ScopedCapture(force_module_load=False) as capture:
+                assemble(bsr_options={"plan": plan})
+            wp.capture_launch(capture.graph)
+            assert_np_equal((matrix @ x).numpy(), (assemble() @ x).numpy(), tol=1.0e-5)
+
+            # Accumulate into another matrix
+            accumulated = assemble()
+            assemble(output=accumulated, add=True, bsr_options={"plan": plan})
+            assert_np_equal((accumulated @ x).numpy(), 2.0 * (matrix @ x).numpy(), tol=1.0e-5)
+
+        other_space = fem.make_polynomial_space(geo, degree=1)
+        with test.assertRaisesRegex(ValueError, "AssemblyPlan.reset"):
+            fem.integrate(
+                scaled_bilinear_form,
+                fields={"v": fem.make_test(other_space), "u": fem.make_trial(other_space)},
+                values={"scale": scale},
+                output_dtype=float,
+                assembly="nodal",
+                kernel_options={"enable_backward": False},
+                bsr_options={"plan": plan},
+            )
+        with test.assertRaisesRegex(ValueError, "row_compress"):
+            fem.integrate(
+                scaled_bilinear_form,
+                fields=fields,
+                values={"scale": scale},
+                output_dtype=float,
+                kernel_options={"enable_backward": False},
+                bsr_options={"plan": fem.AssemblyPlan(), "construction": "row_compress"},
+            )
+
+        plan.reset()
+        test.assertFalse(plan.is_recorded)
+        test.assertIsNone(plan.matrix)
+
+
+def test_integrate_operator(test, device):
+    with wp.ScopedDevice(device):
+        rng = np.random.default_rng(123)
+
+        for geo, dtype in (
+            (fem.Grid2D(res=wp.vec2i(3)), float),
+            (fem.Grid3D(res=wp.vec3i(2)), wp.vec3),
+        ):
+            space = fem.make_polynomial_space(geo, degree=2, dtype=dtype)
+            fields = {"v": fem.make_test(space), "u": fem.make_trial(space)}
+
+            matrix = fem.integrate(diffusion_mass_form, fields=fields, output_dtype=float)
+
+            for assembly in ("generic", "dispatch"):
+                op = fem.integrate_operator(diffusion_mass_form, fields=fields, assembly=assembly)
+                test.assertEqual(op.shape, matrix.shape)
+                test.assertEqual(op.dtype, space.dof_dtype)
+
+                dof_shape = (space.node_count(),) if dtype is float else (space.node_count(), 3)
+                x = wp.array(rng.uniform(size=dof_shape), dtype=dtype)
+                y = wp.array(rng.uniform(size=dof_shape), dtype=dtype)
+
+                z = wp.full(space.node_count(), value=dtype(np.nan), dtype=dtype)
+                op.matvec(x, y, z, 2.0, 0.0)
+                assert_np_equal(z.numpy(), 2.0 * (matrix @ x).numpy(), tol=1.0e-4)
+
+                z = wp.clone(y)
+                op.matvec(x, z, z, 2.0, 0.5)
+                assert_np_equal(z.numpy(), 2.0 * (matrix @ x).numpy() + 0.5 * y.numpy(), tol=1.0e-4)
+
+        # Matrix-free conjugate gradient matches the assembled solve
+        b = wp.array(rng.uniform(size=(space.node_count(), 3)), dtype=wp.vec3)
+        x_assembled = wp.zeros_like(b)
+        x_free = wp.zeros_like(b)
+        wp.optim.linear.cg(matrix, b, x_assembled, tol=1.0e-6, maxiter=200, use_cuda_graph=False)
+        wp.optim.linear.cg(op, b, x_free, tol=1.0e-6, maxiter=200, use_cuda_graph=False)
+        assert_np_equal(x_free.numpy(), x_assembled.numpy(), tol=1.0e-4)
+
+        with test.assertRaisesRegex(ValueError, "test and a trial field"):
+            fem.integrate_operator(linear_form, fields={"u": fem.make_test(space)})
+
+
+def test_temporary_store(test, device):
+    with wp.ScopedDevice(device):
+        store = fem.TemporaryStore()
+
+        # Buffers are shared across data types
+        a = fem.borrow_temporary(store, shape=(64,), dtype=float)
+        a_ptr = a.ptr
+        a.release()
+        b = fem.borrow_temporary(store, shape=(32,), dtype=wp.vec2)
+        test.assertEqual(b.ptr, a_ptr)
+
+        stats = store.statistics
+        test.assertEqual(stats.hits, 1)
+        test.assertEqual(stats.misses, 1)
+        test.assertEqual(stats.resident_bytes, 256)
+        test.assertEqual(stats.borrowed_bytes, 256)
+
+        c = fem.borrow_temporary(store, shape=(128,), dtype=wp.float64)
+        test.assertEqual(store.statistics.peak_borrowed_bytes, 256 + 1024)
+        b.release()
+        c.release()
+        test.assertEqual(store.statistics.borrowed_bytes, 0)
+        test.assertEqual(store.statistics.resident_bytes, 256 + 1024)
+
+        # Least recently used buffers are freed first
+        store.max_resident_bytes = 1024
+        stats = store.statistics
+        test.assertEqual(stats.trimmed, 1)
+        test.assertEqual(stats.resident_bytes, 1024)
+        test.assertEqual(stats.peak_resident_bytes, 256 + 1024)
+
+        # Borrowed buffers are never trimmed
+        d = fem.borrow_temporary(store, shape=(1024,), dtype=float)
+        test.assertEqual(store.statistics.resident_bytes, 4096)
+        test.assertEqual(store.statistics.trimmed, 2)
+        d.release()
+        test.assertEqual(store.statistics.resident_bytes, 0)
+
+        detached = fem.borrow_temporary(store, shape=(8,), dtype=int)
+        detached.detach()
+        test.assertEqual(store.statistics.resident_bytes, 0)
+
+        # Repeated integration only reuses buffers
+        store = fem.TemporaryStore()
+        geo = fem.Grid2D(res=wp.vec2i(4))
+        space = fem.make_polynomial_space(geo, degree=1)
+        fields = {"v": fem.make_test(space), "u": fem.make_trial(space)}
+        reference = fem.integrate(bilinear_form, fields=fields, output_dtype=float)
+
+        fem.integrate(bilinear_form, fields=fields, output_dtype=float, temporary_store=store)
+        misses = store.statistics.misses
+        test.assertGreater(misses, 0)
+        matrix = fem.integrate(bilinear_form, fields=fields, output_dtype=float, temporary_store=store)
+        test.assertEqual(store.statistics.misses, misses)
+        test.assertGreater(store.statistics.hits, 0)
+        test.assertEqual(store.statistics.borrowed_bytes, 0)
+
+        x = wp.array(np.linspace(1.0, 2.0, space.node_count(), dtype=np.float32), dtype=float)
+        assert_np_equal((matrix @ x).numpy(), (reference @ x).numpy(), tol=1.0e-6)
+
+        # Sparse work arrays may borrow from the store
+        work_arrays = wp.sparse.bsr_mm_work_arrays(temporary_store=store)
+        product = wp.sparse.bsr_mm(matrix, matrix, work_arrays=work_arrays)
+        reference_product = wp.sparse.bsr_mm(reference, reference)
+        test.assertGreater(store.statistics.borrowed_bytes, 0)
+        assert_np_equal((product @ x).numpy(), (reference_product @ x).numpy(), tol=1.0e-6)
+
+
 # -- Device setup and test registration --
 
 devices = get_test_devices()
@@ -766,6 +966,9 @@ add_function_test(TestFemIntegrate, "test_grad_decomposition", test_grad_decompo
 add_function_test(TestFemIntegrate, "test_integrate_high_order", test_integrate_high_order, devices=cuda_devices)
 add_function_test(TestFemIntegrate, "test_padded_sparse_assembly", test_padded_sparse_assembly, devices=cuda_devices)
 add_function_test(TestFemIntegrate, "test_interpolate_reduction", test_interpolate_reduction, devices=devices)
+add_function_test(TestFemIntegrate, "test_integrate_operator", test_integrate_operator, devices=devices)
+add_function_test(TestFemIntegrate, "test_assembly_plan", test_assembly_plan, devices=devices)
+add_function_test(TestFemIntegrate, "test_temporary_store", test_temporary_store, devices=devices)
 add_function_test(TestFemIntegrate, "test_capturability", test_capturability, devices=cuda_devices_with_mempool)
 
 if __name__ == "__main__":
@@ -795,6 +795,40 @@ def tile_bvh_query_valid_ray_kernel(
             wp.atomic_add(bounds_intersected, result_idx, 1)
 
 
+@wp.kernel
+def bvh_query_aabb_hit_order(
+    bvh_id: wp.uint64,
+    query_lowers: wp.array[wp.vec3],
+    query_uppers: wp.array[wp.vec3],
+    hits: wp.array2d[int],
+    hit_counts: wp.array[int],
+):
+    tid = wp.tid()
+    query = wp.bvh_query_aabb(bvh_id, query_lowers[tid], query_uppers[tid])
+    bounds_nr = int(0)
+    num_hits = int(0)
+
+    while wp.bvh_query_next(query, bounds_nr):
+        if num_hits < hits.shape[1]:
+            hits[tid, num_hits] = bounds_nr
+        num_hits += 1
+
+    hit_counts[tid] = num_hits
+
+
+def get_bvh_hit_order(bvh, query_lowers, query_uppers, max_hits=64):
+    hits = wp.full((len(query_lowers), max_hits), -1, dtype=int, device="cpu")
+    hit_counts = wp.zeros(len(query_lowers), dtype=int, device="cpu")
+    wp.launch(
+        bvh_query_aabb_hit_order,
+        dim=len(query_lowers),
+        inputs=[bvh.id, query_lowers, query_uppers],
+        outputs=[hits, hit_counts],
+        device="cpu",
+    )
+    return hits.numpy(), hit_counts.numpy()
+
+
 devices = get_test_devices()
 cuda_devices = get_cuda_test_devices()
 cuda_devices_with_mempool = get_cuda_test_devices_with_mempool()
@@ -826,6 +860,44 @@ class TestBvh(unittest.TestCase):
         instance = wp.Bvh.__new__(wp.Bvh)
         instance.__del__()
 
+    def test_bvh_parallel_host_build(self):
+        # the multi-threaded host builder must produce the same tree as the serial one,
+        # which shows up as an identical traversal order for every query
+        rng = np.random.default_rng(123)
+        num_items = 40000
+        centers = rng.uniform(-10.0, 10.0, size=(num_items, 3)).astype(np.float32)
+        extents = rng.uniform(0.01, 0.2, size=(num_items, 3)).astype(np.float32)
+        lowers = wp.array(centers - extents, dtype=wp.vec3, device="cpu")
+        uppers = wp.array(centers + extents, dtype=wp.vec3, device="cpu")
+
+        query_centers = rng.uniform(-10.0, 10.0, size=(256, 3)).astype(np.float32)
+        query_lowers = wp.array(query_centers - 0.5, dtype=wp.vec3, device="cpu")
+        query_uppers = wp.array(query_centers + 0.5, dtype=wp.vec3, device="cpu")
+
+        saved_cpu_max_threads = wp.config.cpu_max_threads
+        try:
+            for constructor in ("sah", "median"):
+                for leaf_size in (1, 4):
+                    with self.subTest(constructor=constructor, leaf_size=leaf_size):
+                        wp.config.cpu_max_threads = 1
+                        bvh = wp.Bvh(lowers, uppers, constructor=constructor, leaf_size=leaf_size)
+                        expected_hits, expected_counts = get_bvh_hit_order(bvh, query_lowers, query_uppers)
+                        self.assertGreater(expected_counts.sum(), 0)
+
+                        wp.config.cpu_max_threads = 4
+                        parallel_bvh = wp.Bvh(lowers, uppers, constructor=constructor, leaf_size=leaf_size)
+                        hits, counts = get_bvh_hit_order(parallel_bvh, query_lowers, query_uppers)
+                        np.testing.assert_array_equal(counts, expected_counts)
+                        np.testing.assert_array_equal(hits, expected_hits)
+
+                        # rebuilding a tree built serially goes through the parallel path as well
+                        bvh.rebuild(constructor)
+                        hits, counts = get_bvh_hit_order(bvh, query_lowers, query_uppers)
+                        np.testing.assert_array_equal(counts, expected_counts)
+                        np.testing.assert_array_equal(hits, expected_hits)
+        finally:
+            wp.config.cpu_max_threads = saved_cpu_max_threads
+
     def test_bvh_cubql_groups_error(self):
         lowers = wp.array([wp.vec3(0.0, 0.0, 0.0)], dtype=wp.vec3, device="cpu")
         uppers = wp.array([wp.vec3(1.0, 1.0, 1.0)], dtype=wp.vec3, device="cpu")
@@ -1152,36 +1152,24 @@ add_function_test(
 )
 add_function_test(TestVolume, "test_volume_transform_gradient", test_volume_transform_gradient, devices=devices)
 add_function_test(TestVolume, "test_volume_store", test_volume_store, devices=devices)
-add_function_test(
-    TestVolume, "test_volume_allocation_f", test_volume_allocation_f, devices=get_selected_cuda_test_devices()
-)
-add_function_test(
-    TestVolume, "test_volume_allocation_v", test_volume_allocation_v, devices=get_selected_cuda_test_devices()
-)
-add_function_test(
-    TestVolume, "test_volume_allocation_i", test_volume_allocation_i, devices=get_selected_cuda_test_devices()
-)
-add_function_test(
-    TestVolume, "test_volume_allocation_v4", test_volume_allocation_v4, devices=get_selected_cuda_test_devices()
-)
+add_function_test(TestVolume, "test_volume_allocation_f", test_volume_allocation_f, devices=devices)
+add_function_test(TestVolume, "test_volume_allocation_v", test_volume_allocation_v, devices=devices)
+add_function_test(TestVolume, "test_volume_allocation_i", test_volume_allocation_i, devices=devices)
+add_function_test(TestVolume, "test_volume_allocation_v4", test_volume_allocation_v4, devices=devices)
 add_function_test(TestVolume, "test_volume_introspection", test_volume_introspection, devices=devices)
-add_function_test(
-    TestVolume, "test_volume_from_numpy", test_volume_from_numpy, devices=get_selected_cuda_test_devices()
-)
-add_function_test(
-    TestVolume, "test_volume_from_numpy_3d", test_volume_from_numpy_3d, devices=get_selected_cuda_test_devices()
-)
+add_function_test(TestVolume, "test_volume_from_numpy", test_volume_from_numpy, devices=devices)
+add_function_test(TestVolume, "test_volume_from_numpy_3d", test_volume_from_numpy_3d, devices=devices)
 add_function_test(
     TestVolume,
     "test_volume_from_numpy_anisotropic",
     test_volume_from_numpy_anisotropic,
-    devices=get_selected_cuda_test_devices(),
+    devices=devices,
 )
 add_function_test(
     TestVolume,
     "test_volume_from_numpy_3d_anisotropic",
     test_volume_from_numpy_3d_anisotropic,
-    devices=get_selected_cuda_test_devices(),
+    devices=devices,
 )
 add_function_test(
     TestVolume,
@@ -1193,7 +1181,7 @@ add_function_test(
     TestVolume,
     "test_volume_from_numpy_numpy_scalar",
     test_volume_from_numpy_numpy_scalar,
-    devices=get_selected_cuda_test_devices(),
+    devices=devices,
 )
 add_function_test(
     TestVolume,
@@ -1217,11 +1205,9 @@ add_function_test(
     TestVolume,
     "test_volume_allocate_anisotropic",
     test_volume_allocate_anisotropic,
-    devices=get_selected_cuda_test_devices(),
-)
-add_function_test(
-    TestVolume, "test_volume_aniso_transform", test_volume_aniso_transform, devices=get_selected_cuda_test_devices()
+    devices=devices,
 )
+add_function_test(TestVolume, "test_volume_aniso_transform", test_volume_aniso_transform, devices=devices)
 add_function_test(TestVolume, "test_volume_multiple_grids", test_volume_multiple_grids, devices=devices)
 add_function_test(TestVolume, "test_volume_feature_array", test_volume_feature_array, devices=devices)
 add_function_test(TestVolume, "test_volume_sample_index", test_volume_sample_index, devices=devices)
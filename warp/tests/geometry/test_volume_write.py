@@ -1487,6 +1487,43 @@ class TestVolumeWrite(unittest.TestCase):
     def test_volume_rebuild_tiles_mutable_background_cpu(self):
         test_volume_rebuild_tiles_mutable_background(self, "cpu")
 
+    def test_volume_parallel_host_build_cpu(self):
+        # the multi-threaded host builder must produce the same NanoVDB buffer as the serial one
+        rng = np.random.default_rng(42)
+        num_points = 40000
+        points_np = rng.uniform(-300.0, 300.0, size=(num_points, 3)).astype(np.float32)
+        mask_np = (rng.uniform(size=num_points) > 0.25).astype(np.int32)
+        points = wp.array(points_np, dtype=wp.vec3, device="cpu")
+        point_mask = wp.array(mask_np, dtype=wp.int32, device="cpu")
+
+        def build_volumes():
+            tile_volume = wp.Volume.allocate_by_tiles(
+                points, voxel_size=0.5, bg_value=2.0, device="cpu", point_mask=point_mask
+            )
+            voxel_volume = wp.Volume.allocate_by_voxels(points, voxel_size=0.5, device="cpu", point_mask=point_mask)
+            rebuildable_volume = wp.Volume.allocate_by_voxels(
+                points[:16],
+                voxel_size=0.5,
+                device="cpu",
+                max_active_voxels=num_points,
+                max_lower_nodes=2048,
+                max_upper_nodes=16,
+            )
+            rebuildable_volume.rebuild(points, point_mask=point_mask)
+            return [volume.array().numpy().copy() for volume in (tile_volume, voxel_volume, rebuildable_volume)]
+
+        saved_cpu_max_threads = wp.config.cpu_max_threads
+        try:
+            wp.config.cpu_max_threads = 1
+            expected = build_volumes()
+            wp.config.cpu_max_threads = 4
+            buffers = build_volumes()
+        finally:
+            wp.config.cpu_max_threads = saved_cpu_max_threads
+
+        for buffer, expected_buffer in zip(buffers, expected, strict=True):
+            np.testing.assert_array_equal(buffer, expected_buffer)
+
 
 add_function_test(TestVolumeWrite, "test_volume_allocation", test_volume_allocation, devices=devices)
 add_function_test(TestVolumeWrite, "test_volume_allocate_by_tiles_f", test_volume_allocate_by_tiles_f, devices=devices)
@@ -2609,6 +2609,40 @@ else:
                 device_check=_check_jax_device,
             )
 
+    # jax_kernel() and jax_callable() also register XLA CPU targets
+    jax_cpu_candidate_devices = [device for device in jax_candidate_devices if device.is_cpu]
+    if jax_cpu_candidate_devices and jax.__version_info__ >= (0, 5, 0):
+        cpu_tests = [
+            ("test_ffi_jax_kernel_add", test_ffi_jax_kernel_add),
+            ("test_ffi_jax_kernel_sincos", test_ffi_jax_kernel_sincos),
+            ("test_ffi_jax_kernel_diagonal", test_ffi_jax_kernel_diagonal),
+            ("test_ffi_jax_kernel_in_out", test_ffi_jax_kernel_in_out),
+            ("test_ffi_jax_kernel_scale_vec_static", test_ffi_jax_kernel_scale_vec_static),
+            ("test_ffi_jax_kernel_launch_dims_custom", test_ffi_jax_kernel_launch_dims_custom),
+            ("test_ffi_jax_callable_scale_constant", test_ffi_jax_callable_scale_constant),
+            ("test_ffi_jax_callable_in_out", test_ffi_jax_callable_in_out),
+            ("test_ffi_jax_kernel_autodiff_simple", test_ffi_jax_kernel_autodiff_simple),
+            ("test_ffi_jax_kernel_autodiff_multi_output", test_ffi_jax_kernel_autodiff_multi_output),
+            ("test_ffi_jax_kernel_autodiff_vec2", test_ffi_jax_kernel_autodiff_vec2),
+            ("test_ffi_jax_kernel_launch_dims_autodiff_vmap", test_ffi_jax_kernel_launch_dims_autodiff_vmap),
+        ]
+        for name, func in cpu_tests:
+            add_function_test(
+                TestJax,
+                name,
+                func,
+                devices=jax_cpu_candidate_devices,
+                device_check=_check_jax_device,
+            )
+        for vmap_method in ["broadcast_all", "sequential"]:
+            add_function_test(
+                TestJax,
+                f"test_ffi_vmap_add_{vmap_method}",
+                partial(test_ffi_vmap_add, vmap_method=vmap_method),
+                devices=jax_cpu_candidate_devices,
+                device_check=_check_jax_device,
+            )
+
     # bfloat16 tests require arch >= 80
     bf16_jax_devices = [
         device for device in jax_candidate_devices if device.is_cpu or (device.is_cuda and device.arch >= 80)
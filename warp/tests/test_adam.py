@@ -199,6 +199,117 @@ def test_adam_set_params_migrates_state(test, device):
     test.assertIs(opt.v[1], unmoved_v)
 
 
+def test_fused_adam_matches_adam(test, device):
+    """Verify a fused step matches the per-array Adam update for mixed parameter dtypes."""
+    rng = np.random.default_rng(42)
+    with wp.ScopedDevice(device):
+        layouts = [(7, wp.float32), (5, wp.vec3), (0, wp.float32), (9, wp.float16), (3, wp.float32)]
+        values = [rng.uniform(-1.0, 1.0, size=(n, 3) if dtype == wp.vec3 else n) for n, dtype in layouts]
+
+        ref_params = [wp.array(value, dtype=dtype) for value, (_, dtype) in zip(values, layouts, strict=True)]
+        fused_params = [wp.array(value, dtype=dtype) for value, (_, dtype) in zip(values, layouts, strict=True)]
+
+        ref_opt = warp.optim.Adam(ref_params, lr=0.01, betas=(0.8, 0.99))
+        fused_opt = warp.optim.FusedAdam(fused_params, lr=0.01, betas=(0.8, 0.99))
+
+        for _ in range(5):
+            grads = [
+                wp.array(rng.uniform(-1.0, 1.0, size=value.shape), dtype=dtype)
+                for value, (_, dtype) in zip(values, layouts, strict=True)
+            ]
+            ref_opt.step(grads)
+            fused_opt.step(grads)
+
+        test.assertEqual(fused_opt.t.numpy()[0], 5)
+        for ref, fused in zip(ref_params, fused_params, strict=True):
+            tol = 1.0e-3 if ref.dtype == wp.float16 else 1.0e-6
+            assert_np_equal(fused.numpy(), ref.numpy(), tol=tol)
+
+
+def test_fused_adam_weight_decay(test, device):
+    """Verify decoupled weight decay on float64 and matrix parameters against a NumPy reference."""
+    rng = np.random.default_rng(42)
+    lr, beta1, beta2, eps, weight_decay = 0.05, 0.9, 0.999, 1.0e-8, 0.1
+
+    with wp.ScopedDevice(device):
+        params = [
+            wp.array(rng.uniform(-1.0, 1.0, size=(4, 3)), dtype=wp.float64, requires_grad=True),
+            wp.array(rng.uniform(-1.0, 1.0, size=(6, 2, 2)), dtype=wp.mat22, requires_grad=True),
+        ]
+        expected = [param.numpy().astype(np.float64) for param in params]
+        m = [np.zeros_like(x) for x in expected]
+        v = [np.zeros_like(x) for x in expected]
+
+        opt = warp.optim.FusedAdam(params, lr=lr, betas=(beta1, beta2), eps=eps, weight_decay=weight_decay)
+
+        for t in range(1, 4):
+            for i, param in enumerate(params):
+                g = rng.uniform(-1.0, 1.0, size=expected[i].shape)
+                param.grad.assign(g)
+
+                m[i] = beta1 * m[i] + (1.0 - beta1) * g
+                v[i] = beta2 * v[i] + (1.0 - beta2) * g * g
+                mhat = m[i] / (1.0 - beta1**t)
+                vhat = v[i] / (1.0 - beta2**t)
+                expected[i] = expected[i] * (1.0 - lr * weight_decay) - lr * mhat / (np.sqrt(vhat) + eps)
+
+            # gradients default to the ``grad`` attribute of each parameter
+            opt.step()
+
+        assert_np_equal(params[0].numpy(), expected[0], tol=1.0e-12)
+        assert_np_equal(params[1].numpy(), expected[1], tol=1.0e-5)
+
+
+def test_fused_adam_capture(test, device):
+    """Verify a captured fused step advances the device-side step counter on every replay."""
+    rng = np.random.default_rng(42)
+    num_steps = 4
+
+    with wp.ScopedDevice(device):
+        start = rng.uniform(-1.0, 1.0, size=(8, 3))
+        grad_values = rng.uniform(-1.0, 1.0, size=(8, 3))
+
+        ref_params = wp.array(start, dtype=wp.vec3)
+        ref_opt = warp.optim.FusedAdam([ref_params], lr=0.1)
+        ref_grad = wp.array(grad_values, dtype=wp.vec3)
+        for _ in range(num_steps):
+            ref_opt.step([ref_grad])
+
+        params = wp.array(start, dtype=wp.vec3)
+        grad = wp.array(grad_values, dtype=wp.vec3)
+        opt = warp.optim.FusedAdam([params], lr=0.1)
+
+        # the first step loads the kernels and uploads the gradient pointer table
+        opt.step([grad])
+        with wp.ScopedCapture(device=device, apic=True, force_module_load=False) as capture:
+            opt.step([grad])
+        for _ in range(num_steps - 1):
+            wp.capture_launch(capture.graph)
+
+        test.assertEqual(opt.t.numpy()[0], num_steps)
+        assert_np_equal(params.numpy(), ref_params.numpy(), tol=1.0e-6)
+
+        # resetting the internal state restarts the bias correction from the first step
+        opt.reset_internal_state()
+        test.assertEqual(opt.t.numpy()[0], 0)
+        test.assertEqual(np.count_nonzero(opt._groups[0][1].m.numpy()), 0)
+
+
+def test_fused_adam_invalid_params(test, device):
+    with wp.ScopedDevice(device):
+        with test.assertRaisesRegex(RuntimeError, r"Unsupported dtype"):
+            warp.optim.FusedAdam([wp.zeros(4, dtype=int)])
+
+        strided = wp.zeros((4, 4), dtype=float)[:, 1]
+        with test.assertRaisesRegex(ValueError, r"contiguous"):
+            warp.optim.FusedAdam([strided])
+
+        params = wp.zeros(4, dtype=float)
+        opt = warp.optim.FusedAdam([params])
+        with test.assertRaisesRegex(ValueError, r"matching the parameter dtype and shape"):
+            opt.step([wp.zeros(3, dtype=float)])
+
+
 devices = get_test_devices()
 
 
@@ -218,6 +329,10 @@ add_function_test(
     test_adam_set_params_migrates_state,
     devices=get_cuda_test_devices(),
 )
+add_function_test(TestAdam, "test_fused_adam_matches_adam", test_fused_adam_matches_adam, devices=devices)
+add_function_test(TestAdam, "test_fused_adam_weight_decay", test_fused_adam_weight_decay, devices=devices)
+add_function_test(TestAdam, "test_fused_adam_capture", test_fused_adam_capture, devices=devices)
+add_function_test(TestAdam, "test_fused_adam_invalid_params", test_fused_adam_invalid_params, devices=devices)
 
 
 if __name__ == "__main__":
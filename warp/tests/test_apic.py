@@ -1474,6 +1474,78 @@ def test_capture_while_cpu(test, device):
     test.assertEqual(int(counter.numpy()[0]), 0)
 
 
+@wp.kernel
+def increment_kernel(a: wp.array(dtype=float)):
+    i = wp.tid()
+    a[i] = a[i] + 1.0
+
+
+@wp.kernel
+def add_id_kernel(a: wp.array(dtype=float), id: wp.uint64):
+    i = wp.tid()
+    a[i] = a[i] + float(id)
+
+
+def test_capture_concurrent_replay_cpu(test, device):
+    """CPU replay runs independent operations concurrently and keeps dependent ones in order."""
+    num_bodies = 8
+    n = 1024
+
+    bodies = [wp.zeros(n, dtype=float, device=device) for _ in range(num_bodies)]
+    copies = [wp.zeros(n, dtype=float, device=device) for _ in range(num_bodies)]
+    # slices of one allocation share a memory region and must not run concurrently
+    packed = wp.zeros(num_bodies * n, dtype=float, device=device)
+
+    wp.load_module(device=device)
+    with wp.ScopedCapture(device=device, apic=True, force_module_load=False) as capture:
+        for _ in range(3):
+            for k in range(num_bodies):
+                wp.launch(increment_kernel, dim=n, inputs=[bodies[k]], device=device)
+                wp.launch(increment_kernel, dim=2 * n, inputs=[packed[(k // 2) * n : (k // 2 + 2) * n]], device=device)
+        for k in range(num_bodies):
+            wp.copy(copies[k], bodies[k])
+        # uint64 arguments may be object ids, so this launch is ordered against everything
+        wp.launch(add_id_kernel, dim=n, inputs=[bodies[0], wp.uint64(10)], device=device)
+        for k in range(num_bodies):
+            wp.launch(scale_kernel, dim=n, inputs=[copies[k], bodies[k], 2.0], device=device)
+
+    expected_packed = np.zeros(num_bodies * n, dtype=np.float32)
+    for k in range(num_bodies):
+        expected_packed[(k // 2) * n : (k // 2 + 2) * n] += 3.0
+
+    saved_max_threads = wp.config.cpu_max_threads
+    try:
+        for max_threads in (1, 4, 0):
+            wp.config.cpu_max_threads = max_threads
+
+            for _ in range(2):
+                for arr in (*bodies, *copies, packed):
+                    arr.zero_()
+
+                wp.capture_launch(capture.graph)
+
+                for k in range(num_bodies):
+                    np.testing.assert_allclose(copies[k].numpy(), np.full(n, 3.0))
+                    np.testing.assert_allclose(bodies[k].numpy(), np.full(n, 6.0))
+                np.testing.assert_allclose(packed.numpy(), expected_packed)
+
+        # loaded graphs use the same schedule
+        wp.config.cpu_max_threads = 4
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "concurrent_replay")
+            wp.capture_save(capture.graph, path, inputs={"b0": bodies[0]}, outputs={"p": packed})
+
+            loaded = wp.capture_load(path, device=device)
+            loaded.set_param("b0", wp.full(n, 1.0, dtype=float, device=device))
+            wp.capture_launch(loaded)
+
+            result = wp.zeros(num_bodies * n, dtype=float, device=device)
+            loaded.get_param("p", result)
+            np.testing.assert_allclose(result.numpy(), 2.0 * expected_packed)
+    finally:
+        wp.config.cpu_max_threads = saved_max_threads
+
+
 def _make_const_writer(value):
     """Build a kernel that writes a compile-time constant. Two kernels from this
     factory share ``kernel.key`` (``_make_const_writer__locals__kernel``) but
@@ -3117,6 +3189,12 @@ add_function_test(
 # reconstructs the conditional body sub-graphs on CUDA.
 add_function_test(TestApic, "test_capture_if_cpu", test_capture_if_cpu, devices=devices)
 add_function_test(TestApic, "test_capture_while_cpu", test_capture_while_cpu, devices=devices)
+add_function_test(
+    TestApic,
+    "test_capture_concurrent_replay_cpu",
+    test_capture_concurrent_replay_cpu,
+    devices=[d for d in devices if d.is_cpu],
+)
 add_function_test(
     TestApic,
     "test_save_load_capture_if_cuda",
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for per-kernel incremental compilation of CPU modules."""
+
+import gc
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import warp as wp
+import warp._src.build
+
+
+class _TempCacheContext:
+    """Switch to a temporary kernel cache for cold compilation."""
+
+    def __enter__(self):
+        self._original_cache_dir = wp.config.kernel_cache_dir
+        self._tmp = tempfile.TemporaryDirectory(prefix="wp_incremental_test_")
+        warp._src.build.init_kernel_cache(path=self._tmp.name)
+        return self
+
+    def __exit__(self, *args):
+        wp.config.kernel_cache_dir = self._original_cache_dir
+        self._tmp.cleanup()
+
+
+@wp.func
+def incremental_helper(x: float):
+    return x * 2.0
+
+
+def create_kernels(module, scale):
+    @wp.kernel(module=module)
+    def add_one(a: wp.array[float]):
+        i = wp.tid()
+        a[i] = a[i] + 1.0
+
+    @wp.kernel(module=module)
+    def scale_values(a: wp.array[float]):
+        i = wp.tid()
+        a[i] = a[i] * scale
+
+    @wp.kernel(module=module)
+    def add_helper(a: wp.array[float]):
+        i = wp.tid()
+        a[i] = a[i] + incremental_helper(float(i))
+
+    return add_one, scale_values, add_helper
+
+
+def run_kernels(kernels, n):
+    a = wp.zeros(n, dtype=float, device="cpu")
+    for kernel in kernels:
+        wp.launch(kernel, dim=n, inputs=[a], device="cpu")
+    return a.numpy()
+
+
+class TestCpuIncrementalBuild(unittest.TestCase):
+    def setUp(self):
+        self._saved_max_workers = wp.config.load_module_max_workers
+
+    def tearDown(self):
+        wp.config.load_module_max_workers = self._saved_max_workers
+
+    def test_recompile_changed_kernel_only(self):
+        """Editing one kernel recompiles only that kernel's object."""
+        module = wp.get_module("test_cpu_incremental_build_changed")
+        module.options["cpu_incremental_build"] = True
+        n = 16
+
+        for max_workers in (0, 4):
+            wp.config.load_module_max_workers = max_workers
+
+            with (
+                _TempCacheContext(),
+                mock.patch.object(warp._src.build, "build_cpu", wraps=warp._src.build.build_cpu) as build_cpu,
+            ):
+                result = run_kernels(create_kernels(module, 2.0), n)
+                np.testing.assert_allclose(result, 2.0 * np.arange(n) + 2.0)
+                self.assertEqual(build_cpu.call_count, 3)
+
+                # drop the previous kernel objects so the module only contains the new versions
+                gc.collect()
+
+                build_cpu.reset_mock()
+                result = run_kernels(create_kernels(module, 3.0), n)
+                np.testing.assert_allclose(result, 2.0 * np.arange(n) + 3.0)
+                self.assertEqual(build_cpu.call_count, 1)
+
+                # the unit of the previous version of the edited kernel is removed
+                unit_files = os.listdir(module._get_cpu_unit_dir())
+                for ext in (".cpp", ".o", ".meta", ".lock"):
+                    self.assertEqual(len([f for f in unit_files if f.endswith(ext)]), 3)
+
+                # a fresh load of unchanged kernels compiles nothing
+                module.unload()
+                build_cpu.reset_mock()
+                result = run_kernels(create_kernels(module, 3.0), n)
+                np.testing.assert_allclose(result, 2.0 * np.arange(n) + 3.0)
+                self.assertEqual(build_cpu.call_count, 0)
+
+            module.unload()
+
+    def test_config_default(self):
+        """The module option inherits ``warp.config.cpu_incremental_build``."""
+        module = wp.get_module("test_cpu_incremental_build_config")
+        saved = wp.config.cpu_incremental_build
+        try:
+            wp.config.cpu_incremental_build = True
+            with _TempCacheContext():
+                kernels = create_kernels(module, 2.0)
+                result = run_kernels(kernels, 8)
+                np.testing.assert_allclose(result, 2.0 * np.arange(8) + 2.0)
+
+                module_exec = module.load("cpu", 1)
+                self.assertIsNone(module_exec.handle)
+                self.assertEqual(len(module_exec.kernel_handles), 3)
+        finally:
+            wp.config.cpu_incremental_build = saved
+            module.unload()
+
+    def test_invalid_option(self):
+        module = wp.get_module("test_cpu_incremental_build_invalid")
+        module.options["cpu_incremental_build"] = 1
+        try:
+            with self.assertRaisesRegex(TypeError, r"cpu_incremental_build must be a bool, got int"):
+                module.resolve_options(wp.config)
+        finally:
+            module.options["cpu_incremental_build"] = None
+
+
+if __name__ == "__main__":
+    wp.clear_kernel_cache()
+    unittest.main(verbosity=2)
@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+
+import warp as wp
+from warp.tests.unittest_utils import *
+
+
+@wp.kernel
+def square_kernel(x: wp.array(dtype=float), y: wp.array(dtype=float)):
+    i = wp.tid()
+    y[i] = x[i] * x[i]
+
+
+@wp.kernel
+def index_kernel_3d(out: wp.array3d(dtype=int)):
+    i, j, k = wp.tid()
+    out[i, j, k] = i * 10000 + j * 100 + k
+
+
+@wp.kernel
+def count_kernel(counter: wp.array(dtype=int), bins: wp.array(dtype=int), total: wp.array(dtype=float)):
+    i = wp.tid()
+    wp.atomic_add(counter, 0, 1)
+    wp.atomic_add(bins, i % 7, 1)
+    wp.atomic_max(counter, 1, i)
+    wp.atomic_add(total, 0, 1.0)
+
+
+@wp.kernel
+def sum_kernel(x: wp.array(dtype=float), loss: wp.array(dtype=float)):
+    i = wp.tid()
+    wp.atomic_add(loss, 0, x[i] * x[i])
+
+
+@wp.kernel
+def tile_sum_kernel(x: wp.array2d(dtype=float), out: wp.array(dtype=float)):
+    i = wp.tid()
+    t = wp.tile_load(x[i], shape=16)
+    s = wp.tile_sum(t)
+    wp.tile_store(out, s, offset=i)
+
+
+def test_cpu_threads_forward(test, device):
+    n = 10007
+    x = wp.array(np.linspace(-1.0, 1.0, n, dtype=np.float32), device=device)
+    y_serial = wp.zeros(n, dtype=float, device=device)
+    y_parallel = wp.zeros(n, dtype=float, device=device)
+
+    wp.launch(square_kernel, dim=n, inputs=[x, y_serial], device=device, cpu_threads=1)
+    wp.launch(square_kernel, dim=n, inputs=[x, y_parallel], device=device, cpu_threads=4)
+
+    assert_np_equal(y_parallel.numpy(), y_serial.numpy())
+
+    out = wp.zeros((13, 17, 19), dtype=int, device=device)
+    wp.launch(index_kernel_3d, dim=out.shape, inputs=[out], device=device, cpu_threads=0)
+
+    i, j, k = np.meshgrid(np.arange(13), np.arange(17), np.arange(19), indexing="ij")
+    assert_np_equal(out.numpy(), i * 10000 + j * 100 + k)
+
+
+def test_cpu_threads_atomics(test, device):
+    n = 100000
+    counter = wp.zeros(2, dtype=int, device=device)
+    bins = wp.zeros(7, dtype=int, device=device)
+    total = wp.zeros(1, dtype=float, device=device)
+
+    wp.launch(count_kernel, dim=n, inputs=[counter, bins, total], device=device, cpu_threads=8)
+
+    test.assertEqual(counter.numpy()[0], n)
+    test.assertEqual(counter.numpy()[1], n - 1)
+    assert_np_equal(bins.numpy(), np.bincount(np.arange(n) % 7))
+    # every partial sum is an integer below 2^24, so the float result is exact in any order
+    test.assertEqual(total.numpy()[0], float(n))
+
+
+def test_cpu_threads_backward(test, device):
+    n = 4096
+    x_np = np.linspace(0.0, 1.0, n, dtype=np.float32)
+
+    grads = []
+    for cpu_threads in (1, 4):
+        x = wp.array(x_np, dtype=float, device=device, requires_grad=True)
+        loss = wp.zeros(1, dtype=float, device=device, requires_grad=True)
+
+        tape = wp.Tape()
+        with tape:
+            wp.launch(sum_kernel, dim=n, inputs=[x, loss], device=device, cpu_threads=cpu_threads)
+
+        tape.backward(loss=loss)
+        grads.append(x.grad.numpy().copy())
+
+        # recorded launches replay their backward pass with the same thread count
+        wp.launch(
+            sum_kernel,
+            dim=n,
+            inputs=[x, loss],
+            adj_inputs=[x.grad, loss.grad],
+            adjoint=True,
+            device=device,
+            cpu_threads=cpu_threads,
+        )
+        assert_np_equal(x.grad.numpy(), 2.0 * grads[-1], tol=1.0e-6)
+
+    assert_np_equal(grads[1], grads[0])
+    assert_np_equal(grads[0], 2.0 * x_np, tol=1.0e-6)
+
+
+def test_cpu_threads_config(test, device):
+    n = 50000
+    counter = wp.zeros(2, dtype=int, device=device)
+    bins = wp.zeros(7, dtype=int, device=device)
+    total = wp.zeros(1, dtype=float, device=device)
+
+    saved = wp.config.cpu_max_threads
+    try:
+        wp.config.cpu_max_threads = 0
+        wp.launch(count_kernel, dim=n, inputs=[counter, bins, total], device=device)
+
+        cmd = wp.launch(count_kernel, dim=n, inputs=[counter, bins, total], device=device, record_cmd=True)
+        test.assertIsNone(cmd.cpu_threads)
+        cmd.launch()
+    finally:
+        wp.config.cpu_max_threads = saved
+
+    test.assertEqual(counter.numpy()[0], 2 * n)
+
+    with test.assertRaises(TypeError):
+        wp.config.cpu_max_threads = 2.0
+
+
+def test_cpu_threads_tiles(test, device):
+    # tile kernels share a static tile buffer on the CPU and fall back to a single thread
+    n = 64
+    x_np = np.arange(n * 16, dtype=np.float32).reshape(n, 16)
+    x = wp.array(x_np, device=device)
+    out = wp.zeros(n, dtype=float, device=device)
+
+    wp.launch_tiled(tile_sum_kernel, dim=n, inputs=[x, out], block_dim=1, device=device, cpu_threads=4)
+
+    hooks = tile_sum_kernel.module.load(device, 1).get_kernel_hooks(tile_sum_kernel)
+    test.assertIsNone(hooks.forward_range)
+    assert_np_equal(out.numpy(), x_np.sum(axis=1))
+
+
+class TestCpuThreads(unittest.TestCase):
+    pass
+
+
+devices = get_test_devices()
+cpu_devices = [d for d in devices if d.is_cpu]
+
+add_function_test(TestCpuThreads, "test_cpu_threads_forward", test_cpu_threads_forward, devices=cpu_devices)
+add_function_test(TestCpuThreads, "test_cpu_threads_atomics", test_cpu_threads_atomics, devices=cpu_devices)
+add_function_test(TestCpuThreads, "test_cpu_threads_backward", test_cpu_threads_backward, devices=cpu_devices)
+add_function_test(TestCpuThreads, "test_cpu_threads_config", test_cpu_threads_config, devices=cpu_devices)
+add_function_test(TestCpuThreads, "test_cpu_threads_tiles", test_cpu_threads_tiles, devices=cpu_devices)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
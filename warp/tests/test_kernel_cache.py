@@ -3,13 +3,56 @@
 
 import json
 import os
+import subprocess
+import sys
 import tempfile
+import textwrap
+import time
 import unittest
 from unittest.mock import patch
 
 import warp._src.build
 import warp.config
 
+COMPILE_LOCK_SCRIPT = """
+import os
+import sys
+import time
+
+import warp as wp
+import warp._src.build
+
+num_compiles = 0
+build_cpu = warp._src.build.build_cpu
+
+
+def counting_build_cpu(*args, **kwargs):
+    global num_compiles
+    num_compiles += 1
+    return build_cpu(*args, **kwargs)
+
+
+warp._src.build.build_cpu = counting_build_cpu
+
+
+@wp.kernel(module="test_compile_lock_shared")
+def shared_kernel(a: wp.array[float]):
+    i = wp.tid()
+    a[i] = float(i) * 3.0
+
+
+wp.init()
+
+# start compiling at roughly the same time as the other processes
+open(os.path.join(sys.argv[1], f"ready_{os.getpid()}"), "w").close()
+while not os.path.exists(os.path.join(sys.argv[1], "go")):
+    time.sleep(0.01)
+
+a = wp.zeros(8, dtype=float, device="cpu")
+wp.launch(shared_kernel, dim=8, inputs=[a], device="cpu")
+print(num_compiles, sum(a.numpy().tolist()))
+"""
+
 
 class TestKernelCache(unittest.TestCase):
     def setUp(self):
@@ -216,6 +259,270 @@ class TestKernelCache(unittest.TestCase):
         self.assertEqual(healed_meta, {lto_symbol: shared_memory_bytes})
         self.assertEqual(healed_lto_data, b"rebuilt")
 
+    def test_cache_lock_times_out(self):
+        """A held cache lock makes other acquirers fall through after the timeout."""
+        with tempfile.TemporaryDirectory() as tmp:
+            lock_path = os.path.join(tmp, "wp_test.lock")
+            with warp._src.build.cache_lock(lock_path) as locked:
+                if not locked:
+                    self.skipTest("File locking is not supported on this file system")
+
+                start = time.perf_counter()
+                with warp._src.build.cache_lock(lock_path, timeout=0.1) as locked_again:
+                    self.assertFalse(locked_again)
+                self.assertGreaterEqual(time.perf_counter() - start, 0.1)
+
+            with warp._src.build.cache_lock(lock_path, timeout=0.1) as locked:
+                self.assertTrue(locked)
+
+    def test_compile_lock_multiprocess(self):
+        """Processes sharing a kernel cache compile a module only once."""
+        num_processes = 4
+
+        with tempfile.TemporaryDirectory() as tmp:
+            script_path = os.path.join(tmp, "compile_lock.py")
+            with open(script_path, "w") as f:
+                f.write(textwrap.dedent(COMPILE_LOCK_SCRIPT))
+
+            env = dict(os.environ, WARP_CACHE_PATH=os.path.join(tmp, "cache"))
+            processes = [
+                subprocess.Popen(
+                    [sys.executable, script_path, tmp],
+                    env=env,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+                for _ in range(num_processes)
+            ]
+
+            try:
+                deadline = time.perf_counter() + 300.0
+                while len([f for f in os.listdir(tmp) if f.startswith("ready_")]) < num_processes:
+                    if time.perf_counter() > deadline or any(p.poll() is not None for p in processes):
+                        break
+                    time.sleep(0.01)
+                open(os.path.join(tmp, "go"), "w").close()
+
+                results = [p.communicate(timeout=600) for p in processes]
+            finally:
+                for p in processes:
+                    if p.poll() is None:
+                        p.kill()
+
+            num_compiles = 0
+            for p, (stdout, stderr) in zip(processes, results, strict=True):
+                self.assertEqual(p.returncode, 0, stderr)
+                compiles, total = stdout.split()[-2:]
+                num_compiles += int(compiles)
+                self.assertEqual(float(total), 84.0)
+
+            self.assertEqual(num_compiles, 1)
+
+    def test_compile_lock_only_in_cache(self):
+        """Compiling to a caller-provided directory leaves no lock files next to it."""
+        import warp as wp  # noqa: PLC0415
+
+        module = wp.get_module("test_kernel_cache_aot_lock")
+
+        @wp.kernel(module=module)
+        def aot_lock_kernel(a: wp.array[float]):
+            i = wp.tid()
+            a[i] = float(i)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            self._init_temp_cache(os.path.join(tmp, "cache"))
+
+            module_dir = os.path.join(tmp, "aot", "module")
+            os.makedirs(module_dir)
+            wp.compile_aot_module(module, device="cpu", module_dir=module_dir)
+
+            self.assertTrue(any(f.endswith(".o") for f in os.listdir(module_dir)))
+            for path in (tmp, os.path.join(tmp, "aot"), module_dir, warp.config.kernel_cache_dir):
+                self.assertEqual([f for f in os.listdir(path) if f.endswith(".lock")], [])
+
+    def _init_temp_cache(self, tmp):
+        # initialize the runtime first so that it keeps the temporary cache path
+        warp._src.context.init()
+        warp._src.build.init_kernel_cache(path=tmp)
+
+    def _make_cache_entry(self, name, num_bytes, last_used):
+        path = os.path.join(warp.config.kernel_cache_dir, name)
+        os.makedirs(path)
+        with open(os.path.join(path, "module.o"), "wb") as f:
+            f.write(b"\0" * num_bytes)
+        os.utime(path, (last_used, last_used))
+        return path
+
+    def test_prune_kernel_cache_lru(self):
+        """prune_kernel_cache() evicts the least recently used entries until the cache fits."""
+        with tempfile.TemporaryDirectory() as tmp:
+            self._init_temp_cache(tmp)
+
+            now = time.time()
+            oldest = self._make_cache_entry("wp_oldest_0000001", 1000, now - 300.0)
+            older = self._make_cache_entry("wp_older_0000002", 1000, now - 200.0)
+            newer = self._make_cache_entry("wp_newer_0000003", 1000, now - 100.0)
+            recent = self._make_cache_entry("wp_recent_0000004", 1000, now)
+
+            # in-flight build directories and non-module entries are never evicted
+            build_dir = self._make_cache_entry("wp_building_0000005_p123_t456", 1000, now - 400.0)
+            lto_dir = self._make_cache_entry("lto", 1000, now - 400.0)
+
+            self.assertEqual(warp._src.build.prune_kernel_cache(max_bytes=4000, min_age=0.0), 0)
+
+            freed = warp._src.build.prune_kernel_cache(max_bytes=2500, min_age=0.0)
+            self.assertEqual(freed, 2000)
+            self.assertFalse(os.path.exists(oldest))
+            self.assertFalse(os.path.exists(older))
+            for path in (newer, recent, build_dir, lto_dir):
+                self.assertTrue(os.path.isdir(path))
+
+            # entries used within min_age are kept even if the cache stays over the limit
+            freed = warp._src.build.prune_kernel_cache(max_bytes=0, min_age=50.0)
+            self.assertEqual(freed, 1000)
+            self.assertFalse(os.path.exists(newer))
+            self.assertTrue(os.path.isdir(recent))
+
+            with self.assertRaises(ValueError):
+                warp._src.build.prune_kernel_cache(max_bytes=-1)
+
+    def test_prune_kernel_cache_locks(self):
+        """prune_kernel_cache() removes the compile locks of evicted and missing entries."""
+        with tempfile.TemporaryDirectory() as tmp:
+            self._init_temp_cache(tmp)
+
+            now = time.time()
+            self._make_cache_entry("wp_evicted.module_0000001", 1000, now - 300.0)
+            self._make_cache_entry("wp_kept_0000002", 1000, now)
+
+            def make_lock(name):
+                path = os.path.join(warp.config.kernel_cache_dir, name)
+                open(path, "w").close()
+                return path
+
+            evicted_locks = [
+                make_lock("wp_evicted.module_0000001.o.lock"),
+                make_lock("wp_evicted.module_0000001.cpu1234abcd.o.lock"),
+            ]
+            kept_lock = make_lock("wp_kept_0000002.o.lock")
+            orphaned_lock = make_lock("wp_missing_0000003.o.lock")
+            building_lock = make_lock("wp_building_0000004.o.lock")
+
+            # the lock of an entry that is being built for the first time is held without an entry directory
+            with warp._src.build.cache_lock(building_lock) as locked:
+                if not locked:
+                    self.skipTest("File locking is not supported on this file system")
+
+                freed = warp._src.build.prune_kernel_cache(max_bytes=1500, min_age=0.0)
+
+            self.assertEqual(freed, 1000)
+            for path in (*evicted_locks, orphaned_lock):
+                self.assertFalse(os.path.exists(path))
+            self.assertTrue(os.path.exists(kept_lock))
+            self.assertTrue(os.path.exists(building_lock))
+
+            # no orphaned locks remain once the build has released its lock
+            warp._src.build.prune_kernel_cache(max_bytes=1500, min_age=0.0)
+            self.assertEqual(
+                sorted(f for f in os.listdir(warp.config.kernel_cache_dir) if f.endswith(".lock")),
+                ["wp_kept_0000002.o.lock", "wp_prune.lock"],
+            )
+
+    def test_prune_kernel_cache_config(self):
+        """prune_kernel_cache() falls back to warp.config.kernel_cache_max_bytes."""
+        saved_max_bytes = warp.config.kernel_cache_max_bytes
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                self._init_temp_cache(tmp)
+
+                entry = self._make_cache_entry("wp_module_0000001", 1000, time.time() - 300.0)
+
+                warp.config.kernel_cache_max_bytes = None
+                self.assertEqual(warp._src.build.prune_kernel_cache(min_age=0.0), 0)
+                self.assertTrue(os.path.isdir(entry))
+
+                warp.config.kernel_cache_max_bytes = 0
+                self.assertEqual(warp._src.build.prune_kernel_cache(min_age=0.0), 1000)
+                self.assertFalse(os.path.exists(entry))
+        finally:
+            warp.config.kernel_cache_max_bytes = saved_max_bytes
+
+    def test_cache_hit_refreshes_last_use(self):
+        """Loading a module from the cache marks its entry as recently used."""
+        import warp as wp  # noqa: PLC0415
+
+        module = wp.get_module("test_kernel_cache_last_use")
+
+        @wp.kernel(module=module)
+        def last_use_kernel(a: wp.array[float]):
+            i = wp.tid()
+            a[i] = float(i)
+
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                self._init_temp_cache(tmp)
+
+                module.load("cpu")
+                entry = os.path.join(warp.config.kernel_cache_dir, module.get_module_identifier())
+                self.assertTrue(os.path.isdir(entry))
+
+                stale = time.time() - 3600.0
+                os.utime(entry, (stale, stale))
+                module.unload()
+                module.load("cpu")
+                self.assertGreater(os.stat(entry).st_mtime, stale + 60.0)
+
+                module.unload()
+        finally:
+            module.unload()
+
+    def test_shared_cache_tier(self):
+        """Modules promoted to the shared cache tier are loaded from it instead of being compiled."""
+        import warp as wp  # noqa: PLC0415
+
+        saved_shared_dir = warp.config.kernel_cache_shared_dir
+
+        for incremental in (False, True):
+            module = wp.get_module(f"test_kernel_cache_shared_tier_{int(incremental)}")
+            module.options["cpu_incremental_build"] = incremental
+
+            @wp.kernel(module=module)
+            def shared_tier_kernel(a: wp.array[float]):
+                i = wp.tid()
+                a[i] = float(i) * 2.0
+
+            try:
+                with (
+                    self.subTest(incremental=incremental),
+                    tempfile.TemporaryDirectory() as tmp,
+                    patch.object(warp._src.build, "build_cpu", wraps=warp._src.build.build_cpu) as build_cpu,
+                ):
+                    warp.config.kernel_cache_shared_dir = os.path.join(tmp, "shared")
+
+                    # the first worker compiles the module and promotes it to the shared tier
+                    self._init_temp_cache(os.path.join(tmp, "worker_0"))
+                    module.load("cpu", 1)
+                    self.assertEqual(build_cpu.call_count, 1)
+                    module.unload()
+
+                    shared_dir = warp._src.build.get_shared_kernel_cache_dir()
+                    self.assertEqual(len(os.listdir(shared_dir)), 1)
+
+                    # a worker with an empty local cache loads the module from the shared tier
+                    self._init_temp_cache(os.path.join(tmp, "worker_1"))
+                    a = wp.zeros(8, dtype=float, device="cpu")
+                    wp.launch(shared_tier_kernel, dim=8, inputs=[a], device="cpu")
+                    self.assertEqual(a.numpy().tolist(), [2.0 * i for i in range(8)])
+                    self.assertEqual(build_cpu.call_count, 1)
+                    self.assertEqual(os.listdir(warp.config.kernel_cache_dir), [])
+
+                    module.unload()
+            finally:
+                warp.config.kernel_cache_shared_dir = saved_shared_dir
+                module.options["cpu_incremental_build"] = None
+                module.unload()
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -376,6 +376,42 @@ def test_launch_tuple_args(test, device):
     assert_np_equal(out.numpy(), np.array((0, 3, 6, 9)))
 
 
+@wp.kernel
+def kernel_scale_offset(values: wp.array(dtype=float), scale: float, offset: wp.vec2, out: wp.array(dtype=float)):
+    tid = wp.tid()
+    out[tid] = values[tid] * scale + offset[0] + offset[1]
+
+
+def test_launch_cached_arg_packing(test, device):
+    """Repeated launches reuse cached argument packers without changing behavior."""
+    values = wp.array(np.arange(0, 4), dtype=float, device=device)
+    out = wp.empty_like(values)
+
+    for scale in (2.0, 3, True):
+        wp.launch(kernel_scale_offset, dim=4, inputs=[values, scale, wp.vec2(1.0, 2.0), out], device=device)
+        assert_np_equal(out.numpy(), np.arange(0, 4) * float(scale) + 3.0)
+
+    # a tuple is converted to the vector type on every launch
+    wp.launch(kernel_scale_offset, dim=4, inputs=[values, 1.0, (0.5, 0.5), out], device=device)
+    assert_np_equal(out.numpy(), np.arange(0, 4) + 1.0)
+
+    # arrays with the same Python type but another dtype or dimension are still rejected
+    int_values = wp.zeros(4, dtype=int, device=device)
+    with test.assertRaisesRegex(RuntimeError, r"argument 'values' expects an array with dtype="):
+        wp.launch(kernel_scale_offset, dim=4, inputs=[int_values, 1.0, wp.vec2(), out], device=device)
+
+    values_2d = wp.zeros((2, 2), dtype=float, device=device)
+    with test.assertRaisesRegex(RuntimeError, r"argument 'values' expects an array with 1 dimension\(s\)"):
+        wp.launch(kernel_scale_offset, dim=4, inputs=[values_2d, 1.0, wp.vec2(), out], device=device)
+
+    with test.assertRaisesRegex(RuntimeError, r"unable to pack kernel parameter type"):
+        wp.launch(kernel_scale_offset, dim=4, inputs=[values, "2.0", wp.vec2(), out], device=device)
+
+    # the cached packers keep working after a failed launch
+    wp.launch(kernel_scale_offset, dim=4, inputs=[values, 2.0, wp.vec2(1.0, 2.0), out], device=device)
+    assert_np_equal(out.numpy(), np.arange(0, 4) * 2.0 + 3.0)
+
+
 # ==================================================================================
 # Launch bounds tests
 # ==================================================================================
@@ -522,6 +558,7 @@ add_function_test(TestLaunch, "test_launch_cmd_adjoint", test_launch_cmd_adjoint
 add_function_test(TestLaunch, "test_launch_cmd_adjoint_empty", test_launch_cmd_adjoint_empty, devices=devices)
 
 add_function_test(TestLaunch, "test_launch_tuple_args", test_launch_tuple_args, devices=devices)
+add_function_test(TestLaunch, "test_launch_cached_arg_packing", test_launch_cached_arg_packing, devices=devices)
 
 add_function_test(TestLaunch, "test_launch_bounds_none", test_launch_bounds_none, devices=devices)
 add_function_test(TestLaunch, "test_launch_bounds_single", test_launch_bounds_single, devices=devices)
@@ -7,8 +7,22 @@ import unittest
 import numpy as np
 
 import warp as wp
+import warp.sparse as sparse
 from warp._src.optim.linear import TiledDot, _run_solver_loop
-from warp.optim.linear import CG, CR, GMRES, BiCGSTAB, aslinearoperator, bicgstab, cg, cr, gmres, preconditioner
+from warp.optim.linear import (
+    CG,
+    CR,
+    GMRES,
+    AMGPreconditioner,
+    BiCGSTAB,
+    ILU0Preconditioner,
+    aslinearoperator,
+    bicgstab,
+    cg,
+    cr,
+    gmres,
+    preconditioner,
+)
 from warp.tests.unittest_utils import *
 
 
@@ -529,6 +543,271 @@ def test_functor_compat_errors(test, device):
             bic_state(M=M2)
 
 
+def _make_poisson_system(n: int, block_size: int, dtype, device):
+    # 2D Laplacian on an n x n grid, coupled with an SPD block for vector-valued unknowns
+    rows, cols, coeffs = [], [], []
+    for i, j in itertools.product(range(n), range(n)):
+        node = i * n + j
+        rows.append(node)
+        cols.append(node)
+        coeffs.append(4.0)
+        for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if 0 <= i + di < n and 0 <= j + dj < n:
+                rows.append(node)
+                cols.append((i + di) * n + j + dj)
+                coeffs.append(-1.0)
+
+    coeffs = np.array(coeffs)
+    if block_size == 1:
+        values = wp.array(coeffs, dtype=dtype, device=device)
+        block_type = dtype
+    else:
+        block = np.eye(block_size) + 0.25 * (np.ones((block_size, block_size)) - np.eye(block_size))
+        block_type = wp.types.matrix(shape=(block_size, block_size), dtype=dtype)
+        values = wp.array(coeffs[:, None, None] * block, dtype=block_type, device=device)
+
+    A = sparse.bsr_zeros(n * n, n * n, block_type=block_type, device=device)
+    sparse.bsr_set_from_triplets(
+        A, wp.array(rows, dtype=int, device=device), wp.array(cols, dtype=int, device=device), values
+    )
+
+    rng = np.random.default_rng(n)
+    b = wp.array(rng.uniform(-1.0, 1.0, size=A.shape[0]), dtype=dtype, device=device)
+    return A, b
+
+
+def _bsr_residual_norm(A, b, x):
+    r = wp.clone(b)
+    sparse.bsr_mv(A, x, r, alpha=-1.0, beta=1.0)
+    return np.linalg.norm(r.numpy())
+
+
+def test_amg_preconditioner(test, device):
+    with wp.ScopedDevice(device):
+        for block_size, dtype, smoother in (
+            (1, wp.float64, "jacobi"),
+            (1, wp.float32, "chebyshev"),
+            (2, wp.float64, "chebyshev"),
+            (3, wp.float32, "jacobi"),
+        ):
+            A, b = _make_poisson_system(32, block_size, dtype, device)
+
+            M = AMGPreconditioner(A, smoother=smoother, coarse_size=64)
+            test.assertGreater(M.num_levels, 2)
+            shapes = M.level_shapes
+            test.assertEqual(shapes[0], A.shape)
+            for fine_shape, coarse_shape in itertools.pairwise(shapes):
+                test.assertLess(coarse_shape[0], fine_shape[0])
+                test.assertEqual(coarse_shape[0] % block_size, 0)
+            test.assertLessEqual(shapes[-1][0], 64)
+
+            x = wp.zeros_like(b)
+            niter_diag, _, _ = cg(A, b, x, M=preconditioner(A, "diag"), tol=1.0e-5, check_every=1, maxiter=1000)
+
+            x.zero_()
+            niter, err, atol = cg(A, b, x, M=M, tol=1.0e-5, check_every=1, maxiter=1000)
+            test.assertLessEqual(err, atol)
+            test.assertLess(niter, niter_diag // 3)
+
+            tol = 1.0e-4 if dtype == wp.float32 else 1.0e-8
+            test.assertLessEqual(_bsr_residual_norm(A, b, x), 4.0 * atol + tol)
+
+        A, b = _make_poisson_system(8, 1, wp.float64, device)
+        M = preconditioner(A, "amg")
+        test.assertIsInstance(M, AMGPreconditioner)
+
+        # small systems are solved directly
+        M = AMGPreconditioner(A, coarse_size=A.shape[0])
+        test.assertEqual(M.num_levels, 1)
+        x = wp.zeros_like(b)
+        M.matvec(b, x, x, 1.0, 0.0)
+        test.assertLess(_bsr_residual_norm(A, b, x), 1.0e-10)
+
+        with test.assertRaisesRegex(ValueError, "Unsupported AMG smoother"):
+            AMGPreconditioner(A, smoother="gauss_seidel")
+        with test.assertRaisesRegex(ValueError, "requires a warp.sparse.BsrMatrix"):
+            AMGPreconditioner(wp.zeros((4, 4), dtype=wp.float64))
+
+
+def test_amg_update(test, device):
+    with wp.ScopedDevice(device):
+        A, b = _make_poisson_system(24, 2, wp.float64, device)
+        M = AMGPreconditioner(A, coarse_size=32)
+
+        # rescaling the coefficients keeps the same aggregates
+        A_scaled = sparse.bsr_copy(A)
+        sparse.bsr_scale(A_scaled, 3.0)
+        M_ref = AMGPreconditioner(A_scaled, coarse_size=32)
+        test.assertEqual(M.level_shapes, M_ref.level_shapes)
+
+        sparse.bsr_scale(A, 3.0)
+        M.update()
+
+        z = wp.empty_like(b)
+        z_ref = wp.empty_like(b)
+        M.matvec(b, z, z, 1.0, 0.0)
+        M_ref.matvec(b, z_ref, z_ref, 1.0, 0.0)
+        assert_np_equal(z.numpy(), z_ref.numpy(), tol=1.0e-10)
+
+        # a different matrix with the same sparsity pattern
+        M.update(A_scaled)
+        x = wp.zeros_like(b)
+        _, err, atol = cg(A_scaled, b, x, M=M, tol=1.0e-6, maxiter=200)
+        test.assertLessEqual(err, atol)
+
+        with test.assertRaisesRegex(ValueError, "same shape, dtype and device"):
+            M.update(_make_poisson_system(8, 2, wp.float64, device)[0])
+
+
+def test_amg_capture(test, device):
+    with wp.ScopedDevice(device):
+        A, b = _make_poisson_system(16, 2, wp.float32, device)
+        for smoother in ("jacobi", "chebyshev"):
+            M = AMGPreconditioner(A, smoother=smoother, coarse_size=32)
+
+            z_ref = wp.zeros_like(b)
+            M.matvec(b, z_ref, z_ref, 1.0, 0.0)
+
+            z = wp.zeros_like(b)
+            with wp.ScopedCapture(device=device, apic=True, force_module_load=False) as capture:
+                M.matvec(b, z, z, 2.0, 0.0)
+            wp.capture_launch(capture.graph)
+            assert_np_equal(z.numpy(), 2.0 * z_ref.numpy(), tol=1.0e-5)
+
+            # re-valued hierarchies are picked up by the captured V-cycle
+            sparse.bsr_scale(A, 2.0)
+            M.update()
+            wp.capture_launch(capture.graph)
+            assert_np_equal(z.numpy(), z_ref.numpy(), tol=1.0e-5)
+            sparse.bsr_scale(A, 0.5)
+
+
+def _ilu0_reference(A_blocks: np.ndarray, pattern: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # dense block ILU(0) restricted to the sparsity pattern, followed by the triangular solves
+    n = pattern.shape[0]
+    LU = A_blocks.copy()
+    for i in range(n):
+        for k in range(i):
+            if pattern[i, k]:
+                LU[i, k] = LU[i, k] @ np.linalg.inv(LU[k, k])
+                for j in range(k + 1, n):
+                    if pattern[i, j] and pattern[k, j]:
+                        LU[i, j] -= LU[i, k] @ LU[k, j]
+
+    block_size = A_blocks.shape[2]
+    b = b.reshape(n, block_size)
+    y = np.zeros_like(b)
+    for i in range(n):
+        y[i] = b[i] - sum(LU[i, k] @ y[k] for k in range(i) if pattern[i, k])
+    x = np.zeros_like(b)
+    for i in reversed(range(n)):
+        s = y[i] - sum(LU[i, j] @ x[j] for j in range(i + 1, n) if pattern[i, j])
+        x[i] = np.linalg.solve(LU[i, i], s)
+    return x.flatten()
+
+
+def test_ilu0_preconditioner(test, device):
+    rng = np.random.default_rng(17)
+
+    with wp.ScopedDevice(device):
+        # random non-symmetric, diagonally dominant matrices against a dense reference
+        n = 24
+        for block_size, dtype in ((1, wp.float64), (3, wp.float64), (2, wp.float32)):
+            pattern = rng.random((n, n)) < 0.2
+            np.fill_diagonal(pattern, True)
+            A_blocks = rng.uniform(-1.0, 1.0, size=(n, n, block_size, block_size))
+            A_blocks[~pattern] = 0.0
+            for i in range(n):
+                A_blocks[i, i] += 4.0 * n * np.eye(block_size)
+
+            rows, cols = np.nonzero(pattern)
+            if block_size == 1:
+                block_type = dtype
+                values = wp.array(A_blocks[rows, cols, 0, 0], dtype=dtype)
+            else:
+                block_type = wp.types.matrix(shape=(block_size, block_size), dtype=dtype)
+                values = wp.array(A_blocks[rows, cols], dtype=block_type)
+            A = sparse.bsr_from_triplets(
+                n, n, wp.array(rows, dtype=int), wp.array(cols, dtype=int), values, prune_numerical_zeros=False
+            )
+
+            b_np = rng.uniform(-1.0, 1.0, size=n * block_size)
+            b = wp.array(b_np, dtype=dtype)
+
+            M = ILU0Preconditioner(A)
+            z = wp.empty_like(b)
+            M.matvec(b, z, z, 1.0, 0.0)
+
+            tol = 1.0e-5 if dtype == wp.float32 else 1.0e-10
+            assert_np_equal(z.numpy(), _ilu0_reference(A_blocks, pattern, b_np), tol=tol)
+
+        # diffusion problems, the factors of symmetric matrices make a symmetric preconditioner
+        for block_size, dtype in ((1, wp.float64), (2, wp.float32)):
+            A, b = _make_poisson_system(24, block_size, dtype, device)
+            M = preconditioner(A, "ilu0")
+            test.assertIsInstance(M, ILU0Preconditioner)
+            test.assertEqual(M.num_levels, (47, 47))
+
+            x = wp.zeros_like(b)
+            niter_diag, _, _ = cg(A, b, x, M=preconditioner(A, "diag"), tol=1.0e-5, check_every=1, maxiter=1000)
+
+            x.zero_()
+            niter, err, atol = cg(A, b, x, M=preconditioner(A, "ic0"), tol=1.0e-5, check_every=1, maxiter=1000)
+            test.assertLessEqual(err, atol)
+            test.assertLess(niter, niter_diag // 2)
+
+            x.zero_()
+            niter, err, atol = bicgstab(A, b, x, M=M, tol=1.0e-5, check_every=1, maxiter=1000)
+            test.assertLessEqual(err, atol)
+
+        # no fill-in for tridiagonal matrices, so the factorization is exact
+        n = 32
+        rows = np.concatenate([np.arange(n), np.arange(1, n), np.arange(n - 1)])
+        cols = np.concatenate([np.arange(n), np.arange(n - 1), np.arange(1, n)])
+        values = np.concatenate([np.full(n, 3.0), np.full(n - 1, -1.0), np.full(n - 1, -0.5)])
+        A = sparse.bsr_from_triplets(
+            n, n, wp.array(rows, dtype=int), wp.array(cols, dtype=int), wp.array(values, dtype=wp.float64)
+        )
+        b = wp.array(rng.uniform(-1.0, 1.0, size=n), dtype=wp.float64)
+        x = wp.empty_like(b)
+        M = ILU0Preconditioner(A)
+        test.assertEqual(M.num_levels, (n, n))
+        M.matvec(b, x, x, 1.0, 0.0)
+        test.assertLess(_bsr_residual_norm(A, b, x), 1.0e-10)
+
+        A = sparse.bsr_from_triplets(
+            2, 2, wp.array([0, 1], dtype=int), wp.array([1, 0], dtype=int), wp.array([1.0, 1.0], dtype=wp.float64)
+        )
+        with test.assertRaisesRegex(ValueError, "diagonal block"):
+            ILU0Preconditioner(A)
+
+
+def test_ilu0_update_capture(test, device):
+    with wp.ScopedDevice(device):
+        A, b = _make_poisson_system(16, 3, wp.float64, device)
+        M = ILU0Preconditioner(A)
+
+        z_ref = wp.empty_like(b)
+        M.matvec(b, z_ref, z_ref, 1.0, 0.0)
+
+        z = wp.zeros_like(b)
+        with wp.ScopedCapture(device=device, apic=True, force_module_load=False) as capture:
+            M.matvec(b, z, z, 1.0, 0.0)
+        wp.capture_launch(capture.graph)
+        assert_np_equal(z.numpy(), z_ref.numpy(), tol=1.0e-12)
+
+        # re-factorized coefficients are picked up by the captured solves
+        sparse.bsr_scale(A, 4.0)
+        M.update()
+        wp.capture_launch(capture.graph)
+        assert_np_equal(z.numpy(), 0.25 * z_ref.numpy(), tol=1.0e-12)
+
+        A_other, _ = _make_poisson_system(16, 3, wp.float64, device)
+        M.update(A_other)
+        M.matvec(b, z, z, 1.0, 0.0)
+        assert_np_equal(z.numpy(), z_ref.numpy(), tol=1.0e-12)
+
+
 class TestLinearSolvers(unittest.TestCase):
     pass
 
@@ -577,6 +856,11 @@ add_function_test(
 add_function_test(TestLinearSolvers, "test_functor_reuse", test_functor_reuse, devices=devices)
 add_function_test(TestLinearSolvers, "test_functor_preconditioner", test_functor_preconditioner, devices=devices)
 add_function_test(TestLinearSolvers, "test_functor_compat_errors", test_functor_compat_errors, devices=devices)
+add_function_test(TestLinearSolvers, "test_amg_preconditioner", test_amg_preconditioner, devices=devices)
+add_function_test(TestLinearSolvers, "test_amg_update", test_amg_update, devices=devices)
+add_function_test(TestLinearSolvers, "test_amg_capture", test_amg_capture, devices=devices)
+add_function_test(TestLinearSolvers, "test_ilu0_preconditioner", test_ilu0_preconditioner, devices=devices)
+add_function_test(TestLinearSolvers, "test_ilu0_update_capture", test_ilu0_update_capture, devices=devices)
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
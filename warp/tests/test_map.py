@@ -603,6 +603,163 @@ def test_cache_broadcasting(test, device):
     test.assertEqual(cache_size_2, cache_size_1 + 1, "Cache should grow for different broadcast patterns")
 
 
+def test_lazy_fusion(test, device):
+    """A chain of lazy mappings is evaluated with a single fused kernel."""
+    map_cache.clear()
+
+    a_np = np.linspace(0.0, 1.0, 16, dtype=np.float32)
+    b_np = np.linspace(-1.0, 2.0, 16, dtype=np.float32)
+    a = wp.array(a_np, dtype=wp.float32, device=device)
+    b = wp.array(b_np, dtype=wp.float32, device=device)
+
+    expr = wp.map(wp.sin, a, lazy=True)
+    test.assertIsInstance(expr, wp.ArrayExpression)
+    expr = (expr * b + 1.0) / 2.0 - wp.map(lambda x: x * x, b, lazy=True)
+    test.assertIsInstance(expr, wp.ArrayExpression)
+    test.assertEqual(expr.shape, (16,))
+    test.assertEqual(expr.dtype, wp.float32)
+    test.assertEqual(len(map_cache), 0, "No kernel should be generated before evaluation")
+
+    result = expr.eval()
+    test.assertIsInstance(result, wp.array)
+    test.assertEqual(len(map_cache), 1, "The expression should be fused into a single kernel")
+
+    expected = (np.sin(a_np) * b_np + 1.0) / 2.0 - b_np * b_np
+    assert_np_equal(result.numpy(), expected, tol=1.0e-6)
+
+    eager = (wp.map(wp.sin, a) * b + 1.0) / 2.0 - wp.map(lambda x: x * x, b)
+    assert_np_equal(result.numpy(), eager.numpy(), tol=1.0e-6)
+
+    # an expression of the same structure and types reuses the fused kernel
+    map_cache.clear()
+    c = wp.array(b_np, dtype=wp.float32, device=device)
+    d = wp.array(a_np, dtype=wp.float32, device=device)
+    first = ((wp.map(wp.sin, c, lazy=True) * d) + 1.0).eval()
+    cache_size = len(map_cache)
+    second = ((wp.map(wp.sin, d, lazy=True) * c) + 1.0).eval()
+    test.assertEqual(len(map_cache), cache_size)
+    assert_np_equal(first.numpy(), np.sin(b_np) * a_np + 1.0, tol=1.0e-6)
+    assert_np_equal(second.numpy(), np.sin(a_np) * b_np + 1.0, tol=1.0e-6)
+
+
+def test_lazy_shared_subexpressions(test, device):
+    a_np = np.arange(12, dtype=np.float32).reshape(3, 4)
+    a = wp.array(a_np, dtype=wp.float32, device=device)
+
+    shared = wp.map(wp.mul, a, 0.5, lazy=True)
+    expr = shared * shared + shared - a
+
+    fused_kernel = wp.map(wp.sub, shared * shared + shared, a, return_kernel=True)
+    test.assertIsInstance(fused_kernel, wp.Kernel)
+    # the shared node is computed once and the repeated array is only passed once
+    test.assertEqual(fused_kernel.adj.source.count("map_func_0("), 1)
+    test.assertEqual(len([arg for arg in fused_kernel.adj.args if arg.label.startswith("__in_")]), 1)
+
+    half = 0.5 * a_np
+    assert_np_equal(expr.numpy(), half * half + half - a_np)
+
+
+def test_lazy_broadcasting(test, device):
+    a_np = np.arange(3, dtype=np.float32).reshape(3, 1)
+    b_np = np.arange(4, dtype=np.float32)
+    v_np = np.arange(12, dtype=np.float32).reshape(4, 3)
+    a = wp.array(a_np, dtype=wp.float32, device=device)
+    b = wp.array(b_np, dtype=wp.float32, device=device)
+    v = wp.array(v_np, dtype=wp.vec3, device=device)
+
+    expr = wp.map(wp.add, a, b, lazy=True) * 2.0
+    test.assertEqual(expr.shape, (3, 4))
+    assert_np_equal(expr.numpy(), (a_np + b_np) * 2.0)
+
+    # mix in a vector-valued mapping over the broadcast expression
+    scaled = wp.map(wp.mul, v, wp.map(wp.add, b, 1.0, lazy=True))
+    test.assertIsInstance(scaled, wp.ArrayExpression)
+    test.assertEqual(scaled.dtype, wp.vec3)
+    assert_np_equal(scaled.numpy(), v_np * (b_np + 1.0)[:, None])
+
+    with test.assertRaisesRegex(ValueError, r"Shapes .* are not broadcastable"):
+        wp.map(wp.add, wp.map(wp.neg, a, lazy=True), wp.zeros((4, 3), dtype=wp.float32, device=device))
+
+
+def test_lazy_operators(test, device):
+    a_np = np.array([1.0, 2.0, 4.0], dtype=np.float32)
+    b_np = np.array([3.0, 5.0, 7.0], dtype=np.float32)
+    a = wp.array(a_np, dtype=wp.float32, device=device)
+    b = wp.array(b_np, dtype=wp.float32, device=device)
+
+    expr = wp.map(wp.abs, a, lazy=True)
+
+    # array operators produce expressions when combined with an expression
+    test.assertIsInstance(b + expr, wp.ArrayExpression)
+    test.assertIsInstance(expr + b, wp.ArrayExpression)
+
+    assert_np_equal((b + expr).numpy(), b_np + a_np)
+    assert_np_equal((b - expr).numpy(), b_np - a_np)
+    assert_np_equal((2.0 - expr).numpy(), 2.0 - a_np)
+    assert_np_equal((3.0 * expr).numpy(), 3.0 * a_np)
+    assert_np_equal((expr / b).numpy(), a_np / b_np, tol=1.0e-6)
+    assert_np_equal((1.0 / expr).numpy(), 1.0 / a_np, tol=1.0e-6)
+    assert_np_equal((expr // 2.0).numpy(), a_np // 2.0)
+    assert_np_equal((expr % 3.0).numpy(), a_np % 3.0)
+    assert_np_equal((expr**2.0).numpy(), a_np**2.0, tol=1.0e-5)
+    assert_np_equal((2.0**expr).numpy(), 2.0**a_np, tol=1.0e-5)
+    assert_np_equal((-expr).numpy(), -a_np)
+    assert_np_equal((+expr).numpy(), a_np)
+
+    # in-place array operators evaluate the expression into the array
+    b += expr * 2.0
+    assert_np_equal(b.numpy(), b_np + 2.0 * a_np)
+
+
+def test_lazy_eval_output(test, device):
+    a_np = np.arange(8, dtype=np.float32)
+    a = wp.array(a_np, dtype=wp.float32, device=device)
+
+    expr = wp.map(wp.mul, a, 3.0, lazy=True) + 1.0
+    out = wp.empty(8, dtype=wp.float32, device=device)
+    result = expr.eval(out=out)
+    test.assertIs(result, out)
+    assert_np_equal(out.numpy(), 3.0 * a_np + 1.0)
+
+    # an explicit output evaluates immediately
+    out.zero_()
+    result = wp.map(wp.add, wp.map(wp.neg, a, lazy=True), 2.0, out=out)
+    test.assertIs(result, out)
+    assert_np_equal(out.numpy(), 2.0 - a_np)
+
+    # functions with multiple return values evaluate immediately
+    @wp.func
+    def split(x: float):
+        return x, 2.0 * x
+
+    o1, o2 = wp.map(split, wp.map(wp.neg, a, lazy=True))
+    assert_np_equal(o1.numpy(), -a_np)
+    assert_np_equal(o2.numpy(), -2.0 * a_np)
+
+    with test.assertRaisesRegex(TypeError, r"Output array shape \(4,\) does not match expected shape \(8,\)"):
+        expr.eval(out=wp.empty(4, dtype=wp.float32, device=device))
+    with test.assertRaisesRegex(TypeError, r"Function sqrt does not support the provided argument types"):
+        wp.map(wp.sqrt, wp.map(wp.add, wp.array([1, 2], dtype=int, device=device), 1, lazy=True))
+
+
+def test_lazy_gradient(test, device):
+    a_np = np.arange(1, 6, dtype=np.float32)
+    a = wp.array(a_np, dtype=wp.float32, requires_grad=True, device=device)
+    b = wp.array(2.0 * a_np, dtype=wp.float32, requires_grad=True, device=device)
+
+    tape = wp.Tape()
+    with tape:
+        expr = wp.map(wp.mul, a, b, lazy=True) + wp.map(wp.sin, a, lazy=True)
+        test.assertTrue(expr.requires_grad)
+        out = expr.eval()
+    test.assertIsNotNone(out.grad)
+    out.grad.fill_(1.0)
+    tape.backward()
+
+    assert_np_equal(a.grad.numpy(), 2.0 * a_np + np.cos(a_np), tol=1.0e-5)
+    assert_np_equal(b.grad.numpy(), a_np, tol=1.0e-6)
+
+
 devices = get_test_devices("basic")
 cuda_test_devices_with_mempool = get_cuda_test_devices_with_mempool()
 
@@ -634,6 +791,12 @@ add_function_test(TestMap, "test_cache_different_dtypes", test_cache_different_d
 add_function_test(TestMap, "test_cache_warp_function", test_cache_warp_function, devices=devices)
 add_function_test(TestMap, "test_cache_explicit_output", test_cache_explicit_output, devices=devices)
 add_function_test(TestMap, "test_cache_broadcasting", test_cache_broadcasting, devices=devices)
+add_function_test(TestMap, "test_lazy_fusion", test_lazy_fusion, devices=devices)
+add_function_test(TestMap, "test_lazy_shared_subexpressions", test_lazy_shared_subexpressions, devices=devices)
+add_function_test(TestMap, "test_lazy_broadcasting", test_lazy_broadcasting, devices=devices)
+add_function_test(TestMap, "test_lazy_operators", test_lazy_operators, devices=devices)
+add_function_test(TestMap, "test_lazy_eval_output", test_lazy_eval_output, devices=devices)
+add_function_test(TestMap, "test_lazy_gradient", test_lazy_gradient, devices=devices)
 
 
 class TestMapDebug(unittest.TestCase):
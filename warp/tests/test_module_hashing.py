@@ -382,6 +382,80 @@ class TestModuleHashing(unittest.TestCase):
         self.assertIn("before True True", result.stdout)
         self.assertIn("after False False", result.stdout)
 
+    def test_incremental_rehash(self):
+        """Rehashing a modified module only rehashes the changed definitions and their dependents."""
+        module = wp.get_module("test_module_hashing_incremental")
+        block_dim = module.options["block_dim"]
+
+        @wp.func(module=module)
+        def incremental_helper(x: float):
+            return x * 2.0
+
+        @wp.kernel(module=module)
+        def incremental_kernel_a(a: wp.array[float]):
+            i = wp.tid()
+            a[i] = incremental_helper(a[i])
+
+        @wp.kernel(module=module)
+        def incremental_kernel_b(a: wp.array[float]):
+            i = wp.tid()
+            a[i] = a[i] + 1.0
+
+        module.get_module_hash()
+
+        # adding a kernel only hashes the new kernel
+        @wp.kernel(module=module)
+        def incremental_kernel_c(a: wp.array[float]):
+            i = wp.tid()
+            a[i] = a[i] - 1.0
+
+        hash_before = module.get_module_hash()
+        self.assertEqual(module.hashers[block_dim].num_adjoints_hashed, 1)
+        self.assertEqual(module.hashers[block_dim].num_adjoints_reused, 2)
+
+        # redefining a function rehashes it and the kernels that call it
+        @wp.func(module=module)
+        def incremental_helper(x: float):
+            return x * 3.0
+
+        hash_after = module.get_module_hash()
+        self.assertNotEqual(hash_after, hash_before)
+        self.assertEqual(module.hashers[block_dim].num_adjoints_hashed, 2)
+        self.assertEqual(module.hashers[block_dim].num_adjoints_reused, 2)
+
+        # the incremental hash matches a hash computed from scratch
+        for kernel in (incremental_kernel_a, incremental_kernel_b, incremental_kernel_c):
+            kernel.adj._hash_memo = None
+        incremental_helper.adj._hash_memo = None
+        self.assertEqual(module.hash_module(), hash_after)
+
+    def test_incremental_rehash_constant(self):
+        """Rebinding a referenced constant invalidates the memoized hashes."""
+        global HASH_TEST_SCALE
+
+        module = wp.get_module("test_module_hashing_constant")
+
+        @wp.kernel(module=module)
+        def constant_kernel(a: wp.array[float]):
+            i = wp.tid()
+            a[i] = a[i] * HASH_TEST_SCALE
+
+        original_scale = HASH_TEST_SCALE
+        try:
+            hash_before = module.get_module_hash()
+
+            HASH_TEST_SCALE = 3.0
+            module.mark_modified()
+            hash_after = module.get_module_hash()
+            self.assertNotEqual(hash_after, hash_before)
+        finally:
+            HASH_TEST_SCALE = original_scale
+
+        module.mark_modified()
+        self.assertEqual(module.get_module_hash(), hash_before)
+
+
+HASH_TEST_SCALE = 2.0
 
 devices = get_test_devices()
 
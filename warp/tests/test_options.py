@@ -158,6 +158,65 @@ def test_options_cpu_compiler_flags_native(test, device):
         wp.set_module_options({"cpu_compiler_flags": None})
 
 
+@wp.kernel(module="unique", module_options={"cpu_simd_width": 8})
+def simd_saxpy(a: float, x: wp.array(dtype=float), y: wp.array(dtype=float), z: wp.array(dtype=float)):
+    i = wp.tid()
+    z[i] = a * x[i] + y[i]
+
+
+@wp.kernel(module="unique", module_options={"cpu_simd_width": 16})
+def simd_branchy(n: int, v: wp.array2d(dtype=wp.vec3), out: wp.array2d(dtype=float)):
+    i, j = wp.tid()
+    if j >= n:
+        return
+    p = v[i, j]
+    if p[0] > 0.5:
+        out[i, j] = wp.length(p)
+    else:
+        out[i, j] = -p[1]
+
+
+def test_options_cpu_simd_width(test, device):
+    """Batched CPU kernels must match the scalar results, including the tail that does not fill a batch."""
+    rng = np.random.default_rng(42)
+
+    for n in (1, 7, 8, 1003):
+        x_np = rng.random(n, dtype=np.float32)
+        y_np = rng.random(n, dtype=np.float32)
+        x = wp.array(x_np, device=device)
+        y = wp.array(y_np, device=device)
+        z = wp.zeros(n, dtype=float, device=device)
+
+        for cpu_threads in (1, 4):
+            z.zero_()
+            wp.launch(simd_saxpy, dim=n, inputs=[2.0, x, y, z], device=device, cpu_threads=cpu_threads)
+            assert_np_equal(z.numpy(), 2.0 * x_np + y_np, tol=1.0e-6)
+
+    v_np = rng.random((5, 37, 3), dtype=np.float32)
+    v = wp.array(v_np, dtype=wp.vec3, device=device)
+    out = wp.full((5, 37), -10.0, dtype=float, device=device)
+    wp.launch(simd_branchy, dim=(5, 37), inputs=[30, v, out], device=device)
+
+    expected = np.where(v_np[..., 0] > 0.5, np.linalg.norm(v_np, axis=-1), -v_np[..., 1])
+    expected[:, 30:] = -10.0
+    assert_np_equal(out.numpy(), expected, tol=1.0e-6)
+
+
+def test_options_cpu_simd_width_invalid(test, device):
+    module = wp.get_module(__name__)
+    old_width = module.options["cpu_simd_width"]
+    try:
+        module.options["cpu_simd_width"] = 12
+        with test.assertRaisesRegex(ValueError, "power of two"):
+            module.resolve_options(wp.config)
+
+        module.options["cpu_simd_width"] = 8.0
+        with test.assertRaises(TypeError):
+            module.resolve_options(wp.config)
+    finally:
+        module.options["cpu_simd_width"] = old_width
+
+
 def test_options_opt_level_hash(test, device):
     """Changing warp.config.optimization_level must change the module hash."""
     module = wp.get_module(__name__)
@@ -340,6 +399,15 @@ add_function_test(
     TestOptions, "test_options_cpu_compiler_flags_native", test_options_cpu_compiler_flags_native, devices=devices
 )
 add_function_test(TestOptions, "test_options_opt_level_hash", test_options_opt_level_hash, devices=devices)
+add_function_test(
+    TestOptions, "test_options_cpu_simd_width", test_options_cpu_simd_width, devices=[d for d in devices if d.is_cpu]
+)
+add_function_test(
+    TestOptions,
+    "test_options_cpu_simd_width_invalid",
+    test_options_cpu_simd_width_invalid,
+    devices=[d for d in devices if d.is_cpu],
+)
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -30,6 +30,39 @@ def test_runlength_encode_int(test, device, n):
     assert_np_equal(unique_counts.numpy()[:run_count], unique_counts_np[:run_count])
 
 
+def test_runlength_encode_multithreaded(test, device):
+    rng = np.random.default_rng(123)
+
+    # mix of short runs and runs long enough to span several worker blocks
+    run_lengths_np = np.concatenate((rng.integers(1, 4, size=20000), [70000, 1, 90000], rng.integers(1, 50, size=2000)))
+    run_values_np = np.arange(len(run_lengths_np), dtype=np.int32) % 3 - 1
+    values_np = np.repeat(run_values_np, run_lengths_np)
+
+    # adjacent runs with equal values merge into one
+    heads = np.concatenate(([True], values_np[1:] != values_np[:-1]))
+    expected_values = values_np[heads]
+    expected_lengths = np.diff(np.concatenate((np.flatnonzero(heads), [len(values_np)])))
+
+    saved = wp.config.cpu_max_threads
+    try:
+        for cpu_max_threads in (1, 4, 3):
+            wp.config.cpu_max_threads = cpu_max_threads
+
+            values = wp.array(values_np, device=device, dtype=int)
+            run_values = wp.empty_like(values)
+            run_lengths = wp.empty_like(values)
+            run_count = wp.empty(shape=(1,), dtype=int, device=device)
+
+            runlength_encode(values, run_values, run_lengths, run_count=run_count)
+
+            count = int(run_count.numpy()[0])
+            test.assertEqual(count, len(expected_values))
+            assert_np_equal(run_values.numpy()[:count], expected_values)
+            assert_np_equal(run_lengths.numpy()[:count], expected_lengths)
+    finally:
+        wp.config.cpu_max_threads = saved
+
+
 def test_runlength_encode_error_insufficient_storage(test, device):
     values = wp.zeros(123, dtype=int, device=device)
     run_values = wp.empty(1, dtype=int, device=device)
@@ -116,6 +149,7 @@ def test_runlength_encode_error_unsupported_dtype(test, device):
 
 
 devices = get_test_devices()
+cpu_devices = [d for d in devices if d.is_cpu]
 
 
 class TestRunlengthEncode(unittest.TestCase):
@@ -167,6 +201,12 @@ add_function_test(
 add_function_test(
     TestRunlengthEncode, "test_runlength_encode_empty", partial(test_runlength_encode_int, n=0), devices=devices
 )
+add_function_test(
+    TestRunlengthEncode,
+    "test_runlength_encode_multithreaded",
+    test_runlength_encode_multithreaded,
+    devices=cpu_devices,
+)
 add_function_test(
     TestRunlengthEncode,
     "test_runlength_encode_error_insufficient_storage",
@@ -23,12 +23,17 @@ from warp.sparse import (
     bsr_mm,
     bsr_mm_work_arrays,
     bsr_mv,
+    bsr_permuted,
+    bsr_rcm_permutation,
     bsr_scale,
     bsr_set_from_triplets,
     bsr_set_transpose,
     bsr_set_zero,
+    bsr_to_sell,
     bsr_transposed,
     bsr_zeros,
+    permute_vector,
+    unpermute_vector,
 )
 from warp.tests.unittest_utils import *
 
@@ -932,6 +937,163 @@ def make_test_bsr_multiply_deep(block_shape, scalar_type):
     return test_bsr_multiply_deep
 
 
+def _make_shuffled_grid_matrix(res, block_shape, scalar_type, device, rng):
+    # 5-point stencil on a res x res grid, with randomly shuffled node numbering
+    n = res * res
+    node_ids = rng.permutation(n)
+    i, j = np.meshgrid(np.arange(res), np.arange(res), indexing="ij")
+    i, j = i.flatten(), j.flatten()
+
+    rows, cols = [node_ids[i * res + j]], [node_ids[i * res + j]]
+    for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        inside = (i + di >= 0) & (i + di < res) & (j + dj >= 0) & (j + dj < res)
+        rows.append(node_ids[i[inside] * res + j[inside]])
+        cols.append(node_ids[(i[inside] + di) * res + j[inside] + dj])
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    values = rng.random(size=(rows.size, *block_shape)) + 0.1
+
+    block_type = scalar_type if block_shape == (1, 1) else wp.types.matrix(shape=block_shape, dtype=scalar_type)
+    A = bsr_zeros(n, n, block_type, device=device)
+    bsr_set_from_triplets(
+        A,
+        rows=wp.array(rows, dtype=int, device=device),
+        columns=wp.array(cols, dtype=int, device=device),
+        values=wp.array(values, dtype=scalar_type, device=device),
+    )
+    return A
+
+
+def _bsr_bandwidth(bsr):
+    rows = bsr.uncompress_rows().numpy()
+    cols = bsr.columns.numpy()[: bsr.nnz]
+    return int(np.max(np.abs(rows - cols)))
+
+
+def test_bsr_rcm_permutation(test, device):
+    rng = np.random.default_rng(123)
+    res = 12
+
+    for block_shape, scalar_type in (((1, 1), wp.float32), ((2, 2), wp.float64)):
+        A = _make_shuffled_grid_matrix(res, block_shape, scalar_type, device, rng)
+
+        permutation = bsr_rcm_permutation(A)
+        np.testing.assert_array_equal(np.sort(permutation.numpy()), np.arange(A.nrow))
+
+        P = bsr_permuted(A, permutation)
+        test.assertEqual(P.nnz_sync(), A.nnz_sync())
+        test.assertLessEqual(_bsr_bandwidth(P), 2 * res)
+        test.assertLess(_bsr_bandwidth(P), _bsr_bandwidth(A))
+
+        perm = permutation.numpy()
+        dense_perm = np.concatenate([perm[:, None] * block_shape[0] + k for k in range(block_shape[0])], axis=1)
+        dense_perm = dense_perm.flatten()
+        assert_np_equal(_bsr_to_dense(P), _bsr_to_dense(A)[np.ix_(dense_perm, dense_perm)], 0.0001)
+
+        # solving in the permuted ordering
+        if block_shape[0] == 1:
+            x = wp.array(rng.random(A.nrow), dtype=scalar_type, device=device)
+        else:
+            x = wp.array(
+                rng.random(size=(A.nrow, block_shape[0])),
+                dtype=wp.types.vector(length=block_shape[0], dtype=scalar_type),
+                device=device,
+            )
+        x_perm = permute_vector(x, permutation)
+        assert_np_equal(x_perm.numpy().flatten(), x.numpy().flatten()[dense_perm])
+        assert_np_equal(unpermute_vector(x_perm, permutation).numpy(), x.numpy())
+
+        y_ref = (A @ x).numpy()
+        y = unpermute_vector(P @ x_perm, permutation)
+        assert_np_equal(y.numpy(), y_ref, 0.0001)
+
+        with test.assertRaisesRegex(ValueError, "cannot be computed in place"):
+            permute_vector(x, permutation, out=x)
+
+    # disconnected components and rectangular permutations
+    A = bsr_diag(wp.full(5, value=2.0, dtype=float, device=device))
+    permutation = bsr_rcm_permutation(A)
+    np.testing.assert_array_equal(np.sort(permutation.numpy()), np.arange(5))
+
+    # many components, as left by Dirichlet projection: isolated rows and shuffled coupled pairs
+    n = 10000
+    pairs = rng.permutation(n)[: n // 2].reshape(-1, 2)
+    rows = np.concatenate((np.arange(n), pairs[:, 0], pairs[:, 1]))
+    cols = np.concatenate((np.arange(n), pairs[:, 1], pairs[:, 0]))
+    A = bsr_zeros(n, n, float, device=device)
+    bsr_set_from_triplets(
+        A,
+        rows=wp.array(rows, dtype=int, device=device),
+        columns=wp.array(cols, dtype=int, device=device),
+        values=wp.ones(rows.size, dtype=float, device=device),
+    )
+    permutation = bsr_rcm_permutation(A)
+    np.testing.assert_array_equal(np.sort(permutation.numpy()), np.arange(n))
+    test.assertEqual(_bsr_bandwidth(bsr_permuted(A, permutation)), 1)
+
+    B = bsr_zeros(2, 3, float, device=device)
+    with test.assertRaisesRegex(ValueError, "square matrix"):
+        bsr_rcm_permutation(B)
+    with test.assertRaisesRegex(ValueError, "column permutation must be provided"):
+        bsr_permuted(B, wp.array([1, 0], dtype=int, device=device))
+
+
+def make_test_bsr_sell_mv(block_shape, scalar_type):
+    def test_bsr_sell_mv(test, device):
+        rng = np.random.default_rng(42)
+
+        nrow, ncol = 45, 30
+        nnz = 300
+        block_type = scalar_type if block_shape == (1, 1) else wp.types.matrix(shape=block_shape, dtype=scalar_type)
+
+        # padded storage with uneven row lengths
+        A = bsr_zeros(nrow, ncol, block_type, device=device, row_capacity=ncol)
+        bsr_set_from_triplets(
+            A,
+            rows=wp.array(rng.integers(0, high=nrow, size=nnz), dtype=int, device=device),
+            columns=wp.array(rng.integers(0, high=ncol, size=nnz), dtype=int, device=device),
+            values=wp.array(rng.random(size=(nnz, *block_shape)), dtype=scalar_type, device=device),
+            topology="padded",
+        )
+        A_dense = _bsr_to_dense(A)
+        active_nnz = int(A.row_counts.numpy()[:nrow].sum())
+
+        if block_shape[1] == 1:
+            x = wp.array(rng.random(ncol), dtype=scalar_type, device=device)
+        else:
+            x = wp.array(
+                rng.random(size=(ncol, block_shape[1])),
+                dtype=wp.types.vector(length=block_shape[1], dtype=scalar_type),
+                device=device,
+            )
+
+        for chunk_size, sigma in ((1, 1), (4, 1), (8, 16), (32, 256)):
+            sell = bsr_to_sell(A, chunk_size=chunk_size, sigma=sigma)
+            test.assertEqual(sell.nnz, active_nnz)
+            test.assertGreater(sell.fill_ratio, 0.0)
+            test.assertLessEqual(sell.fill_ratio, 1.0)
+            if chunk_size == 1:
+                test.assertEqual(sell.fill_ratio, 1.0)
+
+            y = bsr_mv(sell, x)
+            assert_np_equal(y.numpy().flatten(), A_dense @ x.numpy().flatten(), 0.0001)
+
+            y_ref = 0.5 * y.numpy() - 2.0 * bsr_mv(A, x).numpy()
+            bsr_mv(sell, x, y, alpha=-2.0, beta=0.5)
+            assert_np_equal(y.numpy(), y_ref, 0.0001)
+
+            # transposed products use the source matrix
+            x_t = bsr_mv(sell, y, transpose=True)
+            assert_np_equal(x_t.numpy().flatten(), y.numpy().flatten() @ A_dense, 0.0001)
+
+        # refresh values with an unchanged sparsity pattern
+        bsr_scale(A, 3.0)
+        sell.update_values()
+        assert_np_equal(bsr_mv(sell, x).numpy().flatten(), 3.0 * A_dense @ x.numpy().flatten(), 0.0001)
+
+    return test_bsr_sell_mv
+
+
 def test_bsr_mm_max_new_nnz(test, device):
     """Test that BSR matrix multiplication with max_new_nnz works"""
     A = bsr_from_triplets(
@@ -1363,6 +1525,9 @@ add_function_test(
 add_function_test(TestSparse, "test_csr_mv", make_test_bsr_mv((1, 1), wp.float32), devices=devices)
 add_function_test(TestSparse, "test_bsr_mv_1_3", make_test_bsr_mv((1, 3), wp.float32), devices=devices)
 add_function_test(TestSparse, "test_bsr_mv_3_3", make_test_bsr_mv((3, 3), wp.float64), devices=devices)
+add_function_test(TestSparse, "test_csr_sell_mv", make_test_bsr_sell_mv((1, 1), wp.float32), devices=devices)
+add_function_test(TestSparse, "test_bsr_sell_mv_3_2", make_test_bsr_sell_mv((3, 2), wp.float64), devices=devices)
+add_function_test(TestSparse, "test_bsr_rcm_permutation", test_bsr_rcm_permutation, devices=devices)
 
 add_function_test(TestSparse, "test_capturability", test_capturability, devices=cuda_test_devices_with_mempool)
 add_function_test(
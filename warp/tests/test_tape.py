@@ -324,6 +324,221 @@ def test_tape_backward_cuda_launch_failure(test, device):
         tape.backward(grads={y: wp.ones_like(y)})
 
 
+@wp.kernel
+def checkpoint_step(x: wp.array[float], y: wp.array[float]):
+    tid = wp.tid()
+
+    y[tid] = wp.sin(x[tid]) + 0.5 * x[tid]
+
+
+@wp.kernel
+def checkpoint_loss(x: wp.array[float], loss: wp.array[float]):
+    tid = wp.tid()
+
+    wp.atomic_add(loss, 0, x[tid] * x[tid])
+
+
+def checkpoint_steps(x, num_steps):
+    for _i in range(num_steps):
+        y = wp.empty_like(x, requires_grad=True)
+        wp.launch(checkpoint_step, dim=x.shape, inputs=[x], outputs=[y], device=x.device)
+        x = y
+    return x
+
+
+def checkpoint_reference_grad(x_np, num_steps, device):
+    x = wp.array(x_np, dtype=float, device=device, requires_grad=True)
+    loss = wp.zeros(1, dtype=float, device=device, requires_grad=True)
+
+    tape = wp.Tape()
+    with tape:
+        y = checkpoint_steps(x, num_steps)
+        wp.launch(checkpoint_loss, dim=y.shape, inputs=[y], outputs=[loss], device=device)
+    tape.backward(loss)
+
+    return loss.numpy(), x.grad.numpy()
+
+
+def test_tape_checkpoint(test, device):
+    rng = np.random.default_rng(123)
+    x_np = rng.uniform(-1.0, 1.0, size=32).astype(np.float32)
+    num_steps = 6
+
+    expected_loss, expected_grad = checkpoint_reference_grad(x_np, num_steps, device)
+
+    x = wp.array(x_np, dtype=float, device=device, requires_grad=True)
+    loss = wp.zeros(1, dtype=float, device=device, requires_grad=True)
+
+    tape = wp.Tape()
+    with tape:
+        y = wp.checkpoint(checkpoint_steps, x, num_steps)
+        wp.launch(checkpoint_loss, dim=y.shape, inputs=[y], outputs=[loss], device=device)
+
+    # the segment is recorded as a single entry, its launches are not kept on the tape
+    test.assertEqual(len(tape.launches), 2)
+    test.assertTrue(callable(tape.launches[0]))
+
+    tape.backward(loss)
+
+    assert_np_equal(loss.numpy(), expected_loss, tol=1.0e-5)
+    assert_np_equal(x.grad.numpy(), expected_grad, tol=1.0e-5)
+
+    # zeroing and replaying the backward pass gives the same gradients
+    tape.zero()
+    assert_np_equal(x.grad.numpy(), np.zeros_like(x_np))
+    tape.backward(loss)
+    assert_np_equal(x.grad.numpy(), expected_grad, tol=1.0e-5)
+
+    # inputs modified after the forward pass are restored before recomputation
+    tape.zero()
+    x.fill_(100.0)
+    tape.backward(loss)
+    assert_np_equal(x.grad.numpy(), expected_grad, tol=1.0e-5)
+    assert_np_equal(x.numpy(), x_np)
+
+    # without a tape, checkpoint simply calls the function
+    y = wp.checkpoint(checkpoint_steps, x, 2)
+    test.assertEqual(y.shape, x.shape)
+
+    with test.assertRaisesRegex(RuntimeError, "must be called while the tape is active"):
+        tape.checkpoint(checkpoint_steps, x, 2)
+
+
+def test_tape_checkpoint_loop(test, device):
+    rng = np.random.default_rng(42)
+    x_np = rng.uniform(-1.0, 1.0, size=16).astype(np.float32)
+    num_steps = 20
+
+    expected_loss, expected_grad = checkpoint_reference_grad(x_np, num_steps, device)
+
+    def step(_step, x):
+        y = wp.empty_like(x, requires_grad=True)
+        wp.launch(checkpoint_step, dim=x.shape, inputs=[x], outputs=[y], device=device)
+        return y
+
+    for checkpoints in (None, 2, 3, 20):
+        x = wp.array(x_np, dtype=float, device=device, requires_grad=True)
+        loss = wp.zeros(1, dtype=float, device=device, requires_grad=True)
+
+        tape = wp.Tape()
+        with tape:
+            y = wp.checkpoint_loop(step, x, num_steps, checkpoints=checkpoints)
+            wp.launch(checkpoint_loss, dim=y.shape, inputs=[y], outputs=[loss], device=device)
+
+        if checkpoints == 20:
+            # segments no longer than the checkpoint count are recorded as-is
+            test.assertEqual(len(tape.launches), num_steps + 1)
+        else:
+            test.assertEqual(len(tape.launches), (checkpoints or 5) + 1)
+
+        tape.backward(loss)
+
+        assert_np_equal(loss.numpy(), expected_loss, tol=1.0e-5)
+        assert_np_equal(x.grad.numpy(), expected_grad, tol=1.0e-5)
+
+    with test.assertRaisesRegex(ValueError, "checkpoints must be at least 2"):
+        wp.checkpoint_loop(step, x, num_steps, checkpoints=1)
+
+
+@wp.kernel
+def compile_square(x: wp.array[float], y: wp.array[float]):
+    tid = wp.tid()
+
+    y[tid] = x[tid] * x[tid]
+
+
+@wp.kernel
+def compile_sin(x: wp.array[float], y: wp.array[float]):
+    tid = wp.tid()
+
+    y[tid] = wp.sin(x[tid])
+
+
+def compile_backward_forward(a, b, c, d, loss, device):
+    wp.launch(compile_square, dim=a.shape, inputs=[a], outputs=[b], device=device)
+    # side branch that does not contribute to the loss
+    wp.launch(compile_sin, dim=a.shape, inputs=[a], outputs=[d], device=device)
+    wp.copy(c, b)
+    wp.launch(checkpoint_loss, dim=c.shape, inputs=[c], outputs=[loss], device=device)
+    wp.launch(checkpoint_loss, dim=d.shape, inputs=[c], outputs=[loss], device=device)
+
+
+def test_tape_compile_backward(test, device):
+    rng = np.random.default_rng(7)
+    a_np = rng.uniform(-1.0, 1.0, size=16).astype(np.float32)
+
+    a = wp.array(a_np, dtype=float, device=device, requires_grad=True)
+    b = wp.zeros_like(a, requires_grad=True)
+    c = wp.zeros_like(a, requires_grad=True)
+    d = wp.zeros_like(a, requires_grad=True)
+    loss = wp.zeros(1, dtype=float, device=device, requires_grad=True)
+
+    tape = wp.Tape()
+    with tape:
+        compile_backward_forward(a, b, c, d, loss, device)
+
+    tape.backward(loss)
+    expected_grad = a.grad.numpy()
+    assert_np_equal(expected_grad, 8.0 * a_np**3, tol=1.0e-5)
+
+    compiled = tape.compile_backward(loss)
+    test.assertEqual(compiled.num_launches, 4)
+    test.assertEqual(compiled.num_pruned, 1)
+
+    # gradients are zeroed before every replay
+    for _ in range(2):
+        compiled.launch()
+        assert_np_equal(a.grad.numpy(), expected_grad, tol=1.0e-5)
+
+    # the gradient of d is not requested, restricting to the inputs prunes nothing more
+    compiled = tape.compile_backward(loss, inputs=[a])
+    test.assertEqual(compiled.num_pruned, 1)
+    compiled.launch()
+    assert_np_equal(a.grad.numpy(), expected_grad, tol=1.0e-5)
+
+    # only the operations downstream of b are needed for its gradient
+    compiled = tape.compile_backward(loss, inputs=[b])
+    test.assertEqual(compiled.num_launches, 3)
+    compiled.launch()
+    assert_np_equal(b.grad.numpy(), 4.0 * a_np**2, tol=1.0e-5)
+
+    # incoming gradients given as a dictionary
+    compiled = tape.compile_backward(grads={c: wp.full_like(c, 0.5)})
+    test.assertEqual(compiled.num_launches, 2)
+    compiled.launch()
+    assert_np_equal(a.grad.numpy(), a_np, tol=1.0e-5)
+
+    with test.assertRaisesRegex(ValueError, "requires a loss array"):
+        tape.compile_backward()
+
+
+def test_tape_compile_backward_capture(test, device):
+    rng = np.random.default_rng(11)
+    a_np = rng.uniform(-1.0, 1.0, size=16).astype(np.float32)
+
+    a = wp.array(a_np, dtype=float, device=device, requires_grad=True)
+    b = wp.zeros_like(a, requires_grad=True)
+    c = wp.zeros_like(a, requires_grad=True)
+    d = wp.zeros_like(a, requires_grad=True)
+    loss = wp.zeros(1, dtype=float, device=device, requires_grad=True)
+
+    tape = wp.Tape()
+    with tape:
+        compile_backward_forward(a, b, c, d, loss, device)
+
+    compiled = tape.compile_backward(loss, capture=True)
+    test.assertIsNotNone(compiled.graph)
+
+    for scale in (1.0, 0.5):
+        # re-run the forward pass on the same arrays, then replay the captured backward pass
+        a.assign(scale * a_np)
+        loss.zero_()
+        compile_backward_forward(a, b, c, d, loss, device)
+
+        compiled.launch()
+        assert_np_equal(a.grad.numpy(), 8.0 * (scale * a_np) ** 3, tol=1.0e-5)
+
+
 devices = get_test_devices()
 cuda_devices = get_cuda_test_devices()
 
@@ -389,6 +604,10 @@ add_function_test(TestTape, "test_tape_visualize", test_tape_visualize, devices=
 add_function_test(TestTape, "test_tape_struct_subscript", test_tape_struct_subscript, devices=devices)
 add_function_test(TestTape, "test_tape_nested_struct_subscript", test_tape_nested_struct_subscript, devices=devices)
 add_function_test(TestTape, "test_tape_visualize_subscript", test_tape_visualize_subscript, devices=devices)
+add_function_test(TestTape, "test_tape_checkpoint", test_tape_checkpoint, devices=devices)
+add_function_test(TestTape, "test_tape_checkpoint_loop", test_tape_checkpoint_loop, devices=devices)
+add_function_test(TestTape, "test_tape_compile_backward", test_tape_compile_backward, devices=devices)
+add_function_test(TestTape, "test_tape_compile_backward_capture", test_tape_compile_backward_capture, devices=devices)
 add_function_test(
     TestTape, "test_tape_backward_cuda_launch_failure", test_tape_backward_cuda_launch_failure, devices=cuda_devices
 )
@@ -3,6 +3,11 @@
 
 import contextlib
 import io
+import json
+import os
+import tempfile
+import threading
+import time
 import unittest
 import warnings
 
@@ -288,6 +293,81 @@ def test_radix_sort_pairs_error_non_contiguous(test, device):
         wp.utils.radix_sort_pairs(keys, values, 4)
 
 
+def test_host_algorithms_multithreaded(test, device):
+    # large enough to take the multi-threaded host paths, with many duplicate keys
+    # so that an unstable block merge would reorder values
+    n = 200003
+    rng = np.random.default_rng(42)
+
+    saved = wp.config.cpu_max_threads
+    try:
+        for cpu_max_threads in (1, 4, 3):
+            wp.config.cpu_max_threads = cpu_max_threads
+
+            with test.subTest(cpu_max_threads=cpu_max_threads, algorithm="radix_sort_pairs"):
+                cases = (
+                    (wp.int32, rng.integers(-1000, 1000, size=n, dtype=np.int32)),
+                    (wp.float32, rng.integers(-1000, 1000, size=n).astype(np.float32) * 0.5),
+                    (wp.int64, rng.integers(-(2**40), 2**40, size=n, dtype=np.int64) // 1024),
+                )
+                for key_type, keys_np in cases:
+                    keys = wp.zeros(2 * n, dtype=key_type, device=device)
+                    values = wp.zeros(2 * n, dtype=int, device=device)
+                    keys.assign(np.concatenate((keys_np, np.zeros_like(keys_np))))
+                    values.assign(np.concatenate((np.arange(n, dtype=np.int32), np.zeros(n, dtype=np.int32))))
+
+                    wp.utils.radix_sort_pairs(keys, values, n)
+
+                    order = np.argsort(keys_np, kind="stable")
+                    assert_np_equal(keys.numpy()[:n], keys_np[order])
+                    assert_np_equal(values.numpy()[:n], order.astype(np.int32))
+
+            with test.subTest(cpu_max_threads=cpu_max_threads, algorithm="segmented_sort_pairs"):
+                num_segments = 37
+                bounds = np.sort(rng.choice(np.arange(1, n), size=num_segments - 1, replace=False))
+                starts = np.concatenate(([0], bounds)).astype(np.int32)
+                ends = np.concatenate((bounds, [n])).astype(np.int32)
+                keys_np = rng.integers(0, 500, size=n, dtype=np.int32)
+
+                keys = wp.array(np.concatenate((keys_np, np.zeros_like(keys_np))), dtype=int, device=device)
+                values = wp.array(np.arange(2 * n, dtype=np.int32), dtype=int, device=device)
+                wp.utils.segmented_sort_pairs(
+                    keys,
+                    values,
+                    n,
+                    wp.array(starts, dtype=int, device=device),
+                    wp.array(ends, dtype=int, device=device),
+                )
+
+                expected = np.concatenate(
+                    [s + np.argsort(keys_np[s:e], kind="stable") for s, e in zip(starts, ends, strict=True)]
+                )
+                assert_np_equal(values.numpy()[:n], expected.astype(np.int32))
+                assert_np_equal(keys.numpy()[:n], keys_np[expected])
+
+            with test.subTest(cpu_max_threads=cpu_max_threads, algorithm="array_scan"):
+                values_np = rng.integers(-1000, 1000, size=n, dtype=np.int64)
+                values = wp.array(values_np, dtype=wp.int64, device=device)
+                result_inc = wp.zeros_like(values)
+                result_exc = wp.zeros_like(values)
+
+                wp.utils.array_scan(values, result_inc, True)
+                wp.utils.array_scan(values, result_exc, False)
+
+                expected = np.cumsum(values_np)
+                assert_np_equal(result_inc.numpy(), expected)
+                assert_np_equal(result_exc.numpy(), np.concatenate(([0], expected[:-1])))
+
+                # float partial sums are combined per block, so compare with a tolerance
+                vectors_np = rng.uniform(-1.0, 1.0, size=(n, 3))
+                vectors = wp.array(vectors_np, dtype=wp.vec3d, device=device)
+                result = wp.zeros_like(vectors)
+                wp.utils.array_scan(vectors, result, True)
+                assert_np_equal(result.numpy(), np.cumsum(vectors_np, axis=0), tol=1.0e-9)
+    finally:
+        wp.config.cpu_max_threads = saved
+
+
 def test_segmented_sort_pairs(test, device):
     keyTypes = [int, wp.float32]
 
@@ -562,6 +642,7 @@ def parenthesized_multiline_lambda():
 
 
 devices = get_test_devices()
+cpu_devices = [d for d in devices if d.is_cpu]
 
 
 class TestUtils(unittest.TestCase):
@@ -736,6 +817,96 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(result.filter, wp.TIMING_MEMCPY)
         self.assertGreaterEqual(result.elapsed, 0.0)
 
+    def test_scoped_timer_cpu_timing(self):
+        """Verify host activity timing records CPU launches, memory operations, and module loads."""
+
+        @wp.kernel(module="unique")
+        def inc(a: wp.array2d(dtype=float)):
+            i, j = wp.tid()
+            a[i, j] = a[i, j] + 1.0
+
+        with wp.ScopedTimer("cpu", print=False, cpu_filter=wp.TIMING_ALL) as timer:
+            src = wp.zeros((4, 8), dtype=float, device="cpu")
+            wp.launch(inc, dim=src.shape, inputs=[src], device="cpu")
+            dst = wp.empty_like(src)
+            wp.copy(dst, src)
+
+        # host activity timing is disabled outside of the scope
+        self.assertIsNone(wp._src.context.runtime.cpu_timing)
+
+        results = {r.filter: r for r in timer.timing_results}
+        self.assertEqual(set(results), {wp.TIMING_MEMSET, wp.TIMING_MODULE, wp.TIMING_KERNEL, wp.TIMING_MEMCPY})
+
+        for r in timer.timing_results:
+            self.assertEqual(r.device, wp.get_device("cpu"))
+            self.assertGreaterEqual(r.elapsed, 0.0)
+            self.assertIsNotNone(r.start)
+
+        starts = [r.start for r in timer.timing_results]
+        self.assertEqual(starts, sorted(starts))
+
+        self.assertEqual(results[wp.TIMING_MEMSET].args, {"bytes": src.capacity})
+        self.assertEqual(results[wp.TIMING_MEMCPY].name, "memcpy HtoH")
+        self.assertEqual(results[wp.TIMING_MEMCPY].args, {"bytes": src.capacity})
+        self.assertEqual(results[wp.TIMING_KERNEL].name, f"forward kernel {inc.key}")
+        self.assertEqual(results[wp.TIMING_KERNEL].args, {"dim": (4, 8), "threads": 1})
+        self.assertTrue(results[wp.TIMING_MODULE].name.startswith("module load"))
+
+        # filters select the recorded activities
+        with wp.ScopedTimer("cpu", print=False, cpu_filter=wp.TIMING_KERNEL) as timer:
+            wp.launch(inc, dim=src.shape, inputs=[src], device="cpu")
+            wp.copy(dst, src)
+
+        self.assertEqual([r.filter for r in timer.timing_results], [wp.TIMING_KERNEL])
+        assert_np_equal(dst.numpy(), np.full((4, 8), 2.0))
+
+        # nested and concurrent activities are returned in start order rather than completion order
+        def record_activity(name, nested_name=None):
+            with wp._src.utils.ScopedCpuActivity("cpu", name, wp.TIMING_KERNEL):
+                time.sleep(0.01)
+                if nested_name is not None:
+                    record_activity(nested_name)
+
+        with wp.ScopedTimer("cpu", print=False, cpu_filter=wp.TIMING_KERNEL) as timer:
+            record_activity("outer", nested_name="inner")
+            thread = threading.Thread(target=record_activity, args=("thread",))
+            with wp._src.utils.ScopedCpuActivity("cpu", "main", wp.TIMING_KERNEL):
+                thread.start()
+                thread.join()
+
+        self.assertEqual([r.name for r in timer.timing_results], ["outer", "inner", "main", "thread"])
+
+    def test_timing_to_chrome_trace(self):
+        cpu = wp.get_device("cpu")
+        results = [
+            wp.TimingResult(cpu, "forward kernel k", wp.TIMING_KERNEL, 2.0, start=10.0, args={"dim": (4, 8)}),
+            wp.TimingResult(cpu, "memcpy HtoH", wp.TIMING_MEMCPY, 0.5, start=13.0),
+            wp.TimingResult(cpu, "memset", wp.TIMING_MEMSET, 1.0),
+            wp.TimingResult(cpu, "memset", wp.TIMING_MEMSET, 0.25),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "trace.json")
+            trace = wp.timing_to_chrome_trace(results, path)
+            with open(path) as f:
+                self.assertEqual(json.load(f), trace)
+
+        self.assertEqual(trace["displayTimeUnit"], "ms")
+
+        metadata = [e for e in trace["traceEvents"] if e["ph"] == "M"]
+        self.assertEqual(
+            {e["args"]["name"] for e in metadata if e["name"] == "process_name"},
+            {"Host", "CUDA"},
+        )
+
+        events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        self.assertEqual([e["cat"] for e in events], ["kernel", "memcpy", "memset", "memset"])
+        self.assertEqual([e["ts"] for e in events], [0.0, 3000.0, 0.0, 1000.0])
+        self.assertEqual([e["dur"] for e in events], [2000.0, 500.0, 1000.0, 250.0])
+        self.assertEqual(events[0]["args"], {"dim": [4, 8]})
+        self.assertNotIn("args", events[1])
+        self.assertNotEqual(events[0]["pid"], events[2]["pid"])
+
 
 add_function_test(TestUtils, "test_array_scan", test_array_scan, devices=devices)
 add_function_test(TestUtils, "test_array_scan_vector", test_array_scan_vector, devices=devices)
@@ -785,6 +956,9 @@ add_function_test(
     test_radix_sort_pairs_error_non_contiguous,
     devices=devices,
 )
+add_function_test(
+    TestUtils, "test_host_algorithms_multithreaded", test_host_algorithms_multithreaded, devices=cpu_devices
+)
 add_function_test(TestUtils, "test_segmented_sort_pairs", test_segmented_sort_pairs, devices=devices)
 add_function_test(TestUtils, "test_segmented_sort_pairs_empty", test_segmented_sort_pairs, devices=devices)
 add_function_test(
@@ -172,7 +172,9 @@ def default_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader)
     from warp.tests.test_constant_precision import TestConstantPrecision
     from warp.tests.test_context import TestContext
     from warp.tests.test_copy import TestCopy
+    from warp.tests.test_cpu_incremental_build import TestCpuIncrementalBuild
     from warp.tests.test_cpu_precompiled_headers import TestCpuPrecompiledHeaders
+    from warp.tests.test_cpu_threads import TestCpuThreads
     from warp.tests.test_ctypes import TestCTypes
     from warp.tests.test_cuda_profiler import TestCudaProfiler
     from warp.tests.test_dense import TestDense
@@ -307,6 +309,8 @@ def default_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader)
         TestConstantPrecision,
         TestContext,
         TestCopy,
+        TestCpuThreads,
+        TestCpuIncrementalBuild,
         TestCpuPrecompiledHeaders,
         TestCTypes,
         TestCudaArchSuffix,